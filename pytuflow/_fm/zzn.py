@@ -92,7 +92,15 @@ class ZZL:
 
 
 class ZZN:
-    """Class for reading Flood Modeller ZZN files."""
+    """Class for reading Flood Modeller ZZN files.
+
+    The ZZN file is memory-mapped rather than read into memory. Results are stored in the file as
+    ``(timestep, node, result type)`` so extracting a single node or a single timestep only reads the bytes
+    required.
+    """
+
+    #: tuple[str]: The result types in the order they are stored in the file.
+    RESULT_TYPES = ('Flow', 'Stage', 'Froude', 'Velocity', 'Mode', 'State')
 
     def __init__(self, fpath: PathLike) -> None:
         """
@@ -109,12 +117,11 @@ class ZZN:
             raise FileNotFoundError(f'zzl file not found: {self._zzl_path}')
         #: ZZL: Associated ZZL object.
         self.zzl = ZZL(self._zzl_path)
-        self._a = np.fromfile(str(self._zzn_path), dtype=np.float32, count=self.timestep_count()*self.node_count()*self.result_type_count())
-        self._a = np.reshape(self._a, (self.timestep_count(), self.node_count()*self.result_type_count()))
-        self._h = np.array(sum([['Flow', 'Stage', 'Froude', 'Velocity', 'Mode', 'State'] for _ in range(self.node_count())], []))
+        self._a = self._map()
 
     def get_time_series_data(self, typ: str) -> np.ndarray:
-        """Time series data for a given result type.
+        """Time series data for a given result type. The returned array is a (timestep, node) view into
+        the memory-mapped file, so no data is read until it is accessed.
 
         Parameters
         ----------
@@ -126,7 +133,38 @@ class ZZN:
         np.ndarray
             Time series data.
         """
-        return self._a[:,self._h == typ]
+        if self._a is None:  # closed, map the file again
+            self._a = self._map()
+        return self._a[:, :, self.RESULT_TYPES.index(typ)]
+
+    def values(self, typ: str, nodes: int | slice | np.ndarray = slice(None),
+               timesteps: int | slice | np.ndarray = slice(None)) -> np.ndarray:
+        """Returns the values for a given result type for the given nodes and timesteps. Only the requested values
+        are read from the file.
+
+        Parameters
+        ----------
+        typ: str
+            Result type. One of 'Flow', 'Stage', 'Froude', 'Velocity', 'Mode', 'State'.
+        nodes: int | slice | np.ndarray, optional
+            The node indexes.
+        timesteps: int | slice | np.ndarray, optional
+            The timestep indexes.
+
+        Returns
+        -------
+        np.ndarray
+            The values.
+        """
+        a = self.get_time_series_data(typ)
+        if not isinstance(nodes, slice) and not isinstance(timesteps, slice) and np.ndim(nodes) and np.ndim(timesteps):
+            return np.array(a[np.ix_(timesteps, nodes)])
+        return np.array(a[timesteps, nodes])
+
+    def close(self) -> None:
+        """Releases the memory-mapped ZZN file so it is no longer locked. The file is mapped again if more
+        results are read."""
+        self._a = None
 
     def labels(self) -> list[str]:
         """Return node labels.
@@ -243,3 +281,7 @@ class ZZN:
             Reference time.
         """
         return self.zzl.reference_time
+
+    def _map(self) -> np.memmap:
+        return np.memmap(self._zzn_path, dtype=np.float32, mode='r',
+                         shape=(self.timestep_count(), self.node_count(), self.result_type_count()))
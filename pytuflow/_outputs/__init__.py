@@ -16,6 +16,10 @@ from .catch_json import CATCHJson
 from .dat import DAT
 from .nc_grid import NCGrid
 
+# utilities
+from .batch import BatchExtractor
+from .ensemble import EnsembleStatistics
+
 # expose some base classes for convenience
 from .map_output import MapOutput
 from .time_series import TimeSeries
@@ -23,6 +27,7 @@ from .tabular_output import TabularOutput
 from .mesh import Mesh
 from .grid import Grid
 from .grid_mesh import GridMesh
+from .helpers.surface_array import SurfaceArray, GridSurface, MeshSurface
 from .output import Output
 
 from .pymesh import FormatConvention
@@ -0,0 +1,262 @@
+import os
+import threading
+import typing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+try:
+    import pandas as pd
+except ImportError:
+    from .pymesh.stubs import pandas as pd
+
+from .output import Output
+from .._pytuflow_types import PathLike
+from ..util import pytuflow_logging
+
+
+logger = pytuflow_logging.get_logger()
+
+
+ResultLike = typing.Union[PathLike, tuple[PathLike, ...]]
+
+
+# outputs opened by this (worker) process, most recently used last
+_worker_outputs = OrderedDict()
+
+
+def _worker_output(output_class: type[Output], result: tuple[str, ...], cache_size: int) -> Output:
+    """Returns the output for the result, reusing the instance if this process has already opened it."""
+    key = (output_class, result)
+    if key in _worker_outputs:
+        _worker_outputs.move_to_end(key)
+        return _worker_outputs[key]
+    out = output_class(*result)
+    _worker_outputs[key] = out
+    while len(_worker_outputs) > max(cache_size, 1):
+        _worker_outputs.popitem(last=False)
+    return out
+
+
+def _worker_extract(output_class: type[Output], result: tuple[str, ...], method: str, args: tuple,
+                    kwargs: dict, cache_size: int) -> pd.DataFrame:
+    out = _worker_output(output_class, result, cache_size)
+    return getattr(out, method)(*args, **kwargs)
+
+
+class BatchExtractor:
+    """Runs the same extraction (e.g. :meth:`time_series() <pytuflow.TPC.time_series>` or
+    :meth:`maximum() <pytuflow.TPC.maximum>`) over many results in parallel using a pool of processes.
+
+    Each result is loaded and extracted in a worker process and the extracted ``DataFrame`` is streamed back as
+    soon as it is ready, so results are returned in the order they complete, not the order they were given. Worker
+    processes are kept for the life of the extractor and keep the most recently used output(s) open, so running
+    another extraction over the same results (e.g. :meth:`maximum` after :meth:`time_series`) does not need to load
+    the results again if the worker still has them open.
+
+    Parameters
+    ----------
+    output_class : type[Output]
+        The output class used to load the results e.g. :class:`TPC <pytuflow.TPC>`.
+    results : list[PathLike | tuple[PathLike, ...]]
+        The results to extract from. Use a tuple for outputs that require more than one file e.g.
+        ``(xmdf, twodm)`` for :class:`XMDF <pytuflow.XMDF>`.
+    max_workers : int, optional
+        The number of worker processes. Defaults to the number of processors on the machine. If set to ``0``,
+        the extraction is run in the current process (useful for debugging).
+    cache_size : int, optional
+        The number of outputs each worker keeps open for reuse.
+    mp_context : multiprocessing.context.BaseContext, optional
+        The multiprocessing context used to start the worker processes.
+
+    Examples
+    --------
+    Extracting the flow in a channel from a Monte Carlo ensemble of results:
+
+    >>> from pytuflow import TPC, BatchExtractor
+    >>> results = [f'path/to/results/run_{i:04d}.tpc' for i in range(1000)]
+    >>> with BatchExtractor(TPC, results) as batch:
+    ...     for res, df in batch.time_series('FC01.1_R', 'flow', progress=print):
+    ...         ...
+
+    The extraction can be cancelled from another thread (e.g. a GUI) by calling :meth:`cancel`. Any extractions that
+    have not started are dropped and the iteration stops once the running extractions have finished.
+    """
+
+    def __init__(self, output_class: type[Output], results: typing.Iterable[ResultLike], max_workers: int = None,
+                 cache_size: int = 1, mp_context: typing.Any = None):
+        #: type[Output]: The output class used to load the results.
+        self.output_class = output_class
+        #: list[tuple[str, ...]]: The results to extract from.
+        self.results = [tuple(str(x) for x in r) if isinstance(r, (tuple, list)) else (str(r),) for r in results]
+        #: int: The number of worker processes.
+        self.max_workers = max_workers
+        #: int: The number of outputs each worker keeps open for reuse.
+        self.cache_size = cache_size
+        self._mp_context = mp_context
+        self._executor = None
+        self._cancel = threading.Event()
+
+    def __repr__(self) -> str:
+        return f'<BatchExtractor {self.output_class.__name__} ({len(self.results)} results)>'
+
+    def __enter__(self) -> 'BatchExtractor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def cancelled(self) -> bool:
+        """bool: Whether the extraction has been cancelled."""
+        return self._cancel.is_set()
+
+    def cancel(self):
+        """Cancels the running extraction. Can be called from another thread or from the ``progress`` callback."""
+        self._cancel.set()
+
+    def close(self):
+        """Shuts down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def time_series(self, locations: typing.Any, data_types: str | list[str] | None, time_fmt: str = 'relative',
+                    progress: typing.Callable[[int, int, ResultLike], typing.Any] = None,
+                    errors: str = 'raise', **kwargs) -> typing.Generator[tuple[ResultLike, pd.DataFrame], None, None]:
+        """Extracts the time series from every result. See the ``time_series()`` method of the output class for the
+        description of ``locations``, ``data_types``, ``time_fmt`` and any other keyword arguments.
+
+        Parameters
+        ----------
+        locations : PlotExtractionLocation
+            The location(s) to extract the time series for.
+        data_types : str | list[str]
+            The data type(s) to extract.
+        time_fmt : str, optional
+            The format for the time column. Options are 'relative' or 'absolute'.
+        progress : Callable[[int, int, ResultLike], Any], optional
+            Called after each result is extracted with the number of completed results, the total number of
+            results, and the result.
+        errors : str, optional
+            If ``'raise'``, the first failed extraction is raised (after cancelling the rest). If ``'ignore'``,
+            failed extractions are logged and skipped.
+
+        Yields
+        ------
+        tuple[ResultLike, pd.DataFrame]
+            The result and its extracted data, in the order they complete.
+        """
+        yield from self.run('time_series', locations, data_types, time_fmt=time_fmt, progress=progress,
+                            errors=errors, **kwargs)
+
+    def maximum(self, locations: typing.Any, data_types: str | list[str] | None, time_fmt: str = 'relative',
+                progress: typing.Callable[[int, int, ResultLike], typing.Any] = None,
+                errors: str = 'raise', **kwargs) -> typing.Generator[tuple[ResultLike, pd.DataFrame], None, None]:
+        """Extracts the maximums from every result. See :meth:`time_series` for a description of the parameters.
+
+        Yields
+        ------
+        tuple[ResultLike, pd.DataFrame]
+            The result and its extracted data, in the order they complete.
+        """
+        yield from self.run('maximum', locations, data_types, time_fmt=time_fmt, progress=progress,
+                            errors=errors, **kwargs)
+
+    def run(self, method: str, *args, progress: typing.Callable[[int, int, ResultLike], typing.Any] = None,
+            errors: str = 'raise', **kwargs) -> typing.Generator[tuple[ResultLike, pd.DataFrame], None, None]:
+        """Calls an extraction method of the output class for every result e.g. ``run('section', 'FC01.1_R',
+        'bed level', 1.0)``.
+
+        Parameters
+        ----------
+        method : str
+            The name of the extraction method e.g. ``'time_series'``, ``'maximum'``, ``'section'``.
+        *args
+            The positional arguments passed to the method.
+        progress : Callable[[int, int, ResultLike], Any], optional
+            Called after each result is extracted with the number of completed results, the total number of
+            results, and the result.
+        errors : str, optional
+            If ``'raise'``, the first failed extraction is raised (after cancelling the rest). If ``'ignore'``,
+            failed extractions are logged and skipped.
+        **kwargs
+            The keyword arguments passed to the method.
+
+        Yields
+        ------
+        tuple[ResultLike, pd.DataFrame]
+            The result and its extracted data, in the order they complete.
+        """
+        if method.startswith('_') or not callable(getattr(self.output_class, method, None)):
+            raise AttributeError(f'{self.output_class.__name__} has no extraction method {method}')
+        if errors not in ('raise', 'ignore'):
+            raise ValueError(f'errors must be "raise" or "ignore", not {errors}')
+        self._cancel.clear()
+        if self.max_workers == 0:
+            yield from self._run_serial(method, args, kwargs, progress, errors)
+        else:
+            yield from self._run_parallel(method, args, kwargs, progress, errors)
+
+    def _run_serial(self, method: str, args: tuple, kwargs: dict, progress: typing.Callable,
+                    errors: str) -> typing.Generator[tuple[ResultLike, pd.DataFrame], None, None]:
+        total = len(self.results)
+        for i, result in enumerate(self.results):
+            if self.cancelled:
+                return
+            try:
+                df = _worker_extract(self.output_class, result, method, args, kwargs, self.cache_size)
+            except Exception as e:
+                self._handle_error(result, e, errors)
+                df = None
+            if progress is not None:
+                progress(i + 1, total, self._result_like(result))
+            if df is not None:
+                yield self._result_like(result), df
+
+    def _run_parallel(self, method: str, args: tuple, kwargs: dict, progress: typing.Callable,
+                      errors: str) -> typing.Generator[tuple[ResultLike, pd.DataFrame], None, None]:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=self._mp_context)
+        total, completed = len(self.results), 0
+        todo = iter(self.results)
+        # only keep a couple of tasks queued per worker so cancelling doesn't have to wait on a long queue
+        max_pending = 2 * (self.max_workers or os.cpu_count() or 1)
+        pending = {}
+        try:
+            while True:
+                while not self.cancelled and len(pending) < max_pending:
+                    result = next(todo, None)
+                    if result is None:
+                        break
+                    fut = self._executor.submit(_worker_extract, self.output_class, result, method, args, kwargs,
+                                                self.cache_size)
+                    pending[fut] = result
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    result = pending.pop(fut)
+                    completed += 1
+                    try:
+                        df = fut.result()
+                    except Exception as e:
+                        self._handle_error(result, e, errors)
+                        df = None
+                    if progress is not None:
+                        progress(completed, total, self._result_like(result))
+                    if df is not None:
+                        yield self._result_like(result), df
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+    def _handle_error(self, result: tuple[str, ...], e: Exception, errors: str):
+        if errors == 'raise':
+            self.cancel()
+            raise e
+        logger.warning(f'BatchExtractor: Extraction failed for {self._result_like(result)}: {e}')
+
+    @staticmethod
+    def _result_like(result: tuple[str, ...]) -> ResultLike:
+        return Path(result[0]) if len(result) == 1 else tuple(Path(x) for x in result)
@@ -179,6 +179,12 @@ class DAT(Mesh):
 
         self._initial_load()
 
+    def close(self):
+        """Releases the memory mapped .dat files so they are no longer locked. The files are mapped again if
+        more results are read."""
+        if isinstance(self._driver, PyDAT):
+            self._driver.close()
+
     @staticmethod
     def _find_2dm(fpath: PathLike) -> Path:
         stem = Path(fpath).stem
@@ -0,0 +1,433 @@
+import typing
+from contextlib import nullcontext
+from datetime import datetime
+
+import numpy as np
+try:
+    import pandas as pd
+except ImportError:
+    from .pymesh.stubs import pandas as pd
+try:
+    from netCDF4 import Dataset
+    has_netcdf4 = True
+except ImportError:
+    has_netcdf4 = False
+
+from .grid import Grid
+from .grid_mesh import GridMesh
+from .mesh import Mesh
+from .._pytuflow_types import PathLike, TimeLike
+
+
+class _P2Quantile:
+    """Streaming estimate of a single quantile for many cells at once using the P-square algorithm
+    (Jain and Chlamtac, 1985). Each cell keeps 5 markers, so memory does not grow with the number of samples.
+    NaN samples are ignored, so each cell can have a different number of samples.
+    """
+
+    def __init__(self, p: float, size: int):
+        self.p = p
+        self.count = np.zeros(size, dtype=np.int64)
+        self.q = np.zeros((5, size))  # marker heights (the first 5 samples until the markers are initialised)
+        self.n = np.tile(np.arange(1., 6.)[:, None], (1, size))  # marker positions
+        self.nd = np.tile(np.array([1., 1. + 2. * p, 1. + 4. * p, 3. + 2. * p, 5.])[:, None], (1, size))  # desired
+        self.dn = np.array([0., p / 2., p, (1. + p) / 2., 1.])[:, None]
+
+    def add(self, x: np.ndarray):
+        valid = ~np.isnan(x)
+
+        # buffer the first 5 samples
+        init = valid & (self.count < 5)
+        if init.any():
+            idx = np.nonzero(init)[0]
+            self.q[self.count[idx], idx] = x[idx]
+            self.count[idx] += 1
+            ready = idx[self.count[idx] == 5]
+            self.q[:, ready] = np.sort(self.q[:, ready], axis=0)
+
+        idx = np.nonzero(valid & ~init & (self.count >= 5))[0]
+        if not idx.size:
+            return
+        self.count[idx] += 1
+        x = x[idx]
+        q, n, nd = self.q[:, idx], self.n[:, idx], self.nd[:, idx]
+
+        # find the cell the sample falls in and adjust the extreme markers
+        q[0] = np.minimum(q[0], x)
+        q[4] = np.maximum(q[4], x)
+        k = (x[None, :] >= q[1:4]).sum(axis=0)
+        n += np.arange(5)[:, None] > k[None, :]
+        nd += self.dn
+
+        # adjust the middle markers if they are off their desired position
+        cols = np.arange(idx.size)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for i in range(1, 4):
+                d = nd[i] - n[i]
+                adjust = ((d >= 1.) & (n[i + 1] - n[i] > 1.)) | ((d <= -1.) & (n[i - 1] - n[i] < -1.))
+                if not adjust.any():
+                    continue
+                d = np.sign(d)
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+                    (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                j = i + d.astype(int)
+                linear = q[i] + d * (q[j, cols] - q[i]) / (n[j, cols] - n[i])
+                new = np.where((q[i - 1] < parabolic) & (parabolic < q[i + 1]), parabolic, linear)
+                q[i] = np.where(adjust, new, q[i])
+                n[i] = np.where(adjust, n[i] + d, n[i])
+
+        self.q[:, idx], self.n[:, idx], self.nd[:, idx] = q, n, nd
+
+    def value(self) -> np.ndarray:
+        a = np.full(self.count.shape, np.nan)
+        a[self.count > 5] = self.q[2, self.count > 5]
+        for c in range(1, 6):  # markers have not been updated yet, so calculate exactly from the samples
+            mask = self.count == c
+            if mask.any():
+                a[mask] = np.percentile(self.q[:c, mask], self.p * 100., axis=0)
+        return a
+
+
+class EnsembleStatistics:
+    """Calculates statistics (e.g. max-of-max, mean, percentiles) across an ensemble of map outputs that share
+    the same geometry (i.e. the same mesh or the same grid extent and cell size).
+
+    Results are added one at a time, and the statistics are updated using running reductions, so only the
+    statistics are kept in memory regardless of how many results are added. Percentiles are estimated using the
+    P-square algorithm, which keeps 5 markers per cell/vertex for each percentile. The estimate is exact for up to 5
+    results.
+
+    Values that are NaN (e.g. dry cells) are ignored, so the ``count`` statistic gives the number of results
+    that contributed to each cell/vertex.
+
+    Parameters
+    ----------
+    percentiles : list[float], optional
+        The percentiles (0 - 100) to calculate.
+
+    Examples
+    --------
+    Calculate the max-of-max depth and P50/P90 water level across a storm ensemble:
+
+    >>> from pytuflow import XMDF, EnsembleStatistics
+    >>> stats = EnsembleStatistics(percentiles=[50, 90])
+    >>> for xmdf in ensemble_results:
+    ...     stats.add_result(XMDF(xmdf), 'max water level', time_of_max='tmax water level')
+    >>> df = stats.to_frame()  # x, y, max, min, mean, std, count, p50, p90, argmax, tmax
+
+    NCGrid results can be written back out as a grid:
+
+    >>> stats = EnsembleStatistics.from_results((NCGrid(x) for x in ensemble_results), 'max depth')
+    >>> stats.to_netcdf('/path/to/ensemble_max_depth.nc')
+    """
+
+    def __init__(self, percentiles: typing.Iterable[float] = (50, 90)):
+        #: list[float]: The percentiles calculated.
+        self.percentiles = [float(x) for x in percentiles]
+        #: int: The number of results added.
+        self.n_results = 0
+        #: str: The data type of the results added (set by :meth:`add_result`).
+        self.data_type = ''
+        self._size = None
+        self._grid_info = None  # (dx, dy, ox, oy, ncol, nrow) if adding grid results
+        self._xy = None  # coordinates if adding mesh results
+        self._max = self._min = self._mean = self._m2 = self._count = None
+        self._argmax = self._tmax = None
+        self._quantiles = []
+
+    def __repr__(self) -> str:
+        return f'<EnsembleStatistics {self.data_type} ({self.n_results} results)>'
+
+    @staticmethod
+    def from_results(results: typing.Iterable[Mesh | Grid], data_type: str, time: TimeLike = 0,
+                     percentiles: typing.Iterable[float] = (50, 90), averaging_method: str = 'sigma&0&1',
+                     to_vertex: bool = False, time_of_max: str = None) -> 'EnsembleStatistics':
+        """Calculates the statistics over all the results. ``results`` can be a generator that loads each result as
+        it is needed, so only one result is open at a time. See :meth:`add_result` for a description of the other
+        parameters.
+
+        Returns
+        -------
+        EnsembleStatistics
+            The ensemble statistics.
+        """
+        stats = EnsembleStatistics(percentiles)
+        for res in results:
+            stats.add_result(res, data_type, time, averaging_method, to_vertex, time_of_max)
+        return stats
+
+    def add_result(self, result: Mesh | Grid, data_type: str, time: TimeLike = 0,
+                   averaging_method: str = 'sigma&0&1', to_vertex: bool = False, time_of_max: str = None):
+        """Adds the surface of a result to the ensemble statistics.
+
+        Parameters
+        ----------
+        result : Mesh | Grid
+            The result to add.
+        data_type : str
+            The (scalar) data type to add e.g. ``'max depth'``.
+        time : TimeLike, optional
+            The time to extract the surface for. Not used for static data types such as maximums.
+        averaging_method : str, optional
+            The depth-averaging method to use. Only applicable for 3D mesh results.
+        to_vertex : bool, optional
+            Whether to interpolate cell data to vertices.
+        time_of_max : str, optional
+            Data type that contains the time of maximum e.g. ``'tmax water level'``. If provided, the ``tmax``
+            statistic is the time of maximum from the result that gives the ensemble maximum.
+        """
+        values = self._result_values(result, data_type, time, averaging_method, to_vertex)
+        tmax = None
+        if time_of_max is not None:
+            tmax = self._result_values(result, time_of_max, time, averaging_method, to_vertex)
+        if not self.data_type:
+            self.data_type = result._figure_out_data_types(data_type, None)[0]
+        self.add(values, tmax)
+
+    def add(self, values: np.ndarray, time_of_max: np.ndarray = None):
+        """Adds an array of values (one value per cell/vertex) to the ensemble statistics. NaN values are ignored.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values to add.
+        time_of_max : np.ndarray, optional
+            The time of maximum for each value.
+        """
+        x = np.asarray(values, dtype=np.float64).ravel()
+        if self._size is None:
+            self._init(x.size)
+        elif x.size != self._size:
+            raise ValueError(f'Expected {self._size} values, got {x.size}. All results must share the same geometry')
+
+        valid = ~np.isnan(x)
+        new_max = valid & ~(x <= self._max)  # ~(<=) so the first sample (max is NaN) is a new max
+        self._max = np.where(new_max, x, self._max)
+        self._min = np.fmin(self._min, x)
+        self._argmax[new_max] = self.n_results
+        tmax = np.nan if time_of_max is None else np.asarray(time_of_max, dtype=np.float64).ravel()
+        self._tmax = np.where(new_max, tmax, self._tmax)
+
+        # Welford's method for the mean and variance
+        self._count += valid
+        delta = np.where(valid, x - self._mean, 0.)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._mean += np.where(valid, delta / self._count, 0.)
+        self._m2 += np.where(valid, delta * (x - self._mean), 0.)
+
+        for q in self._quantiles:
+            q.add(x)
+        self.n_results += 1
+
+    def statistics(self) -> dict[str, np.ndarray]:
+        """Returns the ensemble statistics. Percentiles are named e.g. ``'p90'``.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The statistic name and its value for every cell/vertex.
+        """
+        if self._size is None:
+            return {}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d = {
+                'max': self._max.copy(),
+                'min': self._min.copy(),
+                'mean': np.where(self._count > 0, self._mean, np.nan),
+                'std': np.where(self._count > 1, np.sqrt(self._m2 / (self._count - 1)), np.nan),
+                'count': self._count.copy(),
+            }
+        for p, q in zip(self.percentiles, self._quantiles):
+            d[self._percentile_name(p)] = q.value()
+        d['argmax'] = np.where(self._count > 0, self._argmax, -1)
+        if not np.isnan(self._tmax).all():
+            d['tmax'] = self._tmax.copy()
+        return d
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the ensemble statistics as a DataFrame with the coordinates of each cell/vertex (in the same
+        layout as the ``surface()`` method of the results) and a column for each statistic.
+
+        Returns
+        -------
+        pd.DataFrame
+            The ensemble statistics.
+        """
+        d = self.statistics()
+        if not d:
+            return pd.DataFrame()
+        if self._grid_info is not None:
+            dx, dy, ox, oy, ncol, nrow = self._grid_info
+            xx, yy = np.meshgrid(ox + dx / 2. + np.arange(ncol) * dx, oy + dy / 2. + np.arange(nrow) * dy)
+            xy = {'x': xx.flatten(), 'y': yy.flatten()}
+        elif self._xy is not None:
+            xy = {'x': self._xy[:, 0], 'y': self._xy[:, 1]}
+        else:
+            xy = {}
+        return pd.DataFrame({**xy, **d})
+
+    def to_grid(self, statistic: str = 'max') -> Grid:
+        """Returns a statistic as a :class:`Grid<pytuflow.Grid>`. Only available if the results added are grids.
+
+        Parameters
+        ----------
+        statistic : str, optional
+            The statistic e.g. ``'max'``, ``'p90'``.
+
+        Returns
+        -------
+        Grid
+            The statistic as a grid.
+        """
+        if self._grid_info is None:
+            raise ValueError('Ensemble statistics can only be converted to a grid if grid results were added')
+        dx, dy, ox, oy, ncol, nrow = self._grid_info
+        d = {
+            'dx': dx, 'dy': dy, 'ox': ox, 'oy': oy, 'ncol': ncol, 'nrow': nrow, 'nodatavalue': np.nan,
+            'data_type': f'{statistic} {self.data_type}'.strip(), 'timesteps': -1, 'dtype': 'scalar',
+            'data': self._statistic(statistic).astype(np.float64).reshape(nrow, ncol),
+        }
+        return Grid(d)
+
+    def to_mesh(self, statistic: str = 'max') -> GridMesh:
+        """Returns a statistic as a :class:`GridMesh<pytuflow.GridMesh>`. Only available if the results added are
+        grids.
+
+        Parameters
+        ----------
+        statistic : str, optional
+            The statistic e.g. ``'max'``, ``'p90'``.
+
+        Returns
+        -------
+        GridMesh
+            The statistic as a mesh.
+        """
+        return self.to_grid(statistic).to_mesh()
+
+    def to_netcdf(self, fpath: PathLike, statistics: typing.Iterable[str] = None):
+        """Writes the statistics to a NetCDF file. Grid results are written in the TUFLOW NetCDF raster format
+        (and can be loaded using :class:`NCGrid<pytuflow.NCGrid>`). Mesh results are written as a variable per
+        statistic on a ``point`` dimension along with the ``x`` and ``y`` coordinates.
+
+        Parameters
+        ----------
+        fpath : PathLike
+            The output file path.
+        statistics : list[str], optional
+            The statistics to write. Defaults to all statistics.
+        """
+        if not has_netcdf4:
+            raise ImportError('netCDF4 is required to write NetCDF files')
+        d = self.statistics()
+        if not d:
+            raise ValueError('No results have been added')
+        statistics = list(d) if statistics is None else list(statistics)
+        with Dataset(fpath, 'w') as nc:
+            nc.title = f'Ensemble statistics: {self.data_type}'
+            nc.comment = f'Calculated from {self.n_results} results'
+            if self._grid_info is not None:
+                dx, dy, ox, oy, ncol, nrow = self._grid_info
+                dims = ('y', 'x')
+                nc.createDimension('x', ncol)
+                nc.createDimension('y', nrow)
+                for axis, n, o, delta in [('x', ncol, ox, dx), ('y', nrow, oy, dy)]:
+                    var = nc.createVariable(axis, 'f8', (axis,))
+                    var.axis = axis.upper()
+                    var[:] = o + delta / 2. + np.arange(n) * delta
+                shape = (nrow, ncol)
+            else:
+                dims = ('point',)
+                nc.createDimension('point', self._size)
+                shape = (self._size,)
+                if self._xy is not None:
+                    for i, axis in enumerate(['x', 'y']):
+                        nc.createVariable(axis, 'f8', dims)[:] = self._xy[:, i]
+            for stat in statistics:
+                a = self._statistic(stat, d)
+                if a.dtype.kind in 'iu':
+                    var = nc.createVariable(stat, 'i4', dims)
+                    var[:] = a.reshape(shape)
+                else:
+                    var = nc.createVariable(stat, 'f4', dims, fill_value=-999.)
+                    var[:] = np.ma.masked_invalid(a.reshape(shape))
+                var.long_name = f'{stat} {self.data_type}'.strip()
+
+    def _init(self, size: int):
+        self._size = size
+        self._max = np.full(size, np.nan)
+        self._min = np.full(size, np.nan)
+        self._mean = np.zeros(size)
+        self._m2 = np.zeros(size)
+        self._count = np.zeros(size, dtype=np.int64)
+        self._argmax = np.full(size, -1, dtype=np.int64)
+        self._tmax = np.full(size, np.nan)
+        self._quantiles = [_P2Quantile(p / 100., size) for p in self.percentiles]
+
+    def _statistic(self, statistic: str, d: dict = None) -> np.ndarray:
+        d = self.statistics() if d is None else d
+        name = statistic.lower()
+        try:
+            name = self._percentile_name(float(name.lstrip('p')))
+        except ValueError:
+            pass
+        if name not in d:
+            raise ValueError(f'Statistic not available: {statistic}. Available statistics: {list(d)}')
+        return d[name]
+
+    @staticmethod
+    def _percentile_name(p: float) -> str:
+        return f'p{p:g}'
+
+    def _result_values(self, result: Mesh | Grid, data_type: str, time: TimeLike, averaging_method: str,
+                       to_vertex: bool) -> np.ndarray:
+        if isinstance(result, Grid):
+            return self._grid_values(result, data_type, time)
+        if isinstance(result, Mesh):
+            return self._mesh_values(result, data_type, time, averaging_method, to_vertex)
+        raise TypeError(f'Ensemble statistics are only supported for Mesh and Grid results, not {type(result)}')
+
+    def _grid_values(self, grid: Grid, data_type: str, time: TimeLike) -> np.ndarray:
+        dtype = grid._figure_out_data_types(data_type, None)[0]
+        dx, dy, ox, oy, ncol, nrow, ndv = grid._grid_info(dtype)
+        info = tuple(float(x) for x in (dx, dy, ox, oy)) + (int(ncol), int(nrow))
+        self._check_geometry(grid_info=info)
+        with (grid._open() if hasattr(grid, '_open') else nullcontext()):
+            if grid._is_static(dtype):
+                idx = -1
+            else:
+                times = grid.times(dtype, fmt='absolute') if isinstance(time, datetime) else grid.times(dtype)
+                idx = (grid._closest_time_index(times, time),)
+            a = np.array(grid._surface(dtype, idx), dtype=np.float64)
+        if a.shape != (info[5], info[4]):
+            raise ValueError(f'Ensemble statistics are only supported for scalar data types: {data_type}')
+        a[a == ndv] = np.nan
+        return a.ravel()
+
+    def _mesh_values(self, mesh: Mesh, data_type: str, time: TimeLike, averaging_method: str,
+                     to_vertex: bool) -> np.ndarray:
+        mesh._load()
+        dtype = mesh._figure_out_data_types(data_type, None)[0]
+        if mesh._driver.DRIVER_SOURCE != 'python':
+            raise NotImplementedError('v1.0 driver does not support surface data extraction.')
+        data, mask = mesh._driver.surface(dtype, time, averaging_method, to_vertex)
+        if data.shape[1] != 3:
+            raise ValueError(f'Ensemble statistics are only supported for scalar data types: {data_type}')
+        self._check_geometry(xy=data[:, :2])
+        a = np.array(data[:, 2], dtype=np.float64)
+        a[~np.asarray(mask, dtype=bool).ravel()] = np.nan
+        return a
+
+    def _check_geometry(self, grid_info: tuple = None, xy: np.ndarray = None):
+        if self.n_results == 0 and self._grid_info is None and self._xy is None:
+            self._grid_info = grid_info
+            self._xy = None if xy is None else np.array(xy, dtype=np.float64)
+            return
+        if grid_info is not None:
+            ok = self._grid_info is not None and np.allclose(grid_info, self._grid_info)
+        else:
+            ok = self._xy is not None and self._xy.shape == xy.shape and np.allclose(xy, self._xy)
+        if not ok:
+            raise ValueError('All results must share the same geometry (same mesh or same grid extent and cell size)')
@@ -11,7 +11,7 @@ from .helpers.tpc_reader import TPCReader
 from .info import INFO
 from .._pytuflow_types import PathLike, TimeLike
 from .helpers.fm_res_driver import FMResultDriver
-from .helpers.lp_1d_fm import LP1DFM
+from .helpers.lp_1d_fm import LP1DFM, NetworkGraphFM
 from .._fm import GXY
 from .._fm import FMDAT
 from ..util import pytuflow_logging
@@ -157,13 +157,15 @@ class FMTS(INFO):
     def _looks_like_this(fpath: Path) -> bool:
         # docstring inherited
         driver = FMResultDriver(fpath)
+        driver.close()
         return driver.driver_name != ''
 
     @staticmethod
     def _looks_empty(fpath: PathLike) -> bool:
         # docstring inherited
         driver = FMResultDriver(fpath)
-        return driver.df is None or driver.df.empty
+        driver.close()
+        return driver.is_empty()
 
     def times(self, filter_by: str = None, fmt: str = 'relative') -> list[TimeLike]:
         # docstring inherited
@@ -421,7 +423,7 @@ class FMTS(INFO):
         return super().time_series(locations, data_types, time_fmt)
 
     def section(self, locations: Union[str, list[str]], data_types: Union[str, list[str]],
-                time: TimeLike, *args, **kwargs) -> pd.DataFrame:
+                time: Union[TimeLike, list[TimeLike], str], *args, **kwargs) -> pd.DataFrame:
         """Returns a long plot for the given location and data types at the given time. If one location is given,
         the long plot will connect the given location down to the outlet. If 2 locations are given, then the
         long plot will connect the two locations (they must be connectable).
@@ -445,14 +447,17 @@ class FMTS(INFO):
         * :code:`offset`: The offset along the long plot
         * :code:`[data_types]`: The data types requested.
 
+        If :code:`time` is :code:`'all'` or a list of times, the long plot is extracted for each of the times and a
+        :code:`time` column is added as the first column.
+
         Parameters
         ----------
         locations : str | list[str]
             The location to extract the section data for. Unlike other plotting methods, the location cannot be None.
         data_types : str | list[str]
             The data type to extract the section data for. If None is passed in, all node data types will be returned.
-        time : TimeLike
-            The time to extract the section data for.
+        time : TimeLike | list[TimeLike] | str
+            The time to extract the section data for. Use :code:`'all'` to extract the section data for all times.
 
         Returns
         -------
@@ -528,9 +533,15 @@ class FMTS(INFO):
         """Not supported for ``FMTS`` results. Raises a :code:`NotImplementedError`."""
         return super().profile(locations, data_types, time)
 
+    def close(self):
+        """Releases the memory-mapped ZZN file so it is no longer locked. The file is mapped again if more
+        results are read."""
+        for driver in self._storage:
+            driver.close()
+
     def _connectivity(self, ids: Union[str, list[str]]) -> pd.DataFrame:
         # docstring inherited
-        lp = LP1DFM(ids, self._node_info, self._channel_info)
+        lp = LP1DFM(ids, self._node_info, self._channel_info, self._network_graph())
         if self._lp is not None and lp == self._lp:
             return self._lp.df
 
@@ -538,6 +549,12 @@ class FMTS(INFO):
         self._lp = lp
         return self._lp.df
 
+    def _network_graph(self) -> NetworkGraphFM:
+        # docstring inherited
+        if self._network is None:
+            self._network = NetworkGraphFM(self._channel_info, self._node_info)
+        return self._network
+
     def _id_to_uid(self, id_: str) -> str | None:
         """Converts a unit ID to its UID. Only searches through units that
         contain results. If multiple units are found, it will first preference units that have bed level information
@@ -616,12 +633,7 @@ class FMTS(INFO):
             for res_type in driver.result_types:
                 stnd = self._get_standard_data_type_name(res_type)
                 self._nd_res_types.append(stnd)  # all results are stored on nodes in flood modeller results
-                try:
-                    df = driver.df.loc[:,driver.df.columns.str.contains(f'^{res_type}::')]
-                except AttributeError:
-                    df = driver.df.loc[:, driver.df.columns.str.contains(f'{res_type}::', regex=False)]
-                df.columns = [x.split('::')[1] for x in df.columns]
-                self._time_series_data[stnd] = df
+                self._time_series_data[stnd] = driver.time_series(res_type)
 
         # load max data
         self._load_maximums()
@@ -379,7 +379,7 @@ class GPKG1D(GPKGBase, INFO):
         return super().time_series(locations, data_types, time_fmt)
 
     def section(self, locations: Union[str, list[str]], data_types: Union[str, list[str]],
-                time: TimeLike, *args, **kwargs) -> pd.DataFrame:
+                time: Union[TimeLike, list[TimeLike], str], *args, **kwargs) -> pd.DataFrame:
         """Returns a long plot for the given location and data types at the given time. If one location is given,
         the long plot will connect the given location down to the outlet. If 2 locations are given, then the
         long plot will connect the two locations (they must be connectable). If more than 2 locations are given,
@@ -401,14 +401,17 @@ class GPKG1D(GPKGBase, INFO):
         * :code:`offset`: The offset along the long plot
         * :code:`[data_types]`: The data types requested.
 
+        If :code:`time` is :code:`'all'` or a list of times, the long plot is extracted for each of the times and a
+        :code:`time` column is added as the first column.
+
         Parameters
         ----------
         locations : str | list[str]
             The location to extract the section data for. Unlike other plotting methods, the location cannot be None.
         data_types : str | list[str]
             The data type to extract the section data for. If None is passed in, all node data types will be returned.
-        time : TimeLike
-            The time to extract the section data for.
+        time : TimeLike | list[TimeLike] | str
+            The time to extract the section data for. Use :code:`'all'` to extract the section data for all times.
 
         Returns
         -------
@@ -468,7 +471,7 @@ class GPKG1D(GPKGBase, INFO):
         return super().profile(locations, data_types, time)
 
     def _initial_load(self):
-        with self.connect(self.fpath) as conn:
+        with self.pooled_connection(self.fpath) as conn:
             cur = conn.cursor()
             cur.execute('SELECT Version FROM TUFLOW_timeseries_version;')
             self.format_version = Version(cur.fetchone()[0])
@@ -505,12 +508,14 @@ class GPKG1D(GPKGBase, INFO):
         if self._loaded:
             return
 
-        with self.connect(self.fpath) as conn:
+        with self.pooled_connection(self.fpath) as conn:
             cur = conn.cursor()
             self._load_channel_info(cur)
             self._load_node_info(cur)
-            self._load_time_series(cur)
-            self._load_maximums()
+            if not self._load_ts_cache():
+                self._load_time_series(cur)
+                self._load_maximums()
+                self._save_ts_cache()
             self._load_1d_info()
 
         self._loaded = True
@@ -518,6 +523,10 @@ class GPKG1D(GPKGBase, INFO):
     def _init_tpc_reader(self) -> TPCReader:
         pass
 
+    def _ts_cache_sources(self) -> list[PathLike]:
+        # docstring inherited
+        return [self.fpath]
+
     def _load_time_series(self, cur: 'Cursor'):
         # nodes
         cur.execute(
@@ -528,7 +537,7 @@ class GPKG1D(GPKGBase, INFO):
         for dtype in data_types:
             dtype1 = 'node flow regime' if dtype == 'Flow Regime' else self._get_standard_data_type_name(dtype)
             self._nd_res_types.append(dtype1)
-            self._time_series_data[dtype1] = self._gpkg_time_series_extractor(cur, dtype, self._gis_layer_p_name)
+            self._time_series_data[dtype1] = self._gpkg_time_series(cur, dtype, self._gis_layer_p_name)
 
         # channels
         cur.execute(
@@ -538,7 +547,7 @@ class GPKG1D(GPKGBase, INFO):
         data_types = [x[0] for x in cur.fetchall()]
         for dtype in data_types:
             dtype1 = 'channel flow regime' if dtype == 'Flow Regime' else self._get_standard_data_type_name(dtype)
-            self._time_series_data[dtype1] = self._gpkg_time_series_extractor(cur, dtype, self._gis_layer_l_name)
+            self._time_series_data[dtype1] = self._gpkg_time_series(cur, dtype, self._gis_layer_l_name)
 
     @staticmethod
     def _sqlite_return_to_df(ret: list[tuple], columns: list[str], type_map: list[type]) -> pd.DataFrame:
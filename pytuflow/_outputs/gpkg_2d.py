@@ -12,6 +12,7 @@ except ImportError:
 from packaging.version import Version
 
 from .gpkg_base import GPKGBase, _safe_identifier
+from .helpers.time_series_csv import TimeSeriesCSV, TimeSeriesCSVMaximums
 from .time_series import TimeSeries
 from .itime_series_2d import ITimeSeries2D
 from .._pytuflow_types import PathLike, AppendDict, TimeLike, TuflowPath
@@ -423,7 +424,7 @@ class GPKG2D(GPKGBase, TimeSeries, ITimeSeries2D):
 
     def _initial_load(self):
         self.name = re.sub(r'_TS_2D$', '', self.fpath.stem)
-        with self.connect(self.fpath) as conn:
+        with self.pooled_connection(self.fpath) as conn:
             cur = conn.cursor()
             cur.execute('SELECT Version FROM TUFLOW_timeseries_version;')
             self.format_version = Version(cur.fetchone()[0])
@@ -467,7 +468,7 @@ class GPKG2D(GPKGBase, TimeSeries, ITimeSeries2D):
         if self._loaded:
             return
 
-        with self.connect(self.fpath) as conn:
+        with self.pooled_connection(self.fpath) as conn:
             cur = conn.cursor()
             self._load_time_series(cur, self._time_series_data_2d)
             self._load_maximums(self._time_series_data_2d, self._maximum_data_2d)
@@ -489,7 +490,7 @@ class GPKG2D(GPKGBase, TimeSeries, ITimeSeries2D):
             data_types = [row[0] for row in cur.fetchall()]
             for dtype in data_types:
                 dtype1 = self._get_standard_data_type_name(dtype)
-                storage[dtype1] = self._gpkg_time_series_extractor(cur, dtype, self._gis_layer_p_name)
+                storage[dtype1] = self._gpkg_time_series(cur, dtype, self._gis_layer_p_name)
                 self._geoms[dtype1] = 'point'
 
         if self._gis_layer_l_name:
@@ -500,7 +501,7 @@ class GPKG2D(GPKGBase, TimeSeries, ITimeSeries2D):
             data_types = [row[0] for row in cur.fetchall()]
             for dtype in data_types:
                 dtype1 = self._get_standard_data_type_name(dtype)
-                storage[dtype1] = self._gpkg_time_series_extractor(cur, dtype, self._gis_layer_l_name)
+                storage[dtype1] = self._gpkg_time_series(cur, dtype, self._gis_layer_l_name)
                 self._geoms[dtype1] = 'line'
 
         if self._gis_layer_r_name:
@@ -511,16 +512,21 @@ class GPKG2D(GPKGBase, TimeSeries, ITimeSeries2D):
             data_types = [row[0] for row in cur.fetchall()]
             for dtype in data_types:
                 dtype1 = 'max water level' if dtype.lower() == 'max water level' else self._get_standard_data_type_name(dtype)
-                storage[dtype1] = self._gpkg_time_series_extractor(cur, dtype, self._gis_layer_r_name)
+                storage[dtype1] = self._gpkg_time_series(cur, dtype, self._gis_layer_r_name)
                 self._geoms[dtype1] = 'polygon'
 
     @staticmethod
     def _load_maximums(time_series_storage: AppendDict, storage: AppendDict) -> None:
         for data_type, results in time_series_storage.items():
             for res in results:
-                max_ = res.max()
-                tmax = res.idxmax()
-                storage[data_type] = pd.DataFrame({'max': max_, 'tmax': tmax})
+                if isinstance(res, TimeSeriesCSV):
+                    storage[data_type] = TimeSeriesCSVMaximums(res, GPKG2D._calc_maximums)
+                else:
+                    storage[data_type] = GPKG2D._calc_maximums(res)
+
+    @staticmethod
+    def _calc_maximums(res: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({'max': res.max(), 'tmax': res.idxmax()})
 
     def _load_info_2d(self, cur: 'Cursor', time_series_data: dict) -> pd.DataFrame:
         info = {'id': [], 'data_type': [], 'geometry': [], 'start': [], 'end': [], 'dt': []}
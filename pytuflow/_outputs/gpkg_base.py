@@ -1,18 +1,30 @@
+import threading
+import typing
+import weakref
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 try:
     import pandas as pd
 except ImportError:
     from .pymesh.stubs import pandas as pd
 
+from .helpers.time_series_csv import TimeSeriesCSV, STORE_TYPES, _ColumnBlocks
+from ..util import pytuflow_logging
+
 if TYPE_CHECKING:
-    from sqlite3 import Cursor
+    from sqlite3 import Connection, Cursor
 
 import re
 
 _VALID_IDENTIFIER = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_\s\\-]*$")
+_VIEW_JOIN = re.compile(r'\bFROM\s+"?(\w+)"?\s+LEFT\s+JOIN\s+"?(\w+)"?\s+ON\s+\1\.(\w+)\s*==?\s*\2\.fid\b',
+                        re.IGNORECASE)
+
+logger = pytuflow_logging.get_logger()
+
 
 def _safe_identifier(name: str) -> str:
     if not _VALID_IDENTIFIER.match(name):
@@ -20,10 +32,46 @@ def _safe_identifier(name: str) -> str:
     return '"' + name.replace('"', '""') + '"'
 
 
+class _ConnectionPool:
+    """Shared SQLite connections, one per file per thread (SQLite connections can't be shared across threads).
+
+    Each GeoPackage output owns a pool, so its connections (including those opened by worker threads) are closed
+    when the output is closed or garbage collected. Connections are opened with ``check_same_thread=False`` only so
+    they can be closed from another thread, each connection is still only used by the thread that opened it.
+    """
+
+    def __init__(self):
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def get(self, fpath: str | Path) -> 'Connection':
+        import sqlite3
+        key = (str(Path(fpath).resolve()), threading.get_ident())
+        with self._lock:
+            if key not in self._connections:
+                self._connections[key] = sqlite3.connect(fpath, check_same_thread=False)
+            return self._connections[key]
+
+    def close(self, fpath: str | Path = None):
+        fpath = str(Path(fpath).resolve()) if fpath is not None else None
+        with self._lock:
+            for key in [x for x in self._connections if fpath is None or x[0] == fpath]:
+                self._connections.pop(key).close()
+
+
 class GPKGBase:
 
+    #: bool: Create an index on ``(ID, Time_relative)`` for time series tables that don't have one. Requires write
+    #: access to the GeoPackage. Without the index, queries for a subset of IDs require a full table scan.
+    create_index = False
+
+    #: int: Number of rows fetched at a time when querying time series tables.
+    fetch_size = 50_000
+
     def __init__(self, *args, **kwargs):
         self.fpath = None
+        self._conn_pool = _ConnectionPool()
+        weakref.finalize(self, self._conn_pool.close)
         super().__init__(*args, **kwargs)
 
     @staticmethod
@@ -38,6 +86,20 @@ class GPKGBase:
             if conn is not None:
                 conn.close()
 
+    @contextmanager
+    def pooled_connection(self, fpath: str | Path):
+        """Context manager that returns a shared connection to the GeoPackage. Unlike :meth:`connect`, the
+        connection is not closed on exit and is reused by later calls for the same file (and thread) until
+        the output is closed (:meth:`close`) or garbage collected.
+        """
+        yield self._conn_pool.get(fpath)
+
+    def close(self):
+        """Closes the shared connections to the GeoPackage held by this output, including any opened by worker
+        threads. The connections are opened again if more results are read.
+        """
+        self._conn_pool.close()
+
     @staticmethod
     def _looks_empty(fpath: str | Path) -> bool:
         # docstring inherited
@@ -52,15 +114,290 @@ class GPKGBase:
             empty = True
         return empty
 
+    def _gpkg_time_series(self, cur: 'Cursor', dtype_name: str, table_name: str) -> 'GPKGTimeSeries':
+        """Returns a lazily loaded time series for a given data type from a given table. The data is queried
+        for the requested IDs only when it is first needed.
+        """
+        indexed = self._gpkg_ensure_index(cur, table_name)
+        return GPKGTimeSeries(self.fpath, table_name, dtype_name, self.fetch_size, indexed, self._conn_pool)
+
+    def _gpkg_ensure_index(self, cur: 'Cursor', table_name: str) -> bool:
+        """Returns whether the time series can be queried by ID using an index. Creates the indexes if they
+        don't exist and :attr:`create_index` is ``True``.
+
+        TUFLOW time series tables are views that join a datasets table to a geometry table, in which case the
+        indexes are required on the underlying tables (the datasets foreign key and the geometry ``ID``).
+        Otherwise, the index is required on ``(ID, Time_relative)``.
+        """
+        import sqlite3
+        view_tables = self._gpkg_view_tables(cur, table_name)
+        if view_tables:
+            dsets, geom, fk = view_tables
+            required = [(dsets, [fk, 'TimeId']), (geom, ['ID'])]
+        else:
+            required = [(table_name, ['ID', 'Time_relative'])]
+        missing = [(tbl, cols) for tbl, cols in required if not self._gpkg_has_index(cur, tbl, cols)]
+        if not missing:
+            return True
+        if not self.create_index:
+            return False
+        try:
+            for tbl, cols in missing:
+                idx_quoted = _safe_identifier(f'{tbl}_{"_".join(cols)}')
+                cols_quoted = ', '.join(_safe_identifier(x) for x in cols)
+                cur.execute(f'CREATE INDEX IF NOT EXISTS {idx_quoted} ON {_safe_identifier(tbl)} ({cols_quoted});')
+            cur.connection.commit()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f'GPKGBase._gpkg_ensure_index(): Unable to create index for {table_name}: {e}')
+            return False
+
+    @staticmethod
+    def _gpkg_has_index(cur: 'Cursor', table_name: str, cols: list[str]) -> bool:
+        """Returns whether the table has an index starting with the given columns."""
+        cur.execute(f'PRAGMA index_list({_safe_identifier(table_name)});')
+        for idx_name in [x[1] for x in cur.fetchall()]:
+            cur.execute(f'PRAGMA index_info({_safe_identifier(idx_name)});')
+            idx_cols = [x[2] for x in sorted(cur.fetchall())]
+            if [x.lower() for x in idx_cols[:len(cols)]] == [x.lower() for x in cols]:
+                return True
+        return False
+
     @staticmethod
-    def _gpkg_time_series_extractor(cur: 'Cursor', dtype_name: str, table_name: str) -> pd.DataFrame:
-        """Extract the time series data from a TUFLOW GeoPackage Time Series file for
-        a given data type from a given table.
+    def _gpkg_view_tables(cur: 'Cursor', table_name: str) -> tuple[str, str, str] | None:
+        """Returns the ``(datasets table, geometry table, foreign key)`` if the time series table is a TUFLOW view
+        of the form ``... FROM <datasets> LEFT JOIN <geometry> ON <datasets>.<foreign key> = <geometry>.fid ...``.
+        """
+        cur.execute("SELECT sql FROM sqlite_master WHERE type = 'view' AND name = ?;", (table_name,))
+        row = cur.fetchone()
+        if not row or not row[0]:
+            return None
+        m = _VIEW_JOIN.search(row[0])
+        if not m or not re.search(rf'\b{m.group(1)}\.rowid\s+as\s+fid\b', row[0], re.IGNORECASE):
+            return None
+        return m.group(1), m.group(2), m.group(3)
+
+    @staticmethod
+    def _gpkg_id_filter(view_tables: tuple[str, str, str] | None, n: int) -> str:
+        """Returns the SQL condition to filter a time series table on ``n`` IDs."""
+        params = ','.join('?' * n)
+        if not view_tables:
+            return f'ID IN ({params})'
+        dsets, geom, fk = [_safe_identifier(x) for x in view_tables]
+        return (f'fid IN (SELECT rowid FROM {dsets} WHERE {fk} IN '  # nosec B608
+                f'(SELECT fid FROM {geom} WHERE ID IN ({params})))')
+
+    @staticmethod
+    def _gpkg_time_series_query(cur: 'Cursor', dtype_name: str, table_name: str, ids: list[str],
+                                times: np.ndarray, start: float = None, end: float = None,
+                                fetch_size: int = 50_000, dtype: type = np.float64,
+                                full_scan: bool = False,
+                                view_tables: tuple[str, str, str] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Query the time series values for the given IDs (and optionally a time window) straight into a
+        (time x ID) array. Rows are fetched in batches into the preallocated array rather than building
+        a list of all rows and pivoting.
+
+        Parameters
+        ----------
+        cur : Cursor
+            The database cursor.
+        dtype_name : str
+            The column name of the data type.
+        table_name : str
+            The time series table name.
+        ids : list[str]
+            The IDs to query.
+        times : np.ndarray
+            The sorted time axis of the returned array.
+        start : float, optional
+            The start of the time window (inclusive).
+        end : float, optional
+            The end of the time window (inclusive).
+        fetch_size : int, optional
+            The number of rows to fetch at a time.
+        dtype : type, optional
+            The data type of the returned array. Use ``object`` for text columns.
+        full_scan : bool, optional
+            Scan the whole table rather than using an ``ID IN (...)`` query. Faster when most of the IDs
+            in the table are requested.
+        view_tables : tuple[str, str, str], optional
+            The ``(datasets table, geometry table, foreign key)`` behind a TUFLOW time series view. If given, the
+            IDs are filtered on the underlying tables so the query can use their indexes (SQLite does not use
+            indexes for an ``IN (...)`` filter on a column from the joined geometry table).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The values with shape ``(len(times), len(ids))`` and any times found in the table that are not
+            in ``times`` (rows at these times are not included in the values).
         """
         col_quoted = _safe_identifier(dtype_name)
         tbl_quoted = _safe_identifier(table_name)
-        cur.execute(f'SELECT ID, Time_relative, {col_quoted} FROM {tbl_quoted};')  # nosec B608
-        df = pd.DataFrame(cur.fetchall(), columns=['ID', 'time', dtype_name])
-        df = df.pivot(index='time', columns='ID', values=dtype_name)
-        df.columns.name = None  # to be consistent with other outputs
-        return df
+        a = np.full((len(times), len(ids)), np.nan, dtype=dtype)
+        other_times = []
+        id_index = pd.Index(ids)
+        # each batch of rows is unpacked into these (reused) columns
+        id_col = np.empty(fetch_size, dtype=object)
+        time_col = np.empty(fetch_size, dtype=np.float64)
+        val_col = np.empty(fetch_size, dtype=dtype)
+        chunks = [None] if full_scan else [ids[i:i+500] for i in range(0, len(ids), 500)]  # SQLite parameter limit
+        for chunk in chunks:
+            sql = f'SELECT ID, Time_relative, {col_quoted} FROM {tbl_quoted} WHERE 1'  # nosec B608
+            params = []
+            if chunk is not None:
+                sql += f' AND {GPKGBase._gpkg_id_filter(view_tables, len(chunk))}'
+                params.extend(chunk)
+            if start is not None:
+                sql += ' AND Time_relative >= ?'
+                params.append(start)
+            if end is not None:
+                sql += ' AND Time_relative <= ?'
+                params.append(end)
+            cur.execute(sql, params)
+            while True:
+                rows = cur.fetchmany(fetch_size)
+                if not rows:
+                    break
+                n = len(rows)
+                id_col[:n], time_col[:n], val_col[:n] = zip(*rows)
+                c = id_index.get_indexer(id_col[:n])
+                t = time_col[:n]
+                vals = val_col[:n]
+                if vals.dtype == object:
+                    vals = np.where(pd.isna(vals), np.nan, vals)
+                r = np.clip(np.searchsorted(times, t), 0, len(times) - 1)
+                valid = times[r] == t if len(times) else np.zeros(t.shape, dtype=bool)
+                if not valid[c != -1].all():
+                    other_times.extend(t[~valid & (c != -1)].tolist())
+                valid &= c != -1
+                a[r[valid], c[valid]] = vals[valid]
+        return a, np.unique(np.array(other_times, dtype=np.float64))
+
+
+class _GPKGStore:
+    """Column store for a single data type in a TUFLOW GeoPackage time series table. Follows the same
+    interface as the CSV column store so it can be used with :class:`TimeSeriesCSV`.
+    """
+
+    kind = 'gpkg'
+
+    def __init__(self, fpath: Path, table_name: str, dtype_name: str, fetch_size: int, indexed: bool,
+                 pool: _ConnectionPool = None):
+        self.fpath = Path(fpath)
+        self.table_name = table_name
+        self.dtype_name = dtype_name
+        self.fetch_size = fetch_size
+        self.indexed = indexed
+        self._pool = pool
+        if pool is None:
+            self._pool = _ConnectionPool()
+            weakref.finalize(self, self._pool.close)
+        self._lock = threading.Lock()
+        self._loaded = _ColumnBlocks()
+        cur = self._pool.get(self.fpath).cursor()
+        tbl_quoted = _safe_identifier(table_name)
+        self.view_tables = GPKGBase._gpkg_view_tables(cur, table_name)
+        if self.view_tables and self.indexed:
+            # avoids scanning the whole datasets table
+            dsets, geom, fk = [_safe_identifier(x) for x in self.view_tables]
+            cur.execute(f'SELECT DISTINCT ID FROM {geom} WHERE EXISTS '  # nosec B608
+                        f'(SELECT 1 FROM {dsets} WHERE {fk} = {geom}.fid) ORDER BY ID;')
+        else:
+            cur.execute(f'SELECT DISTINCT ID FROM {tbl_quoted} ORDER BY ID;')  # nosec B608
+        #: list[str]: The IDs in the table.
+        self.header = [x[0] for x in cur.fetchall()]
+        cur.execute(f'PRAGMA table_info({tbl_quoted});')
+        col_type = {x[1]: str(x[2]).upper() for x in cur.fetchall()}.get(dtype_name, '')
+        self.dtype = object if 'TEXT' in col_type or 'CHAR' in col_type else np.float64
+        # time axis - read from a single ID (uses the index) and extended if other IDs have other times
+        times = []
+        if self.header:
+            id_filter = GPKGBase._gpkg_id_filter(self.view_tables, 1)
+            cur.execute(f'SELECT Time_relative FROM {tbl_quoted} WHERE {id_filter} '  # nosec B608
+                        f'ORDER BY Time_relative;', (self.header[0],))
+            times = [x[0] for x in cur.fetchall()]
+        self._times = np.unique(np.array(times, dtype=np.float64))
+
+    @property
+    def index(self) -> pd.Index:
+        return pd.Index(self._times, name='time')
+
+    def values(self, positions: np.ndarray) -> np.ndarray:
+        with self._lock:
+            missing = self._loaded.missing(positions)
+            if missing.size:
+                ids = [self.header[x] for x in missing]
+                full_scan = missing.size > len(self.header) // 2
+                cur = self._pool.get(self.fpath).cursor()
+                a, other_times = GPKGBase._gpkg_time_series_query(
+                    cur, self.dtype_name, self.table_name, ids, self._times, fetch_size=self.fetch_size,
+                    dtype=self.dtype, full_scan=full_scan, view_tables=self.view_tables
+                )
+                if other_times.size:
+                    # results normally share a time axis, but make sure no timesteps are dropped if they don't
+                    self._extend_time_axis(other_times)
+                    a, _ = GPKGBase._gpkg_time_series_query(
+                        cur, self.dtype_name, self.table_name, ids, self._times, fetch_size=self.fetch_size,
+                        dtype=self.dtype, full_scan=full_scan, view_tables=self.view_tables
+                    )
+                self._loaded.add(missing, a)
+            return self._loaded.get(positions, self._times.size, self.dtype)
+
+    def cache_spec(self) -> dict:
+        """Returns the (JSON serialisable) arguments needed to recreate the store, see :meth:`from_cache_spec`."""
+        return {'kind': self.kind, 'fpath': str(self.fpath), 'table_name': self.table_name,
+                'dtype_name': self.dtype_name, 'fetch_size': self.fetch_size, 'indexed': self.indexed}
+
+    @classmethod
+    def from_cache_spec(cls, spec: dict, owner: typing.Any) -> '_GPKGStore':
+        """Recreates the store from :meth:`cache_spec`, using the connection pool of the owning output."""
+        return cls(spec['fpath'], spec['table_name'], spec['dtype_name'], spec['fetch_size'], spec['indexed'],
+                   getattr(owner, '_conn_pool', None))
+
+    def restore_index(self, index: np.ndarray):
+        """Adds the times (e.g. from a cache) to the time axis."""
+        self._extend_time_axis(np.asarray(index, dtype=np.float64))
+
+    def _extend_time_axis(self, times: np.ndarray):
+        new_times = np.union1d(self._times, times)
+        rows = np.searchsorted(new_times, self._times)
+        for i, block in enumerate(self._loaded.blocks):
+            values = np.full((new_times.size, block.shape[1]), np.nan, dtype=block.dtype)
+            values[rows] = block
+            self._loaded.blocks[i] = values
+        self._times = new_times
+
+
+STORE_TYPES[_GPKGStore.kind] = _GPKGStore
+
+
+class GPKGTimeSeries(TimeSeriesCSV):
+    """Lazily loaded time series for a single data type in a TUFLOW GeoPackage time series table.
+
+    Only the IDs and time axis are queried on initialisation. Values are queried (``ID IN (...)``) only for the
+    requested IDs and kept so later requests for the same IDs do not query the database. The returned ``DataFrame``
+    matches the pivoted table (index is ``Time_relative``, columns are the sorted IDs).
+
+    Parameters
+    ----------
+    fpath : PathLike
+        The path to the GeoPackage.
+    table_name : str
+        The time series table name.
+    dtype_name : str
+        The data type (column) name.
+    fetch_size : int, optional
+        The number of rows to fetch at a time.
+    indexed : bool, optional
+        Whether the table has the indexes required to query IDs without scanning the whole table.
+    pool : _ConnectionPool, optional
+        The connection pool of the output the time series belongs to. If not given, the time series uses its own.
+    """
+
+    def __init__(self, fpath: Path, table_name: str, dtype_name: str, fetch_size: int = 50_000,
+                 indexed: bool = False, pool: _ConnectionPool = None):
+        store = _GPKGStore(fpath, table_name, dtype_name, fetch_size, indexed, pool)
+        super().__init__(None, store=store, positions=np.arange(len(store.header)), columns=pd.Index(store.header))
+
+    def __repr__(self) -> str:
+        return f'<GPKGTimeSeries {self._store.table_name}::{self._store.dtype_name} ({len(self._columns)} columns)>'
@@ -386,7 +386,7 @@ class GPKGRL(GPKG2D):
         if self._loaded:
             return
 
-        with self.connect(self.fpath) as conn:
+        with self.pooled_connection(self.fpath) as conn:
             cur = conn.cursor()
             self._load_time_series(cur, self._time_series_data_rl)
             self._load_maximums(self._time_series_data_rl, self._maximum_data_rl)
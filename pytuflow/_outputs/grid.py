@@ -9,12 +9,15 @@ try:
 except ImportError:
     from .pymesh.stubs import pandas as pd
 
+from .helpers.frame_assembler import FrameAssembler
 from .helpers.grid_line import GridLine
+from .helpers.raster_tiles import RasterTiles
+from .helpers.surface_array import GridSurface
 from .grid_mesh import GridMesh
 from .map_output import MapOutput, PointLocation, Point, LineStringLocation
 from .._pytuflow_types import PathLike, TimeLike, TuflowPath
 
-from .pymesh import Cache, LineStringMixin, PointMixin, Bbox2D, Transform2D
+from .pymesh import Cache, LineStringMixin, PointMixin
 
 
 GRIDLINE_METHOD = 'optimised'  # 'legacy' or 'optimised'
@@ -71,6 +74,10 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
     197540  293778.75  6178586.25    NaN   False
     """
 
+    #: int: The memory budget (bytes) for raster tiles kept in :attr:`cache`. Raster files are read in tiles that
+    #: follow the file's block layout, so point and line extractions only read the part of the raster they need.
+    tile_cache_bytes = 64 * 1024 ** 2
+
     def __init__(self, fpath: PathLike | dict):
         d = None
         if isinstance(fpath, dict):
@@ -83,7 +90,7 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
         self.cache = Cache()
         self._cached_timesteps = {}
         self._cached_data = {}
-        self._data = None
+        self._tiles = None
 
         if d is None:
             if not TuflowPath(fpath).exists():
@@ -204,14 +211,38 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
                 }
             )
 
+    def close(self):
+        """Closes the raster file if it has been opened for reading."""
+        if self._tiles is not None:
+            self._tiles.close()
+
     def _value(self, dtype: str, idx: tuple | int | np.ndarray | slice) -> float | np.ndarray:
-        if self._data is None:
-            with TuflowPath(self.fpath).open_grid() as grid:
-                self._data = grid.as_array()
-        return self._data[idx]
+        if self._tiles is None:
+            self._tiles = RasterTiles(self.fpath, self.cache, max_bytes=self.tile_cache_bytes)
+        return self._tiles[idx]
 
-    def _surface(self, dtype: str, time_index: int | np.ndarray | slice) -> np.ndarray:
+    def _value_at(self, dtype: str, time_index: int, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Returns the values for the given cells. Uses the loaded surface if it's available, otherwise only the
+        cells are read.
+        """
+        is_static = self._is_static(dtype)
+        cached = self._cached_timesteps.get(dtype.lower(), ())
+        if is_static and cached:
+            return self._cached_data[dtype.lower()][rows, cols]
+        if not is_static and time_index in cached:
+            return self._cached_data[dtype.lower()][time_index, rows, cols]
+        idx = (rows, cols) if is_static else (time_index, rows, cols)
+        return np.asarray(self._value(dtype, idx), dtype=float)
+
+    def _time_series_values(self, dtype: str, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Returns the values (ntimes x ncells) for every timestep for the given cells."""
+        return np.asarray(self._value(dtype, (slice(None), rows, cols)), dtype=float)
+
+    def _surface(self, dtype: str, time_index: int | np.ndarray | slice | tuple,
+                 window: tuple[int, int, int, int] = None) -> np.ndarray:
         is_static = self._is_static(dtype)
+        if window is not None:
+            return self._surface_window(dtype, time_index, window)
         if dtype.lower() not in self._cached_timesteps:
             self._cached_timesteps[dtype.lower()] = set()
             _, _, _, _, ncol, nrow, _ = self._grid_info(dtype)
@@ -220,14 +251,13 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
 
         # special treatment if time_index is slice(None)
         if not is_static and isinstance(time_index, slice) and time_index == slice(None):
-            vals = self._value(dtype, time_index)
+            vals = np.asarray(self._value(dtype, time_index), dtype=float)
             for i, val in enumerate(vals):
                 if i not in self._cached_timesteps[dtype.lower()]:
                     self._cached_data[dtype.lower()][i, ...] = val
                     self._cached_timesteps[dtype.lower()].add(i)
             return vals
 
-
         if isinstance(time_index, (int, np.int32, np.int64)):
             time_indexes = {time_index}
         elif not is_static and isinstance(time_index, slice):
@@ -247,15 +277,28 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
                     self._cached_data[dtype.lower()][:] = val
                 else:
                     self._cached_data[dtype.lower()][idx, ...] = val
-                self._cached_timesteps[dtype.lower()].add(time_index)
-            else:
-                val = self._cached_data[dtype.lower()][ti] if not is_static else self._cached_data[dtype.lower()]
-            data.append(val.copy())
+                self._cached_timesteps[dtype.lower()].add(ti)
+            # always returned from the (float) cache, copied so the caller can't modify the cache
+            val = self._cached_data[dtype.lower()][ti] if not is_static else self._cached_data[dtype.lower()]
+            data.append(np.array(val, dtype=float))
 
         if len(data) == 1:
             return data[0]
         return np.array(data).reshape(len(time_indexes), *data[0].shape)
 
+    def _surface_window(self, dtype: str, time_index: int | tuple, window: tuple[int, int, int, int]) -> np.ndarray:
+        # rows r0:r1 and columns c0:c1 of the surface, only the window is read if the surface isn't already loaded
+        r0, r1, c0, c1 = window
+        is_static = self._is_static(dtype)
+        ti = time_index[0] if isinstance(time_index, tuple) else time_index
+        cached = self._cached_timesteps.get(dtype.lower(), ())
+        if is_static and cached:
+            return self._cached_data[dtype.lower()][r0:r1, c0:c1].copy()
+        if not is_static and ti in cached:
+            return self._cached_data[dtype.lower()][ti, r0:r1, c0:c1].copy()
+        idx = (slice(r0, r1), slice(c0, c1)) if is_static else (ti, slice(r0, r1), slice(c0, c1))
+        return np.array(self._value(dtype, idx), dtype=float)
+
     def to_mesh(self, base_topology: 'str | Grid | None' = None) -> GridMesh:
         """Converts the grid to a :class:`GridMesh<pytuflow.GridMesh>` object, essentially converting the grid
         data structure into a mesh data structure. This can be useful for exporting into other formats that can
@@ -402,7 +445,9 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
         return df
 
     def surface(self, data_type: str = None, time: TimeLike = 0, to_vertex: bool = False, coord_scope: str = 'global',
-                direction_to_vector: bool = False, direction_convention = 'arithmetic') -> pd.DataFrame:
+                direction_to_vector: bool = False, direction_convention = 'arithmetic',
+                bbox: tuple[float, float, float, float] = None,
+                return_type: str = 'dataframe') -> pd.DataFrame | GridSurface:
         """Returns the value for every cell/vertex at the specified time.
 
         Parameters
@@ -429,11 +474,23 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
 
             - ``"arithmetic"`` (default) - direction is measured anticlockwise from the positive x-axis (east)
             - ``"nautical"`` - direction is measured clockwise from the positive y-axis (north)
+        bbox : tuple[float, float, float, float], optional
+            Clip the surface to the cells that intersect the bounding box ``(xmin, ymin, xmax, ymax)``. For raster
+            files, only the clipped part of the raster is read.
+        return_type : str, optional
+            The return type. Options are:
+
+            - ``"dataframe"`` (default) - a DataFrame with a row for every cell/vertex
+            - ``"array"`` - a :class:`GridSurface <pytuflow.GridSurface>` holding the 2D value array, the active mask
+              and the cell size/origin. No coordinates are generated, so this is much lighter on memory for large
+              grids. The DataFrame can still be created later with :meth:`GridSurface.to_frame()
+              <pytuflow.GridSurface.to_frame>`.
 
         Returns
         -------
-        pd.DataFrame
-            The surface data as a DataFrame with columns for the coordinates, value(s), and active mask.
+        pd.DataFrame | GridSurface
+            The surface data as a DataFrame with columns for the coordinates, value(s), and active mask, or a
+            :class:`GridSurface <pytuflow.GridSurface>` if ``return_type="array"``.
 
         Examples
         --------
@@ -459,6 +516,8 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
                 data_type = self._info.iloc[0]['data_type']
         else:
             data_type = self._figure_out_data_types(data_type, None)[0]
+        if return_type not in ('dataframe', 'array'):
+            raise ValueError(f'Invalid return type: {return_type}')
         if self._is_static(data_type):
             idx = -1
         else:
@@ -467,14 +526,23 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
             idx = (time_index,)
 
         dx, dy, ox, oy, ncol, nrow, ndv = self._grid_info(data_type)
-
-        data = self._surface(data_type, idx)
+        window = None
+        hr = hc = 0  # offset of the bbox window within the cells that are read
+        if bbox is not None:
+            window = self._bbox_window(bbox, dx, dy, ox, oy, ncol, nrow)
+            r0, r1, c0, c1 = window
+            if to_vertex:  # read a one cell halo so the vertices on the bbox edge average the same cells as surface()
+                window = max(r0 - 1, 0), min(r1 + 1, nrow), max(c0 - 1, 0), min(c1 + 1, ncol)
+                hr, hc = r0 - window[0], c0 - window[2]
+            ox, oy, ncol, nrow = ox + c0 * dx, oy + r0 * dy, c1 - c0, r1 - r0
+
+        data = self._surface(data_type, idx, window)
         vec = None
         vx = vy = None
         # convert direction data to vector data
         if data_type.endswith(' direction') and (direction_to_vector or to_vertex):
             mag_dtype, _ = data_type.rsplit(' ', 1)
-            mag_data = self._surface(mag_dtype, idx)
+            mag_data = self._surface(mag_dtype, idx, window)
             if direction_convention == 'arithmetic':
                 vx = mag_data * np.cos(np.radians(data))
                 vy = mag_data * np.sin(np.radians(data))
@@ -490,15 +558,14 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
         mask = (~np.isnan(data)) & (data != ndv)
         data[~mask] = np.nan
         if to_vertex:
-            x = ox + np.arange(ncol + 1) * dx
-            y = oy + np.arange(nrow + 1) * dy
+            x0, y0 = ox, oy
 
             # average values to vertices (from cell centres, this is the same as bilinear interpolation)
             # pad the data with the edge values to handle the boundaries
             vals = []
             data_ = [vx, vy] if vec is not None else [data]
             for dat in data_:
-                vertices = np.full((nrow + 2, ncol + 2), np.nan)
+                vertices = np.full((dat.shape[0] + 2, dat.shape[1] + 2), np.nan)
                 vertices[1:-1, 1:-1] = dat
                 vertices[0, 1:-1] = data[0, :]
                 vertices[-1, 1:-1] = data[-1, :]
@@ -516,7 +583,7 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
                             vertices[1:, 1:]
                         ]),
                         axis=0
-                    )
+                    )[hr:hr + nrow + 1, hc:hc + ncol + 1]
                 mask = ~np.isnan(vertices)
                 vals.append(vertices)
             if is_vector:
@@ -526,31 +593,15 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
             else:
                 data = vals[0]
         else:
-            x = (ox + dx / 2.) + np.arange(ncol) * dx
-            y = (oy + dy / 2.) + np.arange(nrow) * dy
+            x0, y0 = ox + dx / 2., oy + dy / 2.
             if vec is not None:
                 data = vec
 
-        if coord_scope == 'local':
-            xy = np.column_stack((x, y))
-            bbox = Bbox2D(xy)
-            shift = (
-                -bbox.x.min - bbox.width / 2,
-                -bbox.y.min - bbox.height / 2
-            )
-            trans = Transform2D(translate=shift)
-            x, y = trans.transform(xy).T
-
-        xx, yy = np.meshgrid(x, y)
+        if coord_scope == 'local':  # move the origin to the centre of the extent
+            x0, y0 = -(data.shape[1] - 1) * dx / 2., -(data.shape[0] - 1) * dy / 2.
 
-        if is_vector:
-            df = pd.DataFrame(
-                {'x': xx.flatten(), 'y': yy.flatten(), 'value-x': data[...,0].flatten(),
-                 'value-y': data[...,1].flatten(), 'active': mask.flatten()}
-            )
-        else:
-            df = pd.DataFrame({'x': xx.flatten(), 'y': yy.flatten(), 'value': data.flatten(), 'active': mask.flatten()})
-        return df
+        surf = GridSurface(data, mask, dx, dy, x0, y0)
+        return surf if return_type == 'array' else surf.to_frame()
 
     def data_point(self, locations: PointLocation, data_types: str | list[str] = (),
                    time: TimeLike = 0) -> float | tuple[float, float] | pd.DataFrame:
@@ -680,24 +731,38 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
         df = pd.DataFrame()
         pnts = self._translate_point_location(locations)
         data_types = self._figure_out_data_types(data_types, 'temporal')
-        for name, pnt in pnts.items():
-            wkt = self._point_as_wkt(self._coerce_into_point(pnt))
-            df1 = pd.DataFrame()
+        wkts = {name: self._point_as_wkt(self._coerce_into_point(pnt)) for name, pnt in pnts.items()}
+
+        # extract all the points in one go for each data type
+        values = {}
+        for dtype in data_types:
+            dx, dy, ox, oy, ncol, nrow, _ = self._grid_info(dtype)
+            todo = []
+            for name, pnt in pnts.items():
+                cached = self.cache.get('time_series', dtype, wkts[name], default=None)
+                if cached is not None:
+                    values[(name, dtype)] = cached
+                    continue
+                n, m = self._get_xy_index(pnt, dx, dy, ox, oy, ncol, nrow)
+                if n is not None:
+                    todo.append((name, n, m))
+            if not todo:
+                continue
+            names, rows, cols = zip(*todo)
+            vals = self._time_series_values(dtype, np.array(rows), np.array(cols))
+            for i, name in enumerate(names):
+                values[(name, dtype)] = vals[:, i].copy()
+                self.cache.set(values[(name, dtype)], 'time_series', dtype, wkts[name])
+
+        frame = FrameAssembler()
+        times = {dtype: self.times(dtype, fmt=time_fmt) for dtype in data_types}
+        for name in pnts:
             for dtype in data_types:
-                if self.cache.contains('time_series', dtype, wkt):
-                    vals = self.cache.get('time_series', dtype, wkt)
-                else:
-                    dx, dy, ox, oy, ncol, nrow, _ = self._grid_info(dtype)
-                    n, m = self._get_xy_index(pnt, dx, dy, ox, oy, ncol, nrow)
-                    if n is None:
-                        continue
-                    vals = self._value(dtype, (slice(None), n, m))
-                    self.cache.set(vals, 'time_series', dtype, wkt)
-                vals = np.column_stack((self.times(dtype, fmt=time_fmt), vals))
-                df2 = pd.DataFrame(vals, columns=['time', f'{name}/{dtype}'])
-                df2.set_index('time', inplace=True)
-                df1 = pd.concat([df1, df2], axis=1) if not df1.empty else df2
-            df = pd.concat([df, df1], axis=1) if not df.empty else df1
+                if (name, dtype) not in values:
+                    continue
+                frame.add(times[dtype], values[(name, dtype)], [f'{name}/{dtype}'])
+        if len(frame):
+            df = frame.to_frame()
 
         return df
 
@@ -760,39 +825,62 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
                 data_types = [self._info.iloc[0]['data_type']]
         else:
             data_types = self._figure_out_data_types(data_types, None)
-        for name, line in lines.items():
-            df1 = pd.DataFrame()
-            wkt = self._linestring_as_wkt(self._coerce_into_line(line))
-            if GRIDLINE_METHOD == 'legacy':
-                gridline = GridLine(*self._grid_info(data_types[0]))
+        # trace the lines that are not already cached in one pass
+        info = self._grid_info(data_types[0])
+        if GRIDLINE_METHOD == 'legacy':
+            gridline = GridLine(*info)
+            traced = {}
+            for name, line in lines.items():
                 nm = np.array([(x.offsets[0], x.offsets[1], x.n, x.m) for x in gridline.cells_along_line(line)])
-                mask = np.full(nm.shape[0], True, dtype=bool)
-                rows = nm[:, 2].flatten().astype(int)
-                cols = nm[:, 3].flatten().astype(int)
-                offsets = nm[:, :2].flatten()
-            else:
-                if self.cache.contains('gridline', wkt):
-                    nm, intersections = self.cache.get('gridline', wkt)
+                traced[name] = (nm[:, 2:].astype(int), nm[:, :2])
+        else:
+            wkts = {name: self._linestring_as_wkt(self._coerce_into_line(line)) for name, line in lines.items()}
+            found, todo = {}, {}
+            for name, wkt in wkts.items():
+                if wkt in found or wkt in todo:
+                    continue
+                cached = self.cache.get('gridline', wkt, default=None)
+                if cached is not None:
+                    found[wkt] = cached
                 else:
-                    nm, intersections = self.gridline(line, *self._grid_info(data_types[0]))
-                    self.cache.set((nm, intersections), 'gridline', wkt)
-                mask = nm[:, 0] >= 0
-                rows = nm[mask, 0].flatten().astype(int)
-                cols = nm[mask, 1].flatten().astype(int)
-                offsets = np.repeat(intersections[:, 0], 2)[1:-1]
+                    todo[wkt] = lines[name]
+            if todo:
+                dx, dy, ox, oy, ncol, nrow = info[:6]
+                indptr, cells, intersections = self.gridlines(list(todo.values()), dx, dy, ox, oy, nrow, ncol)
+                for k, wkt in enumerate(todo):
+                    found[wkt] = (cells[indptr[k]:indptr[k + 1]], intersections[indptr[k] + k:indptr[k + 1] + k + 1])
+                    self.cache.set(found[wkt], 'gridline', wkt)
+            traced = {}
+            for name, wkt in wkts.items():
+                nm, intersections = found[wkt]
+                traced[name] = (nm, np.column_stack((intersections[:-1, 0], intersections[1:, 0])))
+
+        # gather the values for all lines with a single lookup per data type
+        rc = np.concatenate([x[0] for x in traced.values()]) if traced else np.empty((0, 2), dtype=int)
+        mask = rc[:, 0] >= 0
+        split = np.cumsum([x[0].shape[0] for x in traced.values()])[:-1]
+        values = {}
+        for dtype in data_types:
+            val = np.full(rc.shape[0], np.nan)
+            if self._is_static(dtype):
+                val[mask] = self._value_at(dtype, -1, rc[mask, 0], rc[mask, 1])
+            else:
+                times = self.times(dtype, fmt='absolute') if isinstance(time, datetime) else self.times(dtype)
+                timeidx = self._closest_time_index(times, time, method='closest')
+                val[mask] = self._value_at(dtype, timeidx, rc[mask, 0], rc[mask, 1])
+            values[dtype] = np.split(val, split)
+
+        frames = []
+        for k, (name, (nm, offsets)) in enumerate(traced.items()):
+            if not nm.shape[0]:
+                continue
+            df1 = pd.DataFrame({'offset': offsets.flatten()})
             for dtype in data_types:
-                val = np.full(nm.shape[0], np.nan)
-                if self._is_static(dtype):
-                    val[mask] = self._surface(dtype, -1)[rows, cols]
-                else:
-                    times = self.times(dtype, fmt='absolute') if isinstance(time, datetime) else self.times(dtype)
-                    timeidx = self._closest_time_index(times, time, method='closest')
-                    val[mask] = self._surface(dtype, timeidx)[rows, cols]
-                df2 = pd.DataFrame(np.repeat(val, 2), columns=[dtype], index=offsets)
-                df2.index.name = 'offset'
-                df1 = pd.concat([df1, df2], axis=1) if not df1.empty else df2
-
-            df = self._merge_line_dataframe(df, df1, name, reset_index=True)
+                df1[dtype] = np.repeat(values[dtype][k], 2)
+            df1.columns = pd.MultiIndex.from_tuples([(name, x) for x in df1.columns])
+            frames.append(df1)
+        if frames:
+            df = pd.concat(frames, axis=1) if len(frames) > 1 else frames[0]
 
         return df
 
@@ -815,6 +903,17 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
         n = int((y - oy) / dy)
         return n, m
 
+    @staticmethod
+    def _bbox_window(bbox: tuple[float, float, float, float], dx: float, dy: float, ox: float, oy: float, ncol: int,
+                     nrow: int) -> tuple[int, int, int, int]:
+        # rows and columns (r0, r1, c0, c1) of the cells that intersect the bounding box
+        xmin, ymin, xmax, ymax = bbox
+        c0 = int(np.clip(np.floor((xmin - ox) / dx), 0, ncol))
+        c1 = int(np.clip(np.ceil((xmax - ox) / dx), c0, ncol))
+        r0 = int(np.clip(np.floor((ymin - oy) / dy), 0, nrow))
+        r1 = int(np.clip(np.ceil((ymax - oy) / dy), r0, nrow))
+        return r0, r1, c0, c1
+
     def _grid_info(self, dtype: str) -> tuple[float, float, float, float, int, int, float]:
         return self._info[self._info['data_type'] == dtype].iloc[0, :][['dx', 'dy', 'ox', 'oy', 'ncol', 'nrow', 'nodatavalue']].values
 
@@ -832,23 +931,7 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
                  *args, **kwargs
                  ) -> tuple[np.ndarray, np.ndarray]:
         """no-doc"""
-        cells = np.array([])
-        intersections = np.array([])
-        line = LineStringMixin._coerce_into_line(line)
-        for i in range(1, line.shape[0]):
-            seg = line[i - 1:i + 1, :2]
-            cells_, intersections_ = Grid.gridline_segment(seg, dx, dy, ox, oy, nrow, ncol)
-
-            if cells.size == 0:
-                cells = cells_
-                intersections = intersections_
-            else:
-                if cells_.size > 0:
-                    cells = np.vstack([cells, cells_])
-                if intersections_.size > 0:
-                    intersections_[:, 0] += intersections[-1, 0]
-                    intersections = np.vstack([intersections, intersections_[1:, :]])
-
+        _, cells, intersections = Grid.gridlines([line], dx, dy, ox, oy, nrow, ncol)
         return cells, intersections
 
     @staticmethod
@@ -861,101 +944,122 @@ class Grid(MapOutput, LineStringMixin, PointMixin):
                          ncol: int,
                          ) -> tuple[np.ndarray, np.ndarray]:
         """no-doc"""
-        def clip_segment_to_aabb(x0_, y0_, x1_, y1_, xmin_, xmax_, ymin_, ymax_):
-            dx = x1_ - x0_
-            dy = y1_ - y0_
-
-            p = np.array([-dx, dx, -dy, dy])
-            q = np.array([x0_ - xmin_, xmax_ - x0_, y0_ - ymin_, ymax_ - y0_])
-
-            t0, t1 = 0.0, 1.0
-
-            for pi, qi in zip(p, q):
-                if pi == 0:
-                    if qi < 0:
-                        return None
-                else:
-                    t = qi / pi
-                    if pi < 0:
-                        t0 = max(t0, t)
-                    else:
-                        t1 = min(t1, t)
-
-            if t0 > t1:
-                return None
+        return Grid.gridline(np.asarray(line)[:2, :2], dx, dy, ox, oy, nrow, ncol)
 
-            return t0, t1
-
-        p0 = line[0]
-        p1 = line[1]
-        x0, y0 = p0
-        x1, y1 = p1
-
-        # Direction
-        vx = x1 - x0
-        vy = y1 - y0
-
-        # Grid extent
+    @staticmethod
+    def gridlines(lines: list[list[tuple[float, float]]],
+                  dx: float,
+                  dy: float,
+                  ox: float,
+                  oy: float,
+                  nrow: int,
+                  ncol: int,
+                  *args, **kwargs
+                  ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """no-doc"""
+        # Traces all segments of all lines through the grid in one pass. The result is a flat (CSR style) table:
+        # line i crosses cells[indptr[i]:indptr[i + 1]] (row, col), or (-1, -1) where the line is outside the grid,
+        # and has intersections[indptr[i] + i:indptr[i + 1] + i + 1] (offset, x, y) at the start/end of each cell.
+        lines = [LineStringMixin._coerce_into_line(x)[:, :2].astype(np.float64) for x in lines]
+        dx, dy, ox, oy, nrow, ncol = float(dx), float(dy), float(ox), float(oy), int(nrow), int(ncol)
+        nseg = np.array([x.shape[0] - 1 for x in lines], dtype=np.int64)
+        if (nseg < 0).any():
+            raise ValueError('Line must contain at least one vertex')
+        if not nseg.all():
+            # a single vertex line crosses no cells but still gets its one intersection (offset 0 at the vertex),
+            # so the intersections of the lines after it stay at indptr + i
+            valid = np.flatnonzero(nseg)
+            indptr_, cells, intersections_ = Grid.gridlines([lines[i] for i in valid], dx, dy, ox, oy, nrow, ncol)
+            ncell = np.zeros(len(lines), dtype=np.int64)
+            ncell[valid] = np.diff(indptr_)
+            chunks = [np.array([[0., *x[0]]]) for x in lines]
+            for k, i in enumerate(valid):
+                chunks[i] = intersections_[indptr_[k] + k:indptr_[k + 1] + k + 1]
+            return np.append(0, np.cumsum(ncell)), cells, np.concatenate(chunks)
+        if not lines:
+            return np.zeros(1, dtype=np.int64), np.empty((0, 2), dtype=np.int64), np.empty((0, 3))
+        pts = np.vstack(lines)
+        is_seg = np.ones(pts.shape[0], dtype=bool)
+        is_seg[np.cumsum(nseg + 1) - 1] = False  # the last vertex of each line does not start a segment
+        seg_line = np.repeat(np.arange(len(lines)), nseg)
+        i0 = np.flatnonzero(is_seg)
+        x0, y0, x1, y1 = pts[i0, 0], pts[i0, 1], pts[i0 + 1, 0], pts[i0 + 1, 1]
+        vx, vy = x1 - x0, y1 - y0
+        nseg_total = x0.size
+
+        # clip each segment to the grid extent (Liang-Barsky)
         xmin, xmax = ox, ox + ncol * dx
         ymin, ymax = oy, oy + nrow * dy
-
-        clip = clip_segment_to_aabb(x0, y0, x1, y1, xmin, xmax, ymin, ymax)
-
-        intersections = []
-        cells = []
-
-        if clip is None:  # line is completely outside
-            intersections = np.array([
-                [x0, y0, 0.0],
-                [x1, y1, 1.0]
-            ])
-            cells = np.array([[-1, -1]])
-            return cells, intersections
-
-        t0, t1 = clip
-
-        # Add outside start
-        if t0 > 0:
-            intersections.append([x0, y0])
-            cells.append([-1, -1])
-
-        x_lines = ox + np.arange(0, ncol + 1) * dx
-        y_lines = oy + np.arange(0, nrow + 1) * dy
-
-        t_x = (x_lines - x0) / vx if vx != 0 else np.empty(0)
-        t_y = (y_lines - y0) / vy if vy != 0 else np.empty(0)
-
-        t_cross = np.concatenate([t_x, t_y])
-        t_cross = t_cross[(t_cross > t0) & (t_cross < t1)]
-        t_cross = np.unique(t_cross)
-        t_cross.sort()
-
-        # Build full ordered t sequence for inside portion
-        t_inside = np.concatenate([[t0], t_cross, [t1]])
-
-        # Entry point
-        intersections.append([x0 + t0 * vx, y0 + t0 * vy])
-
-        for ta, tb in zip(t_inside[:-1], t_inside[1:]):
-            tmid = 0.5 * (ta + tb)
-            xm = x0 + tmid * vx
-            ym = y0 + tmid * vy
-
-            col = int(np.floor((xm - ox) / dx))
-            row = int(np.floor((ym - oy) / dy))
-
-            cells.append([row, col])
-            intersections.append([x0 + tb * vx, y0 + tb * vy])
-
-        # Add outside end
-        if t1 < 1:
-            intersections.append([x1, y1])
-            cells.append([-1, -1])
-
-        intersections = np.array(intersections)
-        intersections = np.column_stack((
-            np.linalg.norm(intersections - np.array([x0, y0]), axis=1),
-            intersections
-        ))
-
-        return np.array(cells), intersections
+        t0, t1 = np.zeros(nseg_total), np.ones(nseg_total)
+        inside = np.ones(nseg_total, dtype=bool)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for p, q in ((-vx, x0 - xmin), (vx, xmax - x0), (-vy, y0 - ymin), (vy, ymax - y0)):
+                inside &= ~((p == 0) & (q < 0))
+                t = q / p
+                t0 = np.where(p < 0, np.maximum(t0, t), t0)
+                t1 = np.where(p > 0, np.minimum(t1, t), t1)
+        inside &= t0 <= t1
+
+        # grid line crossings strictly between the entry and exit of each segment
+        seg_cross, t_cross = [], []
+        for v, a, o, d, n in ((vx, x0, ox, dx, ncol), (vy, y0, oy, dy, nrow)):
+            ok = inside & (v != 0)
+            ea, eb = a + t0 * v, a + t1 * v
+            lo = np.clip(np.floor((np.minimum(ea, eb) - o) / d) - 1, 0, n).astype(np.int64)
+            hi = np.clip(np.ceil((np.maximum(ea, eb) - o) / d) + 1, 0, n).astype(np.int64)
+            count = np.where(ok, hi - lo + 1, 0)
+            seg = np.repeat(np.arange(nseg_total), count)
+            i = lo[seg] + np.arange(seg.size) - np.repeat(np.cumsum(count) - count, count)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = ((o + i * d) - a[seg]) / v[seg]
+            keep = (t > t0[seg]) & (t < t1[seg])
+            seg_cross.append(seg[keep])
+            t_cross.append(t[keep])
+        seg_cross, t_cross = np.concatenate(seg_cross), np.concatenate(t_cross)
+        order = np.lexsort((t_cross, seg_cross))
+        seg_cross, t_cross = seg_cross[order], t_cross[order]
+        unique = np.ones(seg_cross.size, dtype=bool)
+        unique[1:] = (seg_cross[1:] != seg_cross[:-1]) | (t_cross[1:] != t_cross[:-1])
+        seg_cross, t_cross = seg_cross[unique], t_cross[unique]
+
+        # the ordered points along each segment
+        # rank: 0 = segment start (outside the grid), 1 = entry, 2 = crossing, 3 = exit, 4 = segment end (outside)
+        segs = np.arange(nseg_total)
+        starts = ~inside | (t0 > 0)
+        ends = ~inside | (t1 < 1)
+        pt_seg = np.concatenate([segs[starts], segs[inside], seg_cross, segs[inside], segs[ends]])
+        pt_rank = np.repeat([0, 1, 2, 3, 4], [starts.sum(), inside.sum(), seg_cross.size, inside.sum(), ends.sum()])
+        pt_t = np.concatenate([np.zeros(starts.sum()), t0[inside], t_cross, t1[inside], np.ones(ends.sum())])
+        order = np.lexsort((pt_t, pt_rank, pt_seg))
+        pt_seg, pt_rank, pt_t = pt_seg[order], pt_rank[order], pt_t[order]
+        px = np.where(pt_rank == 0, x0[pt_seg], np.where(pt_rank == 4, x1[pt_seg], x0[pt_seg] + pt_t * vx[pt_seg]))
+        py = np.where(pt_rank == 0, y0[pt_seg], np.where(pt_rank == 4, y1[pt_seg], y0[pt_seg] + pt_t * vy[pt_seg]))
+        ddx, ddy = px - x0[pt_seg], py - y0[pt_seg]
+        dist = np.sqrt(ddx * ddx + ddy * ddy)
+
+        # a cell between each consecutive pair of points on a segment, located using the midpoint
+        a = np.flatnonzero(pt_seg[:-1] == pt_seg[1:])
+        cell_seg = pt_seg[a]
+        outside = (pt_rank[a] == 0) | (pt_rank[a + 1] == 4)
+        tmid = 0.5 * (pt_t[a] + pt_t[a + 1])
+        xm = x0[cell_seg] + tmid * vx[cell_seg]
+        ym = y0[cell_seg] + tmid * vy[cell_seg]
+        cells = np.column_stack((
+            np.where(outside, -1, np.clip(np.floor((ym - oy) / dy), 0, nrow - 1)),
+            np.where(outside, -1, np.clip(np.floor((xm - ox) / dx), 0, ncol - 1)),
+        )).astype(np.int64)
+
+        # chain the segments of each line - the offsets accumulate and the shared start point is dropped
+        seg_first = np.cumsum(nseg) - nseg
+        seg_last_pt = np.flatnonzero(np.append(pt_seg[1:] != pt_seg[:-1], True))
+        shift = np.zeros(nseg_total)
+        for j in range(1, int(nseg.max())):
+            s = seg_first[nseg > j] + j
+            shift[s] = shift[s - 1] + dist[seg_last_pt[s - 1]]
+        first_pt = np.append(True, pt_seg[1:] != pt_seg[:-1])
+        keep = ~first_pt | np.isin(pt_seg, seg_first)
+        dist = dist + shift[pt_seg]
+        intersections = np.column_stack((dist, px, py))[keep]
+        indptr = np.append(0, np.cumsum(np.bincount(seg_line[cell_seg], minlength=len(lines))))
+
+        return indptr, cells, intersections
@@ -1,13 +1,17 @@
+import csv
+import io
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Generator, Union
 
+import numpy as np
 try:
     import pandas as pd
 except ImportError:
     from ..pymesh.stubs import pandas as pd
 
+from .time_series_csv import TimeSeriesCSV, dedupe_header
 from ..._fm import ZZN
 
 
@@ -99,6 +103,40 @@ class FMResultDriver:
         """Loads the result file."""
         raise NotImplementedError
 
+    def time_series(self, res_type: str) -> pd.DataFrame:
+        """Returns the time series data for a given result type with the IDs as the column names.
+
+        Parameters
+        ----------
+        res_type: str
+            The result type.
+
+        Returns
+        -------
+        pd.DataFrame
+            The time series data.
+        """
+        try:
+            df = self.df.loc[:, self.df.columns.str.contains(f'^{res_type}::')]
+        except AttributeError:
+            df = self.df.loc[:, self.df.columns.str.contains(f'{res_type}::', regex=False)]
+        df.columns = [x.split('::')[1] for x in df.columns]
+        return df
+
+    def is_empty(self) -> bool:
+        """Returns whether the result file contains no results.
+
+        Returns
+        -------
+        bool
+            True if the result file is empty.
+        """
+        return self.df is None or self.df.empty
+
+    def close(self) -> None:
+        """Releases any open file handles or memory-mapped files held by the driver."""
+        pass
+
     @property
     def reference_time(self) -> Union[datetime, None]:
         #: datetime: reference time of the result file.
@@ -121,6 +159,15 @@ class FMGuiCSVResult(FMResultDriver):
     def __init__(self, fpath: Path):
         #: str: Header of the CSV file.
         self.header = None
+        #: np.ndarray: Preallocated (time x column) store holding every result type.
+        self.store = None
+        #: pd.MultiIndex: Columns of the store keyed by (result type, node).
+        self.columns = None
+        #: pd.Index: Time index shared by all result types (the union of the time steps of each result type).
+        self.index = None
+        # result type -> (ids, column slice in the store)
+        self._data = {}
+        self._df = None
         super().__init__(fpath)
         self.driver_name = 'csv-gui'
 
@@ -145,59 +192,75 @@ class FMGuiCSVResult(FMResultDriver):
     def display_name(self, value: str) -> None:
         pass
 
+    @property
+    def df(self) -> pd.DataFrame | None:
+        #: pd.DataFrame: DataFrame containing the result data. Built from the store when first used.
+        if self._df is None and self.store is not None:
+            self._df = pd.DataFrame(self.store, index=self.index, copy=False,
+                                    columns=[f'{res_type}::{x}' for res_type, x in self.columns])
+        return self._df
+
+    @df.setter
+    def df(self, value: pd.DataFrame | None) -> None:
+        self._df = value
+
     def load(self) -> None:
         # docstring inherited
-        self.header = self.get_header()
-        for res_type, ind, nrows in self.find_results():
+        # the file is read once, split into blocks and each block is copied into its columns of a single
+        # preallocated (time x (result type, node)) store. Blocks are aligned on the union of their time steps.
+        self._data, self._df = {}, None
+        blocks = {}
+        for res_type, lines in self._iter_blocks():
+            if lines is None:  # header line
+                self.header = res_type
+            elif len(lines) >= 2 and res_type not in blocks:
+                ids = dedupe_header(next(csv.reader(lines[:1]))[1:])
+                a = pd.read_csv(io.StringIO(''.join(lines[1:])), header=None).to_numpy(np.float64)
+                blocks[res_type] = (ids, pd.Index(a[:, 0], name='Time (hr)'), a[:, 1:])
+        if not blocks:
+            return
+
+        index = None
+        for _, idx, _ in blocks.values():
+            index = idx if index is None or idx.equals(index) else index.union(idx)
+        self.index = index
+        self.columns = pd.MultiIndex.from_tuples(
+            [(k, x) for k, (ids, _, _) in blocks.items() for x in ids], names=['Result Type', 'ID'])
+        self.store = np.full((index.size, self.columns.size), np.nan, dtype=np.float64)
+        i = 0
+        for res_type, (ids, idx, a) in blocks.items():
+            rows = slice(None) if idx.equals(index) else index.get_indexer(idx)
+            self.store[rows, i:i + len(ids)] = a
+            self._data[res_type] = (ids, slice(i, i + len(ids)))
+            i += len(ids)
             self.result_types.append(res_type)
-            df = pd.read_csv(self.fpath, skiprows=ind, nrows=nrows)
-            df.set_index('Time (hr)', inplace=True)
-            if not self.ids:
-                # noinspection PyUnresolvedReferences
-                self.ids = df.columns.tolist()
-            df.columns = [f'{res_type}::{x}' for x in df.columns]
-            if self.df is None:
-                self.df = df
-            else:
-                self.df = pd.concat([self.df, df], axis=1)
-
-    def get_header(self) -> str | None:
-        """Get the header of the CSV file. The GUI CSV may not always be exported with the header.
+        self.ids = next(iter(blocks.values()))[0]
+        self.timesteps = index.tolist()
 
-        Returns
-        -------
-        str
-            Header of the CSV file.
-        """
-        with self.fpath.open() as f:
-            line = f.readline()
-            if 'Output data from file' in line:
-                return line.strip()
-        return None
-
-
-    def find_results(self) -> Generator[tuple[str, int, int], None, None]:
-        """Find the start of the next result type in the file.
+    def time_series(self, res_type: str) -> pd.DataFrame:
+        # docstring inherited
+        ids, cols = self._data[res_type]
+        return pd.DataFrame(self.store[:, cols], index=self.index, columns=ids, copy=False)
 
-        Yields
-        ------
-        tuple[str, int, int]
-            Result type, start index, number of rows.
-        """
+    def _iter_blocks(self) -> Generator[tuple[str, list[str] | None], None, None]:
+        # yields the header (with None) if the file has one, then each result type with its lines (column names
+        # and data rows). The last block is not followed by a blank line.
         with self.fpath.open() as f:
-            start, nrows, type_, next_  = None, None, None, False
+            type_, lines, next_ = None, None, False
             for i, line in enumerate(f):
+                if i == 0 and 'Output data from file' in line:
+                    yield line.strip(), None
+                    continue
                 if not line.strip():
-                    next_ = True
+                    if type_:
+                        yield type_, lines
+                    type_, lines, next_ = None, None, True
                 elif next_:
-                    type_ = line.strip()
-                    next_ = False
-                elif type_ and not start:
-                    start = i
-
-                if next_ and start:
-                    yield type_, start, i - start - 1
-                    start, type_ = None, None
+                    type_, lines, next_ = line.strip(), [], False
+                elif type_:
+                    lines.append(line)
+            if type_:
+                yield type_, lines
 
 
 class FMPythonCSVResult(FMResultDriver):
@@ -258,19 +321,25 @@ class FMZZNResult(FMResultDriver):
         self.zzn = ZZN(self.fpath)
         self.ids = self.zzn.labels()
         self.timesteps = self.zzn.timesteps()
-        self.result_types = ['Flow', 'Stage', 'Froude', 'Velocity', 'Mode',  'State']
-        for res_type in self.result_types:
-            df = pd.DataFrame(self.zzn.get_time_series_data(res_type))
-            df.columns = [f'{res_type}::{x}' for x in self.ids]
-            df['Time (hr)'] = self.timesteps
-            df.set_index('Time (hr)', inplace=True)
-            if self.df is None:
-                self.df = df
-            else:
-                self.df = pd.concat([self.df, df], axis=1)
+        self.result_types = list(ZZN.RESULT_TYPES)
         self.display_name = self.fpath.stem
         self._reference_time = self.zzn.reference_time()
 
+    def time_series(self, res_type: str) -> TimeSeriesCSV:
+        # docstring inherited
+        # results are read from the memory-mapped file only for the IDs that are requested
+        store = _ZZNStore(self.zzn, res_type, self.timesteps)
+        return TimeSeriesCSV(None, store=store, positions=np.arange(len(self.ids)), columns=pd.Index(self.ids))
+
+    def is_empty(self) -> bool:
+        # docstring inherited
+        return not self.ids or not self.timesteps
+
+    def close(self) -> None:
+        # docstring inherited
+        if self.zzn is not None:
+            self.zzn.close()
+
     @property
     def reference_time(self) -> Union[datetime, None]:
         return self._reference_time
@@ -278,3 +347,23 @@ class FMZZNResult(FMResultDriver):
     @reference_time.setter
     def reference_time(self, value: datetime) -> None:
         pass
+
+
+class _ZZNStore:
+    """Column store for a single result type in a ZZN file. Follows the same interface as the CSV column store
+    so it can be used with :class:`TimeSeriesCSV`. Values are read from the memory-mapped ZZN when requested.
+    """
+
+    def __init__(self, zzn: ZZN, res_type: str, timesteps: list[float]):
+        self.fpath = zzn.fpath
+        self.header = zzn.labels()
+        self._zzn = zzn
+        self._res_type = res_type
+        self._index = pd.Index(np.array(timesteps, dtype=np.float64), name='Time (hr)')
+
+    @property
+    def index(self) -> pd.Index:
+        return self._index
+
+    def values(self, positions: np.ndarray) -> np.ndarray:
+        return self._zzn.values(self._res_type, np.asarray(positions, dtype=int))
@@ -0,0 +1,240 @@
+import typing
+from datetime import datetime
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    from ..pymesh.stubs import pandas as pd
+
+
+class FrameAssembler:
+    """Collects the column blocks of an extraction result (e.g. one block per location and data type) and
+    assembles them into the final ``DataFrame`` in a single step rather than growing the result with
+    ``pd.concat`` inside the extraction loops.
+
+    The blocks are aligned on the union of their indexes in the same way as ``pd.concat(axis=1)``. When all the
+    columns share the same floating point dtype, the values are written into a single pre-allocated array.
+
+    Parameters
+    ----------
+    index_name : str, optional
+        The name of the index of the assembled result. If ``None``, the name of the (unioned) block indexes is kept.
+    index_tol : float, optional
+        If set, the index of every block must match the index of the first block within this tolerance, and the
+        first block's index is used for all blocks. A ``ValueError`` is raised if they don't match.
+    """
+
+    def __init__(self, index_name: str | None = 'time', index_tol: float = None):
+        #: str | None: The name of the index of the assembled result.
+        self.index_name = index_name
+        #: float: The tolerance used to match the block indexes. ``None`` if the indexes are unioned instead.
+        self.index_tol = index_tol
+        self._blocks = []  # (index, values, columns) where values are 2D numpy arrays or a list of 1D arrays
+
+    def __repr__(self) -> str:
+        return f'<FrameAssembler {len(self._blocks)} blocks, {len(self.columns)} columns>'
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    @property
+    def columns(self) -> list[str]:
+        """list[str]: The column names of the assembled result."""
+        return [x for _, _, cols in self._blocks for x in cols]
+
+    def add(self, index: typing.Sequence, values: np.ndarray | list, columns: list[str]):
+        """Adds a block of columns.
+
+        Parameters
+        ----------
+        index : Sequence
+            The index of the block.
+        values : np.ndarray | list
+            The values - either a ``(nrow,)`` or ``(nrow, ncol)`` array, or a list of 1D arrays (one for each column)
+            which can have different dtypes.
+        columns : list[str]
+            The column names.
+        """
+        index = index if isinstance(index, pd.Index) else pd.Index(index)
+        if isinstance(values, list):
+            values = [x if isinstance(x, pd.api.extensions.ExtensionArray) else np.asarray(x) for x in values]
+        else:
+            values = np.asarray(values)
+            values = values.reshape(-1, 1) if values.ndim == 1 else values
+        if self.index_tol is not None and self._blocks:
+            index0 = self._blocks[0][0]
+            if index.size != index0.size or not np.isclose(index0, index, atol=self.index_tol, rtol=0).all():
+                raise ValueError('Time series index does not match between datasets.')
+            index = index0
+        self._blocks.append((index, values, list(columns)))
+
+    def add_frame(self, df: pd.DataFrame):
+        """Adds the columns of a ``DataFrame`` as a block.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to add.
+        """
+        if df.shape[1] and df.dtypes.nunique() == 1 and isinstance(df.dtypes.iloc[0], np.dtype):
+            self.add(df.index, df.to_numpy(), df.columns.tolist())
+        else:
+            # numpy backed columns are added as numpy arrays so numeric columns are recognised in a mixed frame
+            self.add(df.index, [df.iloc[:, i].to_numpy() if isinstance(df.dtypes.iloc[i], np.dtype)
+                                else df.iloc[:, i].array for i in range(df.shape[1])], df.columns.tolist())
+
+    @staticmethod
+    def absolute_time(reference_time: datetime, hours: typing.Sequence[float]) -> pd.DatetimeIndex:
+        """Converts relative times (hours) into absolute times in one vectorised step. The times are rounded to
+        the nearest microsecond (the same as adding a ``timedelta`` to the reference time) and returned with
+        nanosecond units (``datetime64[ns]``). ``NaN`` times become ``NaT``.
+
+        Parameters
+        ----------
+        reference_time : datetime
+            The reference time.
+        hours : Sequence[float]
+            The relative times in hours.
+
+        Returns
+        -------
+        pd.DatetimeIndex
+            The absolute times.
+        """
+        us = np.round(np.asarray(hours, dtype=np.float64) * 3.6e9)
+        return (reference_time + pd.to_timedelta(us, unit='us')).as_unit('ns')
+
+    def index(self) -> pd.Index:
+        """Returns the index of the assembled result i.e. the union of the block indexes.
+
+        Returns
+        -------
+        pd.Index
+            The assembled index.
+        """
+        if not self._blocks:
+            return pd.Index([])
+        index = self._blocks[0][0]
+        for idx, _, _ in self._blocks[1:]:
+            if idx is not index and not idx.equals(index):
+                index = index.union(idx, sort=False)
+        return index
+
+    def to_numpy(self, nodata_below: float = None) -> tuple[np.ndarray, np.ndarray, list[str]]:
+        """Returns the assembled result as numpy arrays. All the columns must be numeric (they are returned as
+        floating point).
+
+        Parameters
+        ----------
+        nodata_below : float, optional
+            Values below this are set to ``NaN``.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, list[str]]
+            The index, the values ``(nrow, ncol)``, and the column names.
+        """
+        index = self.index()
+        return index.to_numpy(), self._array(index, nodata_below), self.columns
+
+    def to_dict(self, nodata_below: float = None) -> dict[str, np.ndarray]:
+        """Returns the assembled result as a dictionary of column name and values. The index is included under
+        :attr:`index_name` (or the name of the index if not set). Duplicate column names are overwritten by the last column.
+
+        Parameters
+        ----------
+        nodata_below : float, optional
+            Values below this are set to ``NaN`` (numeric columns only).
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The assembled columns.
+        """
+        index = self.index()
+        d = {self.index_name if self.index_name is not None else index.name: index.to_numpy()}
+        for name, a in zip(self.columns, self._aligned_columns(index, nodata_below)):
+            d[name] = np.asarray(a)
+        return d
+
+    def to_frame(self, nodata_below: float = None) -> pd.DataFrame:
+        """Returns the assembled result as a ``DataFrame``. An empty ``DataFrame`` is returned if no blocks were
+        added.
+
+        Parameters
+        ----------
+        nodata_below : float, optional
+            Values below this are set to ``NaN`` (numeric columns only).
+
+        Returns
+        -------
+        pd.DataFrame
+            The assembled result.
+        """
+        if not self._blocks:
+            return pd.DataFrame()
+        if not self._numeric():
+            index = self.index()
+            df = pd.DataFrame(dict(enumerate(self._aligned_columns(index, nodata_below))), index=index)
+            df.columns = self.columns
+        else:
+            index = self.index()
+            df = pd.DataFrame(self._array(index, nodata_below), index=index, columns=self.columns)
+        if self.index_name is not None:
+            df.index.name = self.index_name
+        return df
+
+    def _array(self, index: pd.Index, nodata_below: float | None) -> np.ndarray:
+        # the numeric columns are written into a single array
+        dtype = np.result_type(np.float32, *[x.dtype for _, values, _ in self._blocks
+                                             for x in (values if isinstance(values, list) else [values])])
+        a = np.full((index.size, len(self.columns)), np.nan, dtype=dtype)
+        j = 0
+        for idx, values, _ in self._blocks:
+            values = np.column_stack(values) if isinstance(values, list) else values
+            a[self._rows(index, idx), j:j + values.shape[1]] = values
+            j += values.shape[1]
+        if nodata_below is not None:
+            a[a < nodata_below] = np.nan
+        return a
+
+    def _numeric(self) -> bool:
+        # all the columns share the same floating point dtype
+        dtypes = set()
+        for _, values, _ in self._blocks:
+            for a in (values if isinstance(values, list) else [values]):
+                if not isinstance(a, np.ndarray) or a.dtype.kind != 'f':
+                    return False
+                dtypes.add(a.dtype)
+        return len(dtypes) == 1
+
+    @staticmethod
+    def _numeric_extension(a: typing.Any) -> bool:
+        return pd.api.types.is_numeric_dtype(a.dtype) and not pd.api.types.is_bool_dtype(a.dtype)
+
+    @staticmethod
+    def _rows(index: pd.Index, idx: pd.Index) -> slice | np.ndarray:
+        if idx is index or idx.equals(index):
+            return slice(None)
+        return index.get_indexer(idx)
+
+    def _aligned_columns(self, index: pd.Index, nodata_below: float | None) -> typing.Generator[typing.Any, None, None]:
+        for idx, values, _ in self._blocks:
+            columns = values if isinstance(values, list) else list(values.T)
+            aligned = idx is index or idx.equals(index)
+            for a in columns:
+                if nodata_below is not None and not isinstance(a, np.ndarray) and self._numeric_extension(a):
+                    a = a.to_numpy(dtype=np.float64, na_value=np.nan)  # e.g. nullable Int64/Float64 columns
+                numeric = isinstance(a, np.ndarray) and a.dtype.kind in 'fiub'
+                if not aligned:
+                    if numeric:
+                        b = np.full(index.size, np.nan, dtype=np.result_type(a.dtype, np.float32))
+                        b[index.get_indexer(idx)] = a
+                        a = b
+                    else:
+                        a = pd.Series(a, index=idx).reindex(index).array
+                if numeric and a.dtype.kind != 'b' and nodata_below is not None and (a < nodata_below).any():
+                    a = np.where(a < nodata_below, np.nan, a)
+                yield a
@@ -1,17 +1,18 @@
 import typing
-from typing import Union, Generator
+from typing import Union
 
+import numpy as np
 try:
     import pandas as pd
 except ImportError:
     from ..pymesh.stubs import pandas as pd
-from packaging.version import Version
 
 
 class LP1D:
     """Class for generating long profiles for 1D channels."""
 
-    def __init__(self, ids: list[str], node_info: pd.DataFrame, chan_info: pd.DataFrame) -> None:
+    def __init__(self, ids: list[str], node_info: pd.DataFrame, chan_info: pd.DataFrame,
+                 graph: 'NetworkGraph' = None) -> None:
         # private
         self._columns = ['us_node', 'ds_node', 'ispipe', 'length', 'us_invert', 'ds_invert', 'lbus_obvert', 'lbds_obvert']
         self._static_types = []
@@ -26,6 +27,8 @@ class LP1D:
         self.node_info = node_info
         #: pd.DataFrame: Channel information. Column headers are 'id', 'us_node', 'ds_node', 'us_chan', 'ds_chan', 'length', 'us_invert', 'ds_invert', 'lbus_obvert', 'rbus_obvert', 'lbds_obvert', 'rbds_obvert'
         self.chan_info = chan_info
+        #: NetworkGraph: The network graph used to trace the connectivity. Built on first use if not provided.
+        self.graph = graph
         #: pd.DataFrame: The connectivity data.
         self.df = pd.DataFrame(columns=['channel'] + self._columns + ['branch_id'])
         #: pd.DataFrame: The static data.
@@ -57,9 +60,11 @@ class LP1D:
         """Calculate connectivity between channels. More than one ID is allowed, but all channels
         must connect to a common downstream channel.
         """
+        if self.graph is None:
+            self.graph = NetworkGraph(self.chan_info, self.node_info)
         branches = []
         if len(self.ids) == 1:
-            conn = Connectivity(self.chan_info, self.node_info, self.ids[0], None)
+            conn = Connectivity(self.chan_info, self.node_info, self.ids[0], None, self.graph)
             branches.extend(conn.branches)
         else:
             # more than 1 id - find a connection
@@ -68,7 +73,7 @@ class LP1D:
                 for id2 in self.ids:
                     if id1 == id2:
                         continue
-                    conn = Connectivity(self.chan_info, self.node_info, id1, id2)
+                    conn = Connectivity(self.chan_info, self.node_info, id1, id2, self.graph)
                     if conn.connected:
                         ds_id = conn.id2
                         break
@@ -83,7 +88,7 @@ class LP1D:
             for id_ in self.ids:
                 if id_ == ds_id:
                     continue
-                conn = Connectivity(self.chan_info, self.node_info, id_, ds_id)
+                conn = Connectivity(self.chan_info, self.node_info, id_, ds_id, self.graph)
                 if conn.connected:
                     branches.extend(conn.branches)
 
@@ -142,10 +147,138 @@ class LP1D:
         return ids1
 
 
+class NetworkGraph:
+    """Integer indexed graph of a 1D network used to trace the connectivity between channels.
+
+    The graph is built once from the channel and node information and stores, for every channel, the channels
+    directly downstream of it in compressed sparse row (CSR) form. The branches traced between two channels are
+    cached, so calling :meth:`trace` again with the same IDs is free.
+
+    Parameters
+    ----------
+    chan_info : pd.DataFrame
+        Channel information. Requires the ``us_node`` and ``ds_node`` columns, and the ``ds_channel`` column is used
+        to prefer the primary downstream channel when a network branches.
+    node_info : pd.DataFrame
+        Node information. Requires the ``channels`` column.
+    """
+
+    def __init__(self, chan_info: pd.DataFrame, node_info: pd.DataFrame) -> None:
+        #: list[str]: The channel IDs. The position of the ID in the list is its index in the graph.
+        self.ids = []
+        #: np.ndarray: CSR row pointer. The edges leaving vertex ``i`` are ``indptr[i]:indptr[i+1]``.
+        self.indptr = np.zeros(1, dtype=np.int64)
+        #: np.ndarray: CSR column indices - the vertex at the downstream end of each edge.
+        self.indices = np.zeros(0, dtype=np.int64)
+        #: np.ndarray: The channel (index into :attr:`ids`) recorded in the branch when each edge is followed.
+        self.labels = np.zeros(0, dtype=np.int64)
+        self._vertex_index = {}
+        self._label_index = {}
+        self._memo = {}
+        self._build(chan_info, node_info)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: {self.vertex_count} vertices, {self.indices.size} edges>'
+
+    @property
+    def vertex_count(self) -> int:
+        #: int: The number of vertices in the graph.
+        return self.indptr.size - 1
+
+    def trace(self, id1: str, id2: Union[str, None]) -> tuple[bool, list[list[str]]]:
+        """Traces the branches downstream from ``id1`` to ``id2``, or to the outlet(s) if ``id2`` is ``None``.
+
+        A branch stops if it loops back onto itself. Only branches that reach ``id2`` are returned if it is given.
+
+        Parameters
+        ----------
+        id1 : str
+            The upstream ID.
+        id2 : str | None
+            The downstream ID.
+
+        Returns
+        -------
+        tuple[bool, list[list[str]]]
+            Whether ``id1`` is connected to ``id2`` and the list of branches (channel IDs).
+        """
+        key = (id1, id2)
+        if key not in self._memo:
+            start = self._vertex_index[id1]
+            target = self._vertex_index.get(id2, -2) if id2 is not None else -1
+            connected, branches = self._trace(start, target)
+            self._memo[key] = connected, tuple(tuple(x) for x in branches)
+        connected, branches = self._memo[key]
+        return connected, [[self.ids[i] for i in x] for x in branches]
+
+    def _trace(self, start: int, target: int) -> tuple[bool, list[list[int]]]:
+        # depth-first search using an explicit stack so long networks don't hit the recursion limit
+        indptr, indices, labels = self.indptr, self.indices, self.labels
+        path = self._start_path(start)
+        on_path = np.zeros(len(self.ids), dtype=bool)
+        on_path[path] = True
+        branches, connected = [], False
+        stack = [(start, indptr[start])]
+        while stack:
+            v, k = stack[-1]
+            if k == indptr[v + 1]:  # finished with this vertex
+                stack.pop()
+                if k == indptr[v] and target == -1:  # outlet
+                    branches.append(path.copy())
+                if stack:  # step back up the branch
+                    on_path[path.pop()] = False
+                continue
+            stack[-1] = (v, k + 1)
+            w, lab = indices[k], labels[k]
+            if on_path[lab]:  # looped back onto the branch
+                if target == -1:
+                    branches.append(path.copy())
+            elif w == target:
+                branches.append(path + [lab])
+                connected = True
+            else:
+                path.append(lab)
+                on_path[lab] = True
+                stack.append((w, indptr[w]))
+        return connected or (target == -1 and bool(branches)), branches
+
+    def _start_path(self, start: int) -> list[int]:
+        return [start]
+
+    @staticmethod
+    def _node_channels(channels: typing.Any) -> list[str]:
+        # the channels column can contain a single channel, a comma separated string, or a list/tuple of channels
+        if isinstance(channels, str):
+            return channels.split(',')
+        if isinstance(channels, (list, tuple)):
+            return [str(x) for x in channels]
+        if channels is None or pd.isna(channels):
+            return []
+        return [str(channels)]  # e.g. a single numeric channel id
+
+    def _build(self, chan_info: pd.DataFrame, node_info: pd.DataFrame) -> None:
+        self.ids = chan_info.index.tolist()
+        self._vertex_index = self._label_index = {x: i for i, x in reversed(list(enumerate(self.ids)))}
+        us_nodes = chan_info['us_node'].tolist()
+        ds_nodes = chan_info['ds_node'].tolist()
+        ds_chans = chan_info['ds_channel'].tolist() if 'ds_channel' in chan_info else [None] * len(self.ids)
+        node_chans = {nd: self._node_channels(x) for nd, x in node_info['channels'].items()}
+        counts, indices = [], []
+        for i, nd in enumerate(ds_nodes):
+            chans = [self._label_index[x] for x in node_chans.get(nd, []) if x in self._label_index]
+            chans = [x for x in chans if us_nodes[x] == nd]
+            chans.sort(key=lambda x: self.ids[x] != ds_chans[i])  # primary downstream channel first
+            counts.append(len(chans))
+            indices.extend(chans)
+        self.indptr = np.concatenate([[0], np.cumsum(counts, dtype=np.int64)])
+        self.indices = self.labels = np.array(indices, dtype=np.int64)
+
+
 class Connectivity:
     """Class to help calculate connectivity between channels."""
 
-    def __init__(self, chan_info: pd.DataFrame, node_info: pd.DataFrame, id1: str, id2: Union[str, None]) -> None:
+    def __init__(self, chan_info: pd.DataFrame, node_info: pd.DataFrame, id1: str, id2: Union[str, None],
+                 graph: NetworkGraph = None) -> None:
         #: :pd.DataFrame: chan_info
         self.chan_info = chan_info
         #: :pd.DataFrame: node_info
@@ -158,65 +291,23 @@ class Connectivity:
         self.branches = []
         #: bool: True if connected
         self.connected = False
+        #: NetworkGraph: The network graph the connectivity is traced on
+        self.graph = graph if graph is not None else self._graph_class()(chan_info, node_info)
         self.connect()
 
+    @staticmethod
+    def _graph_class() -> type[NetworkGraph]:
+        return NetworkGraph
+
     def connect(self) -> None:
         """Calculate connectivity between channels given two IDS.
         If id2 is None, then connectivity will be calculated all the way to the outlet.
         """
-        connected = self._connect(self.id1, self.id2, [])
-        if connected:
-            self.connected = True
-            return
-        if self.id2 is None:
+        self.connected, self.branches = self.graph.trace(self.id1, self.id2)
+        if self.connected or self.id2 is None:
             return
-        id1, id2 = self.id2, self.id1
-        connected = self._connect(id1, id2, [])
+        connected, branches = self.graph.trace(self.id2, self.id1)
         if connected:
-            self.connected = True
-            self.id1, self.id2 = id1, id2
-
-    def _connect(self, id1: str, id2: Union[str, None], branch: list[str]) -> bool:
-        """Private routine to calculate connectivity between 2 channels. Uses binary tree type search so that
-        multiple branches can be found/searched.
-        Returns True/False depending on whether a connection was found.
-
-        :param id1:
-            Upstream channel ID
-        :param id2:
-            Downstream channel ID
-        :param branch:
-            List of channel IDs that form a branch
-            This will be added to as the routine searches for a connection.
-        """
-        finished = False
-        if id1 not in branch:
-            branch.append(id1)
-        one_connection = False
-        for id_ in self._downstream_channels(id1):
-            one_connection = True
-            finished = id_ in branch[:-1] or id_ == id2
-            if finished:
-                if id_ not in branch:
-                    branch.append(id_)
-                self.branches.append(branch)
-            if not finished:
-                finished = self._connect(id_, id2, branch.copy())
-
-        if not one_connection and id2 is None:
-            finished = True
-            self.branches.append(branch)
-
-        return finished
-
-    def _downstream_channels(self, id_: str) -> Generator[str, None, None]:
-        """Yield downstream channels given a channel ID."""
-        nd = self.chan_info.loc[id_, 'ds_node']
-        if Version(pd.__version__) >= Version('3') and self.node_info['channels'].dtype == 'str':
-            channels = self.node_info.loc[nd, 'channels'].split(',')
-        else:
-            channels = list(self.node_info.loc[nd, 'channels']) if self.node_info.loc[nd, 'nchannel'] > 1 else [self.node_info.loc[nd, 'channels']]
-        for chan in sorted(channels, key=lambda x: {True: 0, False: 1}[self.chan_info.loc[id_, 'ds_channel'] == x if 'ds_channel' in self.chan_info else 0]):
-            us_node = self.chan_info.loc[chan, 'us_node']
-            if us_node == nd:
-                yield chan
+            self.connected, self.branches = connected, branches
+            self.id1, self.id2 = self.id2, self.id1
+
@@ -1,11 +1,10 @@
-from typing import Generator, Union
-
+import numpy as np
 try:
     import pandas as pd
 except ImportError:
     from ..pymesh.stubs import pandas as pd
 
-from .lp_1d import LP1D, Connectivity
+from .lp_1d import LP1D, Connectivity, NetworkGraph
 
 
 class LP1DFM(LP1D):
@@ -15,9 +14,11 @@ class LP1DFM(LP1D):
 
     def connectivity(self) -> None:
         # docstring inherited
+        if self.graph is None:
+            self.graph = NetworkGraphFM(self.chan_info, self.node_info)
         branches = []
         if len(self.ids) == 1:
-            conn = ConnectivityFM(self.chan_info, self.node_info, self.ids[0], None)
+            conn = ConnectivityFM(self.chan_info, self.node_info, self.ids[0], None, self.graph)
             branches.extend(conn.branches)
         else:
             # more than 1 id - find a connection
@@ -26,7 +27,7 @@ class LP1DFM(LP1D):
                 for id2 in self.ids:
                     if id1 == id2:
                         continue
-                    conn = ConnectivityFM(self.chan_info, self.node_info, id1, id2)
+                    conn = ConnectivityFM(self.chan_info, self.node_info, id1, id2, self.graph)
                     if conn.connected:
                         ds_id = conn.id2
                         break
@@ -41,7 +42,7 @@ class LP1DFM(LP1D):
             for id_ in self.ids:
                 if id_ == ds_id:
                     continue
-                conn = ConnectivityFM(self.chan_info, self.node_info, id_, ds_id)
+                conn = ConnectivityFM(self.chan_info, self.node_info, id_, ds_id, self.graph)
                 if conn.connected:
                     branches.extend(conn.branches)
 
@@ -59,39 +60,43 @@ class LP1DFM(LP1D):
         return ids
 
 
-class ConnectivityFM(Connectivity):
-    """Override :class:`LP_1D<pytuflow.outputs.helpers.lp_1d.Connectivity>` for Flood Modeller
-    connectivity because the start and end locations will be nodes and not channels.
+class NetworkGraphFM(NetworkGraph):
+    """Override :class:`NetworkGraph<pytuflow.outputs.helpers.lp_1d.NetworkGraph>` for Flood Modeller
+    because the start and end locations will be nodes and not channels. The vertices of the graph are the nodes and
+    the branches are made up of the channels between them.
     """
 
-    def _connect(self, id1: str, id2: Union[str, None], branch: list[str], chanid: str = '') -> bool:
-        # docstring inherited
-        finished = False
-        if chanid and chanid not in branch:
-            branch.append(chanid)
-        one_connection = False
-        for nd, id_ in self._downstream_channels(id1): # nd = channel downstream node
-            one_connection = True
-            finished = id_ in branch[:-1] or nd == id2
-            if finished:
-                if id_ not in branch:
-                    branch.append(id_)
-                self.branches.append(branch)
-            if not finished:
-                finished = self._connect(nd, id2, branch.copy(), id_)
+    def _start_path(self, start: int) -> list[int]:
+        return []
 
-        if not one_connection and id2 is None:
-            finished = True
-            self.branches.append(branch)
+    def _build(self, chan_info: pd.DataFrame, node_info: pd.DataFrame) -> None:
+        self.ids = chan_info.index.tolist()
+        self._label_index = {x: i for i, x in reversed(list(enumerate(self.ids)))}
+        nodes = node_info.index.tolist()
+        self._vertex_index = {x: i for i, x in reversed(list(enumerate(nodes)))}
+        us_nodes = chan_info['us_node'].tolist()
+        ds_nodes = chan_info['ds_node'].tolist()
+        edges = [[] for _ in nodes]
+        for v, (nd, chans) in enumerate(node_info['channels'].items()):
+            for chan in self._node_channels(chans):
+                i = self._label_index.get(chan)
+                if i is None or us_nodes[i] != nd:
+                    continue
+                if ds_nodes[i] not in self._vertex_index:  # not a known node, treat as an outlet
+                    self._vertex_index[ds_nodes[i]] = len(edges)
+                    edges.append([])
+                edges[v].append((self._vertex_index[ds_nodes[i]], i))
+        self.indptr = np.concatenate([[0], np.cumsum([len(x) for x in edges], dtype=np.int64)])
+        edges = [x for y in edges for x in y]
+        self.indices = np.array([x[0] for x in edges], dtype=np.int64)
+        self.labels = np.array([x[1] for x in edges], dtype=np.int64)
 
-        return finished
 
-    def _downstream_channels(self, id_: str) -> Generator[tuple[str, str], None, None]:
-        """Yield downstream channels given a channel ID."""
-        for chan in self.node_info.loc[id_].channels:
-            if chan not in self.chan_info.index:
-                continue
-            us_node = self.chan_info.loc[chan, 'us_node']
-            if us_node == id_:
-                nd = self.chan_info.loc[chan, 'ds_node']
-                yield nd, chan
+class ConnectivityFM(Connectivity):
+    """Override :class:`LP_1D<pytuflow.outputs.helpers.lp_1d.Connectivity>` for Flood Modeller
+    connectivity because the start and end locations will be nodes and not channels.
+    """
+
+    @staticmethod
+    def _graph_class() -> type[NetworkGraph]:
+        return NetworkGraphFM
@@ -0,0 +1,221 @@
+import threading
+import typing
+
+import numpy as np
+
+from ..pymesh import Cache
+from ..._pytuflow_types import PathLike, TuflowPath
+
+
+class RasterTiles:
+    """Windowed (tiled) read access to a raster file.
+
+    The raster is read in tiles that line up with the native block layout of the file (e.g. the internal tiles of a
+    tiled GeoTIFF, or a group of strips for a striped GeoTIFF). Tiles are kept in the ``'tile'`` namespace of the
+    given :class:`Cache`, so repeated point and line queries in the same area do not go back to the file and only the
+    tiles that are touched are ever read.
+
+    Indexes use the same convention as :class:`Grid <pytuflow.Grid>` i.e. row ``0`` is the bottom (southern) row of
+    the raster and column ``0`` is the left (western) column.
+
+    Parameters
+    ----------
+    fpath : PathLike
+        The path to the raster file.
+    cache : Cache
+        The cache used to store the tiles.
+    band : int, optional
+        The raster band to read.
+    max_bytes : int, optional
+        The byte budget of the ``'tile'`` cache namespace.
+    """
+
+    #: int: The minimum tile size (in cells) along each axis. Tiles are a multiple of the native block size.
+    MIN_TILE_SIZE = 256
+    #: int: Tiles are not made larger than this along an axis (e.g. a striped raster with very wide strips).
+    MAX_TILE_SIZE = 1024
+
+    def __init__(self, fpath: PathLike, cache: Cache, band: int = 1, max_bytes: int = 64 * 1024 ** 2):
+        #: PathLike: The path to the raster file.
+        self.fpath = fpath
+        #: Cache: The cache used to store the tiles.
+        self.cache = cache
+        #: int: The raster band.
+        self.band = band
+        #: int: The byte budget of the tile cache.
+        self.max_bytes = max_bytes
+        self.cache.set_budget('tile', max_bytes)
+        self._grid = None
+        self._lock = threading.RLock()
+        with TuflowPath(self.fpath).open_grid(band=band) as grid:
+            #: int: The number of rows.
+            self.nrow = grid.nrow
+            #: int: The number of columns.
+            self.ncol = grid.ncol
+            self._flip_x, self._flip_y = grid.flip_x, grid.flip_y
+            bh, bw = self._block_shape(grid)
+        #: tuple[int, int]: The tile shape (rows, columns) in the file.
+        self.tile_shape = (self._tile_size(bh, self.nrow), self._tile_size(bw, self.ncol))
+
+    def __repr__(self) -> str:
+        return f'<RasterTiles {self.nrow}x{self.ncol} tile={self.tile_shape}>'
+
+    def __getitem__(self, idx: typing.Any) -> typing.Any:
+        if not isinstance(idx, tuple):
+            idx = (idx,)
+        if any(x is Ellipsis for x in idx):
+            i = idx.index(Ellipsis)
+            idx = idx[:i] + (slice(None),) * (3 - len(idx)) + idx[i + 1:]  # 2 dims, less the ones given
+        idx = idx + (slice(None),) * (2 - len(idx))
+        rows, cols = idx
+        if not isinstance(rows, slice) and not isinstance(cols, slice):  # cell lookups
+            r, c = np.broadcast_arrays(np.asarray(rows), np.asarray(cols))
+            vals = self.take(r.ravel(), c.ravel()).reshape(r.shape)
+            return vals[()] if vals.ndim == 0 else vals
+        # read the bounding window and index into it
+        (r0, r1), rows = self._axis_window(rows, self.nrow)
+        (c0, c1), cols = self._axis_window(cols, self.ncol)
+        return self.read(r0, r1, c0, c1)[rows, cols]
+
+    def close(self):
+        """Closes the raster file."""
+        with self._lock:
+            if self._grid is not None:
+                self._grid.close()
+                self._grid = None
+
+    def read(self, r0: int, r1: int, c0: int, c1: int) -> np.ndarray:
+        """Returns the values for rows ``r0:r1`` and columns ``c0:c1``.
+
+        Parameters
+        ----------
+        r0 : int
+            The first row.
+        r1 : int
+            The end row (exclusive).
+        c0 : int
+            The first column.
+        c1 : int
+            The end column (exclusive).
+
+        Returns
+        -------
+        np.ndarray
+            The values.
+        """
+        r0, r1 = max(r0, 0), min(r1, self.nrow)
+        c0, c1 = max(c0, 0), min(c1, self.ncol)
+        fr0, fr1 = self._file_range(r0, r1, self.nrow, self._flip_y)
+        fc0, fc1 = self._file_range(c0, c1, self.ncol, self._flip_x)
+        th, tw = self.tile_shape
+        tiles_i = range(fr0 // th, (fr1 - 1) // th + 1) if fr1 > fr0 else range(0)
+        tiles_j = range(fc0 // tw, (fc1 - 1) // tw + 1) if fc1 > fc0 else range(0)
+        if self.max_bytes and len(tiles_i) * len(tiles_j) * th * tw * 8 > self.max_bytes:
+            # larger than the tile cache - read straight from the file rather than flushing the cache
+            a = self._read_file(fr0, fr1, fc0, fc1)
+        else:
+            a = None
+            for i in tiles_i:
+                for j in tiles_j:
+                    tile = self._tile(i, j)
+                    if a is None:
+                        a = np.empty((fr1 - fr0, fc1 - fc0), dtype=tile.dtype)
+                    ti0, ti1 = max(fr0, i * th), min(fr1, (i + 1) * th)
+                    tj0, tj1 = max(fc0, j * tw), min(fc1, (j + 1) * tw)
+                    a[ti0 - fr0:ti1 - fr0, tj0 - fc0:tj1 - fc0] = tile[ti0 - i * th:ti1 - i * th,
+                                                                       tj0 - j * tw:tj1 - j * tw]
+            if a is None:
+                a = np.empty((fr1 - fr0, fc1 - fc0))
+        return self._orient(a)
+
+    def take(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Returns the values for the given cells. Only the tiles containing the cells are read.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            The cell rows.
+        cols : np.ndarray
+            The cell columns.
+
+        Returns
+        -------
+        np.ndarray
+            The values.
+        """
+        rows, cols = np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+        fr = self.nrow - 1 - rows if self._flip_y else rows
+        fc = self.ncol - 1 - cols if self._flip_x else cols
+        th, tw = self.tile_shape
+        ntj = -(-self.ncol // tw)
+        keys = (fr // th) * ntj + fc // tw
+        out = None
+        for key in np.unique(keys):
+            mask = keys == key
+            i, j = divmod(int(key), ntj)
+            tile = self._tile(i, j)
+            if out is None:
+                out = np.empty(rows.shape, dtype=tile.dtype)
+            out[mask] = tile[fr[mask] - i * th, fc[mask] - j * tw]
+        return out if out is not None else np.empty(rows.shape)
+
+    def _tile(self, i: int, j: int) -> np.ndarray:
+        key = (str(self.fpath), self.band, i, j)
+        with self._lock:
+            cached = self.cache.get('tile', *key, default=None)
+            if cached is not None:
+                return cached
+            th, tw = self.tile_shape
+            tile = self._read_file(i * th, min((i + 1) * th, self.nrow), j * tw, min((j + 1) * tw, self.ncol))
+            self.cache.set(tile, 'tile', *key)
+            return tile
+
+    def _read_file(self, r0: int, r1: int, c0: int, c1: int) -> np.ndarray:
+        # rows/columns are in the file's orientation
+        with self._lock:
+            if self._grid is None:
+                self._grid = TuflowPath(self.fpath).open_grid(band=self.band)
+            ds = self._grid.ds
+            if hasattr(ds, 'block_shapes'):  # rasterio
+                return ds.read(self.band, window=((r0, r1), (c0, c1)))
+            return ds.GetRasterBand(self.band).ReadAsArray(c0, r0, c1 - c0, r1 - r0)  # gdal
+
+    def _orient(self, a: np.ndarray) -> np.ndarray:
+        if self._flip_x:
+            a = np.fliplr(a)
+        if self._flip_y:
+            a = np.flipud(a)
+        return a
+
+    @staticmethod
+    def _file_range(i0: int, i1: int, n: int, flip: bool) -> tuple[int, int]:
+        return (n - i1, n - i0) if flip else (i0, i1)
+
+    @staticmethod
+    def _axis_window(idx: typing.Any, n: int) -> tuple[tuple[int, int], typing.Any]:
+        # returns the window that covers the index along an axis and the index relative to the window
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(n)
+            if step < 0:
+                return (0, n), idx
+            return (start, max(stop, start)), slice(0, max(stop, start) - start, step)
+        a = np.asarray(idx)
+        a = np.where(a < 0, a + n, a)
+        if a.size == 0:
+            return (0, 0), a
+        lo = int(a.min())
+        return (lo, int(a.max()) + 1), a - lo
+
+    @classmethod
+    def _tile_size(cls, block: int, n: int) -> int:
+        block = max(int(block), 1)
+        size = block * -(-cls.MIN_TILE_SIZE // block)
+        return max(min(size, cls.MAX_TILE_SIZE, n), 1)
+
+    @staticmethod
+    def _block_shape(grid: typing.Any) -> tuple[int, int]:
+        ds = grid.ds
+        if hasattr(ds, 'block_shapes'):  # rasterio
+            return ds.block_shapes[grid.band - 1]
+        bw, bh = ds.GetRasterBand(grid.band).GetBlockSize()  # gdal
+        return bh, bw
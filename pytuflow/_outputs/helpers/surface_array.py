@@ -0,0 +1,180 @@
+import typing
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    from ..pymesh.stubs import pandas as pd
+
+
+class SurfaceArray:
+    """Base class for the array output of ``surface(..., return_type='array')``.
+
+    The values and active mask are kept as returned by the result, without building coordinate columns for every
+    cell/vertex. :meth:`to_frame` converts the surface into the same ``DataFrame`` that ``surface()`` returns by
+    default.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The surface values. Vector results have an extra trailing axis of length 2 for the x and y components.
+    mask : np.ndarray
+        The active (wet) mask.
+    """
+
+    def __init__(self, values: np.ndarray, mask: np.ndarray):
+        #: np.ndarray: The surface values. Vector results have a trailing axis for the x and y components.
+        self.values = values
+        #: np.ndarray: The active (wet) mask.
+        self.mask = mask
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.values.shape}>'
+
+    def __array__(self, dtype: typing.Any = None, copy: bool = None) -> np.ndarray:
+        if dtype is None and not copy:
+            return self.values
+        return np.array(self.values, dtype=dtype, copy=True if copy else None)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """tuple[int, ...]: The shape of the values array."""
+        return self.values.shape
+
+    @property
+    def is_vector(self) -> bool:
+        """bool: Whether the values are vector components."""
+        return self.values.ndim == self.mask.ndim + 1
+
+    def coordinates(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the x and y coordinates of every value (flattened).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The x and y coordinates.
+        """
+        raise NotImplementedError
+
+    def to_frame(self) -> pd.DataFrame:
+        """Converts the surface into a ``DataFrame`` with columns for the coordinates, value(s), and active mask.
+
+        Returns
+        -------
+        pd.DataFrame
+            The surface data.
+        """
+        x, y = self.coordinates()
+        xname, yname = self._coordinate_names()
+        d = {xname: np.asarray(x, dtype=np.float64), yname: np.asarray(y, dtype=np.float64)}
+        if self.is_vector:
+            vals = self.values.reshape(-1, 2)
+            d['value-x'] = np.asarray(vals[:, 0], dtype=np.float64)
+            d['value-y'] = np.asarray(vals[:, 1], dtype=np.float64)
+        else:
+            d['value'] = np.asarray(self.values.ravel(), dtype=np.float64)
+        d['active'] = self.mask.ravel().astype(bool)
+        return pd.DataFrame(d)
+
+    def _coordinate_names(self) -> tuple[str, str]:
+        return 'x', 'y'
+
+
+class GridSurface(SurfaceArray):
+    """Array output of :meth:`Grid.surface() <pytuflow.Grid.surface>`.
+
+    The values are a 2D array ``(nrow, ncol)`` where row ``0`` is the bottom (southern) row. The positions of the
+    values are described by the cell size and origin, so no coordinates are stored.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The surface values.
+    mask : np.ndarray
+        The active (wet) mask.
+    dx : float
+        The spacing between columns.
+    dy : float
+        The spacing between rows.
+    x0 : float
+        The x coordinate of the first column.
+    y0 : float
+        The y coordinate of the first row.
+    """
+
+    def __init__(self, values: np.ndarray, mask: np.ndarray, dx: float, dy: float, x0: float, y0: float):
+        super().__init__(values, mask)
+        #: float: The spacing between columns.
+        self.dx = float(dx)
+        #: float: The spacing between rows.
+        self.dy = float(dy)
+        #: float: The x coordinate of the first column (cell centre or vertex).
+        self.x0 = float(x0)
+        #: float: The y coordinate of the first row (cell centre or vertex).
+        self.y0 = float(y0)
+
+    @property
+    def nrow(self) -> int:
+        """int: The number of rows."""
+        return self.values.shape[0]
+
+    @property
+    def ncol(self) -> int:
+        """int: The number of columns."""
+        return self.values.shape[1]
+
+    @property
+    def x(self) -> np.ndarray:
+        """np.ndarray: The x coordinate of each column."""
+        return self.x0 + np.arange(self.ncol) * self.dx
+
+    @property
+    def y(self) -> np.ndarray:
+        """np.ndarray: The y coordinate of each row."""
+        return self.y0 + np.arange(self.nrow) * self.dy
+
+    @property
+    def transform(self) -> tuple[float, float, float, float, float, float]:
+        """tuple[float, float, float, float, float, float]: The affine coefficients ``(a, b, c, d, e, f)`` that map
+        ``(column, row)`` to ``(x, y)``, where each value sits at the centre of its pixel. The coefficients are in
+        the same order as ``rasterio``'s ``Affine``. Note, row ``0`` is the bottom row so ``e`` is positive; flip the
+        values with ``np.flipud`` and use ``(a, b, c, d, -e, f + nrow * e)`` for a north-up raster.
+        """
+        return self.dx, 0., self.x0 - self.dx / 2., 0., self.dy, self.y0 - self.dy / 2.
+
+    def coordinates(self) -> tuple[np.ndarray, np.ndarray]:
+        xx, yy = np.meshgrid(self.x, self.y)
+        return xx.ravel(), yy.ravel()
+
+
+class MeshSurface(SurfaceArray):
+    """Array output of :meth:`Mesh.surface() <pytuflow.Mesh.surface>`.
+
+    The values are a 1D array with a value for every cell or vertex. The positions are a reference to the mesh
+    geometry and are not copied.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The surface values.
+    mask : np.ndarray
+        The active (wet) mask.
+    xy : np.ndarray
+        The x, y position of each value. Additional columns (e.g. z) are ignored.
+    spherical : bool, optional
+        Whether the positions are longitude/latitude.
+    """
+
+    def __init__(self, values: np.ndarray, mask: np.ndarray, xy: np.ndarray, spherical: bool = False):
+        super().__init__(values, mask)
+        #: np.ndarray: The x, y position of each value.
+        self.xy = xy[:, :2]
+        #: bool: Whether the positions are longitude/latitude.
+        self.spherical = spherical
+
+    def coordinates(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.xy[:, 0], self.xy[:, 1]
+
+    def _coordinate_names(self) -> tuple[str, str]:
+        return ('lon', 'lat') if self.spherical else ('x', 'y')
@@ -0,0 +1,295 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import typing
+import uuid
+import weakref
+from pathlib import Path
+
+import numpy as np
+try:
+    import pandas as pd
+except ImportError:
+    from ..pymesh.stubs import pandas as pd
+
+from .time_series_csv import STORE_TYPES, TimeSeriesCSV, TimeSeriesCSVMaximums
+from ..._pytuflow_types import PathLike
+from ...util import pytuflow_logging
+
+
+logger = pytuflow_logging.get_logger()
+
+
+class TimeSeriesCacheMixin:
+    """Optional on-disk cache of the parsed time series and maximum results.
+
+    When enabled, the parsed result dictionaries (e.g. ``_time_series_data`` and ``_maximum_data``) are written to a
+    cache directory of ``.npy`` files (one block per data type plus an index and column array) the first time the
+    results are loaded. Later loads of the same unchanged results memory-map these arrays instead of parsing the
+    source CSV / NetCDF / GeoPackage files. The cache is keyed on the size and modified time of the source files and
+    is ignored (and overwritten) if any of them change.
+
+    Lazily loaded results (CSV and GeoPackage time series) stay lazy. Only the columns that have been read are
+    stored, and columns read later are added to the cache as they are read, so unread columns are still only
+    parsed from the source file when they are first requested.
+
+    The cache is off by default and can be turned on for all time series results by setting the class attributes e.g.
+
+    >>> from pytuflow._outputs.helpers.time_series_cache import TimeSeriesCacheMixin
+    >>> TimeSeriesCacheMixin.ts_cache = True
+    >>> TimeSeriesCacheMixin.ts_cache_dir = '/path/to/cache'  # optional, defaults to next to the result file
+    """
+
+    #: bool: Whether the time series cache is used.
+    ts_cache = False
+    #: str | Path | None: Directory to store the caches in. If ``None``, caches are stored next to the result file.
+    ts_cache_dir = None
+
+    TS_CACHE_VERSION = 2
+    #: tuple[str]: The result dictionaries that are cached.
+    TS_CACHE_ATTRS = ('_time_series_data', '_maximum_data')
+    #: tuple[str]: Other (JSON serialisable) attributes populated while loading the results that are cached.
+    TS_CACHE_STATE = ('_nd_res_types',)
+
+    def ts_cache_path(self) -> Path:
+        """Returns the path to the time series cache directory for the result.
+
+        Returns
+        -------
+        Path
+            The cache directory path.
+        """
+        if not self.ts_cache_dir:
+            return self.fpath.parent / f'{self.fpath.name}.pytuflow_ts'
+        # shared cache folder - results with the same name can come from different folders
+        key = hashlib.md5(str(Path(self.fpath).resolve()).encode(), usedforsecurity=False).hexdigest()[:8]
+        return Path(self.ts_cache_dir) / f'{self.fpath.name}.{key}.pytuflow_ts'
+
+    def _ts_cache_enabled(self) -> bool:
+        return self.ts_cache
+
+    def _ts_cache_sources(self) -> list[Path]:
+        """Returns the source files the cache depends on."""
+        return [self.fpath]
+
+    @staticmethod
+    def _ts_cache_signature(files: typing.Iterable[PathLike]) -> list[list]:
+        sig = []
+        for p in files:
+            st = Path(p).stat()
+            sig.append([str(p), st.st_size, st.st_mtime_ns])
+        return sig
+
+    def _load_ts_cache(self) -> bool:
+        """Loads the results from the cache. Returns ``True`` if successful."""
+        if not self._ts_cache_enabled():
+            return False
+        p = self.ts_cache_path()
+        try:
+            with (p / 'manifest.json').open() as f:
+                manifest = json.load(f)
+            if manifest['version'] != self.TS_CACHE_VERSION or manifest['fpath'] != str(self.fpath):
+                return False
+            if manifest['sources'] != self._ts_cache_signature([x[0] for x in manifest['sources']]):
+                return False
+            stores = {sid: self._ts_cache_load_store(p, sid, spec) for sid, spec in manifest['stores'].items()}
+            data = {}
+            for attr, dtypes in manifest['attrs'].items():
+                d = data[attr] = {}
+                for dtype, entries in dtypes.items():
+                    d[dtype] = [self._ts_cache_load_frame(p, entry, stores) for entry in entries]
+        except (OSError, ValueError, KeyError, AttributeError):
+            return False
+
+        for attr, d in data.items():
+            res = getattr(self, attr)
+            res.clear()
+            for dtype, frames in d.items():
+                dict.__setitem__(res, dtype, frames)
+        for attr, value in manifest['state'].items():
+            setattr(self, attr, value)
+        for sid, store in stores.items():
+            self._ts_cache_attach_store(p, sid, store)
+        return True
+
+    def _save_ts_cache(self):
+        """Writes the results to the cache. The cache is written to a temporary directory and then
+        moved into place so other processes never see a partially written cache.
+
+        Lazily loaded results (:class:`TimeSeriesCSV`) are not parsed to be written, only the columns that have
+        already been read are stored. Columns read afterward are added to the cache as they are read.
+        """
+        if not self._ts_cache_enabled():
+            return
+        p = self.ts_cache_path()
+        tmp = p.with_name(f'{p.name}.{os.getpid()}.tmp')
+        stores = {}  # id(store) -> (store ID, store)
+        try:
+            tmp.mkdir(parents=True, exist_ok=True)
+            manifest = {
+                'version': self.TS_CACHE_VERSION,
+                'fpath': str(self.fpath),
+                'sources': self._ts_cache_signature(self._ts_cache_sources()),
+                'attrs': {},
+                'state': {x: getattr(self, x) for x in self.TS_CACHE_STATE},
+                'stores': {},
+            }
+            n = 0
+            for attr in self.TS_CACHE_ATTRS:
+                d = manifest['attrs'][attr] = {}
+                for dtype, frames in getattr(self, attr).items():
+                    d[dtype] = []
+                    for df in frames:
+                        d[dtype].append(self._ts_cache_save_frame(tmp, f'{n:04d}', df, stores))
+                        n += 1
+            for sid, store in stores.values():
+                manifest['stores'][sid] = store.cache_spec()
+                for positions, block in zip(store._loaded.block_positions, store._loaded.blocks):
+                    _save_block(tmp, sid, store, positions, block)
+            with (tmp / 'manifest.json').open('w') as f:
+                json.dump(manifest, f)  # written last
+            if p.exists():
+                shutil.rmtree(p, ignore_errors=True)
+            os.replace(tmp, p)
+        except (OSError, TypeError, ValueError) as e:
+            # the cache is an optimisation only, e.g. read-only folder or another process won the race
+            logger.debug(f'{self.__class__.__name__}._save_ts_cache(): Unable to write cache: {e}')
+            return
+        finally:
+            if tmp.exists():
+                shutil.rmtree(tmp, ignore_errors=True)
+        for sid, store in stores.values():
+            self._ts_cache_attach_store(p, sid, store)
+
+    def _ts_cache_save_frame(self, folder: Path, name: str, df: typing.Any, stores: dict) -> dict:
+        if isinstance(df, TimeSeriesCSVMaximums):
+            # maximums are recalculated from the (cached) time series using the same method
+            func = getattr(df._func, '__name__', None)
+            if func and getattr(self, func, None) == df._func:
+                entry = self._ts_cache_save_lazy(folder, name, df._time_series, stores)
+                if entry is not None:
+                    return dict(entry, layout='lazy_maximums', func=func)
+        elif isinstance(df, TimeSeriesCSV):
+            entry = self._ts_cache_save_lazy(folder, name, df, stores)
+            if entry is not None:
+                return entry
+        if not isinstance(df, pd.DataFrame):
+            df = df.to_frame()  # lazily loaded result that can't be recreated from the cache
+        entry = {
+            'name': name,
+            'index_name': df.index.name,
+            'columns_name': df.columns.name,
+            'layout': 'block' if df.dtypes.nunique() < 2 else 'columns',
+        }
+        _save_array(folder / f'{name}.index', df.index.to_numpy())
+        _save_array(folder / f'{name}.columns', df.columns.to_numpy())
+        if entry['layout'] == 'block':
+            _save_array(folder / name, df.to_numpy())
+        else:
+            for i in range(df.shape[1]):
+                _save_array(folder / f'{name}.{i}', df.iloc[:, i].to_numpy())
+        return entry
+
+    @staticmethod
+    def _ts_cache_save_lazy(folder: Path, name: str, ts: TimeSeriesCSV, stores: dict) -> dict | None:
+        store = ts._store
+        if not hasattr(store, 'cache_spec'):
+            return None
+        sid = stores.setdefault(id(store), (f's{len(stores):03d}', store))[0]
+        _save_array(folder / f'{name}.positions', ts._positions)
+        _save_array(folder / f'{name}.columns', ts.columns.to_numpy())
+        return {'name': name, 'layout': 'lazy', 'store': sid, 'columns_name': ts.columns.name}
+
+    def _ts_cache_load_frame(self, folder: Path, entry: dict, stores: dict) -> typing.Any:
+        name = entry['name']
+        if entry['layout'] in ('lazy', 'lazy_maximums'):
+            ts = TimeSeriesCSV(
+                None, store=stores[entry['store']], positions=_load_array(folder / f'{name}.positions'),
+                columns=pd.Index(_load_array(folder / f'{name}.columns'), name=entry['columns_name'])
+            )
+            if entry['layout'] == 'lazy_maximums':
+                return TimeSeriesCSVMaximums(ts, getattr(self, entry['func']))
+            return ts
+        index = pd.Index(_load_array(folder / f'{name}.index'), name=entry['index_name'])
+        columns = pd.Index(_load_array(folder / f'{name}.columns'), name=entry['columns_name'])
+        if entry['layout'] == 'block':
+            return pd.DataFrame(_load_array(folder / name, mmap=True), index=index, columns=columns, copy=False)
+        data = {i: _load_array(folder / f'{name}.{i}') for i in range(columns.size)}
+        df = pd.DataFrame(data, index=index)
+        df.columns = columns
+        return df
+
+    def _ts_cache_load_store(self, folder: Path, sid: str, spec: dict) -> typing.Any:
+        """Recreates a lazy column store and memory-maps the columns that were stored for it. The source file
+        is only read for columns that are not in the cache.
+        """
+        store = STORE_TYPES[spec['kind']].from_cache_spec(spec, self)
+        if folder.joinpath(f'{sid}.index.npy').exists():
+            store.restore_index(_load_array(folder / f'{sid}.index'))
+        for fpath in sorted(folder.glob(f'{sid}.*.positions.npy')):
+            stem = folder / fpath.name[:-len('.positions.npy')]
+            positions = np.load(fpath)
+            block = _load_array(stem, mmap=True)
+            if block.shape[0] != store.index.size:
+                continue  # written before the time axis was extended
+            keep = np.array([x not in store._loaded for x in positions], dtype=bool)
+            if keep.all():
+                store._loaded.add(positions, block)
+            elif keep.any():
+                store._loaded.add(positions[keep], block[:, keep])
+        return store
+
+    @staticmethod
+    def _ts_cache_attach_store(folder: Path, sid: str, store: typing.Any):
+        """Adds the columns read by the store from now on to the cache."""
+        ref = weakref.ref(store)  # avoid a reference cycle through the callback
+
+        def on_add(positions: np.ndarray, a: np.ndarray):
+            if ref() is not None:
+                try:
+                    _save_block(folder, sid, ref(), positions, a)
+                except (OSError, TypeError, ValueError) as e:
+                    logger.debug(f'TimeSeriesCacheMixin: Unable to add columns to cache: {e}')
+
+        store._loaded.on_add = on_add
+
+
+def _save_block(folder: Path, sid: str, store: typing.Any, positions: np.ndarray, a: np.ndarray):
+    """Writes a block of columns for a store into the cache. The positions are written last (and renamed into
+    place) so a block is only picked up once it is complete.
+    """
+    if not folder.exists():
+        return
+    stem = folder / f'{sid}.{uuid.uuid4().hex[:12]}'
+    _save_array(stem, a)
+    _replace_array(folder / f'{sid}.index', store.index.to_numpy())
+    _replace_array(stem.with_name(f'{stem.name}.positions'), positions)
+
+
+def _replace_array(stem: Path, a: np.ndarray):
+    tmp = stem.with_name(f'{stem.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    with tmp.open('wb') as f:
+        np.save(f, np.asarray(a), allow_pickle=False)
+    os.replace(tmp, stem.with_name(f'{stem.name}.npy'))
+
+
+def _save_array(stem: Path, a: np.ndarray):
+    a = np.asarray(a)
+    if a.dtype.kind in 'OT':  # strings (or mixed), store as fixed width unicode with a null mask
+        mask = pd.isna(a)
+        if mask.any():
+            np.save(stem.with_name(f'{stem.name}.mask.npy'), mask)
+        a = np.where(mask, '', a).astype(str)
+    np.save(stem.with_name(f'{stem.name}.npy'), a, allow_pickle=False)
+
+
+def _load_array(stem: Path, mmap: bool = False) -> np.ndarray:
+    a = np.load(stem.with_name(f'{stem.name}.npy'), mmap_mode='r' if mmap else None, allow_pickle=False)
+    if a.dtype.kind == 'U':
+        a = a.astype(object)
+        mask_path = stem.with_name(f'{stem.name}.mask.npy')
+        if mask_path.exists():
+            a[np.load(mask_path)] = np.nan
+    return a
@@ -0,0 +1,369 @@
+import csv
+import threading
+import typing
+from pathlib import Path
+
+import numpy as np
+try:
+    import pandas as pd
+except ImportError:
+    from ..pymesh.stubs import pandas as pd
+
+from ..._pytuflow_types import PathLike
+
+
+def dedupe_header(header: list[str]) -> list[str]:
+    """Names blank columns and de-duplicates the column names of a CSV header the same way as pandas
+    (e.g. ``'Unnamed: 3'``, ``'X.1'``).
+
+    Parameters
+    ----------
+    header : list[str]
+        The raw column names.
+
+    Returns
+    -------
+    list[str]
+        The column names.
+    """
+    names, counts = [], {}
+    for i, name in enumerate(header):
+        name = name if name else f'Unnamed: {i}'
+        if name in counts:
+            base = name
+            while name in counts:
+                name = f'{base}.{counts[base]}'
+                counts[base] += 1
+        counts[name] = counts.get(name, 0) + 1
+        names.append(name)
+    return names
+
+
+class _ColumnBlocks:
+    """Columns of a column store that have been read so far. Each read is kept as its own block (time x column)
+    so reading more columns never copies the columns that are already loaded.
+    """
+
+    def __init__(self):
+        #: list[np.ndarray]: The blocks of columns in the order they were read.
+        self.blocks = []
+        #: list[np.ndarray]: The column positions of each block.
+        self.block_positions = []
+        #: Callable[[np.ndarray, np.ndarray], None]: Called with the positions and values of each new block.
+        self.on_add = None
+        self._loc = {}  # column position -> (block, column in block)
+
+    def __contains__(self, position: int) -> bool:
+        return position in self._loc
+
+    def __len__(self) -> int:
+        return len(self._loc)
+
+    @property
+    def positions(self) -> list[int]:
+        """list[int]: The column positions that have been loaded."""
+        return list(self._loc)
+
+    def missing(self, positions: typing.Iterable[int]) -> np.ndarray:
+        """Returns the (unique, sorted) positions that have not been loaded yet."""
+        return np.unique(np.array([x for x in positions if x not in self._loc], dtype=int))
+
+    def add(self, positions: typing.Iterable[int], a: np.ndarray):
+        """Adds a block of columns read for the given positions."""
+        positions = np.asarray(positions, dtype=int)
+        self._loc.update({int(p): (len(self.blocks), i) for i, p in enumerate(positions)})
+        self.blocks.append(a)
+        self.block_positions.append(positions)
+        if self.on_add is not None:
+            self.on_add(positions, a)
+
+    def get(self, positions: typing.Iterable[int], nrow: int, dtype: type) -> np.ndarray:
+        """Returns the columns for the given (loaded) positions as a single array."""
+        loc = np.array([self._loc[int(x)] for x in positions], dtype=int).reshape((-1, 2))
+        out = np.empty((nrow, loc.shape[0]), dtype=self.blocks[0].dtype if self.blocks else dtype)
+        for k in np.unique(loc[:, 0]):
+            sel = loc[:, 0] == k
+            out[:, sel] = self.blocks[k][:, loc[sel, 1]]
+        return out
+
+
+class _CSVStore:
+    """Column store for a single TUFLOW time series CSV file. Columns are parsed from the file only when first
+    requested and are kept as compact 2D blocks (time x column) with a file column -> block column index.
+    """
+
+    kind = 'csv'
+
+    def __init__(self, fpath: PathLike, dtype: type, na_values: str):
+        self.fpath = Path(fpath)
+        self.dtype = dtype
+        self.na_values = na_values
+        self._index = None
+        self._loaded = _ColumnBlocks()
+        self._lock = threading.Lock()
+        #: list[str]: the raw column headers (deduplicated the same way pandas does)
+        self.header = self._read_header()
+
+    @property
+    def index(self) -> pd.Index:
+        if self._index is None:
+            with self.fpath.open(encoding='utf-8', errors='ignore', newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)
+                times = [row[1] for row in reader if row]
+            self._index = pd.Index(np.array(times, dtype=np.float32), name='Time (h)')
+        return self._index
+
+    def values(self, positions: np.ndarray) -> np.ndarray:
+        """Returns the values for the given file column positions, reading any columns that are not loaded yet."""
+        dtype = np.float32 if self.dtype is not str else object
+        with self._lock:
+            missing = self._loaded.missing(positions)
+            if missing.size:
+                a = self._read(missing.tolist(), self.dtype).to_numpy()
+                self._loaded.add(missing, np.ascontiguousarray(a.astype(dtype, copy=False)))
+            return self._loaded.get(positions, self.index.size, dtype)
+
+    def cache_spec(self) -> dict:
+        """Returns the (JSON serialisable) arguments needed to recreate the store, see :meth:`from_cache_spec`."""
+        return {'kind': self.kind, 'fpath': str(self.fpath), 'dtype': 'str' if self.dtype is str else 'float32',
+                'na_values': self.na_values}
+
+    @classmethod
+    def from_cache_spec(cls, spec: dict, owner: typing.Any) -> '_CSVStore':
+        """Recreates the store from :meth:`cache_spec`. Only the header of the file is read."""
+        return cls(spec['fpath'], str if spec['dtype'] == 'str' else np.float32, spec['na_values'])
+
+    def restore_index(self, index: np.ndarray):
+        """Sets the time index (e.g. from a cache) so it does not need to be read from the file."""
+        self._index = pd.Index(np.asarray(index, dtype=np.float32), name='Time (h)')
+
+    def _read_header(self) -> list[str]:
+        # csv module is a lot faster than pandas for a single line with many columns
+        with self.fpath.open(encoding='utf-8', errors='ignore', newline='') as f:
+            header = next(csv.reader(f), [])
+        return dedupe_header(header)
+
+    def _read(self, usecols: list[int], dtype: type) -> pd.DataFrame:
+        return pd.read_csv(self.fpath, usecols=usecols, index_col=False, na_values=self.na_values, dtype=dtype,
+                           encoding_errors='ignore')
+
+
+#: dict[str, type]: Column store types that can be recreated from their cache spec, keyed on ``kind``.
+STORE_TYPES = {_CSVStore.kind: _CSVStore}
+
+
+class _LazyLocIndexer:
+
+    def __init__(self, parent: typing.Any):
+        self._parent = parent
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        return self._parent._loc(key)
+
+
+class _LazyILocIndexer:
+
+    def __init__(self, parent: typing.Any):
+        self._parent = parent
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        return self._parent._iloc(key)
+
+
+class TimeSeriesCSV:
+    """Lazily loaded time series from a TUFLOW CSV output (e.g. ``_1d_Q.csv``).
+
+    Only the header of the CSV is read on initialisation. The time index is read when first requested and the result
+    columns are read (using ``usecols``) only for the IDs that are requested. Parsed columns are kept in a compact
+    ``float32`` array so subsequent requests for the same IDs do not touch the file.
+
+    The class mimics the small part of the ``DataFrame`` API used by the time series outputs i.e. ``columns``,
+    ``index``, ``shape``, ``loc[rows, columns]`` and ``iloc[rows, columns]``. Other ``DataFrame`` attributes are not
+    available, use :meth:`to_frame` to get a ``DataFrame``.
+
+    Parameters
+    ----------
+    fpath : PathLike
+        The path to the CSV file.
+    dtype : type, optional
+        The data type to parse the columns with. Use ``str`` for files that contain flags.
+    col_name_corr : Callable[[str], str], optional
+        Function that converts the CSV column header into the ID.
+    na_values : str, optional
+        Value to treat as null.
+    """
+
+    def __init__(self, fpath: PathLike, dtype: type = np.float32, col_name_corr: typing.Callable[[str], str] = None,
+                 na_values: str = '**********', store: _CSVStore = None, positions: np.ndarray = None,
+                 columns: pd.Index = None):
+        self._store = store if store is not None else _CSVStore(fpath, dtype, na_values)
+        if positions is None:
+            positions = np.arange(2, len(self._store.header))
+            names = self._store.header[2:]
+            columns = pd.Index([col_name_corr(x) for x in names] if col_name_corr else names)
+        #: np.ndarray: the column position in the CSV file for each of the columns
+        self._positions = positions
+        self._columns = columns
+        self._col2pos = None
+
+    def __repr__(self) -> str:
+        return f'<TimeSeriesCSV {self._store.fpath.name} ({len(self._columns)} columns)>'
+
+    @property
+    def fpath(self) -> Path:
+        return self._store.fpath
+
+    @property
+    def columns(self) -> pd.Index:
+        return self._columns
+
+    @property
+    def index(self) -> pd.Index:
+        return self._store.index
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.index.size, self._columns.size
+
+    @property
+    def empty(self) -> bool:
+        return 0 in self.shape
+
+    @property
+    def loc(self) -> _LazyLocIndexer:
+        return _LazyLocIndexer(self)
+
+    @property
+    def iloc(self) -> _LazyILocIndexer:
+        return _LazyILocIndexer(self)
+
+    def subset(self, mask: np.ndarray, names: list[str]) -> 'TimeSeriesCSV':
+        """Returns a subset of the columns with new names. The subset shares the same underlying column store, so no
+        data is read or copied.
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            Boolean mask of the columns to keep.
+        names : list[str]
+            The new column names for the kept columns.
+
+        Returns
+        -------
+        TimeSeriesCSV
+            The subset.
+        """
+        return TimeSeriesCSV(None, store=self._store, positions=self._positions[mask], columns=pd.Index(names))
+
+    def to_frame(self, columns: typing.Iterable[str] = None) -> pd.DataFrame:
+        """Returns the requested columns as a ``DataFrame``. If ``columns`` is ``None`` all columns are returned.
+
+        Parameters
+        ----------
+        columns : Iterable[str], optional
+            The column names to return.
+
+        Returns
+        -------
+        pd.DataFrame
+            The time series data.
+        """
+        if columns is None:
+            idx = np.arange(self._columns.size)
+        else:
+            idx = self._column_indexes(columns)
+        return self._frame(idx)
+
+    def _frame(self, idx: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(self._store.values(self._positions[idx]), index=self.index.copy(),
+                            columns=self._columns[idx])
+
+    def _column_indexes(self, columns: typing.Iterable[str]) -> np.ndarray:
+        if self._col2pos is None:
+            self._col2pos = {}
+            for i, name in enumerate(self._columns):
+                self._col2pos.setdefault(name, []).append(i)
+        idx = []
+        for name in columns:
+            if name not in self._col2pos:
+                raise KeyError(name)
+            idx.extend(self._col2pos[name])
+        return np.array(idx, dtype=int)
+
+    def _loc(self, key: typing.Any) -> typing.Any:
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(cols, slice) and cols == slice(None):
+            columns = None
+        elif isinstance(cols, str):
+            columns = [cols]
+        elif np.asarray(cols).dtype == bool:
+            columns = self._columns[np.asarray(cols)]
+        else:
+            columns = list(dict.fromkeys(cols))
+        return self.to_frame(columns).loc[rows, cols]
+
+    def _iloc(self, key: typing.Any) -> typing.Any:
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        idx = np.arange(self._columns.size)[cols]
+        df = self._frame(np.atleast_1d(idx))
+        if np.ndim(idx) == 0:
+            return df.iloc[rows, 0]
+        return df.iloc[rows, :] if isinstance(key, tuple) else df.iloc[rows]
+
+
+class TimeSeriesCSVMaximums:
+    """Maximums (``max`` and ``tmax`` columns) derived from a :class:`TimeSeriesCSV`. The maximums for an ID are
+    calculated when they are first requested, which only requires reading the columns for the requested IDs.
+
+    Parameters
+    ----------
+    time_series : TimeSeriesCSV
+        The time series to derive the maximums from.
+    func : Callable[[pd.DataFrame], pd.DataFrame]
+        Function that calculates the maximums from a time series ``DataFrame``. The returned ``DataFrame`` should have
+        the time series column names as the index.
+    """
+
+    def __init__(self, time_series: TimeSeriesCSV, func: typing.Callable[[pd.DataFrame], pd.DataFrame]):
+        self._time_series = time_series
+        self._func = func
+
+    @property
+    def index(self) -> pd.Index:
+        return self._time_series.columns
+
+    @property
+    def columns(self) -> pd.Index:
+        return pd.Index(['max', 'tmax'])
+
+    @property
+    def loc(self) -> _LazyLocIndexer:
+        return _LazyLocIndexer(self)
+
+    @property
+    def iloc(self) -> _LazyILocIndexer:
+        return _LazyILocIndexer(self)
+
+    def to_frame(self, rows: typing.Iterable[str] = None) -> pd.DataFrame:
+        return self._func(self._time_series.to_frame(rows))
+
+    def _iloc(self, key: typing.Any) -> typing.Any:
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        idx = np.arange(self.index.size)[rows]
+        df = self._func(self._time_series._frame(np.atleast_1d(idx)))
+        rows = 0 if np.ndim(idx) == 0 else slice(None)
+        return df.iloc[rows, cols] if isinstance(key, tuple) else df.iloc[rows]
+
+    def _loc(self, key: typing.Any) -> typing.Any:
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(rows, str):
+            ids = [rows]
+        elif isinstance(rows, slice) and rows == slice(None):
+            ids = None
+        elif np.asarray(rows).dtype == bool:
+            ids = self.index[np.asarray(rows)]
+        else:
+            ids = list(dict.fromkeys(rows))
+        df = self.to_frame(ids)
+        return df.loc[rows, cols] if isinstance(key, tuple) else df.loc[rows]
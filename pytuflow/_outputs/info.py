@@ -9,19 +9,21 @@ try:
 except ImportError:
     from .pymesh.stubs import pandas as pd
 
+from .helpers.time_series_cache import TimeSeriesCacheMixin
+from .helpers.time_series_csv import TimeSeriesCSV, TimeSeriesCSVMaximums
 from .helpers.tpc_reader import TPCReader
 from .time_series import TimeSeries
 from .._pytuflow_types import PathLike, TimeLike, AppendDict
 from ..util import pytuflow_logging
 from ..util import patterns
 from ..results import ResultTypeError
-from .helpers.lp_1d import LP1D
+from .helpers.lp_1d import LP1D, NetworkGraph
 
 
 logger = pytuflow_logging.get_logger()
 
 
-class INFO(TimeSeries):
+class INFO(TimeSeriesCacheMixin, TimeSeries):
     """Class for reading TUFLOW info time series results (:code:`.info`). These are text files with a :code:`.info`
     extension (typically found in the 1D output folder and ending with :code:`_1d.info` and not :code:`.2dm.info`)
     that are output by the 2013 TUFLOW release. The format is similar to the TPC format, however
@@ -130,6 +132,7 @@ class INFO(TimeSeries):
         self._maximum_data = AppendDict()
         self._nd_res_types = []
         self._lp = None
+        self._network = None
         self._section_geom = 'channel'
 
         self._loaded = False  # whether the results have been fully loaded
@@ -492,7 +495,7 @@ class INFO(TimeSeries):
         return df
 
     def section(self, locations: Union[str, list[str]], data_types: Union[str, list[str]],
-                time: TimeLike, *args, **kwargs) -> pd.DataFrame:
+                time: Union[TimeLike, list[TimeLike], str], *args, **kwargs) -> pd.DataFrame:
         """Returns a long plot for the given location and data types at the given time. If one location is given,
         the long plot will connect the given location down to the outlet. If 2 locations are given, then the
         long plot will connect the two locations (they must be connectable). If more than 2 locations are given,
@@ -514,14 +517,20 @@ class INFO(TimeSeries):
         * :code:`offset`: The offset along the long plot
         * :code:`[data_types]`: The data types requested.
 
+        If :code:`time` is :code:`'all'` or a list of times, the long plot is extracted for each of the times (e.g.
+        to animate a flood wave along a channel) and a :code:`time` column is added as the first column. The long plot
+        is repeated for each time, so :code:`df.groupby('time')` will return the same data as calling :code:`section()`
+        for each time separately, however the connectivity is only calculated once and the temporal results are
+        read for all times in a single step.
+
         Parameters
         ----------
         locations : str | list[str]
             The location to extract the section data for. Unlike other plotting methods, the location cannot be None.
         data_types : str | list[str]
             The data type to extract the section data for. If None is passed in, all node data types will be returned.
-        time : TimeLike
-            The time to extract the section data for.
+        time : TimeLike | list[TimeLike] | str
+            The time to extract the section data for. Use :code:`'all'` to extract the section data for all times.
 
         Returns
         -------
@@ -573,14 +582,14 @@ class INFO(TimeSeries):
         locations, data_types = self._figure_out_loc_and_data_types_lp(locations, data_types, 'channel')
 
         # get the time index
-        times = self.times(fmt='absolute') if isinstance(time, datetime) else self.times()
-        timeidx = self._closest_time_index(times, time)
+        times, timeidx = self._section_time_index(time)
 
         # get connectivity
         dfconn = self._connectivity(locations)
 
         # init long plot DataFrame
         df = self._init_lp(dfconn)
+        temporal = {}
 
         # loop through data types and add them to the data frame
         for dtype in data_types:
@@ -598,12 +607,23 @@ class INFO(TimeSeries):
                 df[dtype] = self._get_pits(dfconn)
             elif 'tmax' in dtype1:
                 dtype1 = dtype1.replace('TMax', '').strip()
-                df[dtype] = self._maximum_data[dtype1][0].loc[df['node'], 'tmax'].tolist()
+                df[dtype] = self._section_maximums(self._maximum_data[dtype1][0], df['node'])['tmax'].tolist()
             elif 'max' in dtype:
-                df[dtype] = self._maximum_data[dtype1][0].loc[df['node'], 'max'].tolist()
+                df[dtype] = self._section_maximums(self._maximum_data[dtype1][0], df['node'])['max'].tolist()
+            elif isinstance(timeidx, np.ndarray):  # temporal result - all requested times
+                temporal[dtype] = self._section_values(self._time_series_data[dtype1][0], timeidx, df['node'])
+                df[dtype] = np.nan
             else:  # temporal result
-                idx = self._time_series_data[dtype1][0].index[timeidx]
-                df[dtype] = self._time_series_data[dtype1][0].loc[idx, df['node']].tolist()
+                a = self._section_values(self._time_series_data[dtype1][0], np.array([timeidx]), df['node'])
+                df[dtype] = a[0].tolist()
+
+        if isinstance(timeidx, np.ndarray):
+            # repeat the long plot for each time and fill in the temporal results
+            n = df.shape[0]
+            df = df.iloc[np.tile(np.arange(n), timeidx.size)].reset_index(drop=True)
+            df.insert(0, 'time', np.repeat([times[i] for i in timeidx], n))
+            for dtype, a in temporal.items():
+                df[dtype] = a.reshape(-1)
 
         return df
 
@@ -629,16 +649,32 @@ class INFO(TimeSeries):
             return
         self._load_node_info()
         self._load_chan_info()
-        self._load_time_series()
-        self._load_maximums()
+        if not self._load_ts_cache():
+            self._load_time_series()
+            self._load_maximums()
+            self._save_ts_cache()
         self._load_1d_info()
         self._loaded = True
 
+    def _ts_cache_sources(self) -> list[Path]:
+        # docstring inherited
+        sources = [self.fpath]
+        for _, value in self._tpc_reader.iter_properties():
+            if isinstance(value, str) and value != 'NONE':
+                p = self.fpath.parent / value
+                if p.is_file() and p not in sources:
+                    sources.append(p)
+        return sources
+
     def _overview_dataframe(self) -> pd.DataFrame:
         df = self.oned_objs.copy()
         df['domain'] = '1d'
         return df
 
+    def _overview_sources(self) -> list[pd.DataFrame] | None:
+        # docstring inherited
+        return [self.oned_objs]
+
     def _init_tpc_reader(self) -> TPCReader:
         """Initialise the TPCReader object."""
         return TPCReader(self.fpath)
@@ -753,16 +789,11 @@ class INFO(TimeSeries):
                 except Exception as e:
                     logger.warning(f'INFO._load_time_series(): Error loading time series from {p}: {e}')
 
-    def _load_time_series_csv(self, fpath: Path) -> pd.DataFrame:
-        """Load the time-series data from the CSV file into a DataFrame."""
+    def _load_time_series_csv(self, fpath: Path) -> TimeSeriesCSV:
+        """Load the time-series data from the CSV file. Only the header is read here, the data is
+        read lazily for the requested IDs (see :class:`TimeSeriesCSV`)."""
         dtype = str if fpath.stem.endswith('_1d_CF') or fpath.stem.endswith('_1d_NF') else np.float32
-        df = pd.read_csv(fpath, na_values='**********', index_col=1, dtype=dtype, encoding_errors='ignore')
-        df.index.name = 'Time (h)'
-        df.drop(df.columns[0], axis=1, inplace=True)
-        df.rename(columns={x: self._csv_col_name_corr(x) for x in df.columns}, inplace=True)
-        if dtype is str:
-            df.index = df.index.astype(np.float32)
-        return df
+        return TimeSeriesCSV(fpath, dtype=dtype, col_name_corr=self._csv_col_name_corr)
 
     @staticmethod
     def _csv_col_name_corr(name: str) -> str:
@@ -777,14 +808,21 @@ class INFO(TimeSeries):
         # info class does not have actual maximums, so need to be post-processed.
         for data_type, results in self._time_series_data.items():
             for res in results:
-                max_ = res.max()
-                valid = max_.notna()
-                tmax = max_.copy()
-                tmax.loc[:] = np.nan  # set tmax to NaN where max is NaN
-                if tmax.dtype != 'float':
-                    tmax = tmax.astype('float')
-                tmax[valid] = res.loc[:,valid].idxmax()
-                self._maximum_data[data_type] = pd.DataFrame({'max': max_, 'tmax': tmax})
+                if isinstance(res, TimeSeriesCSV):
+                    self._maximum_data[data_type] = TimeSeriesCSVMaximums(res, self._calc_maximums)
+                else:
+                    self._maximum_data[data_type] = self._calc_maximums(res)
+
+    @staticmethod
+    def _calc_maximums(res: pd.DataFrame) -> pd.DataFrame:
+        max_ = res.max()
+        valid = max_.notna()
+        tmax = max_.copy()
+        tmax.loc[:] = np.nan  # set tmax to NaN where max is NaN
+        if tmax.dtype != 'float':
+            tmax = tmax.astype('float')
+        tmax[valid] = res.loc[:,valid].idxmax()
+        return pd.DataFrame({'max': max_, 'tmax': tmax})
 
     def _prepend_1d_type_to_column_name(self, columns: pd.Index) -> pd.Index:
         """Prepend 'node' or 'channel' to the column names.
@@ -845,7 +883,7 @@ class INFO(TimeSeries):
         pd.DataFrame
             The connectivity information.
         """
-        lp = LP1D(ids, self._node_info, self._channel_info)
+        lp = LP1D(ids, self._node_info, self._channel_info, self._network_graph())
         if self._lp is not None and lp == self._lp:
             return self._lp.df
 
@@ -853,5 +891,52 @@ class INFO(TimeSeries):
         self._lp = lp
         return self._lp.df
 
+    def _section_time_index(self, time: Union[TimeLike, list[TimeLike], str]
+                            ) -> tuple[list[TimeLike], Union[int, np.ndarray]]:
+        """Returns the result times and the index of the requested time. If :code:`time` is :code:`'all'` or a list
+        of times, the index is an array with an entry for each time.
+        """
+        if isinstance(time, str):
+            if time.lower() != 'all':
+                raise ValueError(f'Invalid time: {time}. Use a time, a list of times, or "all".')
+            times = self.times()
+            return times, np.arange(len(times))
+        if isinstance(time, (list, tuple, np.ndarray)):
+            times = self.times(fmt='absolute') if len(time) and isinstance(time[0], datetime) else self.times()
+            return times, np.array([self._closest_time_index(times, t) for t in time], dtype=int)
+        times = self.times(fmt='absolute') if isinstance(time, datetime) else self.times()
+        return times, self._closest_time_index(times, time)
+
+    @staticmethod
+    def _section_values(data: Union[pd.DataFrame, TimeSeriesCSV], timeidx: np.ndarray,
+                        nodes: pd.Series) -> np.ndarray:
+        """Returns a (time x node) array of the temporal results for the long plot nodes using a single positional
+        take rather than a label lookup per time.
+        """
+        if not isinstance(data, pd.DataFrame):
+            data = data.to_frame(pd.unique(nodes))  # lazily loaded result, only read the nodes required
+        if not data.columns.is_unique:
+            data = data.loc[:, ~data.columns.duplicated()]
+        pos = data.columns.get_indexer(nodes)
+        if (pos == -1).any():
+            raise KeyError(f'{nodes[pos == -1].tolist()} not in results')
+        a = data.iloc[:, pos].to_numpy()[timeidx]
+        return a.astype(np.float64) if a.dtype.kind == 'f' else a
+
+    @staticmethod
+    def _section_maximums(data: Union[pd.DataFrame, TimeSeriesCSVMaximums], nodes: pd.Series) -> pd.DataFrame:
+        """Returns the maximums (``max`` and ``tmax`` columns) for the long plot nodes in the order of the nodes."""
+        if not isinstance(data, pd.DataFrame):
+            data = data.to_frame(pd.unique(nodes))  # lazily calculated maximums, only calculate the nodes required
+        return data.loc[nodes]
+
+    def _network_graph(self) -> NetworkGraph:
+        """Returns the network graph used to trace connectivity. The graph is built once and reused so that the
+        traced paths are cached across calls.
+        """
+        if self._network is None:
+            self._network = NetworkGraph(self._channel_info, self._node_info)
+        return self._network
+
     def _init_lp(self, dfconn: pd.DataFrame) -> pd.DataFrame:
         return self._lp.init_lp(dfconn)
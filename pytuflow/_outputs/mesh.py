@@ -11,6 +11,8 @@ except ImportError:
 
 from .helpers.mesh_driver_qgis import QgisMeshDriver
 from .helpers.mesh_driver_nc import NCMeshDriver
+from .helpers.surface_array import MeshSurface
+from .helpers.frame_assembler import FrameAssembler
 from .map_output import MapOutput, PointLocation, LineStringLocation
 from .._pytuflow_types import PathLike, TimeLike
 from ..util import pytuflow_logging
@@ -318,7 +320,8 @@ class Mesh(MapOutput):
             raise NotImplementedError('v1.0 driver does not support minimum data extraction.')
 
     def surface(self, data_type: str, time: TimeLike, averaging_method: str = 'sigma&0&1',
-                to_vertex: bool = False, coord_scope: str = 'global') -> pd.DataFrame:
+                to_vertex: bool = False, coord_scope: str = 'global',
+                return_type: str = 'dataframe') -> pd.DataFrame | MeshSurface:
         """Returns the value for every cell/vertex at the specified time. A depth averaging method
         is required for 3D datasets (defaults to sigma averaging from 0 to 1).
 
@@ -367,11 +370,20 @@ class Mesh(MapOutput):
             - ``"local"`` - coordinates are transformed to a local Cartesian coordinate system and the origin is moved
               to the centre of the mesh extent. This can be useful for visualisation purposes, especially when converting
               into 3D formats for viewing in programs like Blender, Unreal Engine, etc
+        return_type : str, optional
+            The return type. Options are:
+
+            - ``"dataframe"`` (default) - a DataFrame with a row for every cell/vertex
+            - ``"array"`` - a :class:`MeshSurface <pytuflow.MeshSurface>` holding the value array, the active mask
+              and a reference to the cell/vertex positions. Nothing is copied, so this is much lighter on memory for
+              large meshes. The values are read-only. The DataFrame can still be created later with
+              :meth:`MeshSurface.to_frame() <pytuflow.MeshSurface.to_frame>`.
 
         Returns
         -------
-        pd.DataFrame
-            The surface data as a DataFrame with columns for the coordinates, value(s), and active mask.
+        pd.DataFrame | MeshSurface
+            The surface data as a DataFrame with columns for the coordinates, value(s), and active mask, or a
+            :class:`MeshSurface <pytuflow.MeshSurface>` if ``return_type="array"``.
 
         Examples
         --------
@@ -392,16 +404,17 @@ class Mesh(MapOutput):
         """
         self._load()
         data_type = self._figure_out_data_types(data_type, None)[0]
+        if return_type not in ('dataframe', 'array'):
+            raise ValueError(f'Invalid return type: {return_type}')
         if self._driver.DRIVER_SOURCE != 'python':
             raise NotImplementedError('v1.0 driver does not support surface data extraction.')
-        data, mask = self._driver.surface(data_type, time, averaging_method, to_vertex, coord_scope)
-        columns = ['lon', 'lat'] if self._driver.extractor.spherical() and coord_scope != 'local' else ['x', 'y']
-        df = pd.DataFrame(
-            data,
-            columns=columns + ['value-x', 'value-y'] if data.shape[1] == 4 else columns + ['value']
-        )
-        df['active'] = mask.flatten().astype(bool)
-        return df
+        values, mask, pos = self._driver.surface_values(data_type, time, averaging_method, to_vertex, coord_scope)
+        # the arrays may be held in the driver's cache
+        values, mask = values.view(), mask.view()
+        values.flags.writeable = mask.flags.writeable = False
+        spherical = self._driver.extractor.spherical() and coord_scope != 'local'
+        surf = MeshSurface(values, mask, pos, spherical)
+        return surf if return_type == 'array' else surf.to_frame()
 
     def data_point(self, locations: PointLocation, data_types: str | list[str] | None, time: TimeLike,
                    averaging_method: str = None) -> float | tuple[float, float] | pd.DataFrame:
@@ -489,12 +502,18 @@ class Mesh(MapOutput):
         rows = []
         values1 = []
         val = np.nan
-        for name, pnt in pnts.items():
+        batch = {}
+        if self._driver.DRIVER_SOURCE == 'python':
+            # locate all points and read the results once per data type
+            for dtype in data_types:
+                batch[dtype] = self._driver.data_point_batch(list(pnts.values()), dtype, time,
+                                                             depth_averaging=averaging_method, return_type='vector')
+        for i, (name, pnt) in enumerate(pnts.items()):
             rows.append(name)
             values2 = []
             for dtype in data_types:
                 if self._driver.DRIVER_SOURCE == 'python':
-                    val = self._driver.data_point(pnt, dtype, time, depth_averaging=averaging_method, return_type='vector')
+                    val = batch[dtype][i]
                 else:
                     val = self._driver.data_point(pnt, dtype, time, averaging_method, return_type='vector')
                 values2.append(val)
@@ -608,32 +627,29 @@ class Mesh(MapOutput):
         3.000000       0.183721
         """
         self._load()
-        df = pd.DataFrame()
+        frame = FrameAssembler(index_tol=0.0001)
         pnts = self._translate_point_location(locations)
         data_types = self._figure_out_data_types(data_types, 'temporal')
-        for name, pnt in pnts.items():
+        batch = {}
+        if self._driver.DRIVER_SOURCE == 'python':
+            # locate all points and read the results once per data type
+            for dtype in data_types:
+                batch[dtype] = self._driver.time_series_batch(list(pnts.values()), dtype, averaging_method)
+        for i, (name, pnt) in enumerate(pnts.items()):
             for dtype in data_types:
                 if self._driver.DRIVER_SOURCE == 'python':
-                    a = self._driver.time_series(pnt, dtype, averaging_method)
+                    a = batch[dtype][i]
                     if a.size:
                         a = a.reshape(a.shape[0], -1)
                         if a.shape[1] > 2:
                             a = np.append(a[:,[0]], np.linalg.norm(a[:,1:], axis=1).reshape(-1, 1), axis=1)
-                        df1 = pd.DataFrame(a[:,1], index=a[:,0], columns=[f'{name}/{dtype}'])
-                        df1.index.name = 'time'
-                    else:
-                        df1 = pd.DataFrame()
+                        frame.add(a[:,0], a[:,1], [f'{name}/{dtype}'])
                 else:
                     df1 = self._driver.time_series(name, pnt, dtype, averaging_method)
-                if df1.empty:
-                    continue
-                if not df.empty:
-                    if np.isclose(df.index, df1.index, atol=0.0001, rtol=0).all():
-                        df1.index = df.index
-                    else:
-                        raise ValueError('Time series index does not match between datasets.')
-                df = pd.concat([df, df1], axis=1) if not df.empty else df1
+                    if not df1.empty:
+                        frame.add_frame(df1)
 
+        df = frame.to_frame()
         if time_fmt == 'absolute':
             df.index = self.reference_time + pd.to_timedelta(df.index, unit='h')
 
@@ -748,6 +764,8 @@ class Mesh(MapOutput):
         df = pd.DataFrame()
         lines = self._translate_line_string_location(locations)
         data_types = self._figure_out_data_types(data_types, None)
+        if self._driver.DRIVER_SOURCE == 'python' and len(lines) > 1:
+            self._driver.mesh_lines(list(lines.values()))  # intersect all lines with the mesh in one pass
         for name, line in lines.items():
             df1 = pd.DataFrame()
             for dtype in data_types:
@@ -767,6 +785,66 @@ class Mesh(MapOutput):
 
         return df
 
+    def section_time_series(self, locations: LineStringLocation, data_type: str,
+                            averaging_method: str = None) -> pd.DataFrame:
+        """Extracts section data for the given locations at every timestep e.g. for a time vs chainage
+        (Hovmoller) plot.
+
+        This gives the same values as calling :meth:`section` for each timestep, however each line is only
+        intersected with the mesh once and the values along the line are read for all timesteps together.
+
+        The ``locations`` argument is the same as :meth:`section`.
+
+        The resulting DataFrame will use the time as the index and multi-index columns. The level 1 index will be the
+        label, and the level 2 index will be the offset along the line.
+
+        Parameters
+        ----------
+        locations : list[Point] | str | PathLike
+            The location to extract the section data for.
+        data_type : str
+            The data type to extract the section data for.
+        averaging_method : str, optional
+            The depth-averaging method to use. Only applicable for 3D results. See :meth:`section` for the
+            available methods.
+
+        Returns
+        -------
+        pd.DataFrame
+            The section data for every timestep.
+
+        Examples
+        --------
+        Get the water level along a line for every timestep. The values for each line can be taken as a 2D
+        ``(time, offset)`` array using ``df['line1'].to_numpy()``:
+
+        >>> mesh = ... # Assume mesh is a loaded Mesh result
+        >>> mesh.section_time_series([(293250, 6178030), (293500, 6178030)], 'water level')
+                    line1
+        offset   0.000000   1.706903   8.548661  ... 213.947585 234.541227 250.000000
+        time
+        0.0           NaN        NaN        NaN  ...        NaN        NaN        NaN
+        0.5           NaN        NaN        NaN  ...        NaN        NaN        NaN
+        1.0     42.319296  42.315569  42.314754  ...        NaN        NaN        NaN
+        1.5     42.061077  42.050357  42.043587  ...        NaN        NaN        NaN
+        2.0     41.552263  41.494993  41.434049  ...        NaN        NaN        NaN
+        2.5     41.190601  41.098198  41.002134  ...        NaN        NaN        NaN
+        3.0     40.847111  40.714054  40.617153  ...        NaN        NaN        NaN
+        """
+        self._load()
+        if self._driver.DRIVER_SOURCE != 'python':
+            raise NotImplementedError('v1.0 driver does not support section time series extraction.')
+        data_type = self._figure_out_data_types(data_type, None)[0]
+        lines = self._translate_line_string_location(locations)
+        if len(lines) > 1:
+            self._driver.mesh_lines(list(lines.values()))  # intersect all lines with the mesh in one pass
+        frames = {}
+        for name, line in lines.items():
+            times, offsets, values = self._driver.section_time_series(line, data_type, averaging_method)
+            frames[name] = pd.DataFrame(values, index=pd.Index(times, name='time'),
+                                        columns=pd.Index(offsets, name='offset'))
+        return pd.concat(frames, axis=1)
+
     def curtain(self, locations: LineStringLocation, data_types: Union[str, list[str]],
                 time: TimeLike) -> pd.DataFrame:
         """Extracts curtain data for the given locations and data types.
@@ -830,6 +908,8 @@ class Mesh(MapOutput):
         df = pd.DataFrame()
         lines = self._translate_line_string_location(locations)
         data_types = self._figure_out_data_types(data_types, None)
+        if self._driver.DRIVER_SOURCE == 'python' and len(lines) > 1:
+            self._driver.mesh_lines(list(lines.values()))  # intersect all lines with the mesh in one pass
         for name, line in lines.items():
             df1 = pd.DataFrame()
             for dtype in data_types:
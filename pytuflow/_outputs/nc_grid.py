@@ -13,6 +13,7 @@ from ..results import ResultTypeError
 from .map_output import PointLocation, LineStringLocation
 from .grid import Grid
 from .helpers.nc_grid_var import NCGridVar
+from .helpers.surface_array import GridSurface
 from .._pytuflow_types import PathLike, TimeLike
 
 try:
@@ -104,6 +105,14 @@ class NCGrid(Grid):
     10   9.487831           45.560959
     """
 
+    #: int: The chunk cache size (bytes) set on the netCDF variables that are read. The chunk cache holds
+    #: decompressed chunks, so it should be large enough to hold at least one chunk. If ``None``, the netCDF
+    #: library default is used.
+    chunk_cache_bytes = None
+    #: int: The maximum size (bytes) of a single read when extracting values for many cells. Cells are read a chunk
+    #: at a time over as many timesteps as fit within this limit.
+    max_read_bytes = 64 * 1024 ** 2
+
     def __init__(self, fpath: PathLike):
         self.fpath = Path(fpath)
         self._loaded = False
@@ -252,10 +261,13 @@ class NCGrid(Grid):
             return super().maximum(data_types)
 
     def surface(self, data_type: str = None, time: TimeLike = 0, to_vertex: bool = False, coord_scope: str = 'global',
-                direction_to_vector: bool = False, direction_convention = 'arithmetic') -> pd.DataFrame:
+                direction_to_vector: bool = False, direction_convention = 'arithmetic',
+                bbox: tuple[float, float, float, float] = None,
+                return_type: str = 'dataframe') -> pd.DataFrame | GridSurface:
         self._load()
         with self._open():
-            return super().surface(data_type, time, to_vertex, coord_scope, direction_to_vector, direction_convention)
+            return super().surface(data_type, time, to_vertex, coord_scope, direction_to_vector, direction_convention,
+                                   bbox, return_type)
 
     def data_point(self, locations: PointLocation, data_types: str | list[str] = (),
                    time: TimeLike = 0) -> float | tuple[float, float] | pd.DataFrame:
@@ -370,3 +382,49 @@ class NCGrid(Grid):
             else:
                 return np.array(val)
         return val
+
+    def _value_at(self, dtype: str, time_index: int, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        is_static = self._is_static(dtype)
+        cached = self._cached_timesteps.get(dtype.lower(), ())
+        if (is_static and cached) or (not is_static and time_index in cached):
+            return super()._value_at(dtype, time_index, rows, cols)
+        time_index = 0 if is_static else time_index
+        return self._read_cells(dtype, slice(time_index, time_index + 1), rows, cols)[0]
+
+    def _time_series_values(self, dtype: str, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        return self._read_cells(dtype, slice(None), rows, cols)
+
+    def _read_cells(self, dtype: str, time_slice: slice, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Returns the values (ntimes x ncells) for the given cells. Cells are grouped by the chunk they are stored
+        in so each chunk is only read (and decompressed) once, rather than once per cell.
+        """
+        var = self._nc.variables[self._stnd2var[dtype]]
+        if self.chunk_cache_bytes is not None:
+            var.set_var_chunk_cache(size=self.chunk_cache_bytes)
+        chunks = var.chunking()
+        if chunks == 'contiguous':  # uncompressed, so reading cell by cell is fine
+            chunks = [1] * var.ndim
+        cht, chy, chx = chunks[0] if var.ndim == 3 else 1, chunks[-2], chunks[-1]
+        times = range(*time_slice.indices(var.shape[0] if var.ndim == 3 else 1))
+        rows, cols = np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+        out = np.full((len(times), rows.size), np.nan)
+
+        keys = (rows // chy) * -(-var.shape[-1] // chx) + cols // chx
+        order = np.argsort(keys, kind='stable')
+        groups = np.split(order, np.flatnonzero(np.diff(keys[order])) + 1) if order.size else []
+        for idx in groups:
+            r, c = rows[idx], cols[idx]
+            r0, r1, c0, c1 = r.min(), r.max() + 1, c.min(), c.max() + 1
+            # read as many timesteps at once as fit within the read limit (whole time chunks)
+            step = max(self.max_read_bytes // max((r1 - r0) * (c1 - c0) * var.dtype.itemsize, 1), 1)
+            step = max(step // cht, 1) * cht
+            for i in range(0, len(times), step):
+                t = times[i:i + step]
+                if var.ndim == 3:
+                    block = var[t.start:t.stop:t.step, r0:r1, c0:c1]
+                else:
+                    block = var[r0:r1, c0:c1][None, ...]
+                if np.ma.isMaskedArray(block):
+                    block = block.filled(np.nan) if np.ma.is_masked(block) else np.array(block)
+                out[i:i + len(t), idx] = block[:, r - r0, c - c0]
+        return out
@@ -18,6 +18,52 @@ from .._pytuflow_types import PathLike, TimeLike, PlotExtractionLocation
 with (Path(__file__).parent / 'data' / 'data_type_name_alternatives.json').open() as f:
     DATA_TYPE_NAME_ALTERNATIVES = json.load(f)
 
+
+class _DataTypeNameResolver:
+    """Resolves data type names to the standard name from :data:`DATA_TYPE_NAME_ALTERNATIVES`.
+
+    All the alternatives are compiled into a single regular expression (one group per standard name, in the
+    same order as the alternatives so that the first match still wins) the first time it's used, and resolved names
+    are stored in a memo table so that repeated names are only matched once.
+    """
+
+    PREFIX = r'(?:(?:t?(?:max|min)(?:imums?/?)?|time[\s_-]+of[\s_-]+peak)(?:\s|_|-)?)?'
+    SUFFIX = r'(?:(?:\s|_|-)?/?t?(?:max|min)(?:imums?)?)?'
+
+    def __init__(self, alternatives: dict[str, list[str]]):
+        self.alternatives = alternatives
+        self._keys = list(alternatives)
+        self._regex = None
+        self._memo = {}
+
+    def resolve(self, name: str) -> str:
+        if name in self._memo:
+            return self._memo[name]
+        if self._regex is None:
+            self._regex = self._compile()
+        stnd = name.lower()
+        m = self._regex.match(name)
+        if m:
+            key = self._keys[next(int(k[1:]) for k, v in m.groupdict().items() if v is not None)]
+            stnd = key
+            if '\\d' in key:
+                n = re.findall(r'\d+', name)
+                stnd = key.replace('\\d', n[0]) if n else key
+        self._memo[name] = stnd
+        return stnd
+
+    def _compile(self) -> re.Pattern:
+        groups = []
+        for i, (key, vals) in enumerate(self.alternatives.items()):
+            alts = [re.escape(key)]
+            if vals:
+                alts.append(fr'{self.PREFIX}(?:{"|".join(vals)}){self.SUFFIX}')
+            groups.append(f'(?P<k{i}>{"|".join(alts)})')
+        return re.compile(fr'^(?:{"|".join(groups)})$', re.IGNORECASE)
+
+
+_DATA_TYPE_NAME_RESOLVER = _DataTypeNameResolver(DATA_TYPE_NAME_ALTERNATIVES['data_types'])
+
 DEFAULT_REFERENCE_TIME = datetime(1990, 1, 1, tzinfo=timezone.utc)
 
 
@@ -233,6 +279,31 @@ class Output(ABC):
     def _overview_dataframe(self) -> pd.DataFrame:
         pass
 
+    def _overview_sources(self) -> list[pd.DataFrame] | None:
+        """Returns the DataFrames that the overview DataFrame is built from. If provided, the results of
+        :meth:`_filter` are indexed (by the filter string) and reused until one of these DataFrames is replaced or
+        changes size. Returns ``None`` if the filter results should not be indexed.
+        """
+        return None
+
+    def _indexed_filter(self, key: tuple, filter_func: typing.Callable[[], tuple[pd.DataFrame, dict[str, bool]]]
+                        ) -> tuple[pd.DataFrame, dict[str, bool]]:
+        """Returns the filter result for the given key from the metadata index, calling ``filter_func`` and
+        storing the result if it isn't already indexed.
+        """
+        sources = self._overview_sources()
+        if sources is None:
+            return filter_func()
+        state = [(x, len(x)) for x in sources]
+        index = getattr(self, '_filter_index', None)
+        if index is None or len(index[0]) != len(state) or any(a is not b or n != m for (a, n), (b, m) in zip(index[0], state)):
+            index = (state, {})
+            self._filter_index = index
+        if key not in index[1]:
+            index[1][key] = filter_func()
+        df, filtered = index[1][key]
+        return df.copy(deep=False), filtered.copy()
+
     def _filter(self, filter_by: str, filtered_something: bool = False, df: pd.DataFrame = None,
                 ignore_excess_filters: bool = False) -> tuple[pd.DataFrame, dict[str, bool]]:
         """Returns a DataFrame with the output combinations for the given filter string and a dictionary
@@ -257,6 +328,14 @@ class Output(ABC):
         tuple[pd.DataFrame, dict[str, bool]]
             The context combinations and a dictionary of what filters were triggered.
         """
+        if df is None and not filtered_something:
+            key = (tuple(x.strip().lower() for x in filter_by.split('/') if x) if filter_by else (),
+                   ignore_excess_filters)
+            return self._indexed_filter(key, lambda: self._filter_(filter_by, False, None, ignore_excess_filters))
+        return self._filter_(filter_by, filtered_something, df, ignore_excess_filters)
+
+    def _filter_(self, filter_by: str, filtered_something: bool, df: pd.DataFrame | None,
+                 ignore_excess_filters: bool) -> tuple[pd.DataFrame, dict[str, bool]]:
         domain_filter = False
         geom_filter = False
         attr_filter = False
@@ -312,18 +391,7 @@ class Output(ABC):
         Returns the standard data type name for a given name. The name can be a short name, long name, or
         any standard alternate name of the given data type.
         """
-        for key, vals in DATA_TYPE_NAME_ALTERNATIVES['data_types'].items():
-            if name.lower() == key.lower():
-                return key
-            for val in vals:
-                if re.match(fr'^(?:(?:t?(?:max|min)(?:imums?/?)?|time[\s_-]+of[\s_-]+peak)(?:\s|_|-)?)?{val}(?:(?:\s|_|-)?/?t?(?:max|min)(?:imums?)?)?$', name,
-                            re.IGNORECASE):
-                    if '\\d' in key:
-                        n = re.findall(r'\d+', name)
-                        return key.replace('\\d', n[0]) if n else key
-                    return key
-
-        return name.lower()
+        return _DATA_TYPE_NAME_RESOLVER.resolve(name)
 
     def _load(self):
         pass
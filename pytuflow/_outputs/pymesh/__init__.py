@@ -4,6 +4,7 @@ from .data_cache import Cache
 from .transform import Transform2D
 from .proj_transformer import proj_transformer
 from .bbox import Bbox2D
+from .temporal_reducer import TemporalReducer
 
 from . import depth_averaging
 
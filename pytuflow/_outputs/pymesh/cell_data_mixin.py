@@ -10,24 +10,25 @@ if typing.TYPE_CHECKING:
 
 class CellDataMixin:
 
+    def ragged_layout(self: 'PyMesh') -> depth_averaging.RaggedLayout:
+        """Returns the layout of the 3D results (the number of vertical layers in each 2D cell). The layout
+        is only calculated once.
+
+        Returns
+        -------
+        RaggedLayout
+            The layout of the 3D results.
+        """
+        if self._ragged_layout is None:
+            self._ragged_layout = depth_averaging.RaggedLayout(self.zlevel_count(slice(None)))
+        return self._ragged_layout
+
     def cell_data(self: 'PyMesh',
                   data_type: str,
                   time_index: int | slice,
                   depth_averaging_method: str,
                   to_vertex: bool = False
                   ) -> tuple[np.ndarray, np.ndarray]:
-        def cell2node(data_: np.ndarray, dry_mask: np.ndarray, wts_: np.ndarray | None) -> tuple[np.ndarray, np.ndarray]:
-            data_[dry_mask] = 0
-            if wts_ is None:
-                wts_ = self.geom.cell_to_vertex_weights().copy()
-                wts_[dry_mask, :] = 0
-                wts_sum = np.bincount(self.geom.cell_nodes.flatten(), wts_.flatten())
-                mask = wts_sum == 0
-                wts_sum[mask] = -999
-                wts_ = wts_ / wts_sum[self.geom.cell_nodes]
-            data_tiled = np.tile(data_, (4, 1)).transpose() * wts_
-            return np.bincount(self.geom.cell_nodes.flatten(), data_tiled.flatten()), wts_
-
         data_types = self.translate_data_type(data_type)
         is_3d = self.is_3d(data_types[0])
         is_vector = self.is_vector(data_types[0])
@@ -43,13 +44,14 @@ class CellDataMixin:
             wd3d_index = self.extractor.data('idx2', slice(None)) - 1
             wd3d = wd[wd3d_index] if wd.ndim == 1 else wd[:, wd3d_index]
 
-        wts = None
+        if to_vertex:
+            c2v = self.geom.cell_to_vertex_operator()
+
         if is_3d and depth_averaging_method is not None:
-            nlevels = self.zlevel_count(slice(None))
-            max_nlevels = nlevels.max()
+            layout = self.ragged_layout()
+            nlevels = layout.nlevels
             zlevels = self.zlevels(time_index, nlevels, np.arange(nlevels.shape[0]), self.cell_index(slice(None), data_types[0]))
-            a_padded = np.full((nlevels.shape[0], max_nlevels), np.nan)
-            b_padded = np.full((nlevels.shape[0], max_nlevels + 1), np.nan)
+            depth_average = depth_averaging.get_method_func(depth_averaging_method)
 
         data = np.array([])
         values = []
@@ -69,38 +71,15 @@ class CellDataMixin:
                 if data.ndim == 2 and data.shape[0] == 1:
                     data = data.flatten()
                 if is_3d and depth_averaging_method is not None:
-                    def depth_average(data_: np.ndarray, zlevels_: np.ndarray) -> np.ndarray:
-                        a_padded[:] = np.nan
-                        b_padded[:] = np.nan
-                        k1, k2 = 0, 0
-                        for i, nlevel in enumerate(nlevels):
-                            a_padded[i, :nlevel] = data_[k1:k1 + nlevel]
-                            b_padded[i, :nlevel + 1] = zlevels_[k2:k2 + nlevel + 1]
-                            k1 += nlevel
-                            k2 += nlevel + 1
-                        return depth_averaging.get_method_func(depth_averaging_method)(b_padded, a_padded)
-
-                    if data.ndim == 1:
-                        data = depth_average(data, zlevels)
-                        if to_vertex:
-                            data, wts = cell2node(data, ~wd, wts)
-                        else:
-                            data[~wd, ...] = 0.
+                    # all timesteps are averaged together
+                    data = layout.depth_average(depth_average, data, zlevels)
+                    if to_vertex:
+                        data = c2v.apply(data, wd)
                     else:
-                        shape = (data.shape[0], self.geom.vertices.shape[0]) if to_vertex else (data.shape[0], nlevels.shape[0])
-                        data_avg = np.full(shape, np.nan)
-                        for t in range(data.shape[0]):
-                            if to_vertex:
-                                depth_avg = depth_average(data[t, :], zlevels)
-                                data_avg[t, :], wts = cell2node(depth_avg, ~wd[t, :], wts)
-                            else:
-                                data_avg[t, :] = depth_average(data[t, :], zlevels[t, :])
-                        if not to_vertex:
-                            data_avg[~wd, ...] = 0.
-                        data = data_avg
+                        data[~wd, ...] = 0.
 
                 elif to_vertex:
-                    data, wts = cell2node(data, ~wd, wts)
+                    data = c2v.apply(data, wd)
                 else:
                     data[~wd3d if is_3d else ~wd, ...] = 0.
 
@@ -114,7 +93,7 @@ class CellDataMixin:
             else:
                 data = np.concatenate(values, axis=2 if is_vector else 1)
         if to_vertex:
-            wd = self._map_wet_dry_to_verts(wd)
+            wd = c2v.active(wd)
 
         if is_3d and depth_averaging_method is None:
             wd = wd3d
@@ -221,6 +200,68 @@ class CellDataMixin:
         data[~wd, ...] = np.nan
         return data if len(values) == 1 else data.reshape(-1, 1, 2)
 
+    def data_point_from_cell_data_batch(
+            self: 'PyMesh',
+            points: np.ndarray,
+            data_type: str,
+            time_index: int,
+            depth_averaging_method: str,
+    ) -> list[float | tuple[float, float]]:
+        """Batched version of :meth:`data_point_from_cell_data`. 2D results for the union of the containing
+        cells are read with one extractor call per data type. 3D results fall back to the per-point routine.
+        """
+        if self.is_3d(data_type) or self.extractor.NAME == 'QgisDataExtractor':
+            return [self.data_point_from_cell_data(p, data_type, time_index, depth_averaging_method) for p in points]
+
+        cell_ids = self.geom.find_containing_cells(points, scope='local')
+        found = np.flatnonzero(cell_ids != -1)
+        values = [np.nan for _ in range(cell_ids.shape[0])]
+        if found.size == 0:
+            return values
+
+        data_type = self.translate_data_type(data_type)
+        cells, inverse = np.unique(cell_ids[found], return_inverse=True)
+        wd = self.extractor.wd_flag(data_type[0], (time_index, cells)).flatten().astype(bool)[inverse]
+        data = np.column_stack([self.extractor.data(dtype, (time_index, cells)).flatten()[inverse] for dtype in data_type])
+
+        for i, val, active in zip(found, data, wd):
+            if not active:
+                continue
+            values[i] = float(val[0]) if len(data_type) == 1 else tuple([x for x in val])
+        return values
+
+    def time_series_from_cell_data_batch(
+            self: 'PyMesh',
+            points: np.ndarray,
+            data_type: str,
+            depth_averaging_method: str
+    ) -> list[np.ndarray]:
+        """Batched version of :meth:`time_series_from_cell_data`. 2D results for the union of the containing
+        cells are read with one extractor call per data type. 3D results fall back to the per-point routine.
+        """
+        if self.is_3d(data_type) or self.extractor.NAME == 'QgisDataExtractor':
+            return [self.time_series_from_cell_data(p, data_type, depth_averaging_method) for p in points]
+
+        cell_ids = self.geom.find_containing_cells(points, scope='local')
+        found = np.flatnonzero(cell_ids != -1)
+        values = [np.array([]) for _ in range(cell_ids.shape[0])]
+        if found.size == 0:
+            return values
+
+        data_type = self.translate_data_type(data_type)
+        cells, inverse = np.unique(cell_ids[found], return_inverse=True)
+        wd = self.extractor.wd_flag(data_type[0], (slice(None), cells)).astype(bool).reshape((-1, cells.size))
+        data = np.stack(
+            [self.extractor.data(dtype, (slice(None), cells)).reshape((-1, cells.size)) for dtype in data_type],
+            axis=2
+        )
+        data[~wd, ...] = np.nan
+        data = data[:, inverse]
+
+        for j, i in enumerate(found):
+            values[i] = data[:, j, 0] if len(data_type) == 1 else data[:, j].reshape(-1, 1, 2)
+        return values
+
     def section_from_cell_data(
             self: 'PyMesh',
             cell_ids: np.ndarray,
@@ -229,6 +270,29 @@ class CellDataMixin:
             time_index: int,
             depth_averaging_method: str
     ) -> np.ndarray:
+        data = self.section_values_from_cell_data(cell_ids, data_type, time_index, depth_averaging_method)[0]
+        vector = data.ndim > 1
+        offset = np.repeat(points[:,[0]], 2, axis=0)[1:-1,...]
+
+        return np.append(
+            offset.reshape((-1, 1, 1) if vector else (-1, 1)),
+            data.reshape(-1, 1, 2) if vector else data.reshape(-1, 1),
+            axis=2 if vector else 1
+        )
+
+    def section_values_from_cell_data(
+            self: 'PyMesh',
+            cell_ids: np.ndarray,
+            data_type: str,
+            time_index: int | slice,
+            depth_averaging_method: str
+    ) -> np.ndarray:
+        """Returns the section values (two for each cell crossed, one at either end) for one or more timesteps.
+        The crossed cells are read together for all the timesteps in a single extractor call per data type.
+
+        The returned array is ``(ntime, N)`` for scalar results and ``(ntime, N, 2)`` for vector results, where
+        ``ntime`` is ``1`` if ``time_index`` is an integer.
+        """
         data_type = self.translate_data_type(data_type)
 
         cells, inverse = np.unique(cell_ids, return_inverse=True)
@@ -239,62 +303,52 @@ class CellDataMixin:
         cell_idx = self.cell_index(cells, data_type[0])
         if is_3d:
             nlevels = self.zlevel_count(cells)
-            max_nlevels = nlevels.max()
+            layout = depth_averaging.RaggedLayout(nlevels)
             if self.extractor.NAME == 'QgisDataExtractor':
                 idx = cells
             else:
-                idx = [icell + ilevel for icell, nlevel in np.column_stack((cell_idx, nlevels)) for ilevel in range(nlevel)]
+                idx = layout.index(cell_idx)
+            zlevels = self.zlevels(time_index, nlevels, cells, cell_idx)
         else:
-            max_nlevels = 1
             idx = cells
 
+        ntime = len(self.times(data_type[0])[time_index]) if isinstance(time_index, slice) else 1
         values = []
         for dtype in data_type:
             a = self.extractor.data(dtype, (time_index, idx))
-            extracted = [a[:,0], a[:,1]] if a.ndim == 2 else [a]
+            if a.ndim == (3 if isinstance(time_index, slice) else 2):
+                extracted = [a[..., 0], a[..., 1]]
+            else:
+                extracted = [a]
             for a in extracted:
-                if is_3d:
-                    zlevels = self.zlevels(time_index, nlevels, cells, cell_idx)
-                    a_padded = np.full((cell_idx.shape[0], max_nlevels), np.nan)
-                    b_padded = np.full((cell_idx.shape[0], max_nlevels + 1), np.nan)
-                    k1, k2 = 0, 0
-                    for i, nlevel in enumerate(nlevels):
-                        a_padded[i, :nlevel] = a[k1:k1 + nlevel]
-                        b_padded[i, :nlevel+1] = zlevels[k2:k2 + nlevel + 1]
-                        k1 += nlevel
-                        k2 += nlevel + 1
-                    avg = depth_averaging.get_method_func(depth_averaging_method)(b_padded, a_padded)
+                a = a.reshape((ntime, -1)) if a.size else np.zeros((ntime, 0))
+                if is_3d and cells.size:
+                    avg = layout.depth_average(depth_averaging.get_method_func(depth_averaging_method), a, zlevels)
                     values.append(avg)
                 else:
                     values.append(a)
 
         if len(values) > 1:
-            data = np.column_stack(values)
+            data = np.stack(values, axis=2)
         else:
             data = values[0]
         if outside:
-            data = np.append(np.zeros((1, data.shape[1]) if data.ndim > 1 else (1,)), data, axis=0)
+            data = np.append(np.zeros((data.shape[0], 1) + data.shape[2:]), data, axis=1)
 
-        wd = self.extractor.wd_flag(data_type[0], (time_index, cells)).flatten().astype(bool)
+        wd = self.extractor.wd_flag(data_type[0], (time_index, cells)).astype(bool).reshape((ntime, cells.size))
         if outside:
-            wd = np.append([False], wd)
+            wd = np.append(np.zeros((ntime, 1), dtype=bool), wd, axis=1)
         data[~wd, ...] = np.nan
-        data = data[inverse]
+        data = data[:, inverse]
 
         if cell_ids[-1] == -1:
-            data = (np.append(
-                np.repeat(data[:-2,...], 2, axis=0),
-                [np.nan, np.nan] if data.ndim == 1 else [[np.nan, np.nan], [np.nan, np.nan]], axis=0)
+            data = np.append(
+                np.repeat(data[:, :-2, ...], 2, axis=1),
+                np.full((data.shape[0], 2) + data.shape[2:], np.nan), axis=1
             )
         else:
-            data = np.repeat(data[:-1,...], 2, axis=0)
-        offset = np.repeat(points[:,[0]], 2, axis=0)[1:-1,...]
-
-        return np.append(
-            offset.reshape((-1, 1) if len(values) == 1 else (-1, 1, 1)),
-            data.reshape(-1, 1) if len(values) == 1 else data.reshape(-1, 1, 2),
-            axis=1 if len(values) == 1 else 2
-        )
+            data = np.repeat(data[:, :-1, ...], 2, axis=1)
+        return data
 
     def profile_from_cell_data(self: 'PyMesh', point: np.ndarray, data_type: str, time_index: int) -> np.ndarray:
         cell_id = self.geom.find_containing_cell(point, scope='local')
@@ -365,7 +419,7 @@ class CellDataMixin:
             if self.extractor.NAME == 'QgisDataExtractor':
                 idx = cells
             else:
-                idx = [icell + ilevel for icell, nlevel in np.column_stack((cell_idx, nlevels)) for ilevel in range(nlevel)]
+                idx = depth_averaging.RaggedLayout(nlevels).index(cell_idx)
         else:
             idx = cells
 
@@ -1,26 +1,220 @@
+import hashlib
+import sys
+import threading
 import typing
+from collections import OrderedDict
 
+import numpy as np
+try:
+    import pandas as pd
+except ImportError:
+    from .stubs import pandas as pd
+
+
+_MISSING = object()
 
 class Cache:
+    """Bounded, memory-aware LRU cache.
+
+    Values are stored under a namespace (e.g. ``"surface"``, ``"time_series"``) and a structured tuple key. The size
+    of each value is estimated when it is stored and the least recently used entries are evicted once either the
+    namespace budget or the global limit is exceeded.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        The global limit in bytes for all namespaces. Defaults to :attr:`Cache.DEFAULT_MAX_BYTES` (unbounded).
+        A value of ``None`` or ``0`` means the cache is unbounded.
+    budgets : dict[str, int], optional
+        Per-namespace limits in bytes e.g. ``{'surface': 500_000_000}``. Namespaces without a budget
+        are only bound by the global limit.
+    """
+
+    #: int | None: The default global limit for new caches. ``None`` (the default) means new caches are unbounded.
+    #: Can be changed to affect all caches created afterward.
+    DEFAULT_MAX_BYTES = None
+
+    #: dict[str, int]: The default per-namespace budgets for new caches.
+    DEFAULT_BUDGETS = {}
+
+    def __init__(self, max_bytes: int = -1, budgets: dict[str, int] = None):
+        self.max_bytes = self.DEFAULT_MAX_BYTES if max_bytes == -1 else max_bytes
+        self._budgets = {k.lower(): v for k, v in (budgets if budgets is not None else self.DEFAULT_BUDGETS).items()}
+        self._cache = {}  # namespace -> OrderedDict[key, (value, size)]
+        self._order = OrderedDict()  # (namespace, key) -> None, in least -> most recently used order
+        self._nbytes = {}
+        self._hits = {}
+        self._misses = {}
+        self._evictions = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def nbytes(self) -> int:
+        """int: The estimated number of bytes currently held by the cache."""
+        return sum(self._nbytes.values())
+
+    def set_budget(self, type_: str, max_bytes: int | None):
+        """Set the byte budget for a namespace. A value of ``None`` removes the budget.
 
-    def __init__(self):
-        self._cache = {}
+        Parameters
+        ----------
+        type_ : str
+            The namespace e.g. ``"surface"``.
+        max_bytes : int | None
+            The budget in bytes.
+        """
+        with self._lock:
+            if max_bytes is None:
+                self._budgets.pop(type_.lower(), None)
+            else:
+                self._budgets[type_.lower()] = max_bytes
+                self._evict(type_.lower())
+
+    def set_limit(self, max_bytes: int | None):
+        """Set the global limit for the cache. A value of ``None`` or ``0`` means the cache is unbounded.
+
+        Parameters
+        ----------
+        max_bytes : int | None
+            The global limit in bytes.
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict(None)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Returns the hit, miss, and eviction counters as well as the current size for each namespace.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Dictionary of namespace to counters.
+        """
+        with self._lock:
+            types = set(self._cache) | set(self._hits) | set(self._misses) | set(self._evictions)
+            return {
+                t: {
+                    'hits': self._hits.get(t, 0),
+                    'misses': self._misses.get(t, 0),
+                    'evictions': self._evictions.get(t, 0),
+                    'entries': len(self._cache.get(t, ())),
+                    'nbytes': self._nbytes.get(t, 0),
+                } for t in sorted(types)
+            }
 
     def clear(self):
-        self._cache.clear()
+        """Removes all entries and resets the hit, miss, and eviction counters."""
+        with self._lock:
+            self._cache.clear()
+            self._order.clear()
+            self._nbytes.clear()
+            self._hits.clear()
+            self._misses.clear()
+            self._evictions.clear()
 
     def contains(self, type_: str, *key: typing.Any) -> bool:
-        k = '::'.join([str(x) for x in key])
-        return type_.lower() in self._cache and k.lower() in self._cache[type_]
+        type_, k = type_.lower(), self._key(key)
+        with self._lock:
+            found = type_ in self._cache and k in self._cache[type_]
+            counter = self._hits if found else self._misses
+            counter[type_] = counter.get(type_, 0) + 1
+            return found
 
-    def get(self, type_: str, *key: typing.Any) -> typing.Any:
-        k = '::'.join([str(x) for x in key])
-        if not self.contains(type_, *key):
-            raise KeyError(f'{type_}::{key} not found')
-        return self._cache[type_.lower()][k.lower()]
+    def get(self, type_: str, *key: typing.Any, default: typing.Any = _MISSING) -> typing.Any:
+        """Returns the cached value. If the entry does not exist, ``default`` is returned if it is given,
+        otherwise a ``KeyError`` is raised. The lookup is a single locked operation, so unlike calling
+        :meth:`contains` followed by :meth:`get`, the entry cannot be evicted by another thread in between.
+        """
+        type_, k = type_.lower(), self._key(key)
+        with self._lock:
+            found = type_ in self._cache and k in self._cache[type_]
+            counter = self._hits if found else self._misses
+            counter[type_] = counter.get(type_, 0) + 1
+            if not found:
+                if default is _MISSING:
+                    raise KeyError(f'{type_}::{key} not found')
+                return default
+            self._cache[type_].move_to_end(k)
+            self._order.move_to_end((type_, k))
+            return self._cache[type_][k][0]
 
     def set(self, value: typing.Any, type_: str, *key: typing.Any):
-        k = '::'.join([str(x) for x in key])
-        if type_.lower() not in self._cache:
-            self._cache[type_.lower()] = {}
-        self._cache[type_.lower()][k.lower()] = value
+        type_, k = type_.lower(), self._key(key)
+        size = self.sizeof(value)
+        with self._lock:
+            self.pop(type_, *key)
+            budget = self._budgets.get(type_)
+            if (budget and size > budget) or (self.max_bytes and size > self.max_bytes):
+                # would evict everything and still not fit
+                return
+            if type_ not in self._cache:
+                self._cache[type_] = OrderedDict()
+            self._cache[type_][k] = (value, size)
+            self._order[(type_, k)] = None
+            self._nbytes[type_] = self._nbytes.get(type_, 0) + size
+            self._evict(type_)
+
+    def pop(self, type_: str, *key: typing.Any) -> typing.Any:
+        """Removes an entry from the cache and returns it, returns ``None`` if the entry does not exist."""
+        type_, k = type_.lower(), self._key(key)
+        with self._lock:
+            if type_ not in self._cache or k not in self._cache[type_]:
+                return None
+            value, size = self._cache[type_].pop(k)
+            del self._order[(type_, k)]
+            self._nbytes[type_] -= size
+            return value
+
+    @staticmethod
+    def sizeof(value: typing.Any) -> int:
+        """Returns an estimate of the memory held by the value in bytes."""
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return int(np.sum(value.memory_usage(deep=False)))
+        if isinstance(value, (tuple, list)):
+            return sys.getsizeof(value) + sum(Cache.sizeof(x) for x in value)
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(Cache.sizeof(x) for x in value.values())
+        return sys.getsizeof(value)
+
+    @staticmethod
+    def _key(key: tuple) -> tuple:
+        return tuple(Cache._key_part(x) for x in key)
+
+    @staticmethod
+    def _key_part(x: typing.Any) -> typing.Hashable:
+        if isinstance(x, str):
+            return x.lower()
+        if x is None or isinstance(x, (bool, int, float)):
+            return x
+        if isinstance(x, np.generic):
+            return x.item()
+        if isinstance(x, (tuple, list)):
+            return Cache._key(tuple(x))
+        if isinstance(x, np.ndarray):
+            # str() abbreviates long arrays, so the key is built from the array bytes
+            a = np.ascontiguousarray(x)
+            return 'ndarray', a.dtype.str, a.shape, hashlib.blake2b(a.tobytes(), digest_size=16).hexdigest()
+        try:
+            hash(x)
+        except TypeError:
+            raise TypeError(f'Cache key is not hashable: {type(x).__name__}') from None
+        return x
+
+    def _evict(self, type_: str | None):
+        if type_ is not None and self._budgets.get(type_):
+            entries = self._cache.get(type_, {})
+            while entries and self._nbytes[type_] > self._budgets[type_]:
+                self._pop_lru(type_, next(iter(entries)))
+        while self.max_bytes and self._order and self.nbytes > self.max_bytes:
+            self._pop_lru(*next(iter(self._order)))
+
+    def _pop_lru(self, type_: str, k: tuple):
+        _, size = self._cache[type_].pop(k)
+        del self._order[(type_, k)]
+        self._nbytes[type_] -= size
+        self._evictions[type_] = self._evictions.get(type_, 0) + 1
@@ -1,2 +1,3 @@
 from .depth_averaging import single_level, multi_level
 from .get_method_func import get_method_func
+from .ragged_layout import RaggedLayout
@@ -0,0 +1,126 @@
+import typing
+
+import numpy as np
+
+
+class RaggedLayout:
+    """Maps 3D results stored as ragged arrays (the layers of each 2D cell stored one after the other, with a
+    variable number of layers per cell) into padded ``(cell, layer)`` arrays that the depth averaging methods use.
+
+    The scatter indexes are calculated once from the number of layers in each cell and can be reused for every
+    timestep.
+
+    Parameters
+    ----------
+    nlevels : np.ndarray
+        The number of vertical layers for each 2D cell.
+    """
+
+    #: int: The maximum memory (bytes) used by the padded arrays when depth averaging many timesteps at once.
+    #: Timesteps are averaged in chunks that fit within this limit.
+    MAX_BYTES = 256 * 1024 ** 2
+
+    def __init__(self, nlevels: np.ndarray):
+        nlevels = np.asarray(nlevels, dtype=np.int64).reshape(-1)
+        #: np.ndarray: The number of vertical layers for each 2D cell.
+        self.nlevels = nlevels
+        #: int: The number of 2D cells.
+        self.ncell = nlevels.size
+        #: int: The maximum number of layers in a cell.
+        self.max_nlevels = int(nlevels.max()) if nlevels.size else 0
+        self._cells, self._layers = self._scatter_index(nlevels)
+        self._zcells, self._zlayers = self._scatter_index(nlevels + 1)
+
+    def __repr__(self) -> str:
+        return f'<RaggedLayout {self.ncell} cells, {self.max_nlevels} layers>'
+
+    @property
+    def size(self) -> int:
+        """int: The number of 3D cells i.e. the length of the ragged value array."""
+        return self._cells.size
+
+    @property
+    def zsize(self) -> int:
+        """int: The number of layer faces i.e. the length of the ragged level array."""
+        return self._zcells.size
+
+    def index(self, cell_idx3: np.ndarray, faces: bool = False) -> np.ndarray:
+        """Returns the ragged array index of every layer (or layer face) given the index of the first layer of each
+        cell.
+
+        Parameters
+        ----------
+        cell_idx3 : np.ndarray
+            The index of the first layer (or layer face) of each cell.
+        faces : bool, optional
+            Return the layer face indexes (``nlevels + 1`` per cell) rather than the layer indexes.
+
+        Returns
+        -------
+        np.ndarray
+            The ragged array indexes.
+        """
+        cells, layers = (self._zcells, self._zlayers) if faces else (self._cells, self._layers)
+        return np.asarray(cell_idx3, dtype=np.int64)[cells] + layers
+
+    def pad(self, values: np.ndarray, faces: bool = False) -> np.ndarray:
+        """Scatters ragged values into a padded array. Any leading dimensions (e.g. time) are kept.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The ragged values ``(..., size)`` or levels ``(..., zsize)`` if ``faces`` is ``True``.
+        faces : bool, optional
+            The values are layer face values (e.g. the vertical levels).
+
+        Returns
+        -------
+        np.ndarray
+            The padded array ``(..., ncell, max_nlevels)``, or ``(..., ncell, max_nlevels + 1)`` for layer faces.
+            Unused positions are NaN.
+        """
+        cells, layers = (self._zcells, self._zlayers) if faces else (self._cells, self._layers)
+        values = np.asarray(values)
+        padded = np.full(values.shape[:-1] + (self.ncell, self.max_nlevels + faces), np.nan)
+        padded[..., cells, layers] = values
+        return padded
+
+    def depth_average(self, func: typing.Callable, values: np.ndarray, zlevels: np.ndarray) -> np.ndarray:
+        """Depth averages ragged values. Values can be for a single timestep ``(size,)`` or for many timesteps
+        ``(ntime, size)``, in which case all the timesteps are averaged together (in chunks).
+
+        Parameters
+        ----------
+        func : Callable
+            The depth averaging method (from :func:`get_method_func`).
+        values : np.ndarray
+            The ragged values.
+        zlevels : np.ndarray
+            The ragged vertical levels. Must have the same leading dimensions as ``values``, or be for a single
+            timestep.
+
+        Returns
+        -------
+        np.ndarray
+            The depth averaged value for each 2D cell ``(ncell,)`` or ``(ntime, ncell)``.
+        """
+        values, zlevels = np.asarray(values), np.asarray(zlevels)
+        if values.ndim == 1:
+            return func(self.pad(zlevels, True), self.pad(values))
+        ntime = values.shape[0]
+        zlevels = np.broadcast_to(zlevels.reshape(-1, self.zsize), (ntime, self.zsize))
+        step = max(self.MAX_BYTES // max(self.ncell * (2 * self.max_nlevels + 1) * 8, 1), 1)
+        out = np.empty((ntime, self.ncell))
+        for t in range(0, ntime, step):
+            a = self.pad(values[t:t + step]).reshape(-1, self.max_nlevels)
+            b = self.pad(zlevels[t:t + step], True).reshape(-1, self.max_nlevels + 1)
+            out[t:t + step] = func(b, a).reshape(-1, self.ncell)
+        return out
+
+    @staticmethod
+    def _scatter_index(counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # the (cell, layer) position of every item in the ragged array
+        cells = np.repeat(np.arange(counts.size), counts)
+        starts = np.cumsum(counts) - counts
+        layers = np.arange(cells.size) - starts[cells]
+        return cells, layers
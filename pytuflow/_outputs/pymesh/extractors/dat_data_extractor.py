@@ -145,17 +145,48 @@ class TS(Card):
         self.numdata = numdata
         self.numcells = numcells
         self.is_vector = is_vector
+        #: np.memmap: the memory mapped file - must be set along with offset before calling read()
+        self.mm = None
+        #: Path: the file - used to map the file again if it is read after :meth:`close`
+        self.fpath = None
+        #: int: the position of the start of the card data in the file
+        self.offset = 0
         self.times = np.ndarray([])
-        self.stat = np.ndarray([])
-        self.val = np.ndarray([])
-        self._stat = []
-        self._val = []
+        self._val = None
+        self._stat = None
+        self._init_active = False
+        self._stat_offsets = []
+        self._val_offsets = []
         self._times = []
 
+    @property
+    def val(self) -> np.ndarray:
+        #: np.ndarray: the (ntimesteps, numdata[, 2]) values - a view into the memory mapped file
+        if self._val is None:
+            shape = (self.numdata, 2) if self.is_vector else (self.numdata,)
+            self._val = self._view(self._val_offsets, shape, np.dtype(self.f))
+        return self._val
+
+    @property
+    def stat(self) -> np.ndarray:
+        #: np.ndarray: the (ntimesteps, numcells) status flags - a view into the memory mapped file
+        if self._stat is None:
+            dtype = np.dtype(f'i{self.sflg}')
+            if -1 in self._stat_offsets:
+                init = np.full((self.numcells,), self._init_active, dtype=dtype)
+                self._stat = np.stack(
+                    [init if x == -1 else self._view([x], (self.numcells,), dtype)[0] for x in self._stat_offsets]
+                )
+            else:
+                self._stat = self._view(self._stat_offsets, (self.numcells,), dtype)
+        return self._stat
+
     def read(self, buf: bytes) -> int:
+        # indexing pass - only the timestep headers are read and the byte offset of the values and status flags
+        # are recorded. The values and status flags are then exposed as views into the memory mapped file.
         first = True
         istat = struct.unpack(self.i, buf[:self.sflg])[0]
-        stat = np.full((self.numdata,), 1 if istat == 1 else 0, dtype='i4').tolist()
+        self._init_active = istat == 1
         k = self.sflg
         counter_limit = 10_000
         counter = 0
@@ -168,16 +199,12 @@ class TS(Card):
             k += self.sflt
             self._times.append(time)
             if istat == 0:
-                stat = stat[:]
+                # status flags are not written - carry over the previous timestep
+                self._stat_offsets.append(self._stat_offsets[-1] if self._stat_offsets else -1)
             else:
-                stat = struct.unpack(self.i * self.numcells, buf[k:k + self.sflg * self.numcells])
+                self._stat_offsets.append(self.offset + k)
                 k += self.sflg * self.numcells
-            self._stat.append(stat)
-            if self.is_vector:
-                val = struct.unpack(self.f * self.numdata * 2, buf[k:k + self.sflt * self.numdata * 2])
-            else:
-                val = struct.unpack(self.f * self.numdata, buf[k:k + self.sflt * self.numdata])
-            self._val.append(val)
+            self._val_offsets.append(self.offset + k)
             k += self.sflt * self.numdata * (2 if self.is_vector else 1)
             first = False
             counter += 1
@@ -185,12 +212,31 @@ class TS(Card):
         if counter >= counter_limit:
             raise RuntimeError('Exceeded maximum number of timesteps while reading TS card; possible malformed file.')
 
-        shape = (len(self._times), self.numdata) if not self.is_vector else (len(self._times), self.numdata, 2)
-        self.val = np.array(self._val, dtype=self.f).reshape(shape)
-        self.stat = np.array(self._stat, dtype=bool).reshape((len(self._times), self.numcells))
         self.times = np.array(self._times, dtype=self.f)
         return k
 
+    def close(self):
+        """Releases the memory mapped file (and the views into it). The file is mapped again if the values or
+        status flags are used after closing."""
+        self.mm, self._val, self._stat = None, None, None
+
+    def _view(self, offsets: list[int], shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Returns a (ntimesteps, *shape) array view into the memory mapped file. Timesteps are normally written
+        at a regular stride so a single strided view is returned, otherwise the timesteps are stacked into memory.
+        """
+        if not offsets:
+            return np.empty((0,) + shape, dtype=dtype)
+        if self.mm is None:
+            self.mm = np.memmap(self.fpath, dtype=np.uint8, mode='r')
+        item_strides = tuple(int(np.prod(shape[i + 1:])) * dtype.itemsize for i in range(len(shape)))
+        size = int(np.prod(shape)) * dtype.itemsize
+        strides = np.unique(np.diff(offsets))
+        if strides.size < 2:
+            stride = int(strides[0]) if strides.size else size
+            return np.ndarray((len(offsets),) + shape, dtype=dtype, buffer=self.mm, offset=offsets[0],
+                              strides=(stride,) + item_strides)
+        return np.stack([np.ndarray(shape, dtype=dtype, buffer=self.mm, offset=x) for x in offsets])
+
 
 class ENDDS(Card):
     VARIABLE = 'enddataset'
@@ -232,6 +278,12 @@ class PyDATDataExtractor(PyDataExtractor):
             dtype = self.translate_file_name(f)
             self._results[dtype] = self.extract_results_from_file(f)
 
+    def close(self):
+        """Releases the memory mapped .dat files. They are mapped again if more results are read."""
+        for cards in self._results.values():
+            if cards.get('timestep'):
+                cards['timestep'].close()
+
     def times(self, data_type: str) -> np.ndarray:
         dtype, is_max, is_min = self.strip_data_type(data_type)
         if is_max or is_min:
@@ -311,12 +363,13 @@ class PyDATDataExtractor(PyDataExtractor):
         return ts_card.times.size < 2
 
     def data(self, data_type: str, index: PyDataExtractor.SliceType | PyDataExtractor.MultiSliceType) -> np.ndarray:
+        # data is a view into the memory mapped file, so only the indexed values are read (and copied)
         data = self._data(data_type)
-        return data[index]
+        return np.array(data[index])
 
     def wd_flag(self, data_type: str, index: PyDataExtractor.SliceType | PyDataExtractor.MultiSliceType) -> np.ndarray:
         stat = self._stat(data_type)
-        return stat[index]
+        return np.asarray(stat[index]).astype(bool)
 
     def _data(self, data_type: str) -> np.ndarray:
         dtype, is_max, is_min = self.strip_data_type(data_type)
@@ -337,7 +390,7 @@ class PyDATDataExtractor(PyDataExtractor):
                 raise ValueError(f'Data type {data_type} not found.')
             data = ts_card.val[idx[0], ...]
         else:
-            idx = np.flatnonzero((ts_card.times < 99998.) & (ts_card.times > -99998.))
+            idx = self._time_index(ts_card)
             data = ts_card.val[idx, ...]
         return data
 
@@ -360,10 +413,19 @@ class PyDATDataExtractor(PyDataExtractor):
                 raise ValueError(f'Data type {data_type} not found.')
             stat = ts_card.stat[idx[0], ...]
         else:
-            idx = np.flatnonzero((ts_card.times < 99998.) & (ts_card.times > -99998.))
+            idx = self._time_index(ts_card)
             stat = ts_card.stat[idx, ...]
         return stat
 
+    @staticmethod
+    def _time_index(ts_card: TS) -> np.ndarray | slice:
+        """Index of the regular timesteps (excludes maximums/minimums). Returned as a slice if possible so indexing
+        the memory mapped data returns a view rather than reading every timestep."""
+        idx = np.flatnonzero((ts_card.times < 99998.) & (ts_card.times > -99998.))
+        if idx.size and idx[-1] - idx[0] + 1 == idx.size:
+            return slice(int(idx[0]), int(idx[-1]) + 1)
+        return idx
+
     @staticmethod
     def translate_file_name(filename: Path) -> str:
         """Translates the file name to data type name."""
@@ -374,8 +436,8 @@ class PyDATDataExtractor(PyDataExtractor):
 
     @staticmethod
     def extract_results_from_file(fpath: Path) -> dict[str, Card]:
-        with fpath.open('rb') as fo:
-            buf = fo.read()
+        mm = np.memmap(fpath, dtype=np.uint8, mode='r')
+        buf = memoryview(mm)
         k = 0
         cards = {}
         sflg = 4
@@ -389,6 +451,8 @@ class PyDATDataExtractor(PyDataExtractor):
             if card_cls is None:
                 raise ValueError(f'Unknown card ID {card_id} at position {k} in file {fpath}')
             card = card_cls(sflg, sflt, numdata, numcells, is_vector)
+            if isinstance(card, TS):
+                card.mm, card.fpath, card.offset = mm, fpath, k + 4
             size = card.read(buf[k+4:])
             cards[card.VARIABLE] = card
             k += 4 + size
@@ -406,6 +470,7 @@ class PyDATDataExtractor(PyDataExtractor):
             elif card.VARIABLE == 'beginvector':
                 is_vector = True
 
+        buf.release()
         return cards
 
     @staticmethod
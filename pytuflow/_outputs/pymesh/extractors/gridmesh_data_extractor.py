@@ -54,18 +54,19 @@ class GridMeshDataExtractor(PyDataExtractor):
     def data(self, data_type: str, index: PyDataExtractor.SliceType | PyDataExtractor.MultiSliceType) -> np.ndarray:
         if self.is_static(data_type):
             if self.is_vector(data_type):
-                data = self._grid.surface(data_type, direction_to_vector=True)[['value-x', 'value-y']].to_numpy()
+                data = self._grid.surface(data_type, direction_to_vector=True, return_type='array').values.reshape(-1, 2)
                 data = data[self.cell_reindex].reshape(-1, 1, 2)
             else:
-                data = self._grid.surface(data_type)['value'].to_numpy()
+                data = self._grid.surface(data_type, return_type='array').values.ravel()
                 data = data[self.cell_reindex].flatten()
         else:
             vals = []
             for timestep in self._time_index(data_type, index):
                 if self.is_vector(data_type):
-                    val = self._grid.surface(data_type, timestep, direction_to_vector=True)[['value-x', 'value-y']].to_numpy()
+                    val = self._grid.surface(data_type, timestep, direction_to_vector=True,
+                                             return_type='array').values.reshape(-1, 2)
                 else:
-                    val = self._grid.surface(data_type, timestep)['value'].to_numpy()
+                    val = self._grid.surface(data_type, timestep, return_type='array').values.ravel()
                 vals.append(val)
             if self.is_vector(data_type):
                 data = np.hstack(vals).reshape(len(vals), -1, 2)
@@ -80,12 +81,12 @@ class GridMeshDataExtractor(PyDataExtractor):
 
     def wd_flag(self, data_type: str, index: PyDataExtractor.SliceType | PyDataExtractor.MultiSliceType) -> np.ndarray:
         if self.is_static(data_type):
-            data = self._grid.surface(data_type)['active'].to_numpy()
+            data = self._grid.surface(data_type, return_type='array').mask.ravel()
             data = data[self.cell_reindex].flatten()
         else:
             vals = []
             for timestep in self._time_index(data_type, index):
-                val = self._grid.surface(data_type, timestep)['active'].to_numpy()
+                val = self._grid.surface(data_type, timestep, return_type='array').mask.ravel()
                 vals.append(val)
             data = np.hstack(vals).reshape(len(vals), -1)
             data = data[:, self.cell_reindex]
@@ -6,6 +6,7 @@ from pathlib import Path
 import numpy as np
 
 from . import PyDataExtractor
+from ..depth_averaging import RaggedLayout
 from ..engines import H5Engine, NCEngine
 
 
@@ -142,6 +143,8 @@ class PyNCMeshDataExtractor(PyDataExtractor):
         if isinstance(cell_idx2, int):
             a = self.data('layerface_Z', (time_index, slice(idx, idx + nlevels + 1)))
         else:
-            idx = [i + j for i, nlevel in np.column_stack((idx, nlevels)) for j in range(nlevel + 1)]
+            idx = RaggedLayout(nlevels).index(idx, faces=True)
+            if idx.size and np.array_equal(idx, np.arange(idx[0], idx[0] + idx.size)):  # contiguous, read as a slice
+                idx = slice(int(idx[0]), int(idx[-1]) + 1)
             a = self.data('layerface_Z', (time_index, idx))
         return a
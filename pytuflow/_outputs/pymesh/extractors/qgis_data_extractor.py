@@ -34,8 +34,9 @@ class QgisDataExtractor(PyDataExtractor):
         self.cache = Cache()
 
     def times(self, data_type: str) -> np.ndarray:
-        if self.cache.contains('times', data_type):
-            return self.cache.get('times', data_type)
+        cached = self.cache.get('times', data_type, default=None)
+        if cached is not None:
+            return cached
         grp_idx = self.find_group_index(data_type)
         if grp_idx == -1:
             raise ValueError(f'Data type not found: {data_type}')
@@ -47,8 +48,9 @@ class QgisDataExtractor(PyDataExtractor):
         return times
 
     def data_types(self) -> list[str]:
-        if self.cache.contains('data_types'):
-            return self.cache.get('data_types')
+        cached = self.cache.get('data_types', default=None)
+        if cached is not None:
+            return cached
         data_types = [
             self.lyr.datasetGroupMetadata(QgsMeshDatasetIndex(i)).name() for i in range(self.lyr.datasetGroupCount())
             if self.lyr.datasetGroupMetadata(QgsMeshDatasetIndex(i)).name() != 'Bed Elevation'
@@ -59,8 +61,9 @@ class QgisDataExtractor(PyDataExtractor):
         return data_types
 
     def reference_time(self, data_type: str) -> datetime:
-        if self.cache.contains('reference_time', data_type):
-            return self.cache.get('reference_time', data_type)
+        cached = self.cache.get('reference_time', data_type, default=None)
+        if cached is not None:
+            return cached
         grp_idx = self.find_group_index(data_type)
         if grp_idx == -1:
             raise ValueError(f'Data type not found: {data_type}')
@@ -73,8 +76,9 @@ class QgisDataExtractor(PyDataExtractor):
             return ref_time
 
     def is_vector(self, data_type: str) -> bool:
-        if self.cache.contains('is_vector', data_type):
-            return self.cache.get('is_vector', data_type)
+        cached = self.cache.get('is_vector', data_type, default=None)
+        if cached is not None:
+            return cached
         grp_idx = self.find_group_index(data_type)
         if grp_idx == -1:
             raise ValueError(f'Data type not found: {data_type}')
@@ -87,8 +91,9 @@ class QgisDataExtractor(PyDataExtractor):
         return self.times(data_type).size <= 1
 
     def is_3d(self, data_type: str) -> bool:
-        if self.cache.contains('is_3d', data_type):
-            return self.cache.get('is_3d', data_type)
+        cached = self.cache.get('is_3d', data_type, default=None)
+        if cached is not None:
+            return cached
         grp_idx = self.find_group_index(data_type)
         if grp_idx == -1:
             raise ValueError(f'Data type not found: {data_type}')
@@ -101,8 +106,9 @@ class QgisDataExtractor(PyDataExtractor):
         return self.lyr.datasetGroupMetadata(idx).dataType() == QgsMeshDatasetGroupMetadata.DataOnVolumes
 
     def on_vertex(self, data_type: str) -> bool:
-        if self.cache.contains('on_vertex', data_type):
-            return self.cache.get('on_vertex', data_type)
+        cached = self.cache.get('on_vertex', data_type, default=None)
+        if cached is not None:
+            return cached
         grp_idx = self.find_group_index(data_type)
         if grp_idx == -1:
             raise ValueError(f'Data type not found: {data_type}')
@@ -258,8 +264,9 @@ class QgisDataExtractor(PyDataExtractor):
     def find_group_index(self, data_type: str, source: str = 'layer') -> int:
         from ...map_output import MapOutput
         data_type = MapOutput._get_standard_data_type_name(data_type)
-        if self.cache.contains('group_index', data_type, source):
-            return self.cache.get('group_index', data_type, source)
+        cached = self.cache.get('group_index', data_type, source, default=None)
+        if cached is not None:
+            return cached
 
         source_ = self.lyr if source == 'layer' else self.lyr.dataProvider()
         for i in self.data_groups(source):
@@ -1,5 +1,8 @@
 from .geometry_lazy_load import GeometryLazyLoadMixin
 from .vtk_geometry import VTKGeometryMixin
+from .geometry_sidecar import GeometrySidecarMixin
+from .cell_to_vertex import CellToVertexOperator
+from .mesh_line_walk import MeshLineWalk
 from .pymesh_geom import PyMeshGeometry
 from .py2dm import Py2dm
 from .pyncmesh_geom import PyNCMeshGeometry
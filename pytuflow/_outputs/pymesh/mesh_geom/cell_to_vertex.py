@@ -0,0 +1,104 @@
+import numpy as np
+
+
+class CellToVertexOperator:
+    """Sparse operator that interpolates cell centre values onto the mesh vertices.
+
+    The operator is the sparse matrix ``(nvertex, ncell)`` of cell to vertex weights. It is stored in coordinate
+    form in cell order (the vertex IDs and weights of each cell), which is the fastest layout to apply with
+    ``np.bincount``, and only needs to be built once per mesh. Wet/dry renormalisation is applied as a masked
+    product - dry cells are removed from both the weighted sum and the sum of weights at each vertex - so the
+    weights are never copied or rebuilt for each timestep.
+
+    Parameters
+    ----------
+    cell_nodes : np.ndarray
+        The vertex IDs connected to each cell ``(ncell, nnode)``.
+    weights : np.ndarray
+        The weight of each cell at each of its vertices ``(ncell, nnode)``.
+    nvertex : int
+        The number of vertices in the mesh.
+    """
+
+    def __init__(self, cell_nodes: np.ndarray, weights: np.ndarray, nvertex: int):
+        #: np.ndarray: The vertex IDs connected to each cell (the matrix row of each stored entry).
+        self.cell_nodes = np.asarray(cell_nodes, dtype=np.int64)
+        #: np.ndarray: The weight of each cell at each of its vertices (the stored entries).
+        self.weights = np.asarray(weights, dtype=np.float64)
+        #: int: The number of vertices (rows).
+        self.nvertex = int(nvertex)
+        #: int: The number of cells (columns).
+        self.ncell = self.cell_nodes.shape[0]
+        self._rows = self.cell_nodes.ravel()
+        self._weight_sum = np.bincount(self._rows, self.weights.ravel(), minlength=self.nvertex)
+
+    def __repr__(self) -> str:
+        return f'<CellToVertexOperator {self.nvertex}x{self.ncell}>'
+
+    def dot(self, values: np.ndarray) -> np.ndarray:
+        """Returns the (un-normalised) weighted sum of the cell values at each vertex i.e. the matrix product.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The cell values ``(ncell,)`` or ``(..., ncell)``.
+
+        Returns
+        -------
+        np.ndarray
+            The vertex values ``(nvertex,)`` or ``(..., nvertex)``.
+        """
+        values = np.asarray(values)
+        a = values.reshape(-1, self.ncell)
+        out = np.empty((a.shape[0], self.nvertex))
+        for t in range(a.shape[0]):
+            out[t] = np.bincount(self._rows, (a[t, :, None] * self.weights).ravel(), minlength=self.nvertex)
+        return out.reshape(values.shape[:-1] + (self.nvertex,))
+
+    def apply(self, values: np.ndarray, wet: np.ndarray = None) -> np.ndarray:
+        """Interpolates cell values onto the vertices. The weights are renormalised around each vertex so that
+        only wet cells contribute. Vertices without any wet cells are given a value of ``0``.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The cell values ``(ncell,)`` or ``(ntime, ncell)``.
+        wet : np.ndarray, optional
+            The active (wet) mask for the cells. Must be broadcastable to the shape of ``values``.
+
+        Returns
+        -------
+        np.ndarray
+            The vertex values ``(nvertex,)`` or ``(ntime, nvertex)``.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if wet is None:
+            num = self.dot(values)
+            den = np.broadcast_to(self._weight_sum, num.shape)
+        else:
+            wet = np.broadcast_to(np.asarray(wet, dtype=bool), values.shape)
+            num = self.dot(np.where(wet, values, 0.))
+            den = self.dot(wet)
+        out = np.zeros(num.shape)
+        np.divide(num, den, out=out, where=den > 0)
+        return out
+
+    def active(self, wet: np.ndarray) -> np.ndarray:
+        """Returns the active (wet) mask for the vertices. A vertex is active if any of its cells are active.
+
+        Parameters
+        ----------
+        wet : np.ndarray
+            The active (wet) mask for the cells ``(ncell,)`` or ``(..., ncell)``.
+
+        Returns
+        -------
+        np.ndarray
+            The active mask for the vertices ``(nvertex,)`` or ``(..., nvertex)``.
+        """
+        wet = np.asarray(wet, dtype=bool)
+        a = wet.reshape(-1, self.ncell)
+        out = np.empty((a.shape[0], self.nvertex), dtype=bool)
+        for t in range(a.shape[0]):
+            out[t] = np.bincount(self._rows, np.repeat(a[t], self.cell_nodes.shape[1]), minlength=self.nvertex) > 0
+        return out.reshape(wet.shape[:-1] + (self.nvertex,))
@@ -0,0 +1,140 @@
+import os
+import shutil
+import typing
+from pathlib import Path
+
+import numpy as np
+try:
+    import pandas as pd
+except ImportError:
+    from ..stubs import pandas as pd
+
+
+class GeometrySidecarMixin:
+    """Optional on-disk cache of the processed mesh geometry.
+
+    When enabled, the vertices, cells, triangles and cell to triangle mapping are written to a sidecar directory of
+    ``.npy`` files the first time the mesh is loaded. Meshes that calculate cell to vertex weights add them to the
+    sidecar the first time they are calculated. Later loads of the same unchanged mesh file memory-map these arrays
+    instead of re-parsing and re-processing the mesh file. The sidecar is keyed on the size and modified time of the
+    mesh file and is ignored (and overwritten) if either change.
+
+    The cache is off by default and can be turned on for all meshes by setting the class attributes e.g.
+
+    >>> from pytuflow._outputs.pymesh.mesh_geom import GeometrySidecarMixin
+    >>> GeometrySidecarMixin.sidecar_cache = True
+    >>> GeometrySidecarMixin.sidecar_dir = '/path/to/cache'  # optional, defaults to next to the mesh file
+    """
+
+    #: bool: Whether the sidecar cache is used.
+    sidecar_cache = False
+    #: str | Path | None: Directory to store the sidecar caches in. If ``None``, caches are stored next to the mesh.
+    sidecar_dir = None
+
+    SIDECAR_VERSION = 1
+    SIDECAR_ARRAYS = ('vertices', 'cells', 'cells_df', 'cells_df_index', 'triangles', 'cell2triangle')
+
+    def sidecar_path(self) -> Path:
+        """Returns the path to the sidecar directory for the mesh.
+
+        Returns
+        -------
+        Path
+            The sidecar directory path.
+        """
+        folder = Path(self.sidecar_dir) if self.sidecar_dir else self.fpath.parent
+        return folder / f'{self.fpath.name}.pytuflow_geom'
+
+    def _sidecar_signature(self) -> np.ndarray:
+        st = self.fpath.stat()
+        return np.array([self.SIDECAR_VERSION, st.st_size, st.st_mtime_ns], dtype=np.int64)
+
+    def _load_sidecar(self) -> bool:
+        """Loads the processed geometry from the sidecar cache. Returns ``True`` if successful."""
+        if not self.sidecar_cache:
+            return False
+        p = self.sidecar_path()
+        try:
+            sig = np.load(p / 'signature.npy')
+            if not np.array_equal(sig, self._sidecar_signature()):
+                return False
+            arrays = {name: np.load(p / f'{name}.npy', mmap_mode='r') for name in self.SIDECAR_ARRAYS}
+            weights = np.load(p / 'weights.npy', mmap_mode='r') if (p / 'weights.npy').exists() else None
+        except (OSError, ValueError):
+            return False
+
+        self._vertices = arrays['vertices']
+        self._cells = arrays['cells']
+        self._cells_df = pd.DataFrame(
+            np.asarray(arrays['cells_df']),
+            index=pd.Index(np.asarray(arrays['cells_df_index']), name=self._sidecar_index_name()),
+            columns=['nnode', 'n1', 'n2', 'n3', 'n4'],
+        )
+        self._triangles = arrays['triangles']
+        self._cell2triangle = arrays['cell2triangle']
+        if weights is not None:
+            self._sidecar_set_weights(weights)
+        return True
+
+    def _save_sidecar(self):
+        """Writes the processed geometry to the sidecar cache. The cache is written to a temporary directory and then
+        moved into place so other processes never see a partially written cache.
+        """
+        if not self.sidecar_cache:
+            return
+        p = self.sidecar_path()
+        tmp = p.with_name(f'{p.name}.{os.getpid()}.tmp')
+        try:
+            tmp.mkdir(parents=True, exist_ok=True)
+            arrays = {
+                'vertices': self._vertices,
+                'cells': self._cells,
+                'cells_df': self._cells_df[['nnode', 'n1', 'n2', 'n3', 'n4']].to_numpy(),
+                'cells_df_index': self._cells_df.index.to_numpy(),
+                'triangles': self._triangles,
+                'cell2triangle': self._cell2triangle,
+            }
+            for name, a in arrays.items():
+                np.save(tmp / f'{name}.npy', np.asarray(a))
+            np.save(tmp / 'signature.npy', self._sidecar_signature())  # written last
+            if p.exists():
+                shutil.rmtree(p, ignore_errors=True)
+            os.replace(tmp, p)
+        except OSError:
+            pass  # the cache is an optimisation only, e.g. read-only folder or another process won the race
+        finally:
+            if tmp.exists():
+                shutil.rmtree(tmp, ignore_errors=True)
+
+    def _save_sidecar_weights(self, weights: np.ndarray):
+        """Adds the cell to vertex weights to an existing sidecar cache. Only ``weights.npy`` is written (to a
+        temporary file that is then renamed), the other arrays in the sidecar may still be memory-mapped by this
+        process and are left alone.
+        """
+        if not self.sidecar_cache:
+            return
+        p = self.sidecar_path()
+        tmp = p / f'weights.{os.getpid()}.tmp'
+        try:
+            if not np.array_equal(np.load(p / 'signature.npy'), self._sidecar_signature()):
+                return
+            with tmp.open('wb') as f:
+                np.save(f, np.asarray(weights))
+            os.replace(tmp, p / 'weights.npy')
+        except (OSError, ValueError):
+            pass  # the cache is an optimisation only
+        finally:
+            if tmp.exists():
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+
+    def _sidecar_index_name(self) -> typing.Any:
+        return None
+
+    def _sidecar_set_weights(self, weights: np.ndarray):
+        """Sets the cell to vertex weights loaded from the sidecar. Only meshes that calculate the weights
+        (:meth:`cell_to_vertex_weights`) override this, for other meshes a stored ``weights.npy`` is ignored.
+        """
+        pass
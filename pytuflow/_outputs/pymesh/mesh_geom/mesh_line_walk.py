@@ -0,0 +1,197 @@
+import numpy as np
+
+
+class MeshLineWalk:
+    """Vectorised walk of line segments through the mesh.
+
+    The mesh is handled as triangles (which are always convex), each clipped against the segments with the
+    Cyrus-Beck algorithm. Candidate triangles for each segment are found from a precomputed bucket (uniform grid)
+    index, so all segments, from one or many lines, are walked together without looping over intersections in
+    Python. The triangle pieces are then merged into the cells that the triangles belong to.
+
+    Parameters
+    ----------
+    tri_xy : np.ndarray
+        The vertex positions of each triangle ``(ntri, 3, 2)``.
+    tri_cell : np.ndarray
+        The cell ID that each triangle belongs to ``(ntri,)``.
+    """
+
+    #: float: Tolerance (as a fraction of the segment length) used to join pieces and drop zero length touches.
+    TOL = 1e-7
+    #: float: Gaps between cells that are shorter than this (as a fraction of the typical cell size) are ignored
+    #: e.g. the slivers between a quadtree cell edge and the (rounded) hanging nodes of the smaller cells next to it.
+    GAP_TOL = 1e-4
+    #: int: The target number of triangles in each bucket of the spatial index.
+    BUCKET_SIZE = 4
+
+    def __init__(self, tri_xy: np.ndarray, tri_cell: np.ndarray):
+        tri_xy = np.asarray(tri_xy, dtype=np.float64)
+        #: np.ndarray: The cell ID that each triangle belongs to.
+        self.tri_cell = np.asarray(tri_cell, dtype=np.int64)
+        #: int: The number of triangles.
+        self.ntri = tri_xy.shape[0]
+
+        # inward facing edge normals (n . p >= c is inside)
+        a, b = tri_xy, np.roll(tri_xy, -1, axis=1)
+        e = b - a
+        area2 = e[:, 0, 0] * (tri_xy[:, 2, 1] - tri_xy[:, 0, 1]) - e[:, 0, 1] * (tri_xy[:, 2, 0] - tri_xy[:, 0, 0])
+        sign = np.sign(area2).reshape((-1, 1))
+        self._normal = np.stack((-e[..., 1] * sign, e[..., 0] * sign), axis=-1)
+        self._c = (self._normal * a).sum(axis=-1)
+        self._valid = area2 != 0
+
+        # bucket index
+        lo, hi = tri_xy.min(axis=1), tri_xy.max(axis=1)
+        self._origin = lo.min(axis=0) if self.ntri else np.zeros(2)
+        extent = (hi.max(axis=0) - self._origin) if self.ntri else np.ones(2)
+        area = np.abs(area2).sum() / 2. if self.ntri else 1.
+        #: float: The length of the gaps between cells that are ignored.
+        self.gap_length = np.sqrt(area / max(self.ntri, 1) * 2) * self.GAP_TOL
+        size = np.sqrt(area / max(self.ntri, 1) * self.BUCKET_SIZE)
+        self._size = size if size > 0 else max(float(extent.max()), 1.)
+        self._shape = np.maximum(np.ceil(extent / self._size).astype(np.int64), 1)
+        i0 = self._bucket(lo)
+        i1 = self._bucket(hi)
+        nx, ny = i1[:, 0] - i0[:, 0] + 1, i1[:, 1] - i0[:, 1] + 1
+        tri = np.repeat(np.arange(self.ntri), nx * ny)
+        k = np.arange(tri.size) - np.repeat(np.cumsum(nx * ny) - nx * ny, nx * ny)
+        bucket = (i0[tri, 1] + k // nx[tri]) * self._shape[0] + i0[tri, 0] + k % nx[tri]
+        order = np.argsort(bucket, kind='stable')
+        self._bucket_tri = tri[order]
+        self._bucket_ptr = np.append(0, np.cumsum(np.bincount(bucket, minlength=self._shape.prod())))
+
+    def __repr__(self) -> str:
+        return f'<MeshLineWalk {self.ntri} triangles>'
+
+    def walk(self, p0: np.ndarray, p1: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+                                                            np.ndarray]:
+        """Walks the segments ``p0 -> p1`` through the mesh and returns the cells crossed by each segment.
+
+        The returned pieces are sorted by segment and then along the segment. Parts of a segment that are outside
+        the mesh have no piece.
+
+        Parameters
+        ----------
+        p0 : np.ndarray
+            The start point of each segment ``(nseg, 2)``.
+        p1 : np.ndarray
+            The end point of each segment ``(nseg, 2)``.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            The segment index, cell ID, entry and exit position (as a fraction ``0 - 1`` of the segment length),
+            and the triangle that contains the midpoint of each piece.
+        """
+        p0, p1 = np.asarray(p0, dtype=np.float64).reshape((-1, 2)), np.asarray(p1, dtype=np.float64).reshape((-1, 2))
+        seg, tri = self._candidates(p0, p1)
+        d = p1 - p0
+
+        # Cyrus-Beck clip of each segment against each candidate triangle
+        ta, tb = np.zeros(seg.size), np.ones(seg.size)
+        keep = self._valid[tri]
+        for k in range(3):
+            n = self._normal[tri, k]
+            num = self._c[tri, k] - (n * p0[seg]).sum(axis=1)
+            den = (n * d[seg]).sum(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = num / den
+            ta = np.where(den > 0, np.maximum(ta, t), ta)
+            tb = np.where(den < 0, np.minimum(tb, t), tb)
+            keep &= (den != 0) | (num <= 0)
+        keep &= tb - ta > self.TOL
+        seg, tri, ta, tb = seg[keep], tri[keep], ta[keep], tb[keep]
+
+        # sort along each segment and drop pieces covered by an earlier piece (e.g. a line along a shared edge)
+        order = np.lexsort((-tb, ta, seg))
+        seg, tri, ta, tb = seg[order], tri[order], ta[order], tb[order]
+        reach = np.maximum.accumulate(seg * 2. + tb)
+        keep = np.ones(seg.size, dtype=bool)
+        keep[1:] = seg[1:] * 2. + tb[1:] > reach[:-1] + self.TOL
+        seg, tri, ta, tb = seg[keep], tri[keep], ta[keep], tb[keep]
+
+        # merge consecutive triangles of the same cell into a single piece
+        cell = self.tri_cell[tri]
+        first = np.ones(seg.size, dtype=bool)
+        first[1:] = (seg[1:] != seg[:-1]) | (cell[1:] != cell[:-1]) | (ta[1:] > tb[:-1] + self.TOL)
+        group = np.cumsum(first) - 1
+        starts = np.flatnonzero(first)
+        piece_tb = np.maximum.reduceat(tb, starts) if starts.size else tb[:0]
+        piece_ta = ta[starts]
+        tmid = 0.5 * (piece_ta + piece_tb)
+        inside = (ta <= tmid[group]) & (tb >= tmid[group])
+        piece_tri = tri[starts]
+        hit = np.flatnonzero(inside)
+        g, i = np.unique(group[hit], return_index=True)
+        piece_tri[g] = tri[hit[i]]
+
+        return seg[starts], cell[starts], piece_ta, piece_tb, piece_tri
+
+    def locate(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Finds the triangle (and cell) containing each point using the bucket index. Points on a shared edge are
+        given the lowest triangle index that contains them.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The points to locate ``(npoint, 2)``.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The cell ID and triangle index containing each point, ``-1`` if the point is outside the mesh.
+        """
+        p = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+        cell = np.full(p.shape[0], -1, dtype=np.int64)
+        tri_ids = np.full(p.shape[0], -1, dtype=np.int64)
+        if not self.ntri or not p.shape[0]:
+            return cell, tri_ids
+
+        # (point, triangle) pairs from the bucket each point falls in
+        i = self._bucket(p)
+        bucket = i[:, 1] * self._shape[0] + i[:, 0]
+        count = self._bucket_ptr[bucket + 1] - self._bucket_ptr[bucket]
+        pnt = np.repeat(np.arange(p.shape[0]), count)
+        k = np.arange(pnt.size) - np.repeat(np.cumsum(count) - count, count)
+        tri = self._bucket_tri[np.repeat(self._bucket_ptr[bucket], count) + k]
+
+        # inside test against the inward edge normals (tolerance is a fraction of the edge length)
+        n = self._normal[tri]
+        dist = (n * p[pnt].reshape((-1, 1, 2))).sum(axis=-1) - self._c[tri]
+        inside = self._valid[tri] & (dist >= -self.TOL * (n * n).sum(axis=-1)).all(axis=1)
+        pnt, tri = pnt[inside], tri[inside]
+        pnt, first = np.unique(pnt, return_index=True)
+        tri_ids[pnt] = tri[first]
+        cell[pnt] = self.tri_cell[tri[first]]
+        return cell, tri_ids
+
+    def _bucket(self, xy: np.ndarray) -> np.ndarray:
+        i = np.floor((xy - self._origin) / self._size).astype(np.int64)
+        return np.clip(i, 0, self._shape - 1)
+
+    def _candidates(self, p0: np.ndarray, p1: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # (segment, triangle) pairs from the buckets along each segment
+        i0 = self._bucket(np.minimum(p0, p1))
+        i1 = self._bucket(np.maximum(p0, p1))
+        nx, ny = i1[:, 0] - i0[:, 0] + 1, i1[:, 1] - i0[:, 1] + 1
+        seg = np.repeat(np.arange(p0.shape[0]), nx * ny)
+        k = np.arange(seg.size) - np.repeat(np.cumsum(nx * ny) - nx * ny, nx * ny)
+        bx, by = i0[seg, 0] + k % nx[seg], i0[seg, 1] + k // nx[seg]
+
+        # only keep the buckets the segment can pass through (long segments have large bounding boxes)
+        centre = self._origin + (np.column_stack((bx, by)) + 0.5) * self._size
+        d = p1[seg] - p0[seg]
+        length = np.hypot(d[:, 0], d[:, 1])
+        r = centre - p0[seg]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dist = np.where(length > 0, np.abs(d[:, 0] * r[:, 1] - d[:, 1] * r[:, 0]) / length, 0.)
+        near = dist <= self._size * 0.7072
+        seg, bucket = seg[near], (by * self._shape[0] + bx)[near]
+
+        count = self._bucket_ptr[bucket + 1] - self._bucket_ptr[bucket]
+        seg = np.repeat(seg, count)
+        k = np.arange(seg.size) - np.repeat(np.cumsum(count) - count, count)
+        tri = self._bucket_tri[np.repeat(self._bucket_ptr[bucket], count) + k]
+        key = np.unique(seg * self.ntri + tri)
+        return key // max(self.ntri, 1), key % max(self.ntri, 1)
@@ -1,4 +1,6 @@
+import io
 import re
+import typing
 from pathlib import Path
 
 import numpy as np
@@ -16,11 +18,11 @@ try:
 except ImportError:
     gpd = None
 
-from . import GeometryLazyLoadMixin, VTKGeometryMixin, PyMeshGeometry
+from . import GeometryLazyLoadMixin, VTKGeometryMixin, GeometrySidecarMixin, PyMeshGeometry
 from .. import Bbox2D, Transform2D
 
 
-class Py2dm(PyMeshGeometry, GeometryLazyLoadMixin, VTKGeometryMixin):
+class Py2dm(PyMeshGeometry, GeometryLazyLoadMixin, VTKGeometryMixin, GeometrySidecarMixin):
 
     def __init__(self, fpath: Path | str):
         self._init_lazy_load()
@@ -54,66 +56,118 @@ class Py2dm(PyMeshGeometry, GeometryLazyLoadMixin, VTKGeometryMixin):
         if not self._loaded:
             self._load()
 
-    @staticmethod
-    def read_2dm_file(fpath: Path) -> pd.DataFrame:
-        """Reads the .2dm file into a dataframe with the first two rows skipped and the column names
-        starting at "A".
-
-        Parameters
-        ----------
-        fpath : Path
-            The path to the .2dm file.
-
-        Returns
-        -------
-        pd.DataFrame
-            The dataframe containing the .2dm file data.
-        """
-        return pd.read_csv(fpath, skiprows=2, sep=r'\s+', names=[chr(x) for x in range(ord('A'), ord('A') + 11)])
+    def _sidecar_index_name(self) -> str:
+        return 'ind'
 
     @staticmethod
-    def load_nodes(df: pd.DataFrame) -> np.ndarray:
-        """Loads the nodes from the raw 2dm dataframe.
+    def read_2dm(fpath: Path, chunk_size: int = None) -> tuple[np.ndarray, np.ndarray]:
+        """Reads the nodes and cells from the .2dm file into numpy arrays without going through a DataFrame.
 
-        Parameters
-        ----------
-        df : pd.DataFrame
-            The raw 2dm dataframe.
+        Lines are classified by their card (``ND``, ``E3T``, ``E4Q``) and all other cards (e.g. ``NS``, ``MAT``,
+        header cards) are skipped. Consecutive lines of the same kind (nodes or elements) are parsed straight from
+        the file buffer into preallocated arrays. Element lines may or may not have a material ID. Node and cell
+        indexes are returned as they are written in the file (i.e. typically starting at 1).
 
-        Returns
-        -------
-        np.ndarray
-            The nodes array.
-        """
-        nds = df[df['A'] == 'ND'][['B', 'C', 'D', 'E']].rename(columns={'B': 'ind', 'C': 'x', 'D': 'y', 'E': 'z'})
-        uses_fortran_indexing = nds['ind'].min() == 1
-        if uses_fortran_indexing:
-            nds['ind'] -= 1
-        nds.set_index('ind', inplace=True)
-        return nds.to_numpy('f8')
-
-    @staticmethod
-    def load_cells(df: pd.DataFrame) -> pd.DataFrame:
-        """Loads the cells/primitives from the raw 2dm dataframe.
+        If ``chunk_size`` is given, the file is streamed roughly ``chunk_size`` bytes at a time. The file is scanned
+        once to count the cards so the output arrays can be preallocated, then filled chunk by chunk. This keeps
+        the peak memory close to the size of the output arrays rather than a multiple of the size of the file.
 
         Parameters
         ----------
-        df : pd.DataFrame
-            The raw 2dm dataframe.
+        fpath : Path
+            The path to the .2dm file.
+        chunk_size : int, optional
+            The approximate number of bytes to read at a time. If not provided, the whole file is read in one go.
 
         Returns
         -------
-        pd.DataFrame
+        tuple[np.ndarray, np.ndarray]
+            Nodes array ``Nx4`` ``[id, x, y, z]`` (float64) and cells array ``Mx5`` ``[id, n1, n2, n3, n4]``
+            (int64) in file order, where ``n4`` is ``-1`` for triangles.
         """
-        fortran_indexing = df[df['A'] == 'ND']['B'].min() == 1
-        cells = df[df['A'].isin(['E4Q', 'E3T'])][['A', 'B', 'C', 'D', 'E', 'F']].rename(
-            columns={'A': 'shape', 'B': 'ind', 'C': 'n1', 'D': 'n2', 'E': 'n3', 'F': 'n4'}
-        )
-        tri = cells['shape'] == 'E3T'
-        cells = cells.drop(columns=['shape'])
-        cells = cells.astype('i8') - 1 if fortran_indexing else cells.astype('i8')
-        cells.loc[tri, 'n4'] = -1
-        return cells.set_index('ind')
+        def chunks() -> typing.Generator[bytes, None, None]:
+            with open(fpath, 'rb') as f:
+                if not chunk_size:
+                    yield f.read()
+                    return
+                leftover = b''
+                while True:
+                    buf = f.read(chunk_size)
+                    if not buf:
+                        if leftover:
+                            yield leftover
+                        return
+                    buf = leftover + buf
+                    k = buf.rfind(b'\n') + 1
+                    if k == 0:
+                        leftover = buf
+                        continue
+                    leftover = buf[k:]
+                    yield buf[:k]
+
+        def classify(buf: bytes) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+            # returns the start, end, and card type of each line (0 = other, 1 = node, 2 = triangle, 3 = quad)
+            a = np.frombuffer(buf, dtype=np.uint8)
+            nl = np.flatnonzero(a == 10)
+            starts = np.insert(nl + 1, 0, 0)
+            ends = np.append(nl, a.size)
+            padded = np.append(a, np.zeros(3, dtype=np.uint8))
+            b0, b1, b2 = padded[starts], padded[starts + 1], padded[starts + 2]
+            card = np.zeros(starts.size, dtype=np.int8)
+            card[(b0 == ord('N')) & (b1 == ord('D')) & ((b2 == ord(' ')) | (b2 == ord('\t')))] = 1
+            card[(b0 == ord('E')) & (b1 == ord('3')) & (b2 == ord('T'))] = 2
+            card[(b0 == ord('E')) & (b1 == ord('4')) & (b2 == ord('Q'))] = 3
+            return starts, ends, card
+
+        def parse(buf: bytes, usecols: tuple[int, ...], dtype: type) -> np.ndarray:
+            return np.loadtxt(io.BytesIO(buf), usecols=usecols, dtype=dtype, comments=None, ndmin=2)
+
+        def parse_elements(buf: bytes, is_quad: np.ndarray) -> np.ndarray:
+            # element lines are ragged (E3T/E4Q, with or without a material ID) so the run is split into tokens
+            # and each card picks its node columns from the position of its first token
+            tokens = np.array(buf.split())
+            a = np.frombuffer(buf, dtype=np.uint8)
+            ws = (a == 32) | (a == 9) | (a == 10) | (a == 13)
+            token_line = np.cumsum(a == 10)[~ws & np.append(True, ws[:-1])]
+            first = np.flatnonzero(np.append(True, token_line[1:] != token_line[:-1]))
+            cells_ = np.full((is_quad.size, 5), -1, dtype=np.int64)
+            cells_[:, :4] = tokens[first[:, None] + np.arange(1, 5)].astype(np.int64)
+            cells_[is_quad, 4] = tokens[first[is_quad] + 5].astype(np.int64)
+            return cells_
+
+        # preallocate - in chunked mode the counts are found using a first pass through the file
+        counts = None
+        if chunk_size:
+            counts = np.zeros(4, dtype=np.int64)
+            for buf in chunks():
+                counts += np.bincount(classify(buf)[2], minlength=4)
+
+        nodes, cells = None, None
+        inode, icell = 0, 0
+        for buf in chunks():
+            starts, ends, card = classify(buf)
+            if counts is None:
+                counts = np.bincount(card, minlength=4)
+            if nodes is None:
+                nodes = np.empty((counts[1], 4), dtype=np.float64)
+                cells = np.full((counts[2] + counts[3], 5), -1, dtype=np.int64)
+
+            # runs of consecutive lines of the same kind (node or element) are parsed straight from the buffer
+            kind = np.minimum(card, 2)
+            brk = np.flatnonzero(np.diff(kind)) + 1
+            for i0, i1 in zip(np.insert(brk, 0, 0), np.append(brk, kind.size)):
+                n = i1 - i0
+                if kind[i0] == 1:
+                    nodes[inode:inode + n] = parse(buf[starts[i0]:ends[i1 - 1]], (1, 2, 3, 4), np.float64)
+                    inode += n
+                elif kind[i0] == 2:
+                    cells[icell:icell + n] = parse_elements(buf[starts[i0]:ends[i1 - 1]], card[i0:i1] == 3)
+                    icell += n
+
+        if nodes is None:
+            nodes = np.empty((0, 4), dtype=np.float64)
+            cells = np.empty((0, 5), dtype=np.int64)
+        return nodes, cells
 
     def tuflow_grid_bbox(self, output_cell_size: float) -> Bbox2D:
         # only supports TUFLOW Classic/HPC and only if "Grid Output Origin == Origin" (which is not the default)
@@ -153,18 +207,28 @@ class Py2dm(PyMeshGeometry, GeometryLazyLoadMixin, VTKGeometryMixin):
 
     def _load(self):
         """Loads and processes the 2dm file: loads nodes, quads, triangles, and converts to local coordinates."""
-        df = self.read_2dm_file(self.fpath)
-
-        self._vertices = self.load_nodes(df)
-        self._cells_df = self.load_cells(df)
-
-        self._cells_df.insert(0, 'nnode', 4)
-        self._cells_df.loc[self._cells_df['n4'] == -1, 'nnode'] = 3
-        self._cells = self._flatten_cells(self._cells_df)
-
-        quads = self._cells_df.loc[self._cells_df['n4'] != -1, ['n1', 'n2', 'n3', 'n4']].reset_index().to_numpy()
-        tris = self._cells_df.loc[self._cells_df['n4'] == -1, ['n1', 'n2', 'n3']].reset_index().to_numpy()
-        self._triangles, self._cell2triangle = self.create_triangles(quads, tris)
+        if not self._load_sidecar():
+            nodes, cells = self.read_2dm(self.fpath)
+            if nodes.size and nodes[:, 0].min() == 1:  # fortran indexing
+                is_quad = cells[:, 4] != -1
+                cells[:, :4] -= 1
+                cells[is_quad, 4] -= 1
+            self._vertices = nodes[:, 1:]
+            self._cells_df = pd.DataFrame(
+                cells[:, 1:],
+                index=pd.Index(cells[:, 0], name='ind'),
+                columns=['n1', 'n2', 'n3', 'n4'],
+            )
+
+            self._cells_df.insert(0, 'nnode', 4)
+            self._cells_df.loc[self._cells_df['n4'] == -1, 'nnode'] = 3
+            self._cells = self._flatten_cells(self._cells_df)
+
+            is_quad = self._cells_df['n4'] != -1
+            quads = self._cells_df.loc[is_quad, ['n1', 'n2', 'n3', 'n4']].reset_index().to_numpy()
+            tris = self._cells_df.loc[~is_quad, ['n1', 'n2', 'n3']].reset_index().to_numpy()
+            self._triangles, self._cell2triangle = self.create_triangles(quads, tris)
+            self._save_sidecar()
 
         self._global_bbox.update_extents(self._vertices)
         shift = (
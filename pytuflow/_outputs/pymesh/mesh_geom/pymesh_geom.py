@@ -16,11 +16,17 @@ except ImportError:
     from ..stubs import pyvista as pv
 
 from .. import barycentric_coord, Bbox2D, Transform2D, PointMixin, PointLike, LineStringMixin, LineStringLike
+from .cell_to_vertex import CellToVertexOperator
+from .mesh_line_walk import MeshLineWalk
 
 
 class PyMeshGeometry(PointMixin, LineStringMixin):
     """Base class for mesh geometry."""
 
+    #: bool: Use the vectorised :class:`MeshLineWalk` in :meth:`mesh_line`. If ``False``, each line segment is
+    #: intersected with the mesh one at a time using :meth:`_mesh_intersects`.
+    vectorised_line_walk = True
+
     def __init__(self, fpath: Path | str):
         # Path: File path to the mesh
         self.fpath = Path(fpath)
@@ -58,6 +64,8 @@ class PyMeshGeometry(PointMixin, LineStringMixin):
         self.data_type = 'Bed Elevation'
         #: bool: whether to reverse the winding order of triangles
         self.winding_order = 'CCW'
+        self._cell_to_vertex = None
+        self._line_walk = None
 
     def load(self):
         pass
@@ -247,6 +255,35 @@ class PyMeshGeometry(PointMixin, LineStringMixin):
         """
         raise NotImplementedError
 
+    def cell_to_vertex_operator(self) -> CellToVertexOperator:
+        """Returns the sparse operator used to interpolate from cell centers to vertex values. The operator is
+        built from :meth:`cell_to_vertex_weights` the first time it is requested and reused afterwards.
+
+        Returns
+        -------
+        CellToVertexOperator
+            The cell to vertex interpolation operator.
+        """
+        if self._cell_to_vertex is None:
+            self._cell_to_vertex = CellToVertexOperator(
+                self.cell_nodes, self.cell_to_vertex_weights(), self.vertices.shape[0]
+            )
+        return self._cell_to_vertex
+
+    def line_walk(self) -> MeshLineWalk:
+        """Returns the vectorised line walk used to intersect lines with the mesh. The triangle edge normals and
+        spatial index are built the first time it is requested and reused afterwards.
+
+        Returns
+        -------
+        MeshLineWalk
+            The mesh line walk (in local coordinates).
+        """
+        if self._line_walk is None:
+            pos = self.vertex_position(slice(None), 'local')[:, :2]
+            self._line_walk = MeshLineWalk(pos[self.triangles[:, 1:4]], self.triangles[:, 0])
+        return self._line_walk
+
     def triangle_vertices(self, triangle_id: int) -> np.ndarray:
         """Returns the vertex ids connected to the given triangle.
 
@@ -367,6 +404,114 @@ class PyMeshGeometry(PointMixin, LineStringMixin):
 
         return -1
 
+    def find_containing_cells(self, points: np.ndarray, scope: str = 'global') -> np.ndarray:
+        """Find the cells that contain the given points. Batched version of :meth:`find_containing_cell` that looks
+        up all the points at once in the bucket index of :meth:`line_walk`.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            ``(N,2)`` array of x,y positions to find the containing cells for.
+        scope : str, optional
+            The coordinate scope of the points. Options are ``"global"`` or ``"local"``.
+
+        Returns
+        -------
+        np.ndarray
+            ``(N,)`` array of cell IDs that contain the given points, ``-1`` if no cell contains the point.
+        """
+        p = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+        if scope == 'global':
+            p = self.trans.transform(p)
+        return self.line_walk().locate(p)[0]
+
+    def find_containing_triangles(self, points: np.ndarray, cell_ids: np.ndarray, scope: str = 'global') -> np.ndarray:
+        """Find the triangles that contain the given points within the given cells. Batched version of
+        :meth:`find_containing_triangle` where the containing cells are already known.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            ``(N,2)`` array of x,y positions to find the containing triangles for.
+        cell_ids : np.ndarray
+            ``(N,)`` array of the cell IDs that contain the points, ``-1`` if the point is outside the mesh.
+        scope : str, optional
+            The coordinate scope of the points. Options are ``"global"`` or ``"local"``.
+
+        Returns
+        -------
+        np.ndarray
+            ``(N,)`` array of triangle IDs that contain the given points, ``-1`` if no triangle contains the point.
+        """
+        p = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+        if scope == 'global':
+            p = self.trans.transform(p)
+        cell_ids = np.asarray(cell_ids, dtype=np.int64).reshape(-1)
+        tri_ids = np.full(cell_ids.shape, -1, dtype=np.int64)
+        inside = np.flatnonzero(cell_ids != -1)
+        if inside.size:
+            # test each candidate triangle of the containing cell, first triangle first
+            candidates = self.cell2triangle[cell_ids[inside]].reshape((inside.size, -1))
+            for j in range(candidates.shape[1]):
+                test = (tri_ids[inside] == -1) & (candidates[:, j] != -1)
+                if not test.any():
+                    continue
+                hit = self._points_in_triangles(p[inside[test]], candidates[test, j])
+                tri_ids[inside[test][hit]] = candidates[test, j][hit]
+        return tri_ids
+
+    def locate_points(self, points: np.ndarray, scope: str = 'global') -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Locates a batch of points within the mesh in a single pass. Returns the containing cell and triangle
+        for each point and the barycentric weights of each point within its triangle.
+
+        Returns 3 numpy arrays:
+
+        1. ``N,`` - ``[cell ID]`` - The cell ids containing the points (``-1`` if outside the mesh).
+        2. ``N,`` - ``[triangle ID]`` - The triangle ids containing the points (``-1`` if outside the mesh).
+        3. ``Nx3`` - ``[u, v, w]`` - The barycentric weights of the points (``nan`` if outside the mesh).
+
+        Parameters
+        ----------
+        points : np.ndarray
+            ``(N,2)`` array of x,y positions to locate.
+        scope : str, optional
+            The coordinate scope of the points. Options are ``"global"`` or ``"local"``.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The cell IDs, triangle IDs, and barycentric weights for each point.
+        """
+        p = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+        if scope == 'global':
+            p = self.trans.transform(p)
+
+        cell_ids, tri_ids = self.line_walk().locate(p)
+
+        uvw = np.full((p.shape[0], 3), np.nan)
+        found = tri_ids != -1
+        if found.any():
+            pos = self.vertex_position(self.triangle_vertices(tri_ids[found]).flatten(), 'local')
+            pos = pos[:, :2].reshape((-1, 3, 2))
+            uvw[found] = np.column_stack(barycentric_coord(p[found], pos[:, 0], pos[:, 1], pos[:, 2]))
+
+        return cell_ids, tri_ids, uvw
+
+    def _points_in_triangles(self, points: np.ndarray, triangle_ids: np.ndarray) -> np.ndarray:
+        """Vectorised point in triangle test (same sign test as used by :meth:`find_containing_triangle`).
+        Points are in local coordinates and paired with the triangle ids.
+        """
+        pos = self.vertex_position(self.triangle_vertices(triangle_ids).flatten(), 'local')[:, :2].reshape((-1, 3, 2))
+        v1, v2, v3 = pos[:, 0], pos[:, 1], pos[:, 2]
+
+        def sign(p1, p2, p3):
+            return (p1[:, 0] - p3[:, 0]) * (p2[:, 1] - p3[:, 1]) - (p2[:, 0] - p3[:, 0]) * (p1[:, 1] - p3[:, 1])
+
+        b1 = sign(points, v1, v2) < 0.0
+        b2 = sign(points, v2, v3) < 0.0
+        b3 = sign(points, v3, v1) < 0.0
+        return (b1 == b2) & (b2 == b3)
+
     def cell_edge_intersections(self, cell_id: int, p0: np.ndarray, p1: np.ndarray, scope: str = 'global') -> np.ndarray:
         """Returns the intersection points between a line (p0, p1) and the edges of the given cell.
 
@@ -468,6 +613,9 @@ class PyMeshGeometry(PointMixin, LineStringMixin):
             5. ``Nx3`` - ``[offset, x, y]`` - Mid-points between intersections + start and end points.
             6. ``Nx2`` - ``[dir-x, dir-y]`` - Direction vectors for each mid-segment between intersections.
         """
+        if self.vectorised_line_walk:
+            return self.mesh_lines([line], scope)[0]
+
         line = self._coerce_into_line(line)
         if scope == 'global':
             line = self.trans.transform(line).astype(self.dtype)
@@ -501,6 +649,133 @@ class PyMeshGeometry(PointMixin, LineStringMixin):
 
         return cell_ids, acell, dir_, mid_cell_ids, amid, dir_mid
 
+    def mesh_lines(self,
+                   lines: typing.Iterable[LineStringLike],
+                   scope: str = 'global',
+                   ) -> list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """Batched version of :meth:`mesh_line`. The segments of all the lines are walked through the mesh
+        together with :meth:`line_walk`.
+
+        Parameters
+        ----------
+        lines : typing.Iterable[LineStringLike]
+            The lines to calculate the mesh intersections for.
+        scope : str, optional
+            The coordinate scope of the lines. Options are ``"global"`` or ``"local"``.
+
+        Returns
+        -------
+        list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]
+            The 6 arrays returned by :meth:`mesh_line` for each line.
+        """
+        if not self.vectorised_line_walk:
+            return [self.mesh_line(line, scope) for line in lines]
+
+        tol = MeshLineWalk.TOL
+
+        # segments of all lines (zero length segments are ignored)
+        p0, p1, line_idx = [], [], []
+        for i, line in enumerate(lines):
+            line = np.asarray(self._coerce_into_line(line), dtype=np.float64)[:, :2]
+            if scope == 'global':
+                line = self.trans.transform(line).astype(self.dtype).astype(np.float64)
+            keep = np.append(True, (np.diff(line, axis=0) != 0).any(axis=1))
+            line = line[keep] if keep.sum() > 1 else line[:2]
+            p0.append(line[:-1])
+            p1.append(line[1:])
+            line_idx.append(np.full(line.shape[0] - 1, i))
+        nline = len(line_idx)
+        if not nline:
+            return []
+        p0, p1, line_idx = np.concatenate(p0), np.concatenate(p1), np.concatenate(line_idx)
+        nseg = line_idx.size
+        vec = p1 - p0
+        length = np.hypot(vec[:, 0], vec[:, 1])
+        dir_seg = np.zeros(vec.shape)
+        np.divide(vec, length.reshape((-1, 1)), out=dir_seg, where=length.reshape((-1, 1)) > 0)
+
+        walk = self.line_walk()
+        seg, cell, ta, tb, _ = walk.walk(p0, p1)
+
+        # split each segment into parts - the cells and the gaps outside the mesh between them
+        first = np.ones(seg.size, dtype=bool)
+        first[1:] = seg[1:] != seg[:-1]
+        last = np.ones(seg.size, dtype=bool)
+        last[:-1] = seg[1:] != seg[:-1]
+        prev_tb = np.append(0., tb[:-1])
+        prev_tb[first] = 0.
+        gap_before = (ta - prev_tb > tol) & ((ta - prev_tb) * length[seg] > walk.gap_length)
+        gap_after = last & (1. - tb > tol) & ((1. - tb) * length[seg] > walk.gap_length)
+        ta = np.where(gap_before, ta, prev_tb)
+        empty = np.bincount(seg, minlength=nseg) == 0
+
+        n = 1 + gap_before + gap_after
+        part_seg = np.concatenate((np.repeat(seg, n), np.flatnonzero(empty)))
+        pos = np.cumsum(n) - n
+        k = pos + gap_before
+        part_label = np.full(part_seg.size, -1, dtype=np.int64)
+        part_t0 = np.zeros(part_seg.size)
+        part_t1 = np.ones(part_seg.size)
+        part_label[k] = cell
+        part_t0[k], part_t1[k] = ta, tb
+        part_t0[pos[gap_before]], part_t1[pos[gap_before]] = prev_tb[gap_before], ta[gap_before]
+        part_t0[k[gap_after] + 1] = tb[gap_after]
+        order = np.argsort(part_seg, kind='stable')
+        part_seg, part_label, part_t0, part_t1 = part_seg[order], part_label[order], part_t0[order], part_t1[order]
+
+        # points - the start of each part and the end of the segment
+        nparts = np.bincount(part_seg, minlength=nseg)
+        seg_end = np.cumsum(nparts + 1) - 1
+        pt_seg = np.repeat(np.arange(nseg), nparts + 1)
+        pt_t = np.empty(pt_seg.size)
+        pt_label = np.empty(pt_seg.size, dtype=np.int64)
+        is_part = np.ones(pt_seg.size, dtype=bool)
+        is_part[seg_end] = False
+        pt_t[is_part] = part_t0
+        pt_t[seg_end] = 1.
+        pt_label[is_part] = part_label
+        pt_label[seg_end] = pt_label[seg_end - 1]
+        # if the segment finishes outside the mesh, the exit point takes the label of the last cell
+        exits = seg_end[(nparts > 1) & (pt_label[seg_end] == -1)] - 1
+        pt_label[exits] = pt_label[exits - 1]
+
+        # mid-points - the start of the segment, the middle of each part and the end of the segment
+        mid_seg = np.repeat(np.arange(nseg), nparts + 2)
+        mid_end = np.cumsum(nparts + 2) - 1
+        mid_t = np.empty(mid_seg.size)
+        is_mid = np.ones(mid_seg.size, dtype=bool)
+        is_mid[mid_end] = is_mid[mid_end - nparts - 1] = False
+        mid_t[is_mid] = 0.5 * (part_t0 + part_t1)
+        mid_t[mid_end - nparts - 1] = 0.
+        mid_t[mid_end] = 1.
+        mid_label = np.empty(mid_seg.size, dtype=np.int64)
+        mid_label[is_mid | (np.arange(mid_seg.size) == mid_end[mid_seg])] = pt_label
+        mid_label[mid_end - nparts - 1] = pt_label[seg_end - nparts]
+
+        # join the segments of each line - the end of a segment is the start of the next
+        same_line = np.append(False, line_idx[1:] == line_idx[:-1])
+        cum = np.cumsum(length)
+        start = np.flatnonzero(~same_line)
+        seg_offset = cum - length - np.repeat(cum[start] - length[start], np.diff(np.append(start, nseg)))
+        last_seg = np.append(line_idx[1:] != line_idx[:-1], True)
+        keep_pt = ~np.isin(np.arange(pt_seg.size), seg_end[~last_seg])
+        keep_mid = ~(np.isin(np.arange(mid_seg.size), mid_end[~last_seg])
+                     | np.isin(np.arange(mid_seg.size), (mid_end - nparts - 1)[same_line]))
+
+        def assemble(s, t, label, keep):
+            s, t, label = s[keep], t[keep], label[keep]
+            xy = p0[s] + vec[s] * t.reshape((-1, 1))
+            a = np.column_stack((seg_offset[s] + t * length[s], xy)).astype(self.dtype)
+            return label, a, dir_seg[s].astype(self.dtype), np.bincount(line_idx[s], minlength=nline)
+
+        cell_ids, acell, dir_, npt = assemble(pt_seg, pt_t, pt_label, keep_pt)
+        mid_cell_ids, amid, dir_mid, nmid = assemble(mid_seg, mid_t, mid_label, keep_mid)
+        split_pt, split_mid = np.cumsum(npt)[:-1], np.cumsum(nmid)[:-1]
+        return list(zip(
+            np.split(cell_ids, split_pt), np.split(acell, split_pt), np.split(dir_, split_pt),
+            np.split(mid_cell_ids, split_mid), np.split(amid, split_mid), np.split(dir_mid, split_mid)
+        ))
+
     def _mesh_line_segment(self, line: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """The workhorse for the above routine. Calculates per line segment information."""
         p1 = np.append(line[0], self.dtype(0))
@@ -24,11 +24,11 @@ try:
 except ImportError:
     from ..stubs.netCDF4 import Dataset
 
-from . import PyMeshGeometry, GeometryLazyLoadMixin, VTKGeometryMixin
+from . import PyMeshGeometry, GeometryLazyLoadMixin, VTKGeometryMixin, GeometrySidecarMixin
 from .. import proj_transformer, Transform2D
 
 
-class PyNCMeshGeometry(PyMeshGeometry, GeometryLazyLoadMixin, VTKGeometryMixin):
+class PyNCMeshGeometry(PyMeshGeometry, GeometryLazyLoadMixin, VTKGeometryMixin, GeometrySidecarMixin):
 
     def __init__(self, fpath: str | Path):
         self._init_lazy_load()
@@ -101,44 +101,51 @@ class PyNCMeshGeometry(PyMeshGeometry, GeometryLazyLoadMixin, VTKGeometryMixin):
             # Sum angles for each node & divide by total angle
             ang_sum = np.bincount(self.cell_nodes.flatten(), weights=ang.flatten())
             self._weights = ang / ang_sum[self.cell_nodes]
+            self._save_sidecar_weights(self._weights)
 
         return self._weights
 
+    def _sidecar_set_weights(self, weights: np.ndarray):
+        self._weights = weights
+
     def _load(self):
         with self._open() as nc:
-            self._vertices = np.column_stack((
-                self._data(nc, 'node_X'),
-                self._data(nc, 'node_Y'),
-                self._data(nc, 'node_Zb')
-            ))
-            if np.ma.isMaskedArray(self._vertices):
-                if np.ma.is_masked(self._vertices):
-                    self._vertices = self._vertices.filled(np.nan)
-                else:
-                    self._vertices = np.array(self._vertices)
-            cell_node = self._data(nc, 'cell_node')
-            if np.ma.isMaskedArray(cell_node):
-                if np.ma.is_masked(cell_node):
-                    cell_node = cell_node.filled(np.nan)
-                else:
-                    cell_node = np.array(cell_node)
-            columns = ['n1', 'n2', 'n3', 'n4'] if cell_node.shape[1] == 4 else ['n1', 'n2', 'n3']
-
-            self._cells_df = pd.DataFrame(
-                cell_node - 1,
-                columns=columns,
-                dtype=np.int64
-            )
-            if len(columns) == 3:
-                self._cells_df['n4'] = -1
-
-            self._cells_df.insert(0, 'nnode', 4)
-            self._cells_df.loc[self._cells_df['n4'] == -1, 'nnode'] = 3
-            self._cells = self._flatten_cells(self._cells_df)
-
-            quads = self._cells_df.loc[self._cells_df['n4'] != -1, ['n1', 'n2', 'n3', 'n4']].reset_index().to_numpy()
-            tris = self._cells_df.loc[self._cells_df['n4'] == -1, ['n1', 'n2', 'n3']].reset_index().to_numpy()
-            self._triangles, self._cell2triangle = self.create_triangles(quads, tris)
+            if not self._load_sidecar():
+                self._vertices = np.column_stack((
+                    self._data(nc, 'node_X'),
+                    self._data(nc, 'node_Y'),
+                    self._data(nc, 'node_Zb')
+                ))
+                if np.ma.isMaskedArray(self._vertices):
+                    if np.ma.is_masked(self._vertices):
+                        self._vertices = self._vertices.filled(np.nan)
+                    else:
+                        self._vertices = np.array(self._vertices)
+                cell_node = self._data(nc, 'cell_node')
+                if np.ma.isMaskedArray(cell_node):
+                    if np.ma.is_masked(cell_node):
+                        cell_node = cell_node.filled(np.nan)
+                    else:
+                        cell_node = np.array(cell_node)
+                columns = ['n1', 'n2', 'n3', 'n4'] if cell_node.shape[1] == 4 else ['n1', 'n2', 'n3']
+
+                self._cells_df = pd.DataFrame(
+                    cell_node - 1,
+                    columns=columns,
+                    dtype=np.int64
+                )
+                if len(columns) == 3:
+                    self._cells_df['n4'] = -1
+
+                self._cells_df.insert(0, 'nnode', 4)
+                self._cells_df.loc[self._cells_df['n4'] == -1, 'nnode'] = 3
+                self._cells = self._flatten_cells(self._cells_df)
+
+                is_quad = self._cells_df['n4'] != -1
+                quads = self._cells_df.loc[is_quad, ['n1', 'n2', 'n3', 'n4']].reset_index().to_numpy()
+                tris = self._cells_df.loc[~is_quad, ['n1', 'n2', 'n3']].reset_index().to_numpy()
+                self._triangles, self._cell2triangle = self.create_triangles(quads, tris)
+                self._save_sidecar()
 
             self._global_bbox.update_extents(self._vertices)
 
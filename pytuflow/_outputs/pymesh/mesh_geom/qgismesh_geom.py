@@ -36,6 +36,8 @@ class PointMixinQgis(PointMixin):
 
 class QgisMeshGeometry(PyMeshGeometry, PointMixinQgis):
 
+    vectorised_line_walk = False
+
     def __init__(self, fpath: Path | str):
         super().__init__(fpath)
         self.has_z = True
@@ -137,7 +139,9 @@ class QgisMeshGeometry(PyMeshGeometry, PointMixinQgis):
             self._vertex_positions_cache = a
         return a
 
-    def triangle_vertices(self, triangle_id: int) -> np.ndarray:
+    def triangle_vertices(self, triangle_id: int | np.ndarray) -> np.ndarray:
+        if isinstance(triangle_id, np.ndarray):
+            return np.array([self.triangle_vertices(int(x)) for x in triangle_id.flatten()], dtype=int).reshape((-1, 3))
         if triangle_id in self._triangles:
             return self._triangles[triangle_id]
         raise RuntimeError(f'Triangle index not found in cache: {triangle_id}')
@@ -202,6 +206,29 @@ class QgisMeshGeometry(PyMeshGeometry, PointMixinQgis):
                         return tri_id
         return -1
 
+    def find_containing_cells(self, points: np.ndarray, *args, **kwargs) -> np.ndarray:
+        return np.array([self.find_containing_cell(p) for p in np.asarray(points).reshape((-1, 2))], dtype=np.int64)
+
+    def find_containing_triangles(self, points: np.ndarray, cell_ids: np.ndarray, *args, **kwargs) -> np.ndarray:
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+        return np.array([self.find_containing_triangle(p) if c != -1 else -1
+                         for p, c in zip(points, np.asarray(cell_ids).reshape(-1))], dtype=np.int64)
+
+    def locate_points(self, points: np.ndarray, *args, **kwargs) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # QGIS spatial index is queried one point at a time, triangles are only known once they have been visited
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+        cell_ids = np.full(points.shape[0], -1, dtype=np.int64)
+        tri_ids = np.full(points.shape[0], -1, dtype=np.int64)
+        uvw = np.full((points.shape[0], 3), np.nan)
+        for i, p in enumerate(points):
+            tri_id = self.find_containing_triangle(p)
+            if tri_id == -1:
+                continue
+            tri_ids[i] = tri_id
+            cell_ids[i] = self.triangle_cell(tri_id)
+            uvw[i] = np.array(self.barycentric_factors(p, tri_id, scope='local')).flatten()
+        return cell_ids, tri_ids, uvw
+
     def cell_edge_intersections(self, cell_id: int, p0: np.ndarray, p1: np.ndarray, scope: str = 'global') -> np.ndarray:
         def cross2d(x: np.ndarray, y: np.ndarray) -> np.ndarray:
             """2D cross product. Numpy 2.0 deprecates np.cross for 2D arrays."""
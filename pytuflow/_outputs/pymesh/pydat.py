@@ -38,6 +38,10 @@ class PyDAT(PyMesh):
 
         self.name = twodm.stem
 
+    def close(self):
+        if isinstance(self.extractor, PyDATDataExtractor):
+            self.extractor.close()
+
     def data_types(self) -> list[str]:
         if not self._data_types:
             data_types = self.extractor.data_types()
@@ -7,7 +7,7 @@ except ImportError:
     from .stubs import pandas as pd
 
 from . import (LineStringMixin, LineStringLike, PointMixin, PointLike, VertexDataMixin, CellDataMixin, Cache,
-               PyMeshGeometry, PyDataExtractor, NCEngine, H5Engine, SoftLoadMixin, QgisMeshGeometry)
+               PyMeshGeometry, PyDataExtractor, NCEngine, H5Engine, SoftLoadMixin, QgisMeshGeometry, TemporalReducer)
 
 try:
     import shapely
@@ -44,6 +44,7 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         self._data_types = []
         self._standardised_data_types = []
         self._cells_4_mapping = None
+        self._ragged_layout = None
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} {self.name}>'
@@ -96,8 +97,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         tuple[str, ...]
             The translated data type(s). Returned as a tuple since vectors may require multiple data types.
         """
-        if self.cache.contains('translate_data_type', data_type):
-            return self.cache.get('translate_data_type', data_type)
+        cached = self.cache.get('translate_data_type', data_type, default=None)
+        if cached is not None:
+            return cached
         from ..map_output import MapOutput
         dtype = MapOutput._get_standard_data_type_name(data_type)
         try:
@@ -121,8 +123,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
             An array of times.
         """
         data_type = self.translate_data_type(data_type)[0]
-        if self.cache.contains('times', data_type):
-            return self.cache.get('times', data_type)
+        cached = self.cache.get('times', data_type, default=None)
+        if cached is not None:
+            return cached
         times = self.extractor.times(data_type)
         self.cache.set(times, 'times', data_type)
         return times
@@ -167,8 +170,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         datetime
             The dataset reference time.
         """
-        if self.cache.contains('reference_time', data_type):
-            return self.cache.get('reference_time', data_type)
+        cached = self.cache.get('reference_time', data_type, default=None)
+        if cached is not None:
+            return cached
         ref_time = self.extractor.reference_time(self.translate_data_type(data_type)[0])
         self.cache.set(ref_time, 'reference_time', data_type)
         return ref_time
@@ -192,33 +196,36 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         -------
         float | tuple[float, float]
             The maximum value for the specified result type.
+
+        Raises
+        ------
+        ValueError
+            If the maximum needs to be calculated from the data and the result type is never active (e.g. dry
+            everywhere for all timesteps).
         """
         if not self.is_3d(data_type):
             depth_averaging = None
         if not self.is_vector(data_type):
             split_vector_components = False
 
-        if self.cache.contains('maximum', data_type, depth_averaging, split_vector_components):
-            return self.cache.get('maximum', data_type, depth_averaging, split_vector_components)
+        cached = self.cache.get('maximum', data_type, depth_averaging, split_vector_components, default=None)
+        if cached is not None:
+            return cached
         if data_type.lower() in ['bed elevation', 'bed level']:
             mx = float(np.max(self.geom.vertex_position(slice(None), get_z=True)[:, 2]))
-            self.cache.set('maximum', data_type, mx)
+            self.cache.set(mx, 'maximum', data_type, depth_averaging, split_vector_components)
             return mx
 
         try:  # some formats store maximums/minimums in the metadata
             mx = self.extractor.maximum(self.translate_data_type(data_type)[0], depth_averaging, split_vector_components)
-        except NotImplementedError:  # need to extract full data to find maximum
-            if self.on_vertex(data_type):
-                data, mask = self.vertex_data(data_type, slice(None))
+        except NotImplementedError:  # need to reduce the full data to find maximum
+            a = self.temporal_stats(data_type, depth_averaging, split_vector_components)['max']
+            if np.isnan(a).all():
+                raise ValueError(f'No active values to calculate the maximum from: {data_type}')
+            if split_vector_components:
+                mx = tuple(float(x) for x in np.fmax.reduce(a, axis=0))
             else:
-                data, mask = self.cell_data(data_type, slice(None), depth_averaging)
-            if self.is_vector(data_type) and not split_vector_components:
-                data = np.linalg.norm(data, axis=1 if data.ndim == 2 else 2)
-
-            if self.is_vector(data_type) and split_vector_components:
-                mx = (float(data[mask].max(axis=0)[0]), float(data[mask].max(axis=0)[1]))
-            else:
-                mx = float(data[mask].max())
+                mx = float(np.fmax.reduce(a, axis=None))
 
         self.cache.set(mx, 'maximum', data_type, depth_averaging, split_vector_components)
         return mx
@@ -241,38 +248,116 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         Returns
         -------
         float | tuple[float, float]
-            The maximum value for the specified result type.
+            The minimum value for the specified result type.
+
+        Raises
+        ------
+        ValueError
+            If the minimum needs to be calculated from the data and the result type is never active (e.g. dry
+            everywhere for all timesteps).
         """
         if not self.is_3d(data_type):
             depth_averaging = None
         if not self.is_vector(data_type):
             split_vector_components = False
 
-        if self.cache.contains('minimum', data_type, depth_averaging, split_vector_components):
-            return self.cache.get('minimum', data_type, depth_averaging, split_vector_components)
+        cached = self.cache.get('minimum', data_type, depth_averaging, split_vector_components, default=None)
+        if cached is not None:
+            return cached
         if data_type.lower() in ['bed elevation', 'bed level']:
             mn = float(np.min(self.geom.vertex_position(slice(None), get_z=True)[:, 2]))
-            self.cache.set('minimum', data_type, mn)
+            self.cache.set(mn, 'minimum', data_type, depth_averaging, split_vector_components)
             return mn
 
         try:  # some formats store maximums/minimums in the metadata
             mn = self.extractor.minimum(self.translate_data_type(data_type)[0], depth_averaging, split_vector_components)
-        except NotImplementedError:  # need to extract full data to find maximum
-            if self.on_vertex(data_type):
-                data, mask = self.vertex_data(data_type, slice(None))
-            else:
-                data, mask = self.cell_data(data_type, slice(None), depth_averaging)
-            if self.is_vector(data_type) and not split_vector_components:
-                data = np.linalg.norm(data, axis=1 if data.ndim == 2 else 2)
-
-            if self.is_vector(data_type):
-                mn = (float(data[mask].min(axis=0)[0]), float(data[mask].min(axis=0)[1]))
+        except NotImplementedError:  # need to reduce the full data to find minimum
+            a = self.temporal_stats(data_type, depth_averaging, split_vector_components)['min']
+            if np.isnan(a).all():
+                raise ValueError(f'No active values to calculate the minimum from: {data_type}')
+            if split_vector_components:
+                mn = tuple(float(x) for x in np.fmin.reduce(a, axis=0))
             else:
-                mn = float(data[mask].min())
+                mn = float(np.fmin.reduce(a, axis=None))
 
         self.cache.set(mn, 'minimum', data_type, depth_averaging, split_vector_components)
         return mn
 
+    def temporal_stats(self, data_type: str, depth_averaging: str = None, split_vector_components: bool = False,
+                       thresholds: tuple[float, ...] = (), block_size: int = None) -> dict[str, np.ndarray]:
+        """Returns the temporal statistics (derived datasets) for every cell/vertex in the mesh - the maximum
+        (``'max'``), minimum (``'min'``), time of maximum (``'tmax'``), time of minimum (``'tmin'``), and the duration
+        the values exceed each of the thresholds (``'duration'``).
+
+        The timesteps are read and reduced in blocks (see :class:`TemporalReducer`) so the full temporal dataset
+        is never held in memory. Values that are never active (wet) are ``NaN``.
+
+        Parameters
+        ----------
+        data_type : str
+            The type of result.
+        depth_averaging : str, optional
+            The depth averaging method to use when extracting 3D data.
+        split_vector_components : bool, optional
+            Reduce the vector components separately rather than the magnitude.
+        thresholds : tuple[float, ...], optional
+            The thresholds to calculate the exceedance duration for.
+        block_size : int, optional
+            The number of timesteps read in each block. By default, this is calculated from
+            ``TemporalReducer.MAX_BYTES``.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The temporal statistics. The ``'duration'`` array is ``(nthreshold, ...)``.
+        """
+        if not self.is_3d(data_type):
+            depth_averaging = None
+        if not self.is_vector(data_type):
+            split_vector_components = False
+        thresholds = tuple(float(x) for x in thresholds)
+        cached = self.cache.get('temporal_stats', data_type, depth_averaging, split_vector_components, thresholds, default=None)
+        if cached is not None:
+            return cached
+
+        def read(time_index: int | slice) -> tuple[np.ndarray, np.ndarray]:
+            ntime = 1 if isinstance(time_index, int) else len(times[time_index])
+            if ntime == 1 and isinstance(time_index, slice):
+                time_index = time_index.start  # single timestep blocks are read without the time dimension
+            if self.on_vertex(data_type):
+                data, mask = self.vertex_data(data_type, time_index)
+            else:
+                data, mask = self.cell_data(data_type, time_index, depth_averaging)
+            mask = mask.reshape((ntime, -1))
+            data = data.reshape((ntime, mask.shape[1]) + ((2,) if vector else ()))
+            if vector and not split_vector_components:
+                data = np.linalg.norm(data, axis=2)
+            elif vector:
+                mask = mask.reshape(mask.shape + (1,))
+            return data, mask
+
+        reducer = TemporalReducer(thresholds)
+        vector = self.is_vector(data_type)
+        if self.is_static(data_type):
+            times = np.array([0.])
+            reducer.add(times, *read(0))
+        else:
+            times = self.times(data_type)
+            data, mask = read(0)
+            reducer.add(times[:1], data, mask)
+            if block_size is None:
+                step_bytes = data.nbytes + mask.nbytes
+                if self.is_3d(data_type) and depth_averaging is not None:  # raw 3D values and levels
+                    layout = self.ragged_layout()
+                    step_bytes += (layout.size * (2 if vector else 1) + layout.zsize) * 8
+                block_size = TemporalReducer.block_size(step_bytes)
+            for i in range(1, times.size, block_size):
+                reducer.add(times[i:i + block_size], *read(slice(i, i + block_size)))
+
+        stats = {x: reducer.result(x) for x in ['max', 'min', 'tmax', 'tmin', 'duration']}
+        self.cache.set(stats, 'temporal_stats', data_type, depth_averaging, split_vector_components, thresholds)
+        return stats
+
     def is_vector(self, data_type: str) -> bool:
         """Returns whether the specified data type is a vector result.
 
@@ -286,8 +371,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         bool
             ``True`` if the data type is a vector result, ``False`` otherwise.
         """
-        if self.cache.contains('is_vector', data_type):
-            return self.cache.get('is_vector', data_type)
+        cached = self.cache.get('is_vector', data_type, default=None)
+        if cached is not None:
+            return cached
         vector = data_type.lower() not in ['bed elevation', 'bed level'] and self.extractor.is_vector(self.translate_data_type(data_type)[0])
         self.cache.set(vector, 'is_vector', data_type)
         return vector
@@ -305,8 +391,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         bool
             ``True`` if the data type is a static result, ``False`` otherwise.
         """
-        if self.cache.contains('is_static', data_type):
-            return self.cache.get('is_static', data_type)
+        cached = self.cache.get('is_static', data_type, default=None)
+        if cached is not None:
+            return cached
         static = data_type.lower() in ['bed elevation', 'bed level'] or self.extractor.is_static(self.translate_data_type(data_type)[0])
         self.cache.set(static, 'is_static', data_type)
         return static
@@ -326,8 +413,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         """
         if data_type.lower() == 'bed elevation':
             return True
-        if self.cache.contains('on_vertex', data_type):
-            return self.cache.get('on_vertex', data_type)
+        cached = self.cache.get('on_vertex', data_type, default=None)
+        if cached is not None:
+            return cached
         vertex = self.extractor.on_vertex(self.translate_data_type(data_type)[0])
         self.cache.set(vertex, 'on_vertex', data_type)
         return vertex
@@ -345,8 +433,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         bool
             ``True`` if the data type is a 3D result, ``False`` otherwise.
         """
-        if self.cache.contains('is_3d', data_type):
-            return self.cache.get('is_3d', data_type)
+        cached = self.cache.get('is_3d', data_type, default=None)
+        if cached is not None:
+            return cached
         is_3d = self.extractor.is_3d(self.translate_data_type(data_type)[0])
         self.cache.set(is_3d, 'is_3d', data_type)
         return is_3d
@@ -452,6 +541,27 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
         tuple[np.ndarray, np.ndarray]
             A tuple containing the data array and a mask array containing information on whether the vertex/cell is wet.
         """
+        values, mask, pos = self.surface_values(data_type, time, depth_averaging, to_vertex, coord_scope, time_index)
+        data = np.column_stack((pos[:, :2], values.reshape(-1, 2) if values.ndim > 1 else values))
+        return data, mask
+
+    def surface_values(self,
+                       data_type: str,
+                       time: float | datetime,
+                       depth_averaging: str = 'sigma&0&1',
+                       to_vertex: bool = False,
+                       coord_scope: str = 'global',
+                       time_index: int = -1
+                       ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Same as :meth:`surface`, but the values and positions are returned as separate arrays rather than
+        being stacked together. The positions are a view of the mesh geometry and are not copied.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            A tuple containing the values (flattened, or ``(n, 2)`` for vector results), the mask array,
+            and the vertex/cell positions.
+        """
         with self.extractor.open():
             if self.is_static(data_type):
                 time_index = -1
@@ -463,24 +573,26 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
             if not self.is_3d(data_type):
                 depth_averaging = None
 
-            if self.cache.contains('surface', data_type, time_index, depth_averaging, to_vertex):
-                return self.cache.get('surface', data_type, time_index, depth_averaging, to_vertex)
+            if to_vertex:
+                pos = self.geom.vertex_position(slice(None), scope=coord_scope, get_z=True)
+            else:
+                pos = self.geom.cell_position(slice(None), scope=coord_scope)
+
+            cached = self.cache.get('surface', data_type, time_index, depth_averaging, to_vertex, default=None)
+            if cached is not None:
+                data, mask = cached
+                return data, mask, pos
 
             if self.on_vertex(data_type):
                 data, mask = self.vertex_data(data_type, time_index)
             else:
                 data, mask = self.cell_data(data_type, time_index, depth_averaging, to_vertex)
 
-            if to_vertex:
-                pos = self.geom.vertex_position(slice(None), scope=coord_scope, get_z=True)
-            else:
-                pos = self.geom.cell_position(slice(None), scope=coord_scope)
-
-            data = np.column_stack((pos[:, :2], data.flatten() if not self.is_vector(data_type) else data.reshape(-1, 2)))
-            mask = mask.flatten()
+            data = data.ravel() if not self.is_vector(data_type) else data.reshape(-1, 2)
+            mask = mask.ravel()
 
             self.cache.set((data, mask), 'surface', data_type, time_index, depth_averaging, to_vertex)
-            return data, mask
+            return data, mask, pos
 
     def data_point(self,
                    point: PointLike,
@@ -541,8 +653,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
                 time_index = time_index if time_index >= 0 else self._find_time_index(data_type, time)
 
             # check cache
-            if self.cache.contains('data_point', data_type, wkt, time_index, return_type, depth_averaging):
-                return self.cache.get('data_point', data_type, wkt, time_index, return_type, depth_averaging)
+            cached = self.cache.get('data_point', data_type, wkt, time_index, return_type, depth_averaging, default=None)
+            if cached is not None:
+                return cached
 
             # get value
             if self.on_vertex(data_type):
@@ -608,8 +721,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
             depth_averaging = depth_averaging if self.is_3d(data_type) else None
 
             # check cache
-            if self.cache.contains('time_series', data_type, return_type, depth_averaging, wkt):
-                return self.cache.get('time_series', data_type, return_type, depth_averaging, wkt)
+            cached = self.cache.get('time_series', data_type, return_type, depth_averaging, wkt, default=None)
+            if cached is not None:
+                return cached
 
             # get data
             if self.on_vertex(data_type):
@@ -631,6 +745,166 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
 
             return time_series
 
+    def data_point_batch(self,
+                         points: list[PointLike],
+                         data_type: str,
+                         time: float = 0.,
+                         time_index: int = -1,
+                         depth_averaging: str = 'sigma&0&1',
+                         return_type: str = 'scalar',
+                         ) -> list[float | tuple[float, float] | np.ndarray]:
+        """Batched version of :meth:`data_point`. All points are located within the mesh in a single pass and
+        the data is read from the results with one extractor call per data type, rather than once per point.
+
+        Parameters
+        ----------
+        points : list[PointLike]
+            The points to extract the data for.
+        data_type : str
+            The result type to extract the data for.
+        time : float, optional
+            The time to extract the data for.
+        time_index : int, optional
+            The time index to return the data for. Takes precedence over the ``time`` parameter if
+            a value greater than ``-1`` is provided.
+        depth_averaging : str, optional
+            The depth averaging method to use when extracting 3D data.
+        return_type : str, options
+            The return type of the data for vector results (has no effect on scalar results).
+
+        Returns
+        -------
+        list[float | tuple[float, float] | np.ndarray]
+            The data value for each point, in the same order as the input points.
+        """
+        with self.extractor.open():
+            vector = self.is_vector(data_type)
+            if not vector:
+                return_type = 'scalar'
+
+            if self.is_static(data_type):
+                time_index = -1
+            else:
+                time_index = time_index if time_index >= 0 else self._find_time_index(data_type, time)
+
+            wkts = [self._point_as_wkt(x) for x in points]
+            values = [None for _ in points]
+            todo = []
+            for i, wkt in enumerate(wkts):
+                values[i] = self.cache.get('data_point', data_type, wkt, time_index, return_type, depth_averaging,
+                                           default=None)
+                if values[i] is None:
+                    todo.append(i)
+            if not todo:
+                return values
+
+            p = self.geom.trans.transform(np.array([self._coerce_into_point(points[i]) for i in todo]).reshape((-1, 2)))
+            if self.on_vertex(data_type):
+                data = self.data_point_from_vertex_data_batch(p, data_type, time_index, return_type)
+            else:
+                data = self.data_point_from_cell_data_batch(p, data_type, time_index, depth_averaging)
+
+            for i, data_point in zip(todo, data):
+                self.cache.set(data_point, 'data_point', data_type, wkts[i], time_index, return_type, depth_averaging)
+                values[i] = data_point
+
+            return values
+
+    def time_series_batch(self,
+                          points: list[PointLike],
+                          data_type: str,
+                          depth_averaging: str = 'sigma&0&1',
+                          return_type: str = 'scalar',
+                          ) -> list[np.ndarray]:
+        """Batched version of :meth:`time_series`. All points are located within the mesh in a single pass and
+        the data is read from the results with one extractor call per data type, rather than once per point.
+
+        Parameters
+        ----------
+        points : list[PointLike]
+            The points to extract the time series for.
+        data_type : str
+            The result type to extract the time series for.
+        depth_averaging : str, optional
+            The depth averaging method to use when extracting 3D data.
+        return_type : str, options
+            The return type of the data for vector results (has no effect on scalar results).
+
+        Returns
+        -------
+        list[np.ndarray]
+            The time series for each point (same format as :meth:`time_series`), in the same order as the
+            input points. Points outside the mesh return an empty array.
+        """
+        with self.extractor.open():
+            if self.is_static(data_type):
+                raise ValueError('Time series not available for static data types.')
+
+            vector = self.is_vector(data_type)
+            if not vector:
+                return_type = 'scalar'
+
+            depth_averaging = depth_averaging if self.is_3d(data_type) else None
+
+            wkts = [self._point_as_wkt(x) for x in points]
+            values = [None for _ in points]
+            todo = []
+            for i, wkt in enumerate(wkts):
+                values[i] = self.cache.get('time_series', data_type, return_type, depth_averaging, wkt, default=None)
+                if values[i] is None:
+                    todo.append(i)
+            if not todo:
+                return values
+
+            p = self.geom.trans.transform(np.array([self._coerce_into_point(points[i]) for i in todo]).reshape((-1, 2)))
+            if self.on_vertex(data_type):
+                data = self.time_series_from_vertex_data_batch(p, data_type, return_type=return_type)
+            else:
+                data = self.time_series_from_cell_data_batch(p, data_type, depth_averaging)
+
+            times = self.times(data_type)
+            for i, a in zip(todo, data):
+                if a.size == 0:
+                    values[i] = np.array([])
+                    continue
+                time_series = np.append(
+                    times.reshape((-1, 1, 1) if a.ndim > 2 else (-1, 1)),
+                    a.reshape(-1, 1) if a.ndim == 1 else a,
+                    axis=2 if a.ndim > 2 else 1
+                )
+                self.cache.set(time_series, 'time_series', data_type, return_type, depth_averaging, wkts[i])
+                values[i] = time_series
+
+            return values
+
+    def mesh_lines(self, lines: list[LineStringLike]) -> list[tuple[np.ndarray, ...]]:
+        """Returns the mesh intersections (see :meth:`PyMeshGeometry.mesh_line`) for each line. Lines that are not
+        already cached are intersected with the mesh together in a single pass.
+
+        Parameters
+        ----------
+        lines : list[LineStringLike]
+            The lines to intersect with the mesh.
+
+        Returns
+        -------
+        list[tuple[np.ndarray, ...]]
+            The mesh intersections for each line.
+        """
+        lines = [self._coerce_into_line(line) for line in lines]
+        wkts = [self._linestring_as_wkt(line) for line in lines]
+        found = {}
+        for wkt in wkts:
+            if wkt not in found:
+                cached = self.cache.get('mesh_line', wkt, default=None)
+                if cached is not None:
+                    found[wkt] = cached
+        todo = list({wkt: line for wkt, line in zip(wkts, lines) if wkt not in found}.items())
+        if todo:
+            for (wkt, _), mesh_line in zip(todo, self.geom.mesh_lines([line for _, line in todo])):
+                found[wkt] = tuple(mesh_line)
+                self.cache.set(found[wkt], 'mesh_line', wkt)
+        return [found[wkt] for wkt in wkts]
 
     def section(self,
                 line: LineStringLike,
@@ -694,19 +968,12 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
             depth_averaging = depth_averaging if self.is_3d(data_type) else None
 
             # check cache for results
-            if self.cache.contains('section', data_type, time_index, return_type, depth_averaging, wkt):
-                return self.cache.get('section', data_type, time_index, return_type, depth_averaging, wkt)
+            cached = self.cache.get('section', data_type, time_index, return_type, depth_averaging, wkt, default=None)
+            if cached is not None:
+                return cached
 
             # check cache for line intersections, otherwise calculate
-            if self.cache.contains('mesh_line', wkt):
-                cell_ids, acell, _, mid_cell_ids, amid, _ = self.cache.get('mesh_line', wkt)
-            else:
-                cell_ids, acell, dir_, mid_cell_ids, amid, dir_mid = self.geom.mesh_line(line)
-                self.cache.set(
-                    (cell_ids, acell, dir_, mid_cell_ids, amid, dir_mid),
-                    'mesh_line',
-                    wkt
-                )
+            cell_ids, acell, _, mid_cell_ids, amid, _ = self.mesh_lines([line])[0]
 
             # get data
             if self.on_vertex(data_type):
@@ -723,6 +990,67 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
 
             return section
 
+    def section_time_series(self,
+                            line: LineStringLike,
+                            data_type: str,
+                            depth_averaging: str = 'sigma&0&1',
+                            return_type: str = 'scalar',
+                            ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the section for the given line and data type at every timestep e.g. for a time vs chainage
+        (Hovmoller) plot. The line is intersected with the mesh once and the data along the line is read for all
+        timesteps together, rather than one timestep at a time as when calling :meth:`section` repeatedly.
+
+        Parameters
+        ----------
+        line : LineStringLike
+            The line to extract the section along.
+        data_type : str
+            The result type to extract the section for.
+        depth_averaging : str, optional
+            The depth averaging method to use when extracting 3D data (see :meth:`section`).
+        return_type : str, options
+            The return type of the data for vector results (has no effect on scalar results). Options are:
+
+            - `scalar` (default): returns the scalar value or magnitude of vector values.
+            - `vector`: returns the vector components.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The times ``(ntime,)``, the offsets along the line ``(N,)``, and the values ``(ntime, N)``, or
+            ``(ntime, N, 2)`` for vector results when ``return_type`` is ``'vector'``. The offsets are the same as
+            the ones returned by :meth:`section`. Static results have a single time.
+        """
+        with self.extractor.open():
+            line = self._coerce_into_line(line)
+            wkt = self._linestring_as_wkt(line)
+
+            if not self.is_vector(data_type):
+                return_type = 'scalar'
+            depth_averaging = depth_averaging if self.is_3d(data_type) else None
+
+            cached = self.cache.get('section_time_series', data_type, return_type, depth_averaging, wkt, default=None)
+            if cached is not None:
+                return cached
+
+            cell_ids, acell, _, mid_cell_ids, amid, _ = self.mesh_lines([line])[0]
+
+            static = self.is_static(data_type)
+            times = np.array([0.]) if static else np.asarray(self.times(data_type), dtype=np.float64)
+            time_index = 0 if static else slice(None)
+            if self.on_vertex(data_type):
+                offsets = amid[:, 0]
+                values = self.section_values_from_vertex_data(mid_cell_ids, amid, data_type, time_index, return_type)
+            else:
+                offsets = np.repeat(acell[:, 0], 2)[1:-1]
+                values = self.section_values_from_cell_data(cell_ids, data_type, time_index, depth_averaging)
+                if values.ndim > 2 and return_type == 'scalar':
+                    values = np.linalg.norm(values, axis=2)
+
+            ret = (times, offsets.astype(np.float64), values)
+            self.cache.set(ret, 'section_time_series', data_type, return_type, depth_averaging, wkt)
+            return ret
+
     def profile(self, point: PointLike, data_type: str, time: float, return_type: str = 'scalar') -> np.ndarray:
         """Returns the vertical profile at the given point for the specified data type and time.
 
@@ -763,8 +1091,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
                 return_type = 'scalar'
 
             # check cache
-            if self.cache.contains('profile', data_type, time_index, return_type, self._point_as_wkt(p)):
-                return self.cache.get('profile', data_type, time_index, return_type, self._point_as_wkt(p))
+            cached = self.cache.get('profile', data_type, time_index, return_type, self._point_as_wkt(p), default=None)
+            if cached is not None:
+                return cached
 
             # get data
             if self.on_vertex(data_type):
@@ -811,8 +1140,9 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
             time_index = self._find_time_index(data_type, time)
 
             # check cache for results
-            if self.cache.contains('curtain', data_type, time_index, self._linestring_as_wkt(line)):
-                return self.cache.get('curtain', data_type, time_index, self._linestring_as_wkt(line))
+            cached = self.cache.get('curtain', data_type, time_index, self._linestring_as_wkt(line), default=None)
+            if cached is not None:
+                return cached
 
             if data_type.lower() in ['velocity', 'max velocity', 'min velocity'] and not self.is_vector(data_type):
                 if data_type.lower() == 'velocity':
@@ -826,15 +1156,7 @@ class PyMesh(VertexDataMixin, CellDataMixin, PointMixin, LineStringMixin, SoftLo
                     data_type = test_a[test]
 
             # check cache for line intersections, otherwise calculate
-            if self.cache.contains('mesh_line', self._linestring_as_wkt(line)):
-                cell_ids, acell, dir_, mid_cell_ids, amid, dir_mid = self.cache.get('mesh_line', self._linestring_as_wkt(line))
-            else:
-                cell_ids, acell, dir_, mid_cell_ids, amid, dir_mid = self.geom.mesh_line(line)
-                self.cache.set(
-                    (cell_ids, acell, dir_, mid_cell_ids, amid, dir_mid),
-                    'mesh_line',
-                    self._linestring_as_wkt(line)
-                )
+            cell_ids, acell, dir_, mid_cell_ids, amid, dir_mid = self.mesh_lines([line])[0]
 
             # get data
             if self.on_vertex(data_type):
@@ -0,0 +1,144 @@
+import typing
+
+import numpy as np
+
+
+class TemporalReducer:
+    """Streaming (single pass) temporal reduction of mesh results. Timesteps are added in blocks and the
+    maximum, minimum, time of maximum, time of minimum, and the duration the values exceed one or more thresholds
+    are updated for each block, so the memory used is bounded by the block size rather than the number of
+    timesteps.
+
+    Inactive (dry) values are ignored. Values that are never active have a ``NaN`` result. If a value reaches
+    its maximum (or minimum) more than once, the time of the first occurrence is kept.
+
+    The exceedance duration is the time the values spend above each threshold, linearly interpolating the time
+    the threshold is crossed between timesteps. The values are taken to be below the threshold when inactive.
+
+    Parameters
+    ----------
+    thresholds : Sequence[float], optional
+        The thresholds to calculate the exceedance duration for.
+    """
+
+    #: int: The maximum memory (bytes) used by a block of timesteps when reducing the full mesh.
+    MAX_BYTES = 256 * 1024 ** 2
+
+    def __init__(self, thresholds: typing.Sequence[float] = ()):
+        #: tuple[float, ...]: The thresholds for the exceedance duration.
+        self.thresholds = tuple(float(x) for x in thresholds)
+        #: np.ndarray: The maximum of each value.
+        self.max = None
+        #: np.ndarray: The minimum of each value.
+        self.min = None
+        #: np.ndarray: The time of the maximum of each value.
+        self.tmax = None
+        #: np.ndarray: The time of the minimum of each value.
+        self.tmin = None
+        #: np.ndarray: The duration each value exceeds each threshold ``(nthreshold, ...)``.
+        self.duration = None
+        #: int: The number of timesteps that have been added.
+        self.ntime = 0
+        self._last = None  # last timestep of the previous block (values below the threshold when inactive)
+        self._last_time = None
+
+    def __repr__(self) -> str:
+        return f'<TemporalReducer {self.ntime} timesteps>'
+
+    @staticmethod
+    def block_size(step_bytes: int, max_bytes: int = None) -> int:
+        """Returns the number of timesteps in each block given the memory used by a single timestep.
+
+        Parameters
+        ----------
+        step_bytes : int
+            The memory (bytes) used by a single timestep.
+        max_bytes : int, optional
+            The maximum memory (bytes) used by a block. Defaults to :attr:`MAX_BYTES`.
+
+        Returns
+        -------
+        int
+            The number of timesteps in each block.
+        """
+        max_bytes = TemporalReducer.MAX_BYTES if max_bytes is None else max_bytes
+        return max(int(max_bytes // max(int(step_bytes), 1)), 1)
+
+    def add(self, times: np.ndarray, values: np.ndarray, active: np.ndarray = None):
+        """Adds a block of timesteps. Blocks must be added in time order.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            The time of each timestep in the block ``(nblock,)``.
+        values : np.ndarray
+            The values ``(nblock, ...)``.
+        active : np.ndarray, optional
+            The active mask for the values. Must be broadcastable to the shape of ``values``.
+        """
+        times = np.asarray(times, dtype=np.float64).reshape(-1)
+        values = np.asarray(values, dtype=np.float64)
+        if not times.size:
+            return
+        self.ntime += times.size
+        if active is None:
+            active = np.ones(values.shape, dtype=bool)
+        else:
+            active = np.broadcast_to(np.asarray(active, dtype=bool), values.shape)
+
+        hi = np.where(active, values, -np.inf)
+        lo = np.where(active, values, np.inf)
+        imax, imin = hi.argmax(axis=0), lo.argmin(axis=0)
+        bmax = np.take_along_axis(hi, imax[None], axis=0)[0]
+        bmin = np.take_along_axis(lo, imin[None], axis=0)[0]
+        if self.max is None:
+            self.max, self.tmax = bmax, times[imax]
+            self.min, self.tmin = bmin, times[imin]
+            self.duration = np.zeros((len(self.thresholds),) + values.shape[1:])
+        else:
+            new = bmax > self.max
+            self.max, self.tmax = np.where(new, bmax, self.max), np.where(new, times[imax], self.tmax)
+            new = bmin < self.min
+            self.min, self.tmin = np.where(new, bmin, self.min), np.where(new, times[imin], self.tmin)
+
+        if self.thresholds:
+            if self._last is not None:
+                hi = np.append(self._last[None], hi, axis=0)
+                times = np.append(self._last_time, times)
+            self._last, self._last_time = hi[-1], times[-1]
+            dt = np.diff(times).reshape((-1,) + (1,) * (values.ndim - 1))
+            a, b = hi[:-1], hi[1:]
+            for i, h in enumerate(self.thresholds):
+                above_a, above_b = a > h, b > h
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    frac = np.where(above_a, a - h, b - h) / np.abs(b - a)
+                frac = np.where(above_a & above_b, 1., np.where(above_a ^ above_b, frac, 0.))
+                self.duration[i] += (np.clip(frac, 0., 1.) * dt).sum(axis=0)
+
+    def result(self, stat: str) -> np.ndarray:
+        """Returns the reduced values for the given statistic. Values that were never active are ``NaN``.
+
+        Parameters
+        ----------
+        stat : str
+            The statistic to return - ``'max'``, ``'min'``, ``'tmax'``, ``'tmin'``, or ``'duration'``.
+
+        Returns
+        -------
+        np.ndarray
+            The reduced values. ``'duration'`` is ``(nthreshold, ...)``.
+        """
+        if self.max is None:
+            raise ValueError('No timesteps have been added')
+        never = self.max == -np.inf
+        if stat == 'max':
+            return np.where(never, np.nan, self.max)
+        elif stat == 'min':
+            return np.where(never, np.nan, self.min)
+        elif stat == 'tmax':
+            return np.where(never, np.nan, self.tmax)
+        elif stat == 'tmin':
+            return np.where(never, np.nan, self.tmin)
+        elif stat == 'duration':
+            return self.duration
+        raise ValueError(f'Unknown statistic: {stat}')
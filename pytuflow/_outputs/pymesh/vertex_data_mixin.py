@@ -115,6 +115,101 @@ class VertexDataMixin:
 
         return data
 
+    def data_point_from_vertex_data_batch(self: 'PyMesh',
+                                          points: np.ndarray,
+                                          data_type: str,
+                                          time_index: int,
+                                          return_type: str
+                                          ) -> list[float | tuple[float, float]]:
+        """Batched version of :meth:`data_point_from_vertex_data`. Points are located in a single pass
+        and the data for the union of the triangle vertices is read with one extractor call.
+        """
+        data_type = self.translate_data_type(data_type)[0]
+        cells, tris, uvw = self.geom.locate_points(points, 'local')
+        found = np.flatnonzero(tris != -1)
+        values = [np.nan for _ in range(tris.shape[0])]
+        if found.size == 0:
+            return values
+
+        cells, tris, uvw = cells[found], tris[found], uvw[found]
+        vert_ids, inverse = np.unique(self.geom.triangle_vertices(tris), return_inverse=True)
+        inverse = inverse.reshape((-1, 3))
+
+        if data_type.lower() == 'bed elevation':
+            a = self.geom.vertex_position(vert_ids)[:, 2][inverse]
+            wd = np.full(found.size, True, dtype=bool)
+        else:
+            a = self.extractor.data(data_type, (time_index, vert_ids))[inverse]
+            wd = self._cell_wd_flag(data_type, time_index, cells)
+
+        if self.is_vector(data_type) and return_type == 'vector':
+            data_x = (a[..., 0] * uvw).sum(axis=1)
+            data_y = (a[..., 1] * uvw).sum(axis=1)
+            data = [(float(x), float(y)) for x, y in zip(data_x, data_y)]
+        elif self.is_vector(data_type):
+            mag = np.linalg.norm(a, axis=2)
+            data = [float(x) for x in (mag * uvw).sum(axis=1)]
+        else:
+            data = [float(x) for x in (a * uvw).sum(axis=1)]
+
+        for i, val, active in zip(found, data, wd):
+            values[i] = val if active else np.nan
+        return values
+
+    def time_series_from_vertex_data_batch(self: 'PyMesh',
+                                           points: np.ndarray,
+                                           data_type: str,
+                                           return_type: str,
+                                           ) -> list[np.ndarray]:
+        """Batched version of :meth:`time_series_from_vertex_data`. Points are located in a single pass
+        and the data for the union of the triangle vertices is read with one extractor call.
+        """
+        data_type = self.translate_data_type(data_type)[0]
+        cells, tris, uvw = self.geom.locate_points(points, 'local')
+        found = np.flatnonzero(tris != -1)
+        values = [np.array([]) for _ in range(tris.shape[0])]
+        if found.size == 0:
+            return values
+
+        cells, tris, uvw = cells[found], tris[found], uvw[found]
+        vert_ids, inverse = np.unique(self.geom.triangle_vertices(tris), return_inverse=True)
+        a = self.extractor.data(data_type, (slice(None), vert_ids))[:,inverse.reshape((-1, 3))]
+
+        vector = self.is_vector(data_type)
+        if vector and return_type == 'vector':
+            data_x = (a[..., 0] * uvw).sum(axis=2)
+            data_y = (a[..., 1] * uvw).sum(axis=2)
+            data = np.stack((data_x, data_y), axis=2)
+        elif vector:
+            mag = np.linalg.norm(a, axis=3)
+            data = (mag * uvw).sum(axis=2)
+        else:
+            data = (a * uvw).sum(axis=2)
+
+        wd = self._cell_wd_flag(data_type, slice(None), cells)
+        data[~wd, ...] = np.nan
+
+        for j, i in enumerate(found):
+            if vector and return_type == 'vector':
+                values[i] = data[:, j].reshape((-1, 1, 2))
+            elif vector:
+                values[i] = data[:, j].reshape((-1, 1))
+            else:
+                values[i] = data[:, j]
+        return values
+
+    def _cell_wd_flag(self: 'PyMesh',
+                      data_type: str,
+                      time_index: int | slice,
+                      cell_ids: np.ndarray
+                      ) -> np.ndarray:
+        """Returns the wet/dry flag for the given cells with a single extractor call (cells can repeat)."""
+        cells, inverse = np.unique(cell_ids, return_inverse=True)
+        wd = self.extractor.wd_flag(data_type, (time_index, cells)).astype(bool)
+        if isinstance(time_index, slice):
+            return wd.reshape((-1, cells.size))[:, inverse]
+        return wd.flatten()[inverse]
+
     def section_from_vertex_data(
             self: 'PyMesh',
             cell_ids: np.ndarray,
@@ -124,19 +219,35 @@ class VertexDataMixin:
             return_type: str,
     ) -> np.ndarray:
         """Extract data along a section defined by a linestring from mesh vertices."""
+        values = self.section_values_from_vertex_data(cell_ids, points, data_type, time_index, return_type)[0]
+        vector = values.ndim > 1
+        return np.append(
+            points[:, 0].reshape((-1, 1, 1) if vector else (-1, 1)),
+            values.reshape(-1, 1, 2) if vector else values.reshape(-1, 1),
+            axis=2 if vector else 1
+        )
+
+    def section_values_from_vertex_data(
+            self: 'PyMesh',
+            cell_ids: np.ndarray,
+            points: np.ndarray,
+            data_type: str,
+            time_index: int | slice,
+            return_type: str,
+    ) -> np.ndarray:
+        """Returns the section values at the mid-points for one or more timesteps. The vertices of the
+        triangles containing the mid-points are read together for all the timesteps in a single extractor call.
+
+        The returned array is ``(ntime, N)``, or ``(ntime, N, 2)`` for vector results when ``return_type`` is
+        ``'vector'``, where ``ntime`` is ``1`` if ``time_index`` is an integer.
+        """
         # results on vertices - use mid-points
         # get vertices of triangle that mid-point falls within
         data_type = self.translate_data_type(data_type)[0]
-        verts = np.empty((len(cell_ids), 3), dtype='i8')
-        for i, (cell_id, mid) in enumerate(zip(cell_ids, points)):
-            if cell_id == -1:
-                verts[i, ...] = -1
-                continue
-            tri = self.geom.find_containing_triangle(mid[1:], scope='local', cell_id=cell_id)
-            if tri == -1:
-                verts[i, ...] = -1
-            else:
-                verts[i, ...] = self.geom.triangle_vertices(tri)
+        verts = np.full((len(cell_ids), 3), -1, dtype='i8')
+        tri = self.geom.find_containing_triangles(points[:, 1:], cell_ids, scope='local')
+        if (tri != -1).any():
+            verts[tri != -1] = self.geom.triangle_vertices(tri[tri != -1])
         # unique vertices
         uvert, inverse = np.unique(verts.flatten(), return_inverse=True)
         # if -1 exists, it will always be first since the unique routine sorts
@@ -146,13 +257,16 @@ class VertexDataMixin:
 
         # extract data and then remap back to original verts
         vector = self.is_vector(data_type)
+        ntime = 1
         if data_type.lower() == 'bed elevation':
             data = self.geom.vertex_position(uvert)[..., 2]
         else:
+            ntime = len(self.times(data_type)[time_index]) if isinstance(time_index, slice) else 1
             data = self.extractor.data(data_type, (time_index, uvert))
+        data = data.reshape((ntime, uvert.size, 2) if vector else (ntime, uvert.size))
         if outside:
-            data = np.append([[np.nan, np.nan]] if vector else [np.nan], data, axis=0).reshape((-1, 2) if vector else (-1,))
-        data = data[inverse].reshape((-1, 3, 2) if vector else (-1, 3))
+            data = np.append(np.full((data.shape[0], 1) + data.shape[2:], np.nan), data, axis=1)
+        data = data[:, inverse].reshape((data.shape[0], -1, 3, 2) if vector else (data.shape[0], -1, 3))
 
         # vertex points for interpolation
         pos = self.geom.vertex_position(uvert, scope='local')[..., :2]
@@ -164,14 +278,14 @@ class VertexDataMixin:
         # interpolate
         uvw = np.column_stack(barycentric_coord(points[:, 1:], pos[:, 0:2], pos[:, 2:4], pos[:, 4:6]))
         if vector and return_type == 'vector':
-            vecx = (data[..., 0] * uvw).sum(axis=1)
-            vecy = (data[..., 1] * uvw).sum(axis=1)
-            values = np.concatenate((vecx.reshape(-1, 1, 1), vecy.reshape(-1, 1, 1)), axis=2)
+            vecx = (data[..., 0] * uvw).sum(axis=-1)
+            vecy = (data[..., 1] * uvw).sum(axis=-1)
+            values = np.stack((vecx, vecy), axis=2)
         elif vector:
-            mag = np.linalg.norm(data, axis=2)
-            values = (mag * uvw).sum(axis=1).reshape(-1, 1)
+            mag = np.linalg.norm(data, axis=-1)
+            values = (mag * uvw).sum(axis=-1)
         else:
-            values = (data * uvw).sum(axis=1)
+            values = (data * uvw).sum(axis=-1)
 
         # is the cell active?
         cells, inverse = np.unique(cell_ids, return_inverse=True)
@@ -180,19 +294,15 @@ class VertexDataMixin:
         if outside:
             cells = cells[1:]
         if data_type.lower() == 'bed elevation':
-            active = np.full(len(cells), True, dtype=bool)
+            active = np.full((1, len(cells)), True, dtype=bool)
         else:
-            active = self.extractor.wd_flag(data_type, (time_index, cells)).astype(bool)
+            active = self.extractor.wd_flag(data_type, (time_index, cells)).astype(bool).reshape((ntime, cells.size))
         if outside:
-            active = np.append([False], active)
-        active = active[inverse]
+            active = np.append(np.zeros((active.shape[0], 1), dtype=bool), active, axis=1)
+        active = np.broadcast_to(active[:, inverse], values.shape[:2])
         values[~active] = np.nan
 
-        return np.append(
-            points[:, 0].reshape((-1, 1, 1) if values.ndim > 2 else (-1, 1)),
-            values.reshape(-1, 1) if values.ndim == 1 else values,
-            axis=2 if values.ndim > 2 else 1
-        )
+        return values
 
     def profile_from_vertex_data(self: 'PyMesh',
                                  point: PointLike,
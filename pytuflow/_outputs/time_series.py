@@ -1,13 +1,14 @@
 from abc import abstractmethod
-from datetime import timedelta, datetime
+from datetime import datetime
 
-import numpy as np
 try:
     import pandas as pd
 except ImportError:
     from .pymesh.stubs import pandas as pd
 
 from .tabular_output import TabularOutput
+from .helpers.frame_assembler import FrameAssembler
+from .helpers.time_series_csv import TimeSeriesCSV, TimeSeriesCSVMaximums
 from ..util import misc
 
 
@@ -143,7 +144,7 @@ class TimeSeries(TabularOutput):
         pd.DataFrame
             The extracted time-series data.
         """
-        df = pd.DataFrame()
+        frame = FrameAssembler()
         for dtype2 in data_types:
             dtype = [x for x in custom_names if self._get_standard_data_type_name(x) == dtype2]
             dtype = dtype[0] if dtype else dtype2
@@ -153,24 +154,28 @@ class TimeSeries(TabularOutput):
                 idx = res_df.columns[res_df.columns.isin(ctx['id'])]
                 if idx.empty:
                     continue
-                df1 = res_df.loc[:, idx]
+                if isinstance(res_df, TimeSeriesCSV):
+                    df1 = res_df.to_frame(idx)  # lazily loaded result, only read the requested IDs
+                else:
+                    df1 = res_df.loc[:, idx]
+                if share_idx:
+                    frame.add(df1.index, df1.to_numpy(), [f'{dtype}/{x}' for x in df1.columns])
+                    continue
+                # each column gets its own time column
+                time = df1.index.to_numpy()
                 if time_fmt == 'absolute':
-                    # noinspection PyTypeChecker
-                    df1.index = [reference_time + timedelta(hours=x) for x in df1.index]
-                df1.index.name = 'time'
-                index_name = df1.index.name
-                if not share_idx:
-                    col_names = misc.flatten([[index_name, x] for x in df1.columns])
-                    df1.reset_index(inplace=True, drop=False)
-                    df1 = df1[col_names]
-
-                df1.columns = [f'{x}/{dtype}/{df1.columns[i + 1]}' if x == index_name else f'{dtype}/{x}' for i, x in
-                               enumerate(df1.columns)]
-                df = df1 if df.empty else pd.concat([df, df1], axis=1)
+                    time = FrameAssembler.absolute_time(reference_time, time).array
+                values = [df1.iloc[:, i].to_numpy() for i in range(df1.shape[1])]
+                frame.add(pd.RangeIndex(df1.shape[0]), misc.flatten([[time, x] for x in values]),
+                          misc.flatten([[f'time/{dtype}/{x}', f'{dtype}/{x}'] for x in df1.columns]))
 
         # remove -99999 values as these are used to indicate dry for RL results
-        mask = (df.select_dtypes(include=[np.number]) < -99998)
-        df.loc[:, mask.columns] = df.loc[:, mask.columns].where(~mask, np.nan)
+        df = frame.to_frame(nodata_below=-99998)
+        if share_idx and time_fmt == 'absolute' and not df.empty:
+            df.index = FrameAssembler.absolute_time(reference_time, df.index)
+            df.index.name = 'time'
+        elif not share_idx:
+            df.index.name = None
 
         return df
 
@@ -199,7 +204,7 @@ class TimeSeries(TabularOutput):
         pd.DataFrame
             The extracted maximum data.
         """
-        df = pd.DataFrame()
+        frame = FrameAssembler(index_name=None)
         for dtype2 in data_types:
             dtype = [x for x in custom_names if self._get_standard_data_type_name(x) == dtype2]
             dtype = dtype[0] if dtype else dtype2
@@ -207,12 +212,13 @@ class TimeSeries(TabularOutput):
                 continue
             for res_df in maximum_data[dtype2]:
                 rows = res_df.index[res_df.index.isin(ctx['id'])]
-                df1 = res_df.loc[rows]
-                if time_fmt == 'absolute':
-                    df1['tmax'] = df1['tmax'].apply(lambda x: reference_time + timedelta(hours=x))
-                df1.columns = [f'{dtype}/{x}' for x in df1.columns]
-                if df.empty:
-                    df = df1
+                if isinstance(res_df, TimeSeriesCSVMaximums):
+                    df1 = res_df.to_frame(rows)  # lazily calculated maximums, only calculate the requested IDs
                 else:
-                    df = pd.concat([df, df1], axis=1)
-        return df
+                    df1 = res_df.loc[rows]
+                values = [df1.iloc[:, i].to_numpy() for i in range(df1.shape[1])]
+                if time_fmt == 'absolute' and 'tmax' in df1.columns:
+                    i = df1.columns.get_loc('tmax')
+                    values[i] = FrameAssembler.absolute_time(reference_time, values[i]).array
+                frame.add(df1.index, values, [f'{dtype}/{x}' for x in df1.columns])
+        return frame.to_frame()
@@ -18,6 +18,7 @@ from .gpkg_1d import GPKG1D
 from .gpkg_2d import GPKG2D
 from .gpkg_rl import GPKGRL
 from .helpers.nc_ts import NCTS
+from .helpers.time_series_csv import TimeSeriesCSV, TimeSeriesCSVMaximums
 from .info import INFO
 from .itime_series_2d import ITimeSeries2D
 from .helpers.tpc_reader import TPCReader
@@ -97,6 +98,8 @@ class TPC(INFO, ITimeSeries2D):
     GEOMETRY_TYPES = {'point': ['point'], 'line': ['line'], 'polygon': ['polygon', 'region', 'poly']}
     ATTRIBUTE_TYPES = {}
     ID_COLUMNS = ['id']
+    TS_CACHE_ATTRS = INFO.TS_CACHE_ATTRS + ('_time_series_data_2d', '_time_series_data_rl', '_maximum_data_2d',
+                                            '_maximum_data_rl')
 
     def __init__(self, fpath: PathLike):
         # private
@@ -555,7 +558,7 @@ class TPC(INFO, ITimeSeries2D):
         return df
 
     def section(self, locations: Union[str, list[str]], data_types: Union[str, list[str]],
-                time: TimeLike, *args, **kwargs) -> pd.DataFrame:
+                time: Union[TimeLike, list[TimeLike], str], *args, **kwargs) -> pd.DataFrame:
         if self._gpkgswmm is not None:
             try:
                 return self._gpkgswmm.section(locations, data_types, time, *args, **kwargs)
@@ -637,6 +640,10 @@ class TPC(INFO, ITimeSeries2D):
         self._ncid = None
         self._loaded = True
 
+    def _ts_cache_enabled(self) -> bool:
+        # the GPKG results are loaded (and cached) by the GPKG1D, GPKG2D, and GPKGRL classes
+        return super()._ts_cache_enabled() and self.format != 'GPKG'
+
     def _overview_dataframe(self) -> pd.DataFrame:
         df = pd.DataFrame(columns=self.oned_objs.columns)
         for domain, df1 in {'1d': self.oned_objs, '2d': self.po_objs, 'rl': self.rl_objs}.items():
@@ -646,6 +653,10 @@ class TPC(INFO, ITimeSeries2D):
                 df = pd.concat([df, df2], axis=0, ignore_index=True) if not df.empty else df2
         return df
 
+    def _overview_sources(self) -> list[pd.DataFrame] | None:
+        # docstring inherited
+        return [self.oned_objs, self.po_objs, self.rl_objs]
+
     def _filter(self, filter_by: str, filtered_something: bool = False, df: pd.DataFrame = None,
                 ignore_excess_filters: bool = False) -> tuple[pd.DataFrame, dict[str, bool]]:
         # docstring inherited
@@ -797,21 +808,27 @@ class TPC(INFO, ITimeSeries2D):
             self._time_series_data_rl = self._gpkgrl._time_series_data_rl
 
     @staticmethod
-    def _post_process_channel_losses(df: pd.DataFrame, dtype: str) -> None | pd.DataFrame:
+    def _post_process_channel_losses(df: pd.DataFrame | TimeSeriesCSV, dtype: str) -> None | pd.DataFrame | TimeSeriesCSV:
         d = {'Channel Entry Losses': 'Entry', 'Channel Additional Losses': 'Additional', 'Channel Exit Losses': 'Exit'}
         cols = df.columns.str.contains(d[dtype], regex=False)
         if cols.any():
+            names = [' '.join(x.split(' ')[2:]) for x in df.columns[cols]]
+            if isinstance(df, TimeSeriesCSV):
+                return df.subset(cols, names)
             df1 = df.loc[:,cols].copy()
-            df1.columns = [' '.join(x.split(' ')[2:]) for x in df1.columns]
+            df1.columns = names
             return df1
         return None
 
     @staticmethod
-    def _post_process_channel_losses_2(df: pd.DataFrame) -> None | pd.DataFrame:
+    def _post_process_channel_losses_2(df: pd.DataFrame | TimeSeriesCSV) -> None | pd.DataFrame | TimeSeriesCSV:
         cols = df.columns.str.startswith('LC')
         if cols.any():
+            names = [' '.join(x.split(' ')[1:]) for x in df.columns[cols]]
+            if isinstance(df, TimeSeriesCSV):
+                return df.subset(cols, names)
             df1 = df.loc[:,cols].copy()
-            df1.columns = [' '.join(x.split(' ')[1:]) for x in df1.columns]
+            df1.columns = names
             return df1
         return None
 
@@ -853,14 +870,19 @@ class TPC(INFO, ITimeSeries2D):
         # 2d results do not have maximums, so need to be post-processed.
         for data_type, results in self._time_series_data_2d.items():
             for res in results:
-                max_ = res.max()
-                tmax = res.idxmax()
-                self._maximum_data_2d[data_type] = pd.DataFrame({'max': max_, 'tmax': tmax})
+                if isinstance(res, TimeSeriesCSV):
+                    self._maximum_data_2d[data_type] = TimeSeriesCSVMaximums(res, self._calc_maximums_2d)
+                else:
+                    self._maximum_data_2d[data_type] = self._calc_maximums_2d(res)
 
         if self._gpkgswmm is not None:
             # noinspection PyProtectedMember
             self._maximum_data.update(self._gpkgswmm._maximum_data)
 
+    @staticmethod
+    def _calc_maximums_2d(res: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({'max': res.max(), 'tmax': res.idxmax()})
+
     def _load_maximum_from_property(self, prop: str) -> None | pd.DataFrame:
         p = self._expand_property_path(prop)
         if p:
@@ -0,0 +1,95 @@
+"""Benchmark the numpy 2dm reader (Py2dm.read_2dm) against the previous pandas read_csv based path.
+
+Usage:
+    python tests/benchmarks/benchmark_2dm_reader.py [path/to/mesh.2dm] [--cells 1000000] [--chunk-size 16777216]
+
+If no 2dm is given, a synthetic mesh with the given number of cells is written to a temporary folder.
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from pytuflow._outputs.pymesh.mesh_geom import Py2dm
+
+
+def write_synthetic_2dm(fpath: Path, ncells: int):
+    ncol = int(np.sqrt(ncells))
+    nrow = ncells // ncol
+    with fpath.open('w') as f:
+        f.write('MESH2D 0.0 0.0 0.0 {0} {1} 1.0 1.0 1.0\nNO_MOVE_EQ9_CENTER_NODE\n'.format(nrow, ncol))
+        cell_id = 1
+        for j in range(nrow):
+            for i in range(ncol):
+                n1 = j * (ncol + 1) + i + 1
+                n2, n3, n4 = n1 + 1, n1 + ncol + 2, n1 + ncol + 1
+                if cell_id % 5:
+                    f.write(f'E4Q {cell_id} {n1} {n2} {n3} {n4} 1\n')
+                else:
+                    f.write(f'E3T {cell_id} {n1} {n2} {n3} 1\n')
+                cell_id += 1
+        node_id = 1
+        for j in range(nrow + 1):
+            for i in range(ncol + 1):
+                f.write(f'ND {node_id} {i:.3f} {j:.3f} {np.sin(i) + np.cos(j):.3f}  2 0. 0. 0.\n')
+                node_id += 1
+
+
+def pandas_path(fpath: Path):
+    # the previous reader - read_csv into a padded DataFrame, then filter the node and element cards
+    df = pd.read_csv(fpath, skiprows=2, sep=r'\s+', names=[chr(x) for x in range(ord('A'), ord('A') + 11)])
+    fortran_indexing = df[df['A'] == 'ND']['B'].min() == 1
+    nds = df[df['A'] == 'ND'][['B', 'C', 'D', 'E']].rename(columns={'B': 'ind', 'C': 'x', 'D': 'y', 'E': 'z'})
+    if fortran_indexing:
+        nds['ind'] -= 1
+    nodes = nds.set_index('ind').to_numpy('f8')
+    cells = df[df['A'].isin(['E4Q', 'E3T'])][['A', 'B', 'C', 'D', 'E', 'F']].rename(
+        columns={'A': 'shape', 'B': 'ind', 'C': 'n1', 'D': 'n2', 'E': 'n3', 'F': 'n4'}
+    )
+    tri = cells['shape'] == 'E3T'
+    cells = cells.drop(columns=['shape'])
+    cells = cells.astype('i8') - 1 if fortran_indexing else cells.astype('i8')
+    cells.loc[tri, 'n4'] = -1
+    return nodes, cells.set_index('ind')
+
+
+def run(name: str, func, *args):
+    # timing and memory are measured in separate calls since tracemalloc slows down allocation heavy code
+    t = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - t
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{name:<24} {elapsed:8.2f} s {peak / 1024 ** 2:10.1f} MB peak')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('twodm', nargs='?')
+    parser.add_argument('--cells', type=int, default=1_000_000)
+    parser.add_argument('--chunk-size', type=int, default=16 * 1024 ** 2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if args.twodm:
+            fpath = Path(args.twodm)
+        else:
+            fpath = Path(tmpdir) / 'synthetic.2dm'
+            write_synthetic_2dm(fpath, args.cells)
+        print(f'{fpath.name}: {fpath.stat().st_size / 1024 ** 2:.1f} MB')
+        run('pandas read_csv', pandas_path, fpath)
+        run('numpy reader', Py2dm.read_2dm, fpath)
+        run('numpy reader (chunked)', Py2dm.read_2dm, fpath, args.chunk_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,18 @@
+import tempfile
 import unittest
 from datetime import datetime
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import rasterio
+from netCDF4 import Dataset
 
-from pytuflow import XMDF, NCMesh, CATCHJson, DAT, NCGrid, Grid
+from pytuflow import XMDF, NCMesh, CATCHJson, DAT, NCGrid, Grid, EnsembleStatistics
+from pytuflow._outputs.pymesh import Cache, TemporalReducer
+from pytuflow._outputs.pymesh.depth_averaging import RaggedLayout
+from pytuflow._outputs.pymesh.mesh_geom import CellToVertexOperator, MeshLineWalk
+from pytuflow._outputs.pymesh.mesh_geom import GeometrySidecarMixin, Py2dm
 
 
 def load_comparison_data(path):
@@ -58,6 +65,56 @@ class TestXMDF(unittest.TestCase):
         self.assertEqual((4, 2), df.shape)
         self.assertTrue(df[np.isnan(df.iloc[:, 1])].empty)
 
+    def test_mesh_line_walk(self):
+        # two unit squares (cells 0 and 2) each split into 2 triangles, with a gap between them (cell 1 missing)
+        sq = np.array([[[0, 0], [1, 0], [1, 1]], [[1, 1], [0, 1], [0, 0]]], dtype=float)
+        walk = MeshLineWalk(np.concatenate((sq, sq + [2, 0])), [0, 0, 2, 2])
+        seg, cell, ta, tb, tri = walk.walk([[-1., 0.4], [0.5, 0.5]], [[4., 0.4], [0.5, 0.9]])
+        self.assertEqual([0, 0, 1], seg.tolist())
+        self.assertEqual([0, 2, 0], cell.tolist())
+        np.testing.assert_allclose([0.2, 0.6, 0.], ta)
+        np.testing.assert_allclose([0.4, 0.8, 1.], tb)
+        self.assertEqual([0, 2, 1], tri.tolist())
+
+        # batched lines match the legacy per segment walk, second line leaves and re-enters the mesh
+        res = XMDF('./tests/xmdf/EG00_001.xmdf')
+        geom = res._driver.geom
+        lines = [[(293250, 6178030), (293500, 6178030)], [(292900, 6177800), (293700, 6178400), (293300, 6178300)]]
+        batches = geom.mesh_lines(lines)
+        geom.vectorised_line_walk = False
+        for line, batch in zip(lines, batches):
+            legacy = geom.mesh_line(line)
+            for i in (0, 3):  # cell ids
+                np.testing.assert_array_equal(legacy[i], batch[i])
+            for i in (1, 2, 5):  # intersections and directions
+                np.testing.assert_allclose(legacy[i], batch[i], atol=1e-4)
+            # legacy mid-points over a gap in the mesh are not centred, so check these against the intersections
+            acell, amid = batch[1], batch[4]
+            np.testing.assert_allclose(0.5 * (acell[:-1] + acell[1:]), amid[1:-1])
+            np.testing.assert_allclose(acell[[0, -1]], amid[[0, -1]])
+        cell_ids, acell = batches[0][:2]
+        self.assertEqual([2866, 2867, 2868], cell_ids[:3].tolist())
+        np.testing.assert_allclose([0., 3.4138, 13.6835], acell[:3, 0], atol=1e-4)
+        self.assertAlmostEqual(250., acell[-1, 0], places=4)
+        cell_ids, acell, _, mid_cell_ids = batches[1][:4]
+        self.assertEqual([-1, 1006, 1007], cell_ids[:3].tolist())
+        np.testing.assert_allclose([0., 78.2877, 80.5484], acell[:3, 0], atol=1e-4)
+        self.assertAlmostEqual(1000. + np.hypot(400., 100.), acell[-1, 0], places=4)
+        self.assertEqual(cell_ids.size + 1, mid_cell_ids.size)
+
+    def test_mesh_locate_points(self):
+        sq = np.array([[[0, 0], [1, 0], [1, 1]], [[1, 1], [0, 1], [0, 0]]], dtype=float)
+        walk = MeshLineWalk(np.concatenate((sq, sq + [2, 0])), [0, 0, 2, 2])
+        cell, tri = walk.locate([[0.7, 0.2], [0.2, 0.7], [1.5, 0.5], [2.5, 0.2], [5., 5.], [0.5, 0.5]])
+        self.assertEqual([0, 0, -1, 2, -1, 0], cell.tolist())
+        self.assertEqual([0, 1, -1, 2, -1, 0], tri.tolist())
+
+        res = XMDF('./tests/xmdf/EG00_001.xmdf')
+        geom = res._driver.geom
+        points = np.array([(293250, 6178030), (0., 0.), (293260, 6178030)])
+        cell_ids = geom.find_containing_cells(points)
+        self.assertEqual([geom.find_containing_cell(p) for p in points], cell_ids.tolist())
+
     def test_maximum_level(self):
         xmdf = './tests/xmdf/EG00_001.xmdf'
         res = XMDF(xmdf)
@@ -121,6 +178,86 @@ class TestXMDF(unittest.TestCase):
         res._load()
         self.assertIn('dynamic bed level', res.data_types())
 
+    def test_read_2dm(self):
+        twodm = './tests/xmdf/EG00_001.2dm'
+        nodes_ref, cells_ref = [], []
+        with open(twodm) as f:
+            for line in f:
+                data = line.split()
+                if data and data[0] == 'ND':
+                    nodes_ref.append([float(x) for x in data[1:5]])
+                elif data and data[0] in ('E3T', 'E4Q'):
+                    n = 5 if data[0] == 'E3T' else 6
+                    cells_ref.append([int(x) for x in data[1:n]] + [-1] * (6 - n))
+        for chunk_size in [None, 1000]:
+            nodes, cells = Py2dm.read_2dm(twodm, chunk_size)
+            np.testing.assert_array_equal(nodes_ref, nodes)
+            np.testing.assert_array_equal(cells_ref, cells)
+
+    def test_read_2dm_ragged_elements(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p = Path(tmpdir) / 'ragged.2dm'
+            p.write_text(
+                'MESH2D\n'
+                'E3T 1 1 2 3\n'  # no material ID
+                'E4Q 2 2 4 5 3 1\n'
+                'E3T 3 4 6 5 1\n'
+                'E4Q 4 6 7 8 5\r\n'  # no material ID
+                'E3T 5 7 9 8\n'
+                'ND 1 0.0 0.0 1.0\n'
+                'ND 2 1.0 0.0 2.0\n'
+            )
+            expected = [[1, 1, 2, 3, -1], [2, 2, 4, 5, 3], [3, 4, 6, 5, -1], [4, 6, 7, 8, 5], [5, 7, 9, 8, -1]]
+            for chunk_size in [None, 20]:
+                nodes, cells = Py2dm.read_2dm(p, chunk_size)
+                np.testing.assert_array_equal(expected, cells)
+                np.testing.assert_array_equal([[1., 0., 0., 1.], [2., 1., 0., 2.]], nodes)
+
+    def test_geometry_sidecar(self):
+        xmdf = './tests/xmdf/EG00_001.xmdf'
+        df = XMDF(xmdf).time_series((293250, 6178030), 'h')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            GeometrySidecarMixin.sidecar_cache = True
+            GeometrySidecarMixin.sidecar_dir = tmpdir
+            try:
+                res = XMDF(xmdf)
+                df1 = res.time_series((293250, 6178030), 'h')
+                self.assertTrue(res._driver.geom.sidecar_path().exists())
+                res = XMDF(xmdf)
+                df2 = res.time_series((293250, 6178030), 'h')
+                self.assertIsInstance(res._driver.geom.triangles, np.memmap)
+                del res  # release memory-mapped files before the directory is removed
+            finally:
+                GeometrySidecarMixin.sidecar_cache = False
+                GeometrySidecarMixin.sidecar_dir = None
+        self.assertTrue(np.allclose(df.to_numpy(), df1.to_numpy(), equal_nan=True))
+        self.assertTrue(np.allclose(df.to_numpy(), df2.to_numpy(), equal_nan=True))
+
+    def test_time_series_batch(self):
+        xmdf = './tests/xmdf/EG00_001.xmdf'
+        res = XMDF(xmdf)
+        points = {'pnt1': (293250, 6178030), 'outside': (0., 0.), 'pnt2': (293260, 6178030)}
+        df = res.time_series(points, ['h', 'vector velocity'])
+        self.assertEqual(4, df.shape[1])
+        for name, pnt in points.items():
+            if name == 'outside':
+                continue
+            res._driver.clear_cache()
+            df1 = res.time_series(pnt, ['h', 'vector velocity'])
+            columns = [f'{name}/water level', f'{name}/vector velocity']
+            self.assertTrue(np.allclose(df1.to_numpy(), df[columns].to_numpy(), equal_nan=True))
+
+    def test_data_point_batch(self):
+        xmdf = './tests/xmdf/EG00_001.xmdf'
+        res = XMDF(xmdf)
+        points = {'pnt1': (293250, 6178030), 'outside': (0., 0.), 'pnt2': (293260, 6178030)}
+        df = res.data_point(points, ['h', 'v'], 1.)
+        self.assertEqual((3, 2), df.shape)
+        self.assertTrue(np.isnan(df.loc['outside', 'water level']))
+        res._driver.clear_cache()
+        self.assertTrue(np.isclose(res.data_point(points['pnt1'], 'h', 1.), df.loc['pnt1', 'water level']))
+        self.assertTrue(np.isclose(res.data_point(points['pnt2'], 'v', 1.), df.loc['pnt2', 'velocity']))
+
 
 class TestDAT(unittest.TestCase):
 
@@ -173,6 +310,39 @@ class TestDAT(unittest.TestCase):
         mx = res.maximum('water level')
         self.assertTrue(np.isclose(mx, 50.4242821).all())
 
+    def test_memory_mapped(self):
+        p = './tests/dat/EG00_001_h.dat'
+        res = DAT(p)
+        res._load()
+        ts_card = res._driver.extractor._results['water level']['timestep']
+        self.assertIsInstance(ts_card.val.base, np.memmap)
+        df = res.time_series((293250, 6178030), 'h')
+        self.assertEqual((3, 1), df.shape)
+        self.assertTrue(np.isclose(df.iloc[-1, 0], XMDF('./tests/xmdf/EG00_001.xmdf').data_point((293250, 6178030), 'h', 1.)))
+        res.close()
+        self.assertIsNone(ts_card.mm)
+        self.assertIsNone(ts_card._val)
+        df1 = res.time_series((293250, 6178030), 'h')  # mapped again
+        pd.testing.assert_frame_equal(df, df1)
+        res.close()
+
+    def test_memory_mapped_no_timesteps(self):
+        from pytuflow._outputs.pymesh.extractors.dat_data_extractor import TS
+        ts_card = TS(4, 4, 5, 5, True)
+        self.assertEqual((0, 5, 2), ts_card.val.shape)
+        self.assertEqual((0, 5), ts_card.stat.shape)
+
+    def test_maximum_never_active(self):
+        p = './tests/dat/EG00_001_h.dat'
+        res = DAT(p)
+        res._load()
+        ts_card = res._driver.extractor._results['water level']['timestep']
+        ts_card._stat = np.zeros_like(ts_card.stat)  # dry everywhere for all timesteps
+        with self.assertRaises(ValueError):
+            res.maximum('water level')
+        with self.assertRaises(ValueError):
+            res.minimum('water level')
+
     def test_maximum_velocity_vector(self):
         p = './tests/dat/EG00_001_V.dat'
         res = DAT(p)
@@ -212,6 +382,26 @@ class TestNCMesh(unittest.TestCase):
         self.assertEqual('fv_res', res.name)
         self.assertFalse(res.has_reference_time)
 
+    def test_geometry_sidecar_weights(self):
+        nc = './tests/nc_mesh/fv_res.nc'
+        weights = NCMesh(nc)._driver.geom.cell_to_vertex_weights()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            GeometrySidecarMixin.sidecar_cache = True
+            GeometrySidecarMixin.sidecar_dir = tmpdir
+            try:
+                geom = NCMesh(nc)._driver.geom
+                geom.load()
+                geom.cell_to_vertex_weights()  # added to the sidecar that is already written
+                self.assertTrue((geom.sidecar_path() / 'weights.npy').exists())
+                geom1 = NCMesh(nc)._driver.geom
+                geom1.load()
+                self.assertIsInstance(geom1.cell_to_vertex_weights(), np.memmap)
+                self.assertTrue(np.allclose(weights, geom1.cell_to_vertex_weights()))
+                del geom, geom1  # release memory-mapped files before the directory is removed
+            finally:
+                GeometrySidecarMixin.sidecar_cache = False
+                GeometrySidecarMixin.sidecar_dir = None
+
     def test_time_series_averaging(self):
         nc = './tests/nc_mesh/fv_res.nc'
         res = NCMesh(nc)
@@ -225,6 +415,16 @@ class TestNCMesh(unittest.TestCase):
         df = res.section(line, 'v', 0, averaging_method='sigma&0.1&0.9')
         self.assertEqual((6, 2), df.shape)
 
+    def test_section_time_series(self):
+        nc = './tests/nc_mesh/EST000_3D_001.nc'
+        res = NCMesh(nc)
+        line = './tests/nc_mesh/ncmesh_line_longlat.shp'
+        df = res.section_time_series(line, 'salinity')
+        self.assertEqual((5, 138), df.shape)
+        df1 = res.section(line, 'salinity', 186972)
+        self.assertTrue(np.allclose(df1.iloc[:,0].to_numpy(), df['a'].columns.to_numpy()))
+        self.assertTrue(np.allclose(df1.iloc[:,1].to_numpy(), df['a'].iloc[4].to_numpy(), equal_nan=True))
+
     def test_maximum_water_level(self):
         nc = './tests/nc_mesh/EST000_3D_001.nc'
         res = NCMesh(nc)
@@ -283,6 +483,67 @@ class TestNCMesh(unittest.TestCase):
         df = res.surface('H', 186972, averaging_method='sigma&0&1', coord_scope='local', to_vertex=True)
         self.assertEqual(df.shape, (1419, 4))
 
+    def test_depth_average_all_times(self):
+        nc = './tests/nc_mesh/EST000_3D_001.nc'
+        res = NCMesh(nc)
+        mx = res.maximum('sal', averaging_method='sigma&0.1&0.9')
+        mx_ = max(res.surface('sal', t, averaging_method='sigma&0.1&0.9').query('active')['value'].max()
+                  for t in res.times())
+        self.assertAlmostEqual(mx_, mx)
+
+    def test_ragged_layout(self):
+        layout = RaggedLayout([2, 1, 3])
+        self.assertEqual((6, 9), (layout.size, layout.zsize))
+        self.assertEqual([10, 11, 20, 30, 31, 32], layout.index([10, 20, 30]).tolist())
+        a = layout.pad(np.arange(12.).reshape(2, 6))
+        self.assertEqual((2, 3, 3), a.shape)
+        self.assertEqual([6., 7., np.inf], np.nan_to_num(a[1, 0], nan=np.inf).tolist())
+        self.assertEqual([9., 10., 11.], a[1, 2].tolist())
+        b = layout.pad(np.arange(9.), faces=True)
+        self.assertEqual([5., 6., 7., 8.], b[2].tolist())
+
+    def test_cell_to_vertex_operator(self):
+        # two quads sharing an edge (vertices 1 and 4)
+        op = CellToVertexOperator([[0, 1, 4, 3], [1, 2, 5, 4]], np.full((2, 4), 0.5), 6)
+        self.assertEqual([1., 1.5, 2., 1., 1.5, 2.], op.apply([1., 2.]).tolist())
+        vals = op.apply([[1., 2.], [1., 2.]], wet=[[True, True], [False, True]])
+        self.assertEqual([1., 1.5, 2., 1., 1.5, 2.], vals[0].tolist())
+        self.assertEqual([0., 2., 2., 0., 2., 2.], vals[1].tolist())
+        self.assertEqual([False, True, True, False, True, True], op.active([False, True]).tolist())
+        res = NCMesh('./tests/nc_mesh/fv_res.nc')
+        self.assertIs(res._driver.geom.cell_to_vertex_operator(), res._driver.geom.cell_to_vertex_operator())
+
+    def test_temporal_reducer(self):
+        reducer = TemporalReducer(thresholds=(1.,))
+        reducer.add([0., 1.], [[0., 5., 1.], [2., 4., 1.]], [[True, True, False], [True, True, False]])
+        reducer.add([2.], [[1., 6., 1.]])
+        self.assertEqual([2., 6., 1.], reducer.result('max').tolist())
+        self.assertEqual([1., 2., 2.], reducer.result('tmax').tolist())
+        self.assertEqual([0., 4., 1.], reducer.result('min').tolist())
+        self.assertEqual([1.5, 2., 0.], reducer.result('duration')[0].tolist())
+
+    def test_temporal_stats(self):
+        nc = './tests/nc_mesh/EST000_3D_001.nc'
+        res = NCMesh(nc)
+        stats = res._driver.temporal_stats('sal', 'sigma&0&1', thresholds=(10.,), block_size=2)
+        data, active = res._driver.cell_data('sal', slice(None), 'sigma&0&1')
+        data = np.where(active, data, -np.inf)
+        wet = active.any(axis=0)
+        self.assertTrue(np.allclose(data.max(axis=0)[wet], stats['max'][wet]))
+        self.assertTrue(np.allclose(np.array(res.times())[data.argmax(axis=0)][wet], stats['tmax'][wet]))
+        self.assertTrue(np.isnan(stats['max'][~wet]).all())
+        self.assertEqual((1, 1375), stats['duration'].shape)
+        self.assertAlmostEqual(34.9360265569985, res.maximum('sal', averaging_method='sigma&0&1'))
+
+    def test_surface_array(self):
+        nc = './tests/nc_mesh/EST000_3D_001.nc'
+        res = NCMesh(nc)
+        surf = res.surface('v', 186972, return_type='array')
+        self.assertEqual((1375, 2), surf.values.shape)
+        self.assertTrue(surf.is_vector)
+        self.assertFalse(surf.values.flags.writeable)
+        pd.testing.assert_frame_equal(res.surface('v', 186972), surf.to_frame())
+
     def test_dynamic_bed_level(self):
         nc = './tests/nc_mesh/FMA2_SED_001.nc'
         res = NCMesh(nc)
@@ -508,6 +769,15 @@ class TestNCGrid(unittest.TestCase):
         df = res.surface('h', 0, to_vertex=True, coord_scope='global')
         self.assertEqual((36, 4), df.shape)
 
+    def test_surface_all_times_dtype(self):
+        p = './tests/nc_grid/small_model_001.nc'
+        res = NCGrid(p)
+        with res._open():
+            a = res._surface('water level', slice(None))
+            self.assertIs(type(a), np.ndarray)
+            self.assertEqual(np.float64, a.dtype)
+            self.assertEqual(res._surface('water level', 0).dtype, a.dtype)
+
     def test_surface_vector_direction(self):
         p = './tests/nc_grid/small_model_001.nc'
         res = NCGrid(p)
@@ -527,6 +797,79 @@ class TestNCGrid(unittest.TestCase):
         self.assertEqual((25, 4), df.shape)
         self.assertEqual(-2, df.x.min())
 
+    def test_surface_array(self):
+        p = './tests/nc_grid/EG00_001.nc'
+        res = NCGrid(p)
+        surf = res.surface('water level', 1., return_type='array')
+        self.assertEqual((res.nrow, res.ncol), surf.values.shape)
+        self.assertTrue(np.allclose(res.ox + res.dx / 2., surf.x[0]))
+        df = res.surface('water level', 1.)
+        pd.testing.assert_frame_equal(df, surf.to_frame())
+        surf = res.surface('velocity direction', 1., to_vertex=True, direction_to_vector=True, return_type='array')
+        self.assertEqual((res.nrow + 1, res.ncol + 1, 2), surf.values.shape)
+
+    def test_time_series_many_points(self):
+        p = './tests/nc_grid/EG00_001.nc'
+        res = NCGrid(p)
+        res.chunk_cache_bytes = 4 * 1024 ** 2
+        res.max_read_bytes = 100000  # force the reads to be split over time
+        pnts = {f'p{i}': (res.ox + (i + 0.5) * 7 * res.dx, res.oy + (i + 0.5) * 5 * res.dy) for i in range(30)}
+        df = res.time_series(pnts, ['h', 'v'])
+        self.assertEqual((7, 60), df.shape)
+        with Dataset(p) as nc:
+            h = nc.variables['water_level'][:].filled(np.nan)
+        for i in (0, 9, 12, 17):
+            expected = h[:, int((i + 0.5) * 5), int((i + 0.5) * 7)]
+            self.assertTrue(np.allclose(expected, df[f'p{i}/water level'].to_numpy(), equal_nan=True))
+
+    def test_surface_bbox_vertex(self):
+        p = './tests/nc_grid/EG00_001.nc'
+        res = NCGrid(p)
+        bbox = (res.ox + 400., res.oy + 300., res.ox + 600., res.oy + 500.)
+        for dtype in ['max water level', 'max velocity direction']:
+            full = res.surface(dtype, to_vertex=True)
+            clipped = res.surface(dtype, to_vertex=True, bbox=bbox)
+            df = clipped.merge(full, on=['x', 'y'], suffixes=('', '_full'))
+            self.assertEqual(41 * 41, df.shape[0])
+            self.assertTrue(df['value'].notna().any())
+            np.testing.assert_allclose(df['value_full'].to_numpy(), df['value'].to_numpy())
+
+    def test_surface_cached_timestep(self):
+        p = './tests/nc_grid/small_model_001.nc'
+        res = NCGrid(p)
+        with res._open():
+            a = res._surface('water level', 2)
+            self.assertEqual({2}, res._cached_timesteps['water level'])
+            b = res._surface('water level', 2)
+        self.assertEqual(np.float64, a.dtype)
+        np.testing.assert_array_equal(a, b)
+        a[:] = -1.  # returned arrays don't modify the cache
+        self.assertFalse((res._surface('water level', 2) == -1.).any())
+
+    def test_section_many_lines(self):
+        p = './tests/nc_grid/EG00_001.nc'
+        res = NCGrid(p)
+        x0, y0, x1, y1 = res.ox, res.oy, res.ox + res.ncol * res.dx, res.oy + res.nrow * res.dy
+        lines = {
+            'horiz': [(x0 - 10., y1 - 7.), (x1 + 10., y1 - 7.)],
+            'vert': [(x0 + 12., y0 - 10.), (x0 + 12., y1 + 10.)],
+            'point': [(x0 + 12., y0 + 12.)],  # single vertex, crosses no cells
+            'outside': [(x0 - 50., y0 - 50.), (x0 - 10., y0 - 100.), (x0 + 20., y0 + 20.)],
+        }
+        df = res.section(lines, ['h', 'v'], 1.)
+        self.assertEqual(((res.ncol + 2) * 2, (res.nrow + 2) * 2), (df['horiz'].dropna(how='all').shape[0],
+                                                                   df['vert'].dropna(how='all').shape[0]))
+        self.assertEqual([0., 10., 10., 15., 15., 20.], df[('vert', 'offset')].iloc[:6].tolist())
+        a, s = np.hypot(40., 50.), np.hypot(1.25, 5.)  # second segment enters the grid at (x0 + 15, y0)
+        b = a + np.hypot(25., 100.)
+        expected = [0., a, a, b, b, b + s, b + s, b + 2 * s, b + 2 * s, b + 3 * s, b + 3 * s, b + 4 * s]
+        self.assertTrue(np.allclose(expected, df[('outside', 'offset')].dropna().to_numpy()))
+        self.assertNotIn('point', df.columns.get_level_values(0))
+        del lines['point']
+        for name, line in lines.items():
+            df1 = NCGrid(p).section({name: line}, ['h', 'v'], 1.)
+            pd.testing.assert_frame_equal(df1[name], df[name].dropna(how='all'))
+
     def test_to_mesh(self):
         p = './tests/nc_grid/EG00_001.nc'
         res = NCGrid(p)
@@ -586,6 +929,20 @@ class TestNCGrid(unittest.TestCase):
 
 class TestGrid(unittest.TestCase):
 
+    def test_gridlines(self):
+        lines = [[(0.5, 0.5), (2.5, 0.5)], [(1.5, 1.5)], [(0.5, 0.5), (0.5, 1.5)]]  # second line is a single vertex
+        indptr, cells, intersections = Grid.gridlines(lines, 1., 1., 0., 0., 2, 3)
+        self.assertEqual([0, 3, 3, 5], indptr.tolist())
+        self.assertEqual([[0, 0], [0, 1], [0, 2], [0, 0], [1, 0]], cells.tolist())
+        expected = [
+            [0., 0.5, 0.5], [0.5, 1., 0.5], [1.5, 2., 0.5], [2., 2.5, 0.5],
+            [0., 1.5, 1.5],
+            [0., 0.5, 0.5], [0.5, 0.5, 1.], [1., 0.5, 1.5],
+        ]
+        self.assertTrue(np.allclose(expected, intersections))
+        with self.assertRaises(ValueError):
+            Grid.gridlines([[]], 1., 1., 0., 0., 2, 3)
+
     def test_grid_file(self):
         p = 'NETCDF:"./tests/nc_grid/small_model_001.nc":maximum_water_level'
         res = Grid(p)
@@ -636,6 +993,145 @@ class TestGrid(unittest.TestCase):
         res = Grid(d)
         self.assertEqual(13, len(res.times()))
 
+    def test_tiled_raster(self):
+        rng = np.random.default_rng(1)
+        a = rng.random((600, 700))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p = f'{tmpdir}/tiled.tif'
+            transform = rasterio.Affine(2., 0., 1000., 0., -2., 2600.)
+            with rasterio.open(p, 'w', driver='GTiff', height=600, width=700, count=1, dtype='float64',
+                               transform=transform, tiled=True, blockxsize=256, blockysize=256) as ds:
+                ds.write(a, 1)
+            res = Grid(p)
+            flipped = np.flipud(a)  # row 0 is the bottom row
+
+            # points only read the tiles they touch
+            val = res.data_point([(1001., 1401.), (2399., 2599.)])
+            self.assertEqual(flipped[0, 0], val.loc['pnt1'].iloc[0])
+            self.assertEqual(flipped[-1, -1], val.loc['pnt2'].iloc[0])
+            self.assertEqual(2, res.cache.stats()['tile']['entries'])
+
+            df = res.section([(1001., 1401.), (1001., 2599.)], time=-1)
+            vals = df.iloc[:, 1].dropna().to_numpy()
+            self.assertTrue(np.isin(vals, flipped[:, 0]).all())
+            self.assertEqual(600, np.unique(vals).size)
+            self.assertEqual(4, res.cache.stats()['tile']['entries'])
+
+            df = res.surface(bbox=(1100., 1500., 1200., 1560.))
+            self.assertEqual((30 * 50, 4), df.shape)
+            self.assertTrue(np.allclose(df['value'].to_numpy(), flipped[50:80, 50:100].ravel()))
+            self.assertAlmostEqual(1101., df['x'].iloc[0])
+            self.assertAlmostEqual(1501., df['y'].iloc[0])
+            res.close()
+
+
+class TestCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = Cache(max_bytes=2500)
+        for i in range(3):
+            cache.set(np.zeros(100), 'surface', 'h', i)
+        self.assertTrue(cache.contains('surface', 'H', 1))
+        cache.get('surface', 'h', 0)  # most recently used
+        cache.set(np.zeros(100), 'time_series', 'h')
+        self.assertFalse(cache.contains('surface', 'h', 1))
+        self.assertTrue(cache.contains('surface', 'h', 0))
+        self.assertLessEqual(cache.nbytes, 2500)
+        stats = cache.stats()['surface']
+        self.assertEqual(1, stats['evictions'])
+        self.assertEqual(3, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+
+    def test_get_default(self):
+        cache = Cache()
+        self.assertIsNone(cache.max_bytes)  # unbounded unless opted in
+        cache.set(np.zeros(100), 'surface', 'h', 0)
+        self.assertEqual(100, cache.get('surface', 'h', 0, default=None).size)
+        self.assertIsNone(cache.get('surface', 'h', 1, default=None))
+        with self.assertRaises(KeyError):
+            cache.get('surface', 'h', 1)
+        stats = cache.stats()['surface']
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(2, stats['misses'])
+
+    def test_namespace_budget(self):
+        cache = Cache(budgets={'surface': 1000})
+        cache.set(np.zeros(100), 'surface', 'h', 0)
+        cache.set(np.zeros(100), 'surface', 'h', 1)
+        cache.set(np.zeros(100), 'time_series', 'h', 0)
+        self.assertFalse(cache.contains('surface', 'h', 0))
+        self.assertTrue(cache.contains('surface', 'h', 1))
+        self.assertTrue(cache.contains('time_series', 'h', 0))
+        cache.set(np.zeros(1000), 'surface', 'h', 2)  # too big for the budget
+        self.assertFalse(cache.contains('surface', 'h', 2))
+
+    def test_keys(self):
+        cache = Cache()
+        a, b = np.arange(2000), np.arange(2000)
+        b[1000] = -1  # same str() as a
+        cache.set(1, 'data_point', 'h', a)
+        cache.set(2, 'data_point', 'h', b)
+        self.assertEqual(1, cache.get('data_point', 'h', a.copy()))
+        self.assertEqual(2, cache.get('data_point', 'h', b))
+        self.assertEqual(1, cache.get('data_point', 'H', a))
+        with self.assertRaises(TypeError):
+            cache.set(3, 'data_point', {'h': 1})
+        cache.clear()
+        self.assertEqual({}, cache.stats())
+
+    def test_maximum_bed_level_cached(self):
+        res = XMDF('./tests/xmdf/EG00_001.xmdf')
+        driver = res._driver
+        mx, mn = res.maximum('bed level'), res.minimum('bed level')
+        self.assertEqual(mx, driver.cache.get('maximum', 'bed level', None, False))
+        self.assertEqual(mn, driver.cache.get('minimum', 'bed level', None, False))
+        self.assertEqual((mx, mn), (res.maximum('bed level'), res.minimum('bed level')))
+
+
+class TestEnsembleStatistics(unittest.TestCase):
+
+    def test_grid(self):
+        res = NCGrid('./tests/nc_grid/small_model_001.nc')
+        times = res.times('water level')
+        stats = EnsembleStatistics(percentiles=[10, 50, 90])
+        for t in times:  # treat each timestep as an ensemble member
+            stats.add_result(res, 'water level', t)
+        a = np.stack([res.surface('water level', t)['value'].to_numpy() for t in times])
+        df = stats.to_frame()
+        self.assertEqual((25, 11), df.shape)
+        self.assertTrue(np.allclose(np.nanmax(a, axis=0), df['max'], equal_nan=True))
+        self.assertTrue(np.allclose(np.nanmin(a, axis=0), df['min'], equal_nan=True))
+        self.assertTrue(np.allclose(np.nanmean(a, axis=0), df['mean'], equal_nan=True))
+        self.assertTrue(np.allclose(np.nanpercentile(a, 50, axis=0), df['p50'], atol=0.05, equal_nan=True))
+        self.assertEqual((25, 4), stats.to_grid('p90').surface().shape)
+
+    def test_percentile_exact(self):
+        a = np.random.default_rng(0).random((5, 100))
+        stats = EnsembleStatistics(percentiles=[50, 90])
+        for x in a:
+            stats.add(x)
+        self.assertTrue(np.allclose(np.percentile(a, 90, axis=0), stats.statistics()['p90']))
+
+    def test_netcdf(self):
+        res = NCGrid('./tests/nc_grid/small_model_001.nc')
+        stats = EnsembleStatistics.from_results([res, res], 'max h', time_of_max='tmax h')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p = f'{tmpdir}/ensemble.nc'
+            stats.to_netcdf(p)
+            ens = NCGrid(p)
+            self.assertTrue(np.allclose(res.surface('max h')['value'], ens.surface('max')['value'], equal_nan=True))
+            self.assertTrue(np.allclose(res.surface('tmax h')['value'], ens.surface('tmax')['value'], equal_nan=True))
+            ens.close()
+
+    def test_mesh(self):
+        res = XMDF('./tests/xmdf/run.xmdf')
+        stats = EnsembleStatistics.from_results([res, res, res], 'max h')
+        d = stats.statistics()
+        self.assertTrue(np.allclose(res.surface('max h', -1)['value'], d['max']))
+        self.assertTrue((d['count'] == 3).all())
+        with self.assertRaises(ValueError):
+            stats.add_result(NCGrid('./tests/nc_grid/small_model_001.nc'), 'max h')
+
 
 class TestPyMeshRegression(unittest.TestCase):
 
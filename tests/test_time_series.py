@@ -1,10 +1,18 @@
+import gc
 import logging
 import os
+import shutil
+import tempfile
 import unittest
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
 from logging import StreamHandler
-from unittest import TestCase
+from pathlib import Path
+from unittest import TestCase, mock
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from pytuflow.results import ResultTypeError
@@ -20,6 +28,10 @@ from pytuflow._outputs.fm_ts import FMTS
 from pytuflow._outputs.fv_bc_tide import FVBCTide
 from pytuflow._outputs.cross_sections import CrossSections
 from pytuflow._outputs.fm_dat import DATCrossSections
+from pytuflow._outputs.batch import BatchExtractor
+from pytuflow._outputs.helpers.frame_assembler import FrameAssembler
+from pytuflow._outputs.helpers.fm_res_driver import FMResultDriver
+from pytuflow._outputs.helpers.time_series_csv import TimeSeriesCSV, TimeSeriesCSVMaximums
 from pytuflow import pytuflow_logging
 
 
@@ -331,6 +343,57 @@ class Test_TPC_2016(TestCase):
         self.assertEqual(56, len(res.ids('q')))
         self.assertEqual(2, len(res.ids('vol')))
 
+    def test_filter_index(self):
+        p = './tests/2016/EG14_001.tpc'
+        res = TPC(p)
+        self.assertEqual(54, len(res.ids('channel')))
+        self.assertIn((('1d', 'line'), True), res._filter_index[1])
+        ctx, _ = res._filter('channel')
+        ctx['id'] = 'x'
+        self.assertEqual(54, len(res.ids('Channel')))
+        res.oned_objs = res.oned_objs.iloc[:10]
+        self.assertEqual(res.oned_objs['id'].unique().size, len(res.ids('1d')))
+        self.assertEqual('water level', TPC._get_standard_data_type_name('Max_H'))
+
+    def test_frame_assembler(self):
+        frame = FrameAssembler()
+        frame.add([0., 1., 2.], np.array([[1., 2.], [3., 4.], [5., -99999.]]), ['a', 'b'])
+        frame.add([1., 3.], [np.array([6., 7.])], ['c'])
+        df = frame.to_frame(nodata_below=-99998)
+        self.assertEqual(['a', 'b', 'c'], df.columns.tolist())
+        self.assertEqual([0., 1., 2., 3.], df.index.tolist())
+        self.assertEqual('time', df.index.name)
+        self.assertTrue(np.isnan(df.loc[2., 'b']))
+        self.assertEqual(7., df.loc[3., 'c'])
+        index, values, columns = frame.to_numpy()
+        self.assertEqual((4, 3), values.shape)
+        self.assertEqual(6., frame.to_dict()['c'][1])
+        frame = FrameAssembler(index_tol=0.0001)
+        frame.add([0., 1.], [1., 2.], ['a'])
+        with self.assertRaises(ValueError):
+            frame.add([0., 2.], [1., 2.], ['b'])
+
+    def test_frame_assembler_mixed(self):
+        index = FrameAssembler.absolute_time(datetime(2000, 1, 1), [0., 0.5, np.nan])
+        self.assertEqual('datetime64[ns]', str(index.dtype))
+        self.assertEqual(datetime(2000, 1, 1, 0, 30), index[1])
+        self.assertTrue(pd.isna(index[2]))
+        frame = FrameAssembler()
+        df = pd.DataFrame({
+            'a': [1., -99999., 2.],
+            'b': ['x', 'y', 'z'],
+            'c': np.array([-99999, 3, 4], dtype=np.int64),
+            'd': pd.array([5, -99999, None], dtype='Int64'),
+        }, index=index[:2].append(pd.DatetimeIndex([datetime(2000, 1, 1, 1)])))
+        frame.add_frame(df)
+        frame.add(df.index[1:], np.array([[-99999.], [6.]], dtype=np.float32), ['e'])
+        df1 = frame.to_frame(nodata_below=-99998)
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'], df1.columns.tolist())
+        self.assertEqual(['x', 'y', 'z'], df1['b'].tolist())
+        for col, expected in (('a', [1., np.nan, 2.]), ('c', [np.nan, 3., 4.]), ('d', [5., np.nan, np.nan]),
+                              ('e', [np.nan, np.nan, 6.])):
+            np.testing.assert_array_equal(expected, df1[col].to_numpy(dtype=float))
+
     def test_maximums(self):
         p = './tests/2016/EG14_001.tpc'
         res = TPC(p)
@@ -357,6 +420,111 @@ class Test_TPC_2016(TestCase):
         ts = res.time_series(['po_line', 'ds1'], 'q')
         self.assertEqual((181, 2), ts.shape)
 
+    def test_time_series_lazy_load(self):
+        p = './tests/2016/EG14_001.tpc'
+        res = TPC(p)
+        ts = res.time_series('ds1', 'flow')
+        # only the requested column should have been read from the CSV
+        store = res._time_series_data['flow'][0]._store
+        self.assertEqual(1, len(store._loaded))
+        self.assertEqual(np.float32, store._loaded.blocks[0].dtype)
+        self.assertEqual(0, len(res._time_series_data['velocity'][0]._store._loaded))
+        df = pd.read_csv('./tests/2016/csv/EG14_001_1d_Q.csv', index_col=1)
+        col = [x for x in df.columns if x.startswith('Q ds1 ')][0]
+        self.assertTrue(np.allclose(df[col].to_numpy(), ts.iloc[:, 0].to_numpy()))
+
+    def test_time_series_lazy_attributes(self):
+        p = './tests/2016/EG14_001.tpc'
+        res = TPC(p)
+        res.time_series('ds1', 'flow')
+        lazy = res._time_series_data['flow'][0]
+        with self.assertRaises(AttributeError):
+            lazy.max()  # pandas methods are not forwarded (would parse the whole file)
+        self.assertEqual(1, len(lazy._store._loaded))
+        self.assertTrue(np.allclose(lazy.loc[:, lazy.columns[2]].to_numpy(), lazy.iloc[:, 2].to_numpy()))
+        self.assertEqual((lazy.shape[0], 2), lazy.iloc[:, [0, 2]].shape)
+
+    def test_time_series_lazy_code_paths(self):
+        p = './tests/2016/EG14_001.tpc'
+        lazy = TPC(p)
+        res = TPC(p)  # same result with the lazily loaded results replaced by DataFrames
+        res._load()
+        for attr in ('_time_series_data', '_maximum_data', '_time_series_data_2d', '_maximum_data_2d'):
+            for vals in getattr(res, attr).values():
+                vals[:] = [x.to_frame() if hasattr(x, 'to_frame') else x for x in vals]
+        self.assertIsInstance(res._time_series_data['flow'][0], pd.DataFrame)
+
+        def no_indexer(self_):
+            raise AssertionError('lazily loaded results should be read with to_frame()')
+
+        # internal code paths should not rely on the DataFrame like indexers of the lazily loaded results
+        with ExitStack() as stack:
+            for cls in (TimeSeriesCSV, TimeSeriesCSVMaximums):
+                stack.enter_context(mock.patch.object(cls, 'loc', property(no_indexer)))
+                stack.enter_context(mock.patch.object(cls, 'iloc', property(no_indexer)))
+            self.assertEqual(res.data_types(), lazy.data_types())
+            self.assertEqual(res.ids('po'), lazy.ids('po'))
+            pd.testing.assert_frame_equal(res.time_series(['ds1', 'po_line'], None),
+                                          lazy.time_series(['ds1', 'po_line'], None))
+            pd.testing.assert_frame_equal(res.maximum(None, None), lazy.maximum(None, None))
+            for time in [1., [0.5, 1.]]:
+                pd.testing.assert_frame_equal(res.section('ds1', ['h', 'max h', 'tmax h', 'q'], time),
+                                              lazy.section('ds1', ['h', 'max h', 'tmax h', 'q'], time))
+        self.assertIsInstance(lazy._time_series_data['flow'][0], TimeSeriesCSV)
+        self.assertIsInstance(lazy._maximum_data_2d['flow'][0], TimeSeriesCSVMaximums)
+
+    def test_time_series_csv_quoted_fields(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = Path(tmpdir) / 'test_1d_H.csv'
+            with fpath.open('w') as f:
+                f.write('Timestep,"Time (h)","H, ""a""","H b"\n"1, a",0.5,1.0,2.0\n"2",1.0,3.0,4.0\n')
+            ts = TimeSeriesCSV(fpath)
+            self.assertEqual(['H, "a"', 'H b'], ts.columns.tolist())
+            self.assertEqual([0.5, 1.], ts.index.tolist())
+            self.assertEqual([2., 4.], ts.iloc[:, 1].tolist())
+
+    def test_time_series_cache(self):
+        p = './tests/2016/EG14_001.tpc'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            res = TPC(p)
+            res.ts_cache, res.ts_cache_dir = True, tmpdir
+            ts = res.time_series(['ds1', 'po_line'], 'flow')
+            mx = res.maximum(None, None)
+            self.assertTrue((res.ts_cache_path() / 'manifest.json').exists())
+
+            res2 = TPC(p)
+            res2.ts_cache, res2.ts_cache_dir = True, tmpdir
+            pd.testing.assert_frame_equal(ts, res2.time_series(['ds1', 'po_line'], 'flow'))
+            pd.testing.assert_frame_equal(mx, res2.maximum(None, None))
+            store = res2._time_series_data['flow'][0]._store
+            self.assertIsInstance(store._loaded.blocks[0], np.memmap)  # loaded from the cache
+            del res, res2, store
+
+    def test_time_series_cache_lazy(self):
+        p = './tests/2016/EG14_001.tpc'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            res = TPC(p)
+            res.ts_cache, res.ts_cache_dir = True, tmpdir
+            ts = res.time_series('ds1', 'flow')
+
+            # only the column that was read is in the cache, other columns are not parsed until they are accessed
+            res2 = TPC(p)
+            res2.ts_cache, res2.ts_cache_dir = True, tmpdir
+            pd.testing.assert_frame_equal(ts, res2.time_series('ds1', 'flow'))
+            store = res2._time_series_data['flow'][0]._store
+            self.assertEqual(1, len(store._loaded))
+            self.assertIsInstance(store._loaded.blocks[0], np.memmap)
+            self.assertEqual(0, len(res2._time_series_data['velocity'][0]._store._loaded))
+            ts2 = res2.time_series('ds2', 'flow')
+            self.assertEqual(2, len(store._loaded))
+
+            # columns read after the cache was written are added to it
+            res3 = TPC(p)
+            res3.ts_cache, res3.ts_cache_dir = True, tmpdir
+            pd.testing.assert_frame_equal(ts2, res3.time_series('ds2', 'flow'))
+            self.assertEqual(2, len(res3._time_series_data['flow'][0]._store._loaded))
+            del res, res2, res3, store
+
     def test_time_series_different_time_index_1d(self):
         p = './tests/2016/EG14_001_unique_1d_times.tpc'
         res = TPC(p)
@@ -647,6 +815,37 @@ class Test_TPC_2019(TestCase):
         self.assertEqual(8, df[df['branch_id'] == 0].shape[0])
         self.assertEqual(6, df[df['branch_id'] == 1].shape[0])
 
+    def test_network_graph(self):
+        p = './tests/branched_section/EG15_001.tpc'
+        res = TPC(p)
+        df = res.section(['Pipe10', 'Pipe15'], 'bed level', 99)
+        self.assertEqual(['Pipe10', 'Pipe12', 'Pipe11', 'Pipe13', 'Pipe14', 'Pipe6', 'Pipe15'],
+                         df['channel'].unique().tolist())
+        graph = res._network_graph()
+        self.assertIs(graph, res._network_graph())
+        self.assertIn(('Pipe10', 'Pipe15'), graph._memo)
+        connected, branches = graph.trace('Pipe15', 'Pipe10')
+        self.assertFalse(connected)
+        self.assertEqual([], branches)
+        self.assertEqual(['12'], graph._node_channels(12))
+        self.assertEqual(['A', 'B'], graph._node_channels('A,B'))
+        self.assertEqual([], graph._node_channels(np.nan))
+        self.assertEqual([], graph._node_channels(None))
+
+    def test_section_all_times(self):
+        p = './tests/2020/EG15_001.tpc'
+        res = TPC(p)
+        df = res.section('pipe1', ['bed level', 'water level', 'max water level'], 'all')
+        self.assertEqual('time', df.columns[0])
+        self.assertEqual(res.times(), df['time'].unique().tolist())
+        t1, t2 = res.times()[5], res.times()[10]
+        df1 = res.section('pipe1', ['bed level', 'water level', 'max water level'], t2)
+        df2 = df[df['time'] == t2].drop(columns='time')
+        self.assertTrue(np.allclose(df1['water level'], df2['water level']))
+        df = res.section('pipe1', 'water level', [t1, t2])
+        self.assertEqual([t1, t2], df['time'].unique().tolist())
+        self.assertTrue(np.allclose(df1['water level'], df[df['time'] == t2]['water level']))
+
 
 class Test_TPC_SWMM(TestCase):
 
@@ -967,6 +1166,46 @@ class Test_GPKG1D(TestCase):
         ts = res.time_series('FC01.1_R', ['q', 'v'])
         self.assertEqual((181, 2), ts.shape)
 
+    def test_connection_lifetime(self):
+        p = './tests/2023/EG15_001_TS_1D.gpkg'
+        res = GPKG1D(p)
+        with ThreadPoolExecutor(1) as executor:  # connection opened by a worker thread
+            ts = executor.submit(res.time_series, 'FC01.1_R', 'q').result()
+        self.assertEqual((181, 1), ts.shape)
+        pool = res._conn_pool
+        self.assertEqual(2, len(pool._connections))
+        res.close()
+        self.assertEqual(0, len(pool._connections))
+        self.assertEqual((181, 1), res.time_series('FC01.2_R', 'q').shape)  # reopened when needed
+        del res
+        gc.collect()
+        self.assertEqual(0, len(pool._connections))  # released with the output
+
+    def test_time_series_query(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p = shutil.copy('./tests/2023/EG15_001_TS_1D.gpkg', tmpdir)
+            with GPKG1D.connect(p) as conn:
+                cur = conn.cursor()
+                cur.execute("SELECT Time_relative FROM EG15_001_TS_1D_L WHERE ID = 'FC01.1_R' ORDER BY Time_relative;")
+                times = np.array([x[0] for x in cur.fetchall()])
+                a, other_times = GPKG1D._gpkg_time_series_query(cur, 'Flow', 'EG15_001_TS_1D_L', ['FC01.1_R'], times)
+            self.assertEqual(0, other_times.size)
+            GPKG1D.create_index = True
+            try:
+                res = GPKG1D(p)
+                ts = res.time_series('FC01.1_R', 'q')
+            finally:
+                GPKG1D.create_index = False
+            self.assertTrue(np.allclose(a[:, 0], ts.iloc[:, 0].to_numpy()))
+            self.assertTrue(np.allclose(times, ts.index.to_numpy()))
+            store = res._time_series_data['flow'][0]._store
+            self.assertEqual(1, len(store._loaded))  # only the requested ID is queried
+            with GPKG1D.connect(p) as conn:
+                cur = conn.cursor()
+                self.assertTrue(res._gpkg_ensure_index(cur, 'EG15_001_TS_1D_L'))
+            res.close()
+            del res
+
     def test_long_plot(self):
         p = './tests/2023/M06_5m_003_SWMM_swmm_ts.gpkg'
         res = GPKG1D(p)
@@ -1098,6 +1337,47 @@ class Test_GPKGRL(TestCase):
         self.assertEqual((181, 1), df.shape)
 
 
+class Test_BatchExtractor(TestCase):
+
+    def setUp(self):
+        self.results = ['./tests/2016/EG14_001.tpc', './tests/tpc_gpkg/EG15_001.tpc']
+
+    def test_serial(self):
+        progress = []
+        with BatchExtractor(TPC, self.results, max_workers=0) as batch:
+            out = {p.name: df for p, df in batch.time_series('FC01.1_R', 'flow',
+                                                             progress=lambda *x: progress.append(x[:2]))}
+        self.assertEqual([(1, 2), (2, 2)], progress)
+        for p in self.results:
+            df = TPC(p).time_series('FC01.1_R', 'flow')
+            pd.testing.assert_frame_equal(df, out[os.path.basename(p)])
+
+    def test_parallel(self):
+        with BatchExtractor(TPC, self.results, max_workers=2) as batch:
+            out = {p.name: df for p, df in batch.maximum('FC01.1_R', 'flow')}
+            self.assertEqual(2, len(out))
+            out2 = {p.name: df for p, df in batch.time_series('FC01.1_R', 'flow')}  # workers reuse the outputs
+        for p in self.results:
+            res = TPC(p)
+            pd.testing.assert_frame_equal(res.maximum('FC01.1_R', 'flow'), out[os.path.basename(p)])
+            pd.testing.assert_frame_equal(res.time_series('FC01.1_R', 'flow'), out2[os.path.basename(p)])
+
+    def test_cancel(self):
+        with BatchExtractor(TPC, self.results * 3, max_workers=0) as batch:
+            out = list(batch.time_series('FC01.1_R', 'flow', progress=lambda *x: batch.cancel()))
+        self.assertEqual(1, len(out))
+        self.assertTrue(batch.cancelled)
+
+    def test_errors(self):
+        results = self.results + ['./tests/2016/does_not_exist.tpc']
+        with BatchExtractor(TPC, results, max_workers=0) as batch:
+            with self.assertRaises(Exception):
+                list(batch.time_series('FC01.1_R', 'flow'))
+            with self.assertLogs('pytuflow', level='WARNING'):
+                out = list(batch.time_series('FC01.1_R', 'flow', errors='ignore'))
+        self.assertEqual(2, len(out))
+
+
 class Test_FM_TS(unittest.TestCase):
 
     def test_gxy(self):
@@ -1142,11 +1422,65 @@ class Test_FM_TS(unittest.TestCase):
         res = FMTS(p, None, None)
         self.assertEqual('LBE_TBP3_0100F_BASE_350_BM_HPC_GPU', res.name)
 
+    def test_gui_csv_blocks(self):
+        p = './tests/fm/gui_csv/LBE_TBP3_0100F_BASE_350_BM_HPC_GPU_one_column_per_node_all_header.csv'
+        res = FMTS(p, None, None)
+        self.assertIn('state', res.data_types())  # last block is not followed by a blank line
+        df = pd.read_csv(p, skiprows=5, nrows=105, index_col=0)
+        df1 = res.time_series(['TK.001', 'TK.025'], 'flow')
+        self.assertTrue(np.allclose(df[['TK.001', 'TK.025']].to_numpy(), df1.to_numpy()))
+        self.assertTrue(np.allclose(df.index.to_numpy(), df1.index.to_numpy()))
+        driver = FMResultDriver(Path(p))
+        self.assertEqual(driver.store.shape, (105, driver.columns.size))
+        self.assertTrue(np.shares_memory(driver.time_series('Flow').to_numpy(), driver.store))
+        col = driver.columns.get_loc(('Flow', 'TK.025'))
+        self.assertTrue(np.allclose(df['TK.025'].to_numpy(), driver.store[:, col]))
+        self.assertFalse(driver.is_empty())
+        pd.testing.assert_frame_equal(driver.time_series('Flow'), FMResultDriver.time_series(driver, 'Flow'))
+
+    def test_gui_csv_blocks_time_index(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p = Path(tmpdir) / 'gui.csv'
+            p.write_text(
+                '\nFlow\nTime (hr),A,B\n0,1,2\n1,3,4\n2,5,6\n'
+                '\nStage\nTime (hr),A,B\n0,10,20\n1.5,30,40\n2,50,60\n'
+            )
+            driver = FMResultDriver(p)
+            self.assertEqual('csv-gui', driver.driver_name)
+            self.assertEqual([0., 1., 1.5, 2.], driver.timesteps)
+            df = driver.time_series('Flow')
+            self.assertEqual([0., 1., 1.5, 2.], df.index.tolist())
+            np.testing.assert_array_equal([1., 3., np.nan, 5.], df['A'].to_numpy())
+            df = driver.time_series('Stage')
+            np.testing.assert_array_equal([20., np.nan, 40., 60.], df['B'].to_numpy())
+            self.assertEqual((4, 4), driver.df.shape)
+            self.assertEqual(['Flow::A', 'Flow::B', 'Stage::A', 'Stage::B'], driver.df.columns.tolist())
+
     def test_load_zzn(self):
         p = './tests/fm/zzn/FMT_M01_001.zzn'
         res = FMTS(p, None, None)
         self.assertEqual('FMT_M01_001', res.name)
 
+    def test_zzn_memmap(self):
+        from pytuflow._fm import ZZN
+        p = './tests/fm/zzn/FMT_M01_001.zzn'
+        zzn = ZZN(p)
+        a = np.fromfile(p, dtype=np.float32, count=zzn.timestep_count() * zzn.node_count() * 6)
+        a = a.reshape((zzn.timestep_count(), zzn.node_count() * 6))
+        self.assertTrue(np.array_equal(a[:, 1::6], zzn.get_time_series_data('Stage')))
+        self.assertTrue(np.array_equal(a[:, [6 * 5 + 1, 6 * 2 + 1]], zzn.values('Stage', [5, 2])))
+        self.assertTrue(np.array_equal(a[3, ::6], zzn.values('Flow', timesteps=3)))
+        res = FMTS(p, None, None)
+        df = res.time_series(zzn.labels()[5], 'stage')
+        self.assertTrue(np.array_equal(a[:, 6 * 5 + 1], df.iloc[:, 0].to_numpy()))
+        res.close()
+        self.assertIsNone(res._storage[0].zzn._a)
+        df1 = res.time_series(zzn.labels()[5], 'stage')  # mapped again
+        pd.testing.assert_frame_equal(df, df1)
+        res.close()
+        zzn.close()
+        self.assertIsNone(zzn._a)
+
     def test_load_with_dat(self):
         p = './tests/fm/zzn/FMT_M01_001.zzn'
         dat = './tests/fm/zzn/FMT_M01_001.dat'